@@ -0,0 +1,61 @@
+"""
+Akışlı (streaming) Excel Okuyucu
+
+Fiyat takip çalışma kitabını openpyxl salt-okunur modunda satır satır, tek bir
+ileri geçişte okur ve (sütun, model, kapasite, tarih, fiyat) kayıtları üretir.
+Çalışma kitabı hiçbir zaman tamamen belleğe (DataFrame'e) alınmaz; her sütun için
+yalnızca küçük bir durum (model bilgisi ve fiyat bekleyen tarihler) tutulur.
+
+İlk satır başlık satırıdır ve taranmaz. Hücre sınıflandırma ve tarih-fiyat
+eşleştirme kuralları hucre_tarayici modülündedir; sonuçlar pd.read_excel tabanlı
+okuyucu ile aynıdır.
+"""
+
+from hucre_tarayici import SutunTarayici
+
+
+def hucre_metni(deger):
+    """Hücre değerini pd.read_excel + str() ile aynı metne çevirir (boş hücrede None)"""
+    if deger is None:
+        return None
+    if isinstance(deger, float) and deger.is_integer():
+        deger = int(deger)
+    metin = str(deger)
+    if not metin or metin == 'nan' or metin == 'NaN':
+        return None
+    return metin
+
+
+def excel_kayitlarini_oku(dosya, sayfa=None):
+    """Çalışma kitabından (sütun, model, kapasite, tarih, fiyat) kayıtlarını akışla üretir
+
+    sayfa verilmezse ilk çalışma sayfası okunur. Kayıtlar satır sırasıyla üretilir;
+    aynı sütunun kayıtları kendi içinde tarih satırı sırasını korur.
+    """
+    from openpyxl import load_workbook
+
+    wb = load_workbook(dosya, read_only=True, data_only=True)
+    try:
+        ws = wb[sayfa] if sayfa is not None else wb.worksheets[0]
+        durumlar = []
+
+        satirlar = ws.iter_rows(values_only=True)
+        next(satirlar, None)  # Başlık satırı
+
+        for satir, degerler in enumerate(satirlar):
+            if len(degerler) > len(durumlar):
+                durumlar.extend(SutunTarayici() for _ in range(len(degerler) - len(durumlar)))
+
+            for sutun, deger in enumerate(degerler):
+                if deger is None:
+                    continue
+                durum = durumlar[sutun]
+                if not durum.aktif:
+                    continue
+                metin = hucre_metni(deger)
+                if metin is None:
+                    continue
+                for tarih, fiyat in durum.hucre_isle(satir, metin):
+                    yield sutun, durum.model, durum.kapasite, tarih, fiyat
+    finally:
+        wb.close()
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Kalıcı Anomali (Kampanya Fiyatı) Servisi
+
+Her model için StandardScaler + IsolationForest hattı bir kez eğitilir ve model
+önbelleğinde (ModelOnbellegi, 'anomali' türü) saklanır. Yeni kazınan fiyatlar
+tüm geçmiş yeniden eğitilmeden, model başına tek vektörel çağrıyla skorlanır;
+IsolationForest skorlamayı n_jobs kadar iş parçacığında paralel yürütür.
+
+- Kayıtlar model adıyla anahtarlanır (veri özetiyle değil); geçmiş uzadıkça aynı
+  eğitilmiş hat kullanılmaya devam eder.
+- Yeniden eğitim zamanlanmıştır: geçmişteki son tarih, son eğitimdeki son
+  tarihten yeniden_egitim_gun kadar ilerlemişse model yeniden eğitilir. Ayrıca
+  eğitimde kullanılan döneme (son eğitim tarihine kadarki kayıtlar) ait verinin
+  özeti (veri_ozeti) değişmişse, yani geçmiş düzeltilmiş ya da geriye dönük
+  doldurulmuşsa, zaman dolmasa da yeniden eğitilir.
+- Yeni kayıtlarda eksik özellikler eğitimdeki son değerlerden türetilir
+  (performans skoru model sabiti, ürün yaşı tarihten, oran fiyattan).
+
+Kullanım:
+    python anomali_servisi.py --egit                       # Zamanı gelen modelleri yeniden eğit
+    python anomali_servisi.py yeni_fiyatlar.csv -o skorlar.csv
+"""
+
+import argparse
+import copy
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+OZELLIKLER = ['FIYAT', 'PERFORMANS_SKORU', 'FIYAT_PERFORMANS_ORANI', 'URUN_YASI_GUN']
+EGITIM_SUTUNLARI = ['MODEL', 'TARIH'] + OZELLIKLER  # Geçmişten eğitim için okunan sütunlar
+YENIDEN_EGITIM_GUN = 7
+KIRLILIK_ORANI = 0.1
+SKOR_SUTUNLARI = ['ANOMALI_SKORU', 'ANOMALI']
+
+
+def ozellik_matrisi(veri, ortalamalar):
+    """Özellik sütunlarını eğitimdeki ortalamalarla doldurulmuş float64 matris olarak döndürür"""
+    return veri[OZELLIKLER].astype('float64').fillna(ortalamalar).to_numpy()
+
+
+def veri_ozeti(model_verisi):
+    """TARIH ve özellik sütunlarının satır sırasından bağımsız özeti (satır hash'lerinin toplamı)
+
+    Sütunlar float64/datetime64[ns]'e çevrilerek özetlenir; CSV ya da Parquet'ten
+    farklı tiplerle yüklenen aynı veri aynı özeti verir.
+    """
+    tablo = model_verisi[OZELLIKLER].astype('float64')
+    tablo.insert(0, 'TARIH', pd.to_datetime(model_verisi['TARIH']).astype('datetime64[ns]'))
+    return int(pd.util.hash_pandas_object(tablo, index=False).sum())
+
+
+def model_egit(model_verisi, n_jobs=None):
+    """Tek modelin geçmişi için ölçekleyici + Isolation Forest hattını eğitir
+
+    Eğitim durumunu (hat, doldurma ortalamaları ve yeni kayıtların özelliklerini
+    türetmek için son gözlem) sözlük olarak döndürür.
+    """
+    from sklearn.ensemble import IsolationForest
+    from sklearn.pipeline import make_pipeline
+    from sklearn.preprocessing import StandardScaler
+
+    ortalamalar = model_verisi[OZELLIKLER].astype('float64').mean()
+    hat = make_pipeline(StandardScaler(),
+                        IsolationForest(contamination=KIRLILIK_ORANI, random_state=42, n_jobs=n_jobs))
+    hat.fit(ozellik_matrisi(model_verisi, ortalamalar))
+    son = model_verisi.iloc[model_verisi['TARIH'].to_numpy().argmax()]
+    return {
+        'hat': hat,
+        'ortalamalar': ortalamalar,
+        'son_tarih': pd.Timestamp(son['TARIH']),
+        'son_performans': float(son['PERFORMANS_SKORU']),
+        'son_yas': float(son['URUN_YASI_GUN']),
+        'gozlem': len(model_verisi),
+        'veri_ozeti': veri_ozeti(model_verisi),
+        'egitim_zamani': time.time(),
+    }
+
+
+def kayitlari_tamamla(kayitlar, durum):
+    """Yeni kayıtlarda eksik özellikleri modelin son eğitim durumundan türetir"""
+    kayitlar = kayitlar.copy()
+    for sutun in OZELLIKLER:
+        if sutun not in kayitlar.columns:
+            kayitlar[sutun] = np.nan
+    kayitlar['PERFORMANS_SKORU'] = kayitlar['PERFORMANS_SKORU'].fillna(durum['son_performans'])
+    if 'TARIH' in kayitlar.columns:
+        gecen_gun = (pd.to_datetime(kayitlar['TARIH']) - durum['son_tarih']).dt.days
+        kayitlar['URUN_YASI_GUN'] = kayitlar['URUN_YASI_GUN'].fillna(durum['son_yas'] + gecen_gun)
+    kayitlar['FIYAT_PERFORMANS_ORANI'] = kayitlar['FIYAT_PERFORMANS_ORANI'].fillna(
+        kayitlar['FIYAT'] / kayitlar['PERFORMANS_SKORU'])
+    return kayitlar
+
+
+class AnomaliServisi:
+    """Model başına kalıcı anomali dedektörleri; eğitilen hatlar bellekte de tutulur
+
+    isabet/iska guncelle() kararlarını sayar (hazır/yeniden eğitildi); önbelleğin
+    kendi sayaçları yalnızca disk okumalarını sayar.
+    """
+
+    def __init__(self, onbellek=None, yeniden_egitim_gun=YENIDEN_EGITIM_GUN, n_jobs=-1):
+        if onbellek is None:
+            from model_onbellegi import ModelOnbellegi
+            onbellek = ModelOnbellegi()
+        self.onbellek = onbellek
+        self.yeniden_egitim_gun = yeniden_egitim_gun
+        self.n_jobs = n_jobs
+        self.isabet = 0
+        self.iska = 0
+        self._durumlar = {}
+
+    def _anahtar(self, model):
+        from model_onbellegi import onbellek_anahtari
+
+        return onbellek_anahtari('anomali', [], {'anomali': str(model), 'ozellikler': OZELLIKLER,
+                                                 'kirlilik': KIRLILIK_ORANI})
+
+    def durum(self, model):
+        """Modelin kayıtlı eğitim durumunu döndürür (bellekte yoksa diskten); yoksa None"""
+        if model not in self._durumlar:
+            durum = self.onbellek.getir('anomali', self._anahtar(model))
+            if durum is None:
+                return None
+            self._durumlar[model] = durum
+        return self._durumlar[model]
+
+    def egitim_gerekli_mi(self, model, model_verisi):
+        """Modelin geçmişi (model_verisi) için yeniden eğitim gerekiyorsa True
+
+        Kayıt yoksa, geçmiş son eğitimden bu yana yeniden_egitim_gun ilerlediyse ya
+        da eğitilen döneme ait verinin özeti kayıttakinden farklıysa True döner.
+        """
+        durum = self.durum(model)
+        if durum is None:
+            return True
+        tarihler = pd.to_datetime(model_verisi['TARIH'])
+        if (tarihler.max() - durum['son_tarih']).days >= self.yeniden_egitim_gun:
+            return True
+        return veri_ozeti(model_verisi[tarihler <= durum['son_tarih']]) != durum.get('veri_ozeti')
+
+    def guncelle(self, df, zorla=False):
+        """Zamanı gelen modelleri geçmiş üzerinde yeniden eğitir; {model: 'egitildi'|'hazir'} döndürür"""
+        islemler = {}
+        for model, model_verisi in df.groupby('MODEL', observed=True, sort=True):
+            if zorla or self.egitim_gerekli_mi(model, model_verisi):
+                durum = model_egit(model_verisi, self.n_jobs)
+                self.onbellek.kaydet('anomali', self._anahtar(model), durum)
+                self._durumlar[model] = durum
+                self.iska += 1
+                islemler[model] = 'egitildi'
+            else:
+                self.isabet += 1
+                islemler[model] = 'hazir'
+        return islemler
+
+    def skorla(self, kayitlar):
+        """Yeni kayıtları model başına tek çağrıda skorlar
+
+        kayitlar bir DataFrame ya da sözlük listesidir; en az MODEL ve FIYAT
+        gerekir. Girdi sırasıyla ANOMALI_SKORU (düşük = daha anormal) ve ANOMALI
+        (-1 anomali, 1 normal) sütunları eklenmiş bir kopya döner. Eğitilmiş
+        dedektörü olmayan modellerin satırlarında skor NaN, ANOMALI 0 olur.
+        """
+        kayitlar = pd.DataFrame(kayitlar)
+        sonuc = kayitlar.copy()
+        sonuc['ANOMALI_SKORU'] = np.nan
+        sonuc['ANOMALI'] = 0
+        for model, satirlar in kayitlar.groupby('MODEL', observed=True, sort=False).indices.items():
+            durum = self.durum(model)
+            if durum is None:
+                continue
+            grup = kayitlari_tamamla(kayitlar.iloc[satirlar], durum)
+            # Önbellekteki ortak hat değiştirilmez: n_jobs ormanın bu çağrıya özel sığ kopyasına verilir
+            orman = copy.copy(durum['hat'][-1])
+            orman.n_jobs = self.n_jobs
+            olcekli = durum['hat'][:-1].transform(ozellik_matrisi(grup, durum['ortalamalar']))
+            skorlar = orman.decision_function(olcekli)
+            sonuc.iloc[satirlar, sonuc.columns.get_loc('ANOMALI_SKORU')] = skorlar
+            sonuc.iloc[satirlar, sonuc.columns.get_loc('ANOMALI')] = np.where(skorlar < 0, -1, 1)
+        return sonuc
+
+    score = skorla
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Kalıcı anomali dedektörleri ile yeni fiyatları skorla')
+    parser.add_argument('kayitlar', nargs='?', default=None,
+                        help='Skorlanacak yeni kayıtlar (CSV; en az MODEL, FIYAT, tercihen TARIH)')
+    parser.add_argument('-o', '--cikti', default=None, help='Skorların yazılacağı CSV (varsayılan: ekrana)')
+    parser.add_argument('--egit', action='store_true', help='Zamanı gelen modelleri geçmiş veriyle yeniden eğit')
+    parser.add_argument('--zorla', action='store_true', help='Zamanlamadan bağımsız tüm modelleri yeniden eğit')
+    parser.add_argument('--yeniden-egitim-gun', type=int, default=YENIDEN_EGITIM_GUN,
+                        help='Yeniden eğitim aralığı (geçmişte ilerleyen gün)')
+    parser.add_argument('--n-jobs', type=int, default=-1, help='Skorlama iş parçacığı sayısı (-1: tüm çekirdekler)')
+    parser.add_argument('--onbellek', default='.model_onbellegi', help='Model önbelleği klasörü')
+    parser.add_argument('--csv', default='profesyonel_telefon_verileri2.csv', help='Parquet yoksa okunacak geçmiş CSV')
+    args = parser.parse_args(argv)
+    if not args.kayitlar and not (args.egit or args.zorla):
+        parser.error('Skorlanacak kayıt dosyası ya da --egit gerekli')
+
+    from model_onbellegi import ModelOnbellegi
+
+    servis = AnomaliServisi(ModelOnbellegi(args.onbellek), args.yeniden_egitim_gun, args.n_jobs)
+    if args.egit or args.zorla:
+        from veri_semasi import veri_setini_yukle
+
+        gecmis = veri_setini_yukle(args.csv, sutunlar=EGITIM_SUTUNLARI)
+        gecmis['TARIH'] = pd.to_datetime(gecmis['TARIH'])
+        baslangic = time.perf_counter()
+        islemler = servis.guncelle(gecmis, zorla=args.zorla)
+        for model, islem in islemler.items():
+            print(f"  {'🔄' if islem == 'egitildi' else '✅'} {model}: {islem}")
+        print(f"⏱️ Eğitim kontrolü: {time.perf_counter() - baslangic:.2f} sn")
+
+    if args.kayitlar:
+        kayitlar = pd.read_csv(args.kayitlar)
+        baslangic = time.perf_counter()
+        yuklu = [model for model in kayitlar['MODEL'].unique() if servis.durum(model) is not None]
+        print(f"📦 {len(yuklu)} dedektör yüklendi: {time.perf_counter() - baslangic:.2f} sn")
+        baslangic = time.perf_counter()
+        skorlar = servis.skorla(kayitlar)
+        sure = time.perf_counter() - baslangic
+        print(f"🔍 {len(skorlar)} kayıt {sure * 1000:.1f} ms'de skorlandı; "
+              f"{(skorlar['ANOMALI'] == -1).sum()} anomali, {(skorlar['ANOMALI'] == 0).sum()} dedektörsüz")
+        if args.cikti:
+            skorlar.to_csv(args.cikti, index=False)
+            print(f"💾 Skorlar: {args.cikti}")
+        else:
+            print(skorlar[['MODEL', 'FIYAT'] + SKOR_SUTUNLARI].to_string(index=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
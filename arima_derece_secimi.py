@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Otomatik ARIMA Derece Seçimi
+
+Her SKU serisi için ARIMA(p, d, q) (isteğe bağlı mevsimsel (P, 0, Q, s)) derecesini
+AIC'ye göre seçer:
+
+- d, ADF (birim kök) ve KPSS (durağanlık) testleriyle seçilir: seri her iki teste
+  göre durağan olana kadar (en fazla en_fazla_d) fark alınır.
+- 'adimsal' arama (varsayılan) Hyndman-Khandakar yöntemini izler: başlangıç
+  adaylarından sonra yalnızca o ana kadarki en iyi modelin komşuları (p±1, q±1,
+  P±1, Q±1) denenir; hiçbir komşu AIC'yi iyileştirmezse arama biter. En iyi
+  modelden uzak adaylar eğitilmez; bu sezgisel bir budamadır (AIC sınırı
+  değildir), en iyi AIC'li derece bazen kaçırılabilir. 'izgara' budama yapmaz,
+  tüm kombinasyonları eğitir (en_fazla_model sınırına kadar).
+- Bir turun adayları süreç havuzunda paralel eğitilir; her eğitim zaman_asimi
+  saniyeyle sınırlıdır (POSIX'te sinyalle; Windows'ta ve ana iş parçacığı
+  dışındaki çağrılarda sınır uygulanamaz).
+  Aramada kovaryans matrisi hesaplanmaz (cov_type='none').
+- Seçilen dereceler SKU başına (seri_anahtari: 'MODEL - KAPASITE') JSON dosyasında
+  arama ayarlarıyla birlikte saklanır. Bu CLI ve profesyonel_zaman_serisi
+  --arima-derece-ara aynı varsayılanları (ARAMA_AYARLARI) ve anahtarları kullanır;
+  ayarlar aynı kaldıkça ve seri önemli ölçüde değişmedikçe (gözlem sayısı %25
+  artmadıkça, seviye/ölçek kaymadıkça) arama tekrarlanmaz.
+
+Kullanım:
+    python arima_derece_secimi.py --islem-sayisi 4 --mevsimsel 7
+"""
+
+import argparse
+import itertools
+import math
+import sys
+import threading
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+DERECE_DOSYASI = 'arima_dereceleri.json'
+ZAMAN_ASIMI_SN = 20
+ANLAMLILIK = 0.05
+
+# Önbellekteki derecenin geçerliliği: bu eşikler aşılırsa arama yenilenir
+ARTIS_ORANI_SINIRI = 0.25
+SEVIYE_KAYMASI_SINIRI = 0.5   # standart sapma cinsinden
+OLCEK_ORANI_SINIRI = 2.0
+
+# Arama ayarlarının varsayılanları; saklanan kayıttaki ayarlar bunlarla doldurulmuş
+# tam sözlükle karşılaştırılır (CLI ve analiz hattı aynı kayıtları kullanabilsin diye)
+ARAMA_AYARLARI = {'arama': 'adimsal', 'en_fazla_p': 3, 'en_fazla_q': 3, 'mevsimsel': None,
+                  'zaman_asimi': ZAMAN_ASIMI_SN, 'en_fazla_model': 60}
+
+
+def arama_ayarlari(**degisiklikler):
+    """Varsayılan arama ayarlarını verilen değerlerle günceller (anahtar sırası sabit)"""
+    bilinmeyen = set(degisiklikler) - set(ARAMA_AYARLARI)
+    if bilinmeyen:
+        raise TypeError(f"Bilinmeyen arama ayarları: {sorted(bilinmeyen)}")
+    return {k: degisiklikler.get(k, v) for k, v in sorted(ARAMA_AYARLARI.items())}
+
+
+def seri_anahtari(model, kapasite=None):
+    """Derece kayıtlarının anahtarı: SKU için 'MODEL - KAPASITE', model serisi için model adı"""
+    return f"{model} - {kapasite}" if kapasite else str(model)
+
+
+def fark_derecesi_sec(fiyatlar, en_fazla_d=2, alfa=ANLAMLILIK):
+    """ADF ve KPSS testlerine göre fark derecesi d'yi seçer"""
+    from statsmodels.tsa.stattools import adfuller, kpss
+
+    seri = np.asarray(fiyatlar, dtype=np.float64)
+    for d in range(en_fazla_d):
+        if np.ptp(seri) == 0:
+            return d
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')  # KPSS p-değeri tablo sınırında uyarı verir
+            adf_p = adfuller(seri, autolag='AIC')[1]
+            kpss_p = kpss(seri, regression='c', nlags='auto')[1]
+        if adf_p < alfa and kpss_p >= alfa:
+            return d
+        seri = np.diff(seri)
+    return en_fazla_d
+
+
+class _ZamanAsimi(Exception):
+    pass
+
+
+def _zaman_asimi_sinyali(signum, frame):
+    raise _ZamanAsimi()
+
+
+def aday_egit(gorev):
+    """Süreç havuzu işçisi: bir aday dereceyi eğitir; (order, seasonal_order, aic, durum, süre) döndürür"""
+    import signal
+    from statsmodels.tsa.arima.model import ARIMA
+
+    fiyatlar, order, seasonal_order, zaman_asimi = gorev
+    warnings.filterwarnings('ignore')
+    # Sinyal işleyicisi yalnızca ana iş parçacığında kurulabilir; diğerlerinde süre sınırı uygulanmaz
+    sinyal = (hasattr(signal, 'setitimer') and zaman_asimi
+              and threading.current_thread() is threading.main_thread())
+    baslangic = time.perf_counter()
+    try:
+        if sinyal:
+            signal.signal(signal.SIGALRM, _zaman_asimi_sinyali)
+            signal.setitimer(signal.ITIMER_REAL, zaman_asimi)
+        sonuc = ARIMA(fiyatlar, order=order, seasonal_order=seasonal_order).fit(cov_type='none', low_memory=True)
+        aic, durum = float(sonuc.aic), 'TAMAM'
+        if not math.isfinite(aic):
+            aic, durum = math.inf, 'HATA'
+    except _ZamanAsimi:
+        aic, durum = math.inf, 'ZAMAN_ASIMI'
+    except Exception:
+        aic, durum = math.inf, 'HATA'
+    finally:
+        if sinyal:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+    return order, seasonal_order, aic, durum, time.perf_counter() - baslangic
+
+
+def _komsular(aday, en_fazla_p, en_fazla_q, mevsimsel):
+    """Adımsal aramada bir (p, q, P, Q) adayının komşuları"""
+    p, q, P, Q = aday
+    adimlar = [(dp, dq, 0, 0) for dp, dq in itertools.product((-1, 0, 1), repeat=2) if dp or dq]
+    if mevsimsel:
+        adimlar += [(0, 0, dP, dQ) for dP, dQ in itertools.product((-1, 0, 1), repeat=2) if dP or dQ]
+    for dp, dq, dP, dQ in adimlar:
+        komsu = (p + dp, q + dq, P + dP, Q + dQ)
+        if 0 <= komsu[0] <= en_fazla_p and 0 <= komsu[1] <= en_fazla_q and 0 <= komsu[2] <= 1 and 0 <= komsu[3] <= 1:
+            yield komsu
+
+
+def derece_ara(fiyatlar, havuz=None, arama=ARAMA_AYARLARI['arama'], en_fazla_p=ARAMA_AYARLARI['en_fazla_p'],
+               en_fazla_q=ARAMA_AYARLARI['en_fazla_q'], mevsimsel=ARAMA_AYARLARI['mevsimsel'],
+               zaman_asimi=ARAMA_AYARLARI['zaman_asimi'], en_fazla_model=ARAMA_AYARLARI['en_fazla_model']):
+    """Serinin en iyi ARIMA derecesini arar
+
+    mevsimsel: mevsim dönemi (ör. günlük veride haftalık için 7) ya da None.
+    arama='adimsal' yalnızca en iyi modelin komşularını dener (sezgisel),
+    'izgara' tüm adayları eğitir; ikisinde de en çok en_fazla_model aday
+    eğitilir. havuz verilirse (ProcessPoolExecutor) adaylar paralel eğitilir. Sözlük
+    döndürür: order, seasonal_order, aic, denenen (model sayısı), sure_sn.
+    Hiçbir aday eğitilemezse aic None olur ve order varsayılan (1, d, 1)'dir.
+    """
+    fiyatlar = np.asarray(fiyatlar, dtype=np.float64)
+    baslangic = time.perf_counter()
+    d = fark_derecesi_sec(fiyatlar)
+    s = mevsimsel or 0
+
+    def dereceler(aday):
+        p, q, P, Q = aday
+        return (p, d, q), ((P, 0, Q, s) if s and (P or Q) else (0, 0, 0, 0))
+
+    if arama == 'izgara':
+        turlar = [list(itertools.product(range(en_fazla_p + 1), range(en_fazla_q + 1),
+                                         range(2 if s else 1), range(2 if s else 1)))]
+    elif arama == 'adimsal':
+        baslangic_adaylari = [(min(2, en_fazla_p), min(2, en_fazla_q), int(bool(s)), int(bool(s))),
+                              (0, 0, 0, 0), (min(1, en_fazla_p), 0, int(bool(s)), 0),
+                              (0, min(1, en_fazla_q), 0, int(bool(s)))]
+        turlar = [list(dict.fromkeys(baslangic_adaylari))]
+    else:
+        raise ValueError(f"Bilinmeyen arama yöntemi: '{arama}' (seçenekler: adimsal, izgara)")
+
+    sonuclar = {}
+    en_iyi = None
+    while turlar and len(sonuclar) < en_fazla_model:
+        tur = [a for a in turlar.pop() if a not in sonuclar][:en_fazla_model - len(sonuclar)]
+        gorevler = [(fiyatlar, *dereceler(a), zaman_asimi) for a in tur]
+        ciktilar = havuz.map(aday_egit, gorevler) if havuz else map(aday_egit, gorevler)
+        onceki = sonuclar[en_iyi][2] if en_iyi else math.inf
+        for aday, cikti in zip(tur, ciktilar):
+            sonuclar[aday] = cikti
+            if en_iyi is None or cikti[2] < sonuclar[en_iyi][2]:
+                en_iyi = aday
+        # Adımsal: en iyi model iyileştiyse yalnızca onun komşularına bak
+        if arama == 'adimsal' and sonuclar[en_iyi][2] < onceki:
+            turlar.append(list(_komsular(en_iyi, en_fazla_p, en_fazla_q, bool(s))))
+
+    order, seasonal_order, aic, durum, _ = sonuclar[en_iyi]
+    if not math.isfinite(aic):
+        # Hiçbir aday eğitilemedi; eski sabit dereceye dön (aic None: arama başarısız)
+        order, seasonal_order, aic = (1, d, 1), (0, 0, 0, 0), None
+    return {
+        'order': list(order), 'seasonal_order': list(seasonal_order), 'aic': aic,
+        'denenen': len(sonuclar),
+        'zaman_asimi': sum(c[3] == 'ZAMAN_ASIMI' for c in sonuclar.values()),
+        'sure_sn': time.perf_counter() - baslangic,
+    }
+
+
+def _seri_parmak_izi(fiyatlar):
+    return {'n': len(fiyatlar), 'ortalama': float(np.mean(fiyatlar)), 'std': float(np.std(fiyatlar))}
+
+
+def onemli_degisim_var_mi(eski, yeni):
+    """Önbellekteki derecenin seçildiği seri ile şimdiki seri önemli ölçüde farklıysa True"""
+    if yeni['n'] < eski['n'] or yeni['n'] > eski['n'] * (1 + ARTIS_ORANI_SINIRI):
+        return True
+    olcek = max(eski['std'], 1e-9)
+    if abs(yeni['ortalama'] - eski['ortalama']) > SEVIYE_KAYMASI_SINIRI * olcek:
+        return True
+    oran = max(yeni['std'], 1e-9) / olcek
+    return not (1 / OLCEK_ORANI_SINIRI <= oran <= OLCEK_ORANI_SINIRI)
+
+
+def _aic_gecerli(aic):
+    """Kayıttaki AIC başarılı bir aramaya mı ait (eski dosyalarda Infinity olabilir)"""
+    return isinstance(aic, (int, float)) and math.isfinite(aic)
+
+
+def derece_sec(seri_adi, fiyatlar, dereceler=None, havuz=None, **degisiklikler):
+    """SKU için derece döndürür; önbellekteki derece geçerliyse arama yapılmaz
+
+    seri_adi: seri_anahtari(model, kapasite). dereceler: {seri_adi: kayıt}
+    sözlüğü (derece_dosyasi_oku); yeni arama sonucu bu sözlüğe yazılır.
+    degisiklikler ARAMA_AYARLARI'nı günceller. ((p, d, q), (P, D, Q, s),
+    yeni_arama_mi) döndürür. Başarısız arama (aic None) kaydedilmez; varsayılan
+    derece döner ve sonraki çağrıda arama yinelenir.
+    """
+    dereceler = {} if dereceler is None else dereceler
+    iz = _seri_parmak_izi(fiyatlar)
+    ayarlar = arama_ayarlari(**degisiklikler)
+    kayit = dereceler.get(seri_adi)
+    yeni = (kayit is None or kayit.get('ayarlar') != ayarlar or not _aic_gecerli(kayit.get('aic'))
+            or onemli_degisim_var_mi(kayit['seri'], iz))
+    if yeni:
+        kayit = dict(derece_ara(fiyatlar, havuz=havuz, **ayarlar), seri=iz, ayarlar=ayarlar)
+        if kayit['aic'] is None:
+            dereceler.pop(seri_adi, None)
+        else:
+            dereceler[seri_adi] = kayit
+    return tuple(kayit['order']), tuple(kayit['seasonal_order']), yeni
+
+
+def derece_dosyasi_oku(dosya=DERECE_DOSYASI):
+    """Saklanan SKU derecelerini okur (dosya yoksa boş sözlük)"""
+    from kaynak_manifestosu import manifesto_oku
+
+    return (manifesto_oku(dosya) or {}).get('dereceler', {})
+
+
+def derece_dosyasi_yaz(dereceler, dosya=DERECE_DOSYASI):
+    """SKU derecelerini atomik olarak yazar"""
+    from kaynak_manifestosu import manifesto_yaz
+
+    manifesto_yaz(dosya, {'dereceler': dereceler})
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='SKU bazlı otomatik ARIMA derece seçimi')
+    parser.add_argument('--arama', choices=['adimsal', 'izgara'], default=ARAMA_AYARLARI['arama'],
+                        help="adimsal: en iyi modelin komşuları (sezgisel budama); izgara: tüm adaylar")
+    parser.add_argument('--en-fazla-p', type=int, default=ARAMA_AYARLARI['en_fazla_p'])
+    parser.add_argument('--en-fazla-q', type=int, default=ARAMA_AYARLARI['en_fazla_q'])
+    parser.add_argument('--mevsimsel', type=int, default=ARAMA_AYARLARI['mevsimsel'],
+                        help='Mevsim dönemi (ör. 7); verilmezse mevsimsel terim yok')
+    parser.add_argument('--zaman-asimi', type=float, default=ARAMA_AYARLARI['zaman_asimi'],
+                        help='Aday başına eğitim süresi sınırı (sn)')
+    parser.add_argument('--en-fazla-model', type=int, default=ARAMA_AYARLARI['en_fazla_model'],
+                        help='Seri başına denenecek en çok aday')
+    parser.add_argument('--islem-sayisi', type=int, default=None, help='İşçi süreç sayısı (varsayılan: CPU sayısı)')
+    parser.add_argument('--derece-dosyasi', default=DERECE_DOSYASI)
+    parser.add_argument('--yeniden-ara', action='store_true', help='Saklanan dereceleri yok say')
+    parser.add_argument('--csv', default='profesyonel_telefon_verileri2.csv', help='Parquet yoksa okunacak CSV')
+    args = parser.parse_args(argv)
+
+    from tahmin_havuzu import sku_serileri
+    from veri_semasi import SERI_SUTUNLARI, veri_setini_yukle
+
+    seriler = sku_serileri(veri_setini_yukle(args.csv, sutunlar=SERI_SUTUNLARI))
+    dereceler = {} if args.yeniden_ara else derece_dosyasi_oku(args.derece_dosyasi)
+    ayarlar = arama_ayarlari(arama=args.arama, en_fazla_p=args.en_fazla_p, en_fazla_q=args.en_fazla_q,
+                             mevsimsel=args.mevsimsel, zaman_asimi=args.zaman_asimi,
+                             en_fazla_model=args.en_fazla_model)
+
+    print(f"🔎 ARIMA Derece Seçimi ({args.arama})")
+    baslangic = time.perf_counter()
+    havuz = None if args.islem_sayisi == 1 else ProcessPoolExecutor(max_workers=args.islem_sayisi)
+    try:
+        for (model, kapasite), seri in seriler.items():
+            fiyatlar = seri.to_numpy(np.float64)
+            seri_adi = seri_anahtari(model, kapasite)
+            if len(fiyatlar) < 30:
+                print(f"  ⚠️ {seri_adi}: yetersiz veri ({len(fiyatlar)} gün)")
+                continue
+            order, seasonal_order, yeni = derece_sec(seri_adi, fiyatlar, dereceler, havuz, **ayarlar)
+            kayit = dereceler.get(seri_adi)
+            if kayit is None:
+                print(f"  ❌ {seri_adi}: hiçbir aday eğitilemedi; varsayılan ARIMA{order} (kaydedilmedi)")
+                continue
+            kaynak = f"{kayit['denenen']} model, {kayit['sure_sn']:.2f} sn" if yeni else 'önbellekten'
+            mevsim = f" x {seasonal_order}" if seasonal_order[3] else ''
+            print(f"  📱 {seri_adi}: ARIMA{order}{mevsim} AIC={kayit['aic']:.1f} ({kaynak})")
+    finally:
+        if havuz:
+            havuz.shutdown()
+    derece_dosyasi_yaz(dereceler, args.derece_dosyasi)
+    print(f"  🧮 {time.perf_counter() - baslangic:.2f} sn; dereceler: {args.derece_dosyasi}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""
+Artımlı ARIMA Güncelleme
+
+Yeni günlerin fiyatları geldiğinde ARIMA'yı tüm geçmiş üzerinde yeniden
+eğitmek yerine, önceki eğitilmiş statsmodels sonucunu durum uzayı filtresiyle
+yeni gözlemlere uzatır (`extend`); parametreler yeniden kestirilmez. extend
+yalnızca yeni gözlemleri filtreler ve önceki filtre durumundan devam eder; tahmin
+tüm seri üzerinde aynı parametrelerle filtrelemeyle aynıdır.
+
+Seri başına saklanan durum (model önbelleğinde, seri adı + derece ile anahtarlı):
+eğitilmiş sonuç, gözlem sayısı, gözlemlerin özeti ve son tam eğitimdeki gözlem
+sayısı. Tam yeniden eğitim şu durumlarda yapılır:
+
+- Önceki durum yoksa ya da eski gözlemler değişmişse (önek özeti uyuşmazsa)
+- Son tam eğitimden bu yana yeniden_egitim_gun kadar gün eklendiyse (zamanlanmış)
+- Eklenen günlerin bir adım sonrası tahmin hataları, hata standart sapmasının
+  ortalama sapma_esigi katını aşıyorsa (sapma kontrolü)
+"""
+
+import hashlib
+
+import numpy as np
+
+YENIDEN_EGITIM_GUN = 30
+SAPMA_ESIGI = 2.5
+
+# Güncelleme sonucunda yapılan işlem
+ISLEM_ACIKLAMALARI = {
+    'ayni': 'seri değişmedi',
+    'ek': 'yeni günler eklendi (yeniden kestirim yok)',
+    'ilk': 'ilk eğitim',
+    'uyumsuz': 'geçmiş değişti, yeniden eğitildi',
+    'zamanlanmis': 'zamanlanmış yeniden eğitim',
+    'sapma': 'sapma tespit edildi, yeniden eğitildi',
+}
+
+
+def seri_ozeti(fiyatlar):
+    """Gözlem dizisinin SHA-1 özeti (fiyatlar[:n] ile eski özet karşılaştırılabilir)"""
+    return hashlib.sha1(np.ascontiguousarray(fiyatlar, dtype=np.float64).tobytes()).hexdigest()
+
+
+def _tam_egit(fiyatlar, order, seasonal_order=(0, 0, 0, 0)):
+    from statsmodels.tsa.arima.model import ARIMA
+
+    return ARIMA(fiyatlar, order=order, seasonal_order=seasonal_order).fit()
+
+
+def sapma_var_mi(sonuc, yeni_gozlem_sayisi, esik=SAPMA_ESIGI):
+    """Eklenen gözlemlerin bir adım sonrası hataları modelin hata ölçeğinden çok büyükse True"""
+    hata_std = np.sqrt(sonuc.params[-1])  # sigma2, ARIMA parametrelerinin sonuncusu
+    yeni_hatalar = np.asarray(sonuc.resid)[-yeni_gozlem_sayisi:]
+    return bool(np.mean(np.abs(yeni_hatalar)) > esik * hata_std)
+
+
+def arima_guncelle(onbellek, seri_adi, fiyatlar, order=(1, 1, 1), seasonal_order=(0, 0, 0, 0),
+                   yeniden_egitim_gun=YENIDEN_EGITIM_GUN, sapma_esigi=SAPMA_ESIGI):
+    """Seri için güncel ARIMA sonucunu döndürür; mümkünse önceki sonucu uzatır
+
+    (sonuç, işlem) döndürür; işlem ISLEM_ACIKLAMALARI anahtarlarından biridir.
+    onbellek bir ModelOnbellegi'dir; durum, seri_adi ve dereceler ile anahtarlanır.
+    """
+    from model_onbellegi import onbellek_anahtari
+
+    fiyatlar = np.asarray(fiyatlar, dtype=np.float64)
+    parametreler = {'artimli': seri_adi, 'order': list(order)}
+    if any(seasonal_order):
+        parametreler['seasonal_order'] = list(seasonal_order)
+    anahtar = onbellek_anahtari('arima', [], parametreler)
+    durum = onbellek.getir('arima', anahtar)
+    n = len(fiyatlar)
+
+    if durum is None:
+        islem = 'ilk'
+    elif durum['n'] > n or seri_ozeti(fiyatlar[:durum['n']]) != durum['ozet']:
+        islem = 'uyumsuz'
+    elif durum['n'] == n:
+        onbellek.isabet += 1
+        return durum['sonuc'], 'ayni'
+    elif n - durum['son_egitim_n'] >= yeniden_egitim_gun:
+        islem = 'zamanlanmis'
+    else:
+        sonuc = durum['sonuc'].extend(fiyatlar[durum['n']:])
+        islem = 'sapma' if sapma_var_mi(sonuc, n - durum['n'], sapma_esigi) else 'ek'
+        son_egitim_n = durum['son_egitim_n']
+
+    if islem != 'ek':
+        sonuc = _tam_egit(fiyatlar, order, seasonal_order)
+        son_egitim_n = n
+        onbellek.iska += 1
+    else:
+        onbellek.isabet += 1
+
+    onbellek.kaydet('arima', anahtar, {'sonuc': sonuc, 'n': n, 'ozet': seri_ozeti(fiyatlar),
+                                       'son_egitim_n': son_egitim_n})
+    return sonuc, islem
@@ -0,0 +1,256 @@
+"""
+Aşama Ölçümü (Süre, CPU ve Bellek Enstrümantasyonu)
+
+Analiz, veri hazırlama ve veri toplama betiklerinin aşamalarını ölçer. Her aşama
+için duvar saati süresi, CPU süresi ve tracemalloc tepe belleği (aşama başındaki
+izlenen belleğin üzerine çıkılan en yüksek miktar) kaydedilir. Kayıtlar aşama ve
+etiket (ör. sku, site) başına JSON satırları olarak yazılır; istenirse seçilen
+tek bir aşama cProfile ile profillenir.
+
+    with olc('arima', sku='iPhone 16 - 128GB'):
+        ...
+
+    @olculen('temizleme')
+    def veri_temizleme(df): ...
+
+Ölçüm `baslat` ile açılmadıkça `olc` boş bir bağlam döndürür; kütüphane olarak
+içe aktarılan modüllerde ek yük ya da çıktı yoktur. İç içe aşamalar desteklenir
+(kayıttaki 'ust' alanı); ölçer tek iş parçacığı içindir. Süreç havuzundaki
+işçilerde ölçüm açılmaz, yalnızca ana süreçteki aşamalar kaydedilir.
+
+Bellek ölçümü (--olcum-bellek) isteğe bağlıdır: tracemalloc Python ve NumPy
+ayırmalarını izler (TensorFlow/Stan yerel belleği sayılmaz) ve ayırma yoğun
+aşamaları belirgin biçimde yavaşlatır (anomali aşaması ~6 kat). Süreler bellek
+ölçümsüz bir çalıştırmadan, tepe bellek ayrı bir --olcum-bellek çalıştırmasından
+okunmalıdır; bellek ölçülmeyen kayıtlarda bellek_tepe_mb boştur (null).
+
+Kullanım (üç giriş noktasında da aynı seçenekler):
+    python profesyonel_zaman_serisi.py --olcum                    # asama_olcumleri.jsonl + özet tablo
+    python profesyonel_zaman_serisi.py --olcum olcum.jsonl --profil arima
+    python profesyonel_veri_hazirlik.py telefon_fiyatlar.xlsx --olcum --olcum-bellek
+"""
+
+import contextlib
+import functools
+import json
+import sys
+import time
+import tracemalloc
+import uuid
+from datetime import datetime
+
+OLCUM_DOSYASI = 'asama_olcumleri.jsonl'
+PROFIL_SATIRI = 20  # Profil özetinde yazdırılan fonksiyon sayısı (kümülatif süreye göre)
+# Her kayıtta bulunan alanlar; bunların dışındaki alanlar etiketlerdir (sku, site...)
+_ORTAK_ALANLAR = frozenset(('zaman', 'calistirma', 'giris', 'asama', 'ust', 'duvar_sn', 'cpu_sn',
+                            'bellek_tepe_mb', 'hata'))
+
+_etkin = None
+
+
+class AsamaOlcer:
+    """Aşama başına duvar/CPU süresi ve tracemalloc tepe belleği ölçer, JSON satırı yazar"""
+
+    def __init__(self, dosya=None, bellek=False, profil=None, giris=None):
+        self.dosya = dosya
+        self.bellek = bellek
+        self.profil = profil
+        self.giris = giris
+        self.calistirma = uuid.uuid4().hex[:12]  # Aynı dosyaya eklenen çalıştırmaları ayırır
+        self.kayitlar = []
+        self._yigin = []
+        self._profilci = None
+        self._profil_sayisi = 0
+        self._cikti = open(dosya, 'a', encoding='utf-8') if dosya else None
+        self._tracemalloc_baslatildi = False
+        if bellek and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._tracemalloc_baslatildi = True
+
+    @contextlib.contextmanager
+    def olc(self, asama, **etiketler):
+        """Bloğu asama adıyla ölçer; etiketler (sku, site...) kayda aynen eklenir"""
+        cerceve = {'asama': asama, 'tepe': 0, 'bellek': 0}
+        if self.bellek:
+            simdiki, tepe = tracemalloc.get_traced_memory()
+            if self._yigin:
+                # Üst aşamanın o ana kadarki tepesi korunur; tepe sayacı bu aşama için sıfırlanır
+                self._yigin[-1]['tepe'] = max(self._yigin[-1]['tepe'], tepe)
+            tracemalloc.reset_peak()
+            cerceve['bellek'] = simdiki
+        profilleniyor = asama == self.profil and self._profil_ac()
+        self._yigin.append(cerceve)
+
+        hata = None
+        duvar, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        except BaseException as e:
+            hata = type(e).__name__
+            raise
+        finally:
+            duvar, cpu = time.perf_counter() - duvar, time.process_time() - cpu
+            if profilleniyor:
+                self._profilci.disable()
+            self._yigin.pop()
+            tepe_mb = None
+            if self.bellek:
+                tepe = max(cerceve['tepe'], tracemalloc.get_traced_memory()[1])
+                if self._yigin:
+                    self._yigin[-1]['tepe'] = max(self._yigin[-1]['tepe'], tepe)
+                tepe_mb = round(max(tepe - cerceve['bellek'], 0) / 1024 ** 2, 3)
+            self._kaydet(dict({
+                'zaman': datetime.now().isoformat(timespec='milliseconds'),
+                'calistirma': self.calistirma,
+                'giris': self.giris,
+                'asama': asama,
+                'ust': self._yigin[-1]['asama'] if self._yigin else None,
+                'duvar_sn': round(duvar, 6),
+                'cpu_sn': round(cpu, 6),
+                'bellek_tepe_mb': tepe_mb,
+                'hata': hata,
+            }, **etiketler))
+
+    def _profil_ac(self):
+        """Profil aşaması için cProfile'ı açar (iç içe aynı aşamada yalnızca en dıştaki)"""
+        if self._profilci is not None and any(c['asama'] == self.profil for c in self._yigin):
+            return False
+        if self._profilci is None:
+            import cProfile
+            self._profilci = cProfile.Profile()
+        try:
+            self._profilci.enable()
+        except ValueError as e:  # Başka bir profilci etkin
+            print(f"⚠️ cProfile açılamadı: {e}")
+            self.profil = None
+            return False
+        self._profil_sayisi += 1
+        return True
+
+    def _kaydet(self, kayit):
+        self.kayitlar.append(kayit)
+        if self._cikti is not None:
+            self._cikti.write(json.dumps(kayit, ensure_ascii=False, default=str) + '\n')
+            self._cikti.flush()
+
+    def ozet(self):
+        """Aşama başına toplamlar (çalışma sırasıyla)
+
+        Aşamanın etiketsiz (bütün aşama) kayıtları varsa toplam onlardan, yoksa
+        etiketli (SKU/site başına) kayıtların toplamından alınır.
+        """
+        gruplar = {}
+        for kayit in self.kayitlar:
+            etiketli = any(k not in _ORTAK_ALANLAR for k in kayit)
+            grup = gruplar.setdefault(kayit['asama'], {'butun': [], 'etiketli': []})
+            grup['etiketli' if etiketli else 'butun'].append(kayit)
+        satirlar = []
+        for asama, grup in gruplar.items():
+            kayitlar = grup['butun'] or grup['etiketli']
+            tepeler = [k['bellek_tepe_mb'] for k in kayitlar if k['bellek_tepe_mb'] is not None]
+            satirlar.append({
+                'asama': asama,
+                'cagri': len(kayitlar),
+                'etiketli': len(grup['etiketli']),
+                'duvar_sn': sum(k['duvar_sn'] for k in kayitlar),
+                'cpu_sn': sum(k['cpu_sn'] for k in kayitlar),
+                'bellek_tepe_mb': max(tepeler) if tepeler else None,
+                'hata': sum(k['hata'] is not None for k in kayitlar),
+            })
+        return satirlar
+
+    def ozet_yazdir(self):
+        """Aşama özet tablosunu yazdırır"""
+        satirlar = self.ozet()
+        if not satirlar:
+            return
+        bellek = ' (tracemalloc açık: süreler yavaşlamış olabilir)' if self.bellek else ''
+        print(f"\n⏱️ Aşama Ölçümleri ({self.giris or 'çalıştırma'} {self.calistirma}){bellek}")
+        print("-" * 72)
+        print(f"{'Aşama':<16}{'Çağrı':>7}{'Etiketli':>10}{'Duvar (sn)':>12}{'CPU (sn)':>11}{'Tepe (MB)':>12}")
+        for s in satirlar:
+            tepe = f"{s['bellek_tepe_mb']:.1f}" if s['bellek_tepe_mb'] is not None else '-'
+            hata = f"  ❌ {s['hata']} hata" if s['hata'] else ''
+            print(f"{s['asama']:<16}{s['cagri']:>7}{s['etiketli'] or '':>10}{s['duvar_sn']:>12.3f}"
+                  f"{s['cpu_sn']:>11.3f}{tepe:>12}{hata}")
+        if self.dosya:
+            print(f"📝 {len(self.kayitlar)} kayıt: {self.dosya}")
+
+    def kapat(self):
+        """Profili yazar, çıktı dosyasını kapatır ve başlattıysa tracemalloc'u durdurur"""
+        if self._profilci is not None and self._profil_sayisi:
+            import pstats
+            profil_dosyasi = f"profil_{self.profil}.prof"
+            self._profilci.dump_stats(profil_dosyasi)
+            print(f"\n🔬 cProfile: '{self.profil}' ({self._profil_sayisi} çağrı) -> {profil_dosyasi}")
+            pstats.Stats(self._profilci, stream=sys.stdout).strip_dirs().sort_stats('cumulative').print_stats(PROFIL_SATIRI)
+        elif self.profil:
+            print(f"⚠️ Profil aşaması '{self.profil}' çalışmadı; profil yazılmadı")
+        if self._cikti is not None:
+            self._cikti.close()
+            self._cikti = None
+        if self._tracemalloc_baslatildi:
+            tracemalloc.stop()
+            self._tracemalloc_baslatildi = False
+
+
+def baslat(dosya=None, bellek=False, profil=None, giris=None):
+    """Süreç genelindeki etkin ölçeri kurar (öncekini kapatır) ve döndürür"""
+    global _etkin
+    if _etkin is not None:
+        _etkin.kapat()
+    _etkin = AsamaOlcer(dosya, bellek, profil, giris)
+    return _etkin
+
+
+def bitir(ozet=True):
+    """Etkin ölçerin özetini yazdırır ve kapatır (ölçüm açık değilse bir şey yapmaz)"""
+    global _etkin
+    if _etkin is None:
+        return
+    olcer, _etkin = _etkin, None
+    if ozet:
+        olcer.ozet_yazdir()
+    olcer.kapat()
+
+
+def etkin_olcer():
+    """Etkin AsamaOlcer (ölçüm kapalıysa None)"""
+    return _etkin
+
+
+def olc(asama, **etiketler):
+    """Etkin ölçerle aşamayı ölçen bağlam (ölçüm kapalıysa boş bağlam)"""
+    if _etkin is None:
+        return contextlib.nullcontext()
+    return _etkin.olc(asama, **etiketler)
+
+
+def olculen(asama, **etiketler):
+    """Fonksiyonun her çağrısını asama adıyla ölçen dekoratör"""
+    def dekorator(fonksiyon):
+        @functools.wraps(fonksiyon)
+        def sarmalayici(*args, **kwargs):
+            if _etkin is None:
+                return fonksiyon(*args, **kwargs)
+            with _etkin.olc(asama, **etiketler):
+                return fonksiyon(*args, **kwargs)
+        return sarmalayici
+    return dekorator
+
+
+def arguman_ekle(parser):
+    """--olcum, --olcum-bellek ve --profil seçeneklerini ayrıştırıcıya ekler"""
+    parser.add_argument('--olcum', nargs='?', const=OLCUM_DOSYASI, default=None, metavar='DOSYA',
+                        help=f"Aşama süre/CPU/bellek ölçümlerini JSON satırları olarak yaz (varsayılan: {OLCUM_DOSYASI})")
+    parser.add_argument('--olcum-bellek', action='store_true',
+                        help="Aşama başına tracemalloc tepe belleğini de ölç (süreleri yavaşlatır; ölçümü de açar)")
+    parser.add_argument('--profil', default=None, metavar='ASAMA',
+                        help="Seçilen aşamayı cProfile ile profille (profil_<aşama>.prof; ölçümü de açar)")
+
+
+def argumanlardan_baslat(args, giris):
+    """arguman_ekle seçenekleri verildiyse ölçeri başlatır; verilmediyse None"""
+    if not (args.olcum or args.olcum_bellek or args.profil):
+        return None
+    return baslat(args.olcum, bellek=args.olcum_bellek, profil=args.profil, giris=giris)
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Geriye Dönük Test (Rolling-Origin Backtesting)
+
+Her SKU serisi için tahmincileri (naif, ARIMA, Prophet, LSTM) ortak bir arayüzle
+kayan başlangıç noktalı (rolling-origin) değerlendirmeden geçirir ve SKU, tahminci
+ve ufuk (1..ufuk gün) başına MAE/MAPE tablosu üretir.
+
+- Eğitim penceresi 'genisleyen' (başlangıçtan kökene kadar) ya da 'kayan'
+  (kökten önceki sabit uzunlukta pencere) olabilir.
+- Kökler (katlar) ardışık parçalara bölünür; her (SKU, tahminci, parça) bir
+  görevdir ve süreç havuzunda paralel çalışır. Parçanın ilk kökünde model
+  eğitilir, sonraki köklerde destekleyen tahminciler eğitilmiş durumu yeniden
+  kullanır (ARIMA: extend / aynı parametrelerle filtreleme; LSTM: aynı
+  ağırlıklarla yeni pencere; Prophet: önceki parametrelerden sıcak başlangıç). Tahminler hiçbir zaman kökten sonraki veriyi görmez.
+
+Kullanım:
+    python geriye_donuk_test.py --tahminci naif,arima --kat-sayisi 10 --islem-sayisi 4
+"""
+
+import argparse
+import sys
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+HATA_SUTUNLARI = ['MODEL', 'KAPASITE', 'TAHMINCI', 'KOKEN', 'UFUK', 'GERCEK', 'TAHMIN']
+PENCERE_TURLERI = ('genisleyen', 'kayan')
+
+
+class Tahminci:
+    """Ortak tahminci arayüzü
+
+    egit(tarihler, fiyatlar) bir durum döndürür; guncelle(durum, tarihler,
+    fiyatlar, yeni_sayisi) yeni gözlemler eklenmiş eğitim penceresi için durumu
+    günceller (varsayılan: yeniden eğitir); tahmin(durum, ufuk) ufuk uzunluklu
+    dizi döndürür. en_az_gozlem, eğitim penceresinin en kısa uzunluğudur.
+    """
+
+    en_az_gozlem = 2
+
+    def egit(self, tarihler, fiyatlar):
+        raise NotImplementedError
+
+    def guncelle(self, durum, tarihler, fiyatlar, yeni_sayisi):
+        return self.egit(tarihler, fiyatlar)
+
+    def tahmin(self, durum, ufuk):
+        raise NotImplementedError
+
+
+class NaifTahminci(Tahminci):
+    """Son gözlemi tüm ufuklar için tekrarlar"""
+
+    def egit(self, tarihler, fiyatlar):
+        return fiyatlar[-1]
+
+    def tahmin(self, durum, ufuk):
+        return np.full(ufuk, durum)
+
+
+class ArimaTahminci(Tahminci):
+    """ARIMA; güncellemede parametreler yeniden kestirilmez"""
+
+    en_az_gozlem = 30
+
+    def __init__(self, order=(1, 1, 1)):
+        self.order = tuple(order)
+
+    def egit(self, tarihler, fiyatlar):
+        from statsmodels.tsa.arima.model import ARIMA
+
+        return {'sonuc': ARIMA(fiyatlar, order=self.order).fit(), 'n': len(fiyatlar)}
+
+    def guncelle(self, durum, tarihler, fiyatlar, yeni_sayisi):
+        from statsmodels.tsa.arima.model import ARIMA
+
+        if len(fiyatlar) == durum['n'] + yeni_sayisi:
+            sonuc = durum['sonuc'].extend(fiyatlar[-yeni_sayisi:])  # Genişleyen pencere
+        else:
+            sonuc = ARIMA(fiyatlar, order=self.order).filter(durum['sonuc'].params)  # Kayan pencere
+        return {'sonuc': sonuc, 'n': len(fiyatlar)}
+
+    def tahmin(self, durum, ufuk):
+        return np.asarray(durum['sonuc'].forecast(steps=ufuk))
+
+
+class ProphetTahminci(Tahminci):
+    """Prophet (TR tatilleri, MAP); her kökte önceki kökün parametrelerinden yeniden eğitilir"""
+
+    en_az_gozlem = 30
+
+    def __init__(self):
+        self._arka_ucu = None
+
+    def _arka(self):
+        if self._arka_ucu is None:
+            from prophet_hizli import ProphetArkaUcu
+            self._arka_ucu = ProphetArkaUcu(sicak_baslangic=False, ayrintili=False)
+        return self._arka_ucu
+
+    def egit(self, tarihler, fiyatlar):
+        return self._arka().egit('kok', tarihler, fiyatlar)
+
+    def guncelle(self, durum, tarihler, fiyatlar, yeni_sayisi):
+        from prophet_hizli import sicak_baslangic_parametreleri
+
+        return self._arka().egit('kok', tarihler, fiyatlar, baslangic=sicak_baslangic_parametreleri(durum))
+
+    def tahmin(self, durum, ufuk):
+        return self._arka().tahmin_et(durum, ufuk)['yhat'].to_numpy()
+
+
+class LstmTahminci(Tahminci):
+    """Doğrudan çok ufuklu LSTM; güncellemede aynı ağırlıklarla yeni pencere kullanılır"""
+
+    def __init__(self, pencere=60, ufuk=30, epochs=20):
+        self.pencere, self.ufuk, self.epochs = pencere, ufuk, epochs
+        self.en_az_gozlem = pencere + ufuk + 30
+
+    def egit(self, tarihler, fiyatlar):
+        from lstm_tahmin import lstm_agi_olustur, tahminci_olustur
+        from pencereleme import pencereler
+
+        alt, ust = fiyatlar.min(), fiyatlar.max()
+        olcek = max(ust - alt, 1e-9)
+        olcekli = (fiyatlar - alt) / olcek
+        X, y = pencereler(olcekli, self.pencere, ufuk=self.ufuk)
+        model = lstm_agi_olustur(self.pencere, self.ufuk)
+        model.compile(optimizer='adam', loss='mean_squared_error')
+        model.fit(X[..., np.newaxis], y, batch_size=32, epochs=self.epochs, verbose=0)
+        return {'tahminci': tahminci_olustur(model, 'dogrudan', self.ufuk), 'alt': alt, 'olcek': olcek,
+                'son': olcekli[-self.pencere:]}
+
+    def guncelle(self, durum, tarihler, fiyatlar, yeni_sayisi):
+        return dict(durum, son=(fiyatlar[-self.pencere:] - durum['alt']) / durum['olcek'])
+
+    def tahmin(self, durum, ufuk):
+        from lstm_tahmin import son_pencereler
+
+        tahmin = durum['tahminci'](son_pencereler([durum['son']], self.pencere))[0][:ufuk]
+        return tahmin * durum['olcek'] + durum['alt']
+
+
+TAHMINCILER = {
+    'naif': NaifTahminci,
+    'arima': ArimaTahminci,
+    'prophet': ProphetTahminci,
+    'lstm': LstmTahminci,
+}
+
+
+def kokleri_olustur(n, ufuk=30, kat_sayisi=10, adim=7, en_az_gozlem=2):
+    """Serinin sonundan geriye kat_sayisi köken (eğitim uzunluğu) üretir; kısa olanlar atılır"""
+    son = n - ufuk
+    return [k for k in range(son - (kat_sayisi - 1) * adim, son + 1, adim) if k >= en_az_gozlem]
+
+
+def kat_parcasi_degerlendir(gorev):
+    """Süreç havuzu işçisi: bir (SKU, tahminci) için ardışık kökleri değerlendirir
+
+    gorev: (model, kapasite, tarihler, fiyatlar, tahminci_adi, kokler, ufuk,
+    pencere_turu, pencere_uzunlugu). (hata satırları, durum) döndürür; hata
+    oluşursa o ana kadarki satırlar korunur.
+    """
+    model, kapasite, tarihler, fiyatlar, tahminci_adi, kokler, ufuk, pencere_turu, pencere_uzunlugu = gorev
+    warnings.filterwarnings('ignore')
+    tahminci = TAHMINCILER[tahminci_adi]()
+    satirlar, durum, onceki = [], None, None
+    baslangic = time.perf_counter()
+    hata = ''
+    try:
+        for koken in kokler:
+            ilk = max(0, koken - pencere_uzunlugu) if pencere_turu == 'kayan' else 0
+            egitim_tarihleri, egitim = tarihler[ilk:koken], fiyatlar[ilk:koken]
+            if durum is None:
+                durum = tahminci.egit(egitim_tarihleri, egitim)
+            else:
+                durum = tahminci.guncelle(durum, egitim_tarihleri, egitim, koken - onceki)
+            onceki = koken
+            tahmin = tahminci.tahmin(durum, ufuk)
+            gercek = fiyatlar[koken:koken + ufuk]
+            satirlar.extend(
+                (model, kapasite, tahminci_adi, koken, u + 1, gercek[u], tahmin[u]) for u in range(len(gercek))
+            )
+    except Exception as e:
+        hata = f"{type(e).__name__}: {e}"
+    return satirlar, {'MODEL': model, 'KAPASITE': kapasite, 'TAHMINCI': tahminci_adi, 'KAT': len(kokler),
+                      'SURE_SN': time.perf_counter() - baslangic, 'HATA': hata}
+
+
+def hata_ozeti(hatalar):
+    """Hata satırlarından SKU, tahminci ve ufuk başına MAE/MAPE tablosu üretir"""
+    mutlak = (hatalar['GERCEK'] - hatalar['TAHMIN']).abs()
+    hatalar = hatalar.assign(MAE=mutlak, MAPE=mutlak / hatalar['GERCEK'].abs() * 100)
+    return (hatalar.groupby(['MODEL', 'KAPASITE', 'TAHMINCI', 'UFUK'], observed=True, sort=True)
+            .agg(KAT=('KOKEN', 'nunique'), MAE=('MAE', 'mean'), MAPE=('MAPE', 'mean'))
+            .reset_index())
+
+
+def geriye_donuk_test(seriler, tahminciler=('naif', 'arima'), ufuk=30, kat_sayisi=10, adim=7,
+                      pencere_turu='genisleyen', pencere_uzunlugu=365, parca_sayisi=2, islem_sayisi=None):
+    """Tüm seriler ve tahminciler için rolling-origin değerlendirmesi
+
+    seriler: {(model, kapasite): TARIH indeksli pd.Series} (tahmin_havuzu.sku_serileri).
+    Kökler parca_sayisi ardışık parçaya bölünür; parça başında model yeniden
+    eğitilir. (ozet, hatalar, durum) döndürür: ozet hata_ozeti tablosu, hatalar
+    köken/ufuk düzeyindeki satırlar, durum görev başına süre ve hata mesajı.
+    """
+    bilinmeyen = [t for t in tahminciler if t not in TAHMINCILER]
+    if bilinmeyen:
+        raise ValueError(f"Bilinmeyen tahminci: {bilinmeyen} (seçenekler: {', '.join(TAHMINCILER)})")
+    if pencere_turu not in PENCERE_TURLERI:
+        raise ValueError(f"Bilinmeyen pencere türü: '{pencere_turu}' (seçenekler: {', '.join(PENCERE_TURLERI)})")
+
+    gorevler = []
+    for (model, kapasite), seri in seriler.items():
+        tarihler, fiyatlar = seri.index.to_numpy(), seri.to_numpy(np.float64)
+        for adi in tahminciler:
+            kokler = kokleri_olustur(len(fiyatlar), ufuk, kat_sayisi, adim, TAHMINCILER[adi]().en_az_gozlem)
+            for parca in np.array_split(np.array(kokler, dtype=int), min(parca_sayisi, len(kokler)) or 1):
+                if len(parca):
+                    gorevler.append((model, kapasite, tarihler, fiyatlar, adi, parca.tolist(), ufuk,
+                                     pencere_turu, pencere_uzunlugu))
+
+    if islem_sayisi == 1 or len(gorevler) <= 1:
+        sonuclar = list(map(kat_parcasi_degerlendir, gorevler))
+    else:
+        with ProcessPoolExecutor(max_workers=islem_sayisi) as havuz:
+            sonuclar = list(havuz.map(kat_parcasi_degerlendir, gorevler, chunksize=1))
+
+    hatalar = pd.DataFrame([s for satirlar, _ in sonuclar for s in satirlar], columns=HATA_SUTUNLARI)
+    durum = pd.DataFrame([d for _, d in sonuclar])
+    return hata_ozeti(hatalar), hatalar, durum
+
+
+def sonuc_raporu_yazdir(ozet, durum, toplam_sure):
+    """Tahminci başına genel MAE/MAPE, SKU başına en iyi tahminci ve hataları yazdırır"""
+    print(f"\n🧪 Geriye Dönük Test Sonuçları")
+    genel = ozet.groupby('TAHMINCI')[['MAE', 'MAPE']].mean().sort_values('MAE')
+    for tahminci, satir in genel.iterrows():
+        print(f"  📊 {tahminci}: MAE {satir['MAE']:,.0f} TL, MAPE %{satir['MAPE']:.2f}")
+
+    print(f"\n🏆 SKU Başına En İyi Tahminci (tüm ufuklar ortalaması):")
+    sku_ozet = ozet.groupby(['MODEL', 'KAPASITE', 'TAHMINCI'], observed=True)['MAE'].mean().reset_index()
+    for (model, kapasite), grup in sku_ozet.groupby(['MODEL', 'KAPASITE'], observed=True):
+        en_iyi = grup.loc[grup['MAE'].idxmin()]
+        print(f"  📱 {model} {kapasite}: {en_iyi['TAHMINCI']} (MAE {en_iyi['MAE']:,.0f} TL)")
+
+    for d in durum[durum['HATA'] != ''].itertuples(index=False):
+        print(f"  ❌ {d.MODEL} {d.KAPASITE} [{d.TAHMINCI}]: {d.HATA}")
+    print(f"  🧮 {len(durum)} görev, görev süreleri toplamı {durum['SURE_SN'].sum():.2f} sn, "
+          f"{toplam_sure:.2f} sn (duvar saati)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='SKU bazlı rolling-origin geriye dönük test')
+    parser.add_argument('--tahminci', default='naif,arima', help=f"Virgülle ayrılmış ({', '.join(TAHMINCILER)})")
+    parser.add_argument('--pencere', choices=PENCERE_TURLERI, default='genisleyen', help='Eğitim penceresi türü')
+    parser.add_argument('--pencere-uzunlugu', type=int, default=365, help="Kayan pencere uzunluğu (gün)")
+    parser.add_argument('--ufuk', type=int, default=30)
+    parser.add_argument('--kat-sayisi', type=int, default=10, help='Köken (kat) sayısı')
+    parser.add_argument('--adim', type=int, default=7, help='Kökenler arası gün')
+    parser.add_argument('--parca-sayisi', type=int, default=2, help='Köken parçası sayısı (parça başında yeniden eğitim)')
+    parser.add_argument('--islem-sayisi', type=int, default=None, help='İşçi süreç sayısı (varsayılan: CPU sayısı)')
+    parser.add_argument('-o', '--cikti', default='geriye_donuk_test.csv', help='SKU/tahminci/ufuk MAE-MAPE tablosu')
+    parser.add_argument('--csv', default='profesyonel_telefon_verileri2.csv', help='Parquet yoksa okunacak CSV')
+    args = parser.parse_args(argv)
+
+    from tahmin_havuzu import sku_serileri
+    from veri_semasi import SERI_SUTUNLARI, veri_setini_yukle
+
+    seriler = sku_serileri(veri_setini_yukle(args.csv, sutunlar=SERI_SUTUNLARI))
+    baslangic = time.perf_counter()
+    try:
+        ozet, _, durum = geriye_donuk_test(
+            seriler, [t.strip() for t in args.tahminci.split(',')], args.ufuk, args.kat_sayisi, args.adim,
+            args.pencere, args.pencere_uzunlugu, args.parca_sayisi, args.islem_sayisi)
+    except ValueError as e:
+        parser.error(str(e))
+    sonuc_raporu_yazdir(ozet, durum, time.perf_counter() - baslangic)
+    ozet.to_csv(args.cikti, index=False)
+    print(f"💾 {len(ozet)} satır: {args.cikti}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
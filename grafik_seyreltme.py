@@ -0,0 +1,120 @@
+"""
+Grafik Seyreltme (LTTB ve Min/Maks Zarfı)
+
+Fiyat grafiklerindeki her iz, tarayıcıya gönderilmeden önce sabit bir nokta
+bütçesine indirilir. Böylece grafik boyutu ve çizim süresi geçmiş uzadıkça
+değil, iz sayısıyla büyür. Seyreltilmiş izler WebGL ile çizilir (Scattergl).
+
+Yöntemler:
+    lttb  - Largest-Triangle-Three-Buckets. İlk ve son nokta korunur; aradaki
+            noktalar hedef-2 kovaya bölünür. Her kovadan, önceki seçilen nokta
+            ve sonraki kovanın ortalamasıyla en büyük üçgeni oluşturan nokta
+            seçilir. Çizginin görsel biçimi (tepeler, dipler) korunur.
+    zarf  - Min/maks zarfı: her kovadan en küçük ve en büyük nokta (zaman
+            sırasıyla). Kampanya dipleri gibi tek günlük uç değerler kesin korunur.
+
+Bütçeden kısa seriler olduğu gibi döner (eksik fiyatlar grafikte boşluk olur).
+Uzun serilerde eksik (NaN) fiyatlı ve tarihsiz (NaT) noktalar kovalara
+bölünmeden önce atılır; dönen indeksler özgün seriye göredir.
+"""
+
+import numpy as np
+
+NOKTA_BUTCESI = 1000  # İz başına en çok nokta (tipik grafik genişliği piksel mertebesinde)
+YONTEMLER = ('lttb', 'zarf')
+
+
+def _sayisal(x):
+    """Tarih ya da sayı dizisini float64'e çevirir (tarihler nanosaniye)"""
+    x = np.asarray(x)
+    if x.dtype.kind == 'M':
+        return x.astype('datetime64[ns]').astype(np.int64).astype(np.float64)
+    return x.astype(np.float64)
+
+
+def _gecerli_indeksler(y, x=None):
+    """Sonlu y (ve varsa NaT/NaN olmayan x) noktalarının indeksleri; hepsi geçerliyse None"""
+    gecerli = np.isfinite(y)
+    if x is not None:
+        gecerli &= ~np.isnat(x) if x.dtype.kind == 'M' else np.isfinite(x.astype(np.float64))
+    return None if gecerli.all() else np.flatnonzero(gecerli)
+
+
+def lttb(x, y, hedef=NOKTA_BUTCESI):
+    """LTTB ile seçilen noktaların indeksleri (artan sırada, en çok hedef adet)"""
+    n = len(y)
+    if hedef >= n or hedef < 3:
+        return np.arange(n)
+    x, y = np.asarray(x), np.asarray(y, dtype=np.float64)
+    gecerli = _gecerli_indeksler(y, x)
+    if gecerli is not None:
+        return gecerli[lttb(x[gecerli], y[gecerli], hedef)]
+    x = _sayisal(x)
+
+    # hedef-2 kova: [sinirlar[i], sinirlar[i+1]); son sınır son noktadır
+    sinirlar = (np.arange(hedef - 1) * ((n - 2) / (hedef - 2))).astype(np.intp) + 1
+    sinirlar[-1] = n - 1
+    # Sonraki kovanın ortalamaları kümülatif toplamlardan (son kova için son nokta)
+    toplam_x = np.concatenate(([0.0], np.cumsum(x)))
+    toplam_y = np.concatenate(([0.0], np.cumsum(y)))
+    sonraki_bas = np.append(sinirlar[1:], n - 1)
+    sonraki_son = np.append(sinirlar[2:], [n, n])
+    uzunluk = sonraki_son - sonraki_bas
+    ortalama_x = (toplam_x[sonraki_son] - toplam_x[sonraki_bas]) / uzunluk
+    ortalama_y = (toplam_y[sonraki_son] - toplam_y[sonraki_bas]) / uzunluk
+
+    secilen = np.empty(hedef, dtype=np.intp)
+    secilen[0], secilen[-1] = 0, n - 1
+    a = 0
+    for i in range(hedef - 2):
+        bas, son = sinirlar[i], sinirlar[i + 1]
+        # Üçgen alanının iki katı (sabit çarpan seçimi etkilemez)
+        alan = np.abs((x[a] - ortalama_x[i]) * (y[bas:son] - y[a])
+                      - (x[a] - x[bas:son]) * (ortalama_y[i] - y[a]))
+        a = bas + int(alan.argmax())
+        secilen[i + 1] = a
+    return secilen
+
+
+def minmax_zarf(y, hedef=NOKTA_BUTCESI):
+    """Her kovanın en küçük ve en büyük noktasının indeksleri (artan sırada, en çok hedef adet)"""
+    n = len(y)
+    if hedef >= n or hedef < 4:
+        return np.arange(n)
+    y = np.asarray(y, dtype=np.float64)
+    gecerli = _gecerli_indeksler(y)
+    if gecerli is not None:
+        return gecerli[minmax_zarf(y[gecerli], hedef)]
+    # Yalnızca son kovanın dolgusu NaN'dır; her kovada en az bir gerçek nokta vardır
+    boy = -(-n // ((hedef - 2) // 2))  # İlk ve son nokta ayrıca eklenir
+    kova = -(-n // boy)
+    bloklar = np.full(kova * boy, np.nan)
+    bloklar[:n] = y
+    bloklar = bloklar.reshape(kova, boy)
+    baslar = np.arange(kova) * boy
+    return np.unique(np.concatenate((np.nanargmin(bloklar, axis=1) + baslar,
+                                     np.nanargmax(bloklar, axis=1) + baslar, [0, n - 1])))
+
+
+def secilen_indeksler(x, y, hedef=NOKTA_BUTCESI, yontem='lttb'):
+    """Seçilen yöntemle hedef bütçeye inen nokta indeksleri"""
+    if yontem not in YONTEMLER:
+        raise ValueError(f"Bilinmeyen seyreltme yöntemi: '{yontem}' (seçenekler: {', '.join(YONTEMLER)})")
+    return lttb(x, y, hedef) if yontem == 'lttb' else minmax_zarf(y, hedef)
+
+
+def seyrelt_tablo(tablo, x='TARIH', y='FIYAT', hedef=NOKTA_BUTCESI, yontem='lttb'):
+    """x'e göre sıralı tablonun seyreltilmiş satırları (iloc dilimi)"""
+    if len(tablo) <= hedef:
+        return tablo
+    fiyatlar = tablo[y].to_numpy(np.float64, na_value=np.nan)  # Nullable sütunlarda pd.NA -> NaN
+    return tablo.iloc[secilen_indeksler(tablo[x].to_numpy(), fiyatlar, hedef, yontem)]
+
+
+def seyreltilmis_iz(x, y, hedef=NOKTA_BUTCESI, yontem='lttb', **ayarlar):
+    """Seyreltilmiş noktalarla WebGL çizgi izi (go.Scattergl); ayarlar ize aynen geçer"""
+    import plotly.graph_objects as go
+
+    x, y = np.asarray(x), np.asarray(y)
+    indeksler = secilen_indeksler(x, y, hedef, yontem)
+    return go.Scattergl(x=x[indeksler], y=y[indeksler], **ayarlar)
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Hiyerarşik Tahmin ve Uzlaştırma (MODEL → KAPASITE)
+
+Toplam pazar, her model ve her SKU için temel tahminler tek geçişte üretilir,
+ardından toplama matrisi S ile uzlaştırılır; uzlaştırılmış tahminlerde her üst
+düğüm alt düğümlerinin ortalamasına eşittir (fiyatlar toplanmaz, ortalanır; S'nin
+satırları alt serilerin eşit ağırlıklı ortalamasıdır).
+
+Uzlaştırma yöntemleri (ỹ = S G ŷ, tüm ufuklar tek matris çarpımında):
+    alttan  - bottom-up: SKU tahminleri yukarı toplanır
+    usttan  - top-down: toplam tahmini geçmiş oranlarla SKU'lara dağıtılır
+    mint    - MinT: G = (Sᵀ W⁻¹ S)⁻¹ Sᵀ W⁻¹, W örneklem içi artıkların
+              küçültülmüş (shrinkage) kovaryansı
+
+Temel tahmin yöntemleri: 'naif' (son değer; tüm düğümler tek vektörel işlemde)
+ve 'arima' (düğüm başına ARIMA(1,1,1), süreç havuzunda tek map çağrısı).
+
+Hiyerarşi seviyeleri sütun listesidir (varsayılan MODEL, KAPASITE); ör. bir
+satıcı sütunu eklendiğinde S ve uzlaştırma değişmeden büyür.
+
+Kullanım:
+    python hiyerarsik_tahmin.py --temel arima --yontem mint --ufuk 30 -o hiyerarsik_tahminler.csv
+"""
+
+import argparse
+import sys
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+SEVIYELER = ('MODEL', 'KAPASITE')
+TEMEL_YONTEMLER = ('naif', 'arima')
+UZLASTIRMA_YONTEMLERI = ('alttan', 'usttan', 'mint')
+TOPLAM = 'TOPLAM'
+EN_AZ_GUN = 30
+
+
+def alt_seri_paneli(df, seviyeler=SEVIYELER):
+    """En alt seviye serilerini günlük takvimde tek panelde toplar
+
+    (anahtarlar, tarihler, Y) döndürür: anahtarlar sıralı alt seri anahtarları
+    (tuple), tarihler ortak günlük takvim, Y (alt seri x gün) günlük ortalama
+    fiyat matrisi. Seri başlamadan önceki günler NaN'dır; aradaki boş günler
+    önceki fiyatla doldurulur.
+    """
+    gunluk = df.groupby(list(seviyeler) + ['TARIH'], observed=True, sort=True)['FIYAT'].mean().unstack('TARIH')
+    tarihler = pd.date_range(gunluk.columns.min(), gunluk.columns.max(), freq='D')
+    panel = gunluk.reindex(columns=tarihler).ffill(axis=1)
+    anahtarlar = [a if isinstance(a, tuple) else (a,) for a in panel.index]
+    return anahtarlar, tarihler, panel.to_numpy(np.float64)
+
+
+def toplama_matrisi(anahtarlar):
+    """Hiyerarşi düğümlerini ve ortalama toplama matrisi S'yi döndürür
+
+    Düğümler seviye sırasıyladır: toplam (boş tuple), her önek grubu, en son alt
+    seriler. S (düğüm x alt seri); her satır, düğümün alt serilerine eşit ağırlık
+    verir ve satır toplamı 1'dir. Son len(anahtarlar) satır birim matristir.
+    """
+    anahtarlar = [tuple(a) for a in anahtarlar]
+    derinlik = len(anahtarlar[0])
+    dugumler, bloklar = [], []
+    for seviye in range(derinlik + 1):
+        onekler = [a[:seviye] for a in anahtarlar]
+        gruplar = list(dict.fromkeys(onekler))
+        grup_no = {grup: no for no, grup in enumerate(gruplar)}
+        satirlar = np.fromiter((grup_no[o] for o in onekler), dtype=np.int64, count=len(onekler))
+        blok = np.zeros((len(gruplar), len(anahtarlar)))
+        blok[satirlar, np.arange(len(anahtarlar))] = 1.0
+        bloklar.append(blok / blok.sum(axis=1, keepdims=True))
+        dugumler.extend(gruplar)
+    return dugumler, np.vstack(bloklar)
+
+
+def dugum_gecmisi(S, Y):
+    """Her düğümün geçmişi: mevcut alt serilerin (NaN olmayan) ağırlıklı ortalaması"""
+    mevcut = ~np.isnan(Y)
+    pay = S @ np.where(mevcut, Y, 0.0)
+    payda = S @ mevcut
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(payda > 0, pay / payda, np.nan)
+
+
+def naif_temel(H, ufuk):
+    """Son değer tahmini ve bir adım artıkları (fark), tüm düğümler için vektörel"""
+    tahmin = np.repeat(H[:, -1:], ufuk, axis=1)
+    artiklar = np.full_like(H, np.nan)
+    artiklar[:, 1:] = np.diff(H, axis=1)
+    return tahmin, artiklar
+
+
+def isci_hazirla():
+    """İşçi başlatıcı: statsmodels bir kez içe aktarılır"""
+    import statsmodels.tsa.arima.model  # noqa: F401 - içe aktarılırken uyarı filtrelerini değiştirir
+    warnings.filterwarnings('ignore')
+
+
+def dugum_arima(gorev):
+    """Süreç havuzu işçisi: (no, fiyatlar, ufuk) için (no, tahmin, artıklar, hata) döndürür"""
+    no, fiyatlar, ufuk = gorev
+    try:
+        from statsmodels.tsa.arima.model import ARIMA
+
+        sonuc = ARIMA(fiyatlar, order=(1, 1, 1)).fit()
+        # d=1 iken ilk artık seviyenin kendisidir; atılır
+        return no, np.asarray(sonuc.forecast(steps=ufuk)), np.asarray(sonuc.resid)[1:], ''
+    except Exception as e:
+        return no, None, None, f"{type(e).__name__}: {e}"
+
+
+def arima_temel(H, ufuk, islem_sayisi=None):
+    """Düğüm başına ARIMA(1,1,1); hata veren ya da kısa düğümler naif tahmine düşer
+
+    (tahmin, artıklar, hatalar) döndürür; hatalar {düğüm no: mesaj}.
+    """
+    tahmin, artiklar = naif_temel(H, ufuk)
+    hatalar = {}
+    gorevler = []
+    for no, gecmis in enumerate(H):
+        fiyatlar = gecmis[~np.isnan(gecmis)]
+        if len(fiyatlar) < EN_AZ_GUN:
+            hatalar[no] = f"{len(fiyatlar)} gün (< {EN_AZ_GUN}), naif tahmin kullanıldı"
+        else:
+            gorevler.append((no, fiyatlar, ufuk))
+
+    if islem_sayisi == 1 or len(gorevler) <= 1:
+        isci_hazirla()
+        sonuclar = list(map(dugum_arima, gorevler))
+    else:
+        with ProcessPoolExecutor(max_workers=islem_sayisi, initializer=isci_hazirla) as havuz:
+            sonuclar = list(havuz.map(dugum_arima, gorevler, chunksize=4))
+
+    for no, dugum_tahmini, dugum_artiklari, hata in sonuclar:
+        if hata:
+            hatalar[no] = f"{hata}, naif tahmin kullanıldı"
+            continue
+        tahmin[no] = dugum_tahmini
+        artiklar[no] = np.nan
+        artiklar[no, H.shape[1] - len(dugum_artiklari):] = dugum_artiklari
+    return tahmin, artiklar, hatalar
+
+
+def kucultulmus_kovaryans(artiklar):
+    """Artıkların köşegene doğru küçültülmüş kovaryansı (Schäfer-Strimmer, MinT-shrink)
+
+    artiklar (gözlem x düğüm), NaN içermemelidir. (W, lambda) döndürür.
+    """
+    n = len(artiklar)
+    kovaryans = artiklar.T @ artiklar / n
+    varyans = np.diag(kovaryans).copy()
+    varyans[varyans <= 0] = np.finfo(float).tiny
+    olcekli = artiklar / np.sqrt(varyans)
+    korelasyon = olcekli.T @ olcekli / n
+    v = ((olcekli ** 2).T @ (olcekli ** 2) - (olcekli.T @ olcekli) ** 2 / n) / (n * (n - 1))
+    np.fill_diagonal(v, 0.0)
+    d = korelasyon ** 2
+    np.fill_diagonal(d, 0.0)
+    lam = float(np.clip(v.sum() / d.sum(), 0.0, 1.0)) if d.sum() > 0 else 1.0
+    W = lam * np.diag(varyans) + (1 - lam) * kovaryans
+    return W, lam
+
+
+def uzlastirma_matrisi(S, yontem, H=None, artiklar=None):
+    """Uzlaştırma matrisi G (alt seri x düğüm); uzlaştırılmış tahmin S @ G @ ŷ
+
+    usttan yöntemi düğüm geçmişi H'yi (oranlar için), mint yöntemi artıkları
+    (düğüm x gün) kullanır. mint için tüm düğümlerin artığı olan ortak günler
+    alınır; ek bilgi olarak küçültme katsayısı döner.
+    """
+    n_dugum, n_alt = S.shape
+    G = np.zeros((n_alt, n_dugum))
+    bilgi = {}
+    if yontem == 'alttan':
+        G[:, n_dugum - n_alt:] = np.eye(n_alt)
+    elif yontem == 'usttan':
+        # Alt serilerin toplam içindeki ortalama geçmiş oranı; S'nin toplam satırıyla 1'e normalize
+        with np.errstate(invalid='ignore', divide='ignore'):
+            oranlar = np.nanmean(H[n_dugum - n_alt:] / H[0], axis=1)
+        G[:, 0] = oranlar / (S[0] @ oranlar)
+    elif yontem == 'mint':
+        ortak = ~np.isnan(artiklar).any(axis=0)
+        if ortak.sum() < 2:
+            raise ValueError("MinT için tüm düğümlerde ortak artık günü yok")
+        W, bilgi['lambda'] = kucultulmus_kovaryans(artiklar[:, ortak].T)
+        W += np.eye(n_dugum) * 1e-9 * np.mean(np.diag(W))  # sabit seriler için tekillik önlemi
+        WS = np.linalg.solve(W, S)  # W⁻¹ S
+        G = np.linalg.solve(S.T @ WS, WS.T)
+        bilgi['ortak_gun'] = int(ortak.sum())
+    else:
+        raise ValueError(f"Bilinmeyen uzlaştırma yöntemi: '{yontem}' (seçenekler: {', '.join(UZLASTIRMA_YONTEMLERI)})")
+    return G, bilgi
+
+
+def hiyerarsik_tahmin(df, temel='naif', yontem='mint', ufuk=30, islem_sayisi=None, seviyeler=SEVIYELER):
+    """Tüm hiyerarşi için temel ve uzlaştırılmış tahminleri üretir
+
+    (tahminler, bilgi) döndürür. tahminler: SEVIYE, seviye sütunları, TARIH, TEMEL,
+    UZLASTIRILMIS sütunlu düzenli tablo (toplam satırlarında seviye sütunları
+    boştur). bilgi: düğüm/alt seri sayısı, temel tahmin hataları, süreler ve
+    tutarlılık hatası.
+    """
+    if temel not in TEMEL_YONTEMLER:
+        raise ValueError(f"Bilinmeyen temel yöntem: '{temel}' (seçenekler: {', '.join(TEMEL_YONTEMLER)})")
+    if yontem not in UZLASTIRMA_YONTEMLERI:
+        raise ValueError(f"Bilinmeyen uzlaştırma yöntemi: '{yontem}' (seçenekler: {', '.join(UZLASTIRMA_YONTEMLERI)})")
+
+    anahtarlar, tarihler, Y = alt_seri_paneli(df, seviyeler)
+    dugumler, S = toplama_matrisi(anahtarlar)
+    H = dugum_gecmisi(S, Y)
+
+    baslangic = time.perf_counter()
+    if temel == 'naif':
+        temel_tahmin, artiklar = naif_temel(H, ufuk)
+        hatalar = {}
+    else:
+        temel_tahmin, artiklar, hatalar = arima_temel(H, ufuk, islem_sayisi)
+    temel_sure = time.perf_counter() - baslangic
+
+    baslangic = time.perf_counter()
+    G, bilgi = uzlastirma_matrisi(S, yontem, H=H, artiklar=artiklar)
+    uzlastirilmis = S @ (G @ temel_tahmin)
+    uzlastirma_sure = time.perf_counter() - baslangic
+
+    gelecek = pd.date_range(tarihler[-1] + pd.Timedelta(days=1), periods=ufuk, freq='D')
+    seviye_adlari = [TOPLAM] + list(seviyeler)
+    tahminler = pd.DataFrame({
+        'SEVIYE': np.repeat([seviye_adlari[len(d)] for d in dugumler], ufuk),
+        **{sutun: np.repeat([d[i] if i < len(d) else '' for d in dugumler], ufuk)
+           for i, sutun in enumerate(seviyeler)},
+        'TARIH': np.tile(gelecek, len(dugumler)),
+        'TEMEL': temel_tahmin.ravel(),
+        'UZLASTIRILMIS': uzlastirilmis.ravel(),
+    })
+    bilgi.update(
+        dugum=len(dugumler), alt_seri=len(anahtarlar), temel_sure=temel_sure, uzlastirma_sure=uzlastirma_sure,
+        hatalar={' / '.join(map(str, dugumler[no])) or TOPLAM: hata for no, hata in hatalar.items()},
+        tutarlilik_hatasi=float(np.abs(S @ uzlastirilmis[-len(anahtarlar):] - uzlastirilmis).max()),
+    )
+    return tahminler, bilgi
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='MODEL → KAPASITE hiyerarşisinde uzlaştırılmış fiyat tahmini')
+    parser.add_argument('-o', '--cikti', default='hiyerarsik_tahminler.csv', help='Tahmin tablosunun yazılacağı CSV')
+    parser.add_argument('--temel', choices=TEMEL_YONTEMLER, default='arima', help='Temel tahmin yöntemi')
+    parser.add_argument('--yontem', choices=UZLASTIRMA_YONTEMLERI, default='mint', help='Uzlaştırma yöntemi')
+    parser.add_argument('--ufuk', type=int, default=30, help='Tahmin ufku (gün)')
+    parser.add_argument('--islem-sayisi', type=int, default=None, help='İşçi süreç sayısı (varsayılan: CPU sayısı)')
+    parser.add_argument('--seviyeler', default=','.join(SEVIYELER),
+                        help='Hiyerarşi seviyeleri, üstten alta virgülle ayrılmış sütunlar')
+    parser.add_argument('--csv', default='profesyonel_telefon_verileri2.csv', help='Parquet yoksa okunacak CSV')
+    args = parser.parse_args(argv)
+
+    from veri_semasi import veri_setini_yukle
+
+    seviyeler = tuple(s.strip() for s in args.seviyeler.split(','))
+    df = veri_setini_yukle(args.csv, sutunlar=list(seviyeler) + ['TARIH', 'FIYAT'])
+    tahminler, bilgi = hiyerarsik_tahmin(df, args.temel, args.yontem, args.ufuk, args.islem_sayisi, seviyeler)
+
+    print(f"🌳 Hiyerarşi: {bilgi['dugum']} düğüm, {bilgi['alt_seri']} alt seri ({' → '.join(seviyeler)})")
+    print(f"⏱️ Temel tahmin ({args.temel}): {bilgi['temel_sure']:.2f} sn, "
+          f"uzlaştırma ({args.yontem}): {bilgi['uzlastirma_sure'] * 1000:.1f} ms")
+    if 'lambda' in bilgi:
+        print(f"📐 MinT: {bilgi['ortak_gun']} ortak artık günü, küçültme katsayısı {bilgi['lambda']:.3f}")
+    for dugum, hata in bilgi['hatalar'].items():
+        print(f"  ⚠️ {dugum}: {hata}")
+    print(f"✅ Tutarlılık hatası (üst düğüm - alt ortalama): {bilgi['tutarlilik_hatasi']:.2e} TL")
+
+    ozet = tahminler.groupby(['SEVIYE'] + list(seviyeler), sort=False)[['TEMEL', 'UZLASTIRILMIS']].mean()
+    print(f"\n📊 {args.ufuk} günlük ortalama tahminler:")
+    print(ozet.round(0).to_string())
+
+    tahminler.to_csv(args.cikti, index=False, date_format='%d.%m.%Y')
+    print(f"💾 {len(tahminler)} tahmin satırı: {args.cikti}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+"""
+Hücre Tarayıcı
+
+Fiyat takip çalışma kitabındaki hücreleri sınıflandıran ve tarihleri fiyatlarla
+eşleştiren tek geçişli tarayıcı. Hem pd.read_excel tabanlı sütun okuyucu hem de
+akışlı (openpyxl) okuyucu bu modülü kullanır.
+
+- Tüm desenler modül yüklenirken bir kez derlenir.
+- Tarih ve fiyat desenleri tek bir alternasyonda birleştirilmiştir; tipik bir hücre
+  (yalnızca tarih, yalnızca fiyat ya da gürültü) tek bir regex çağrısıyla sınıflanır.
+  Hem tarih hem fiyat içerebilecek karışık hücrelerde ikinci bir arama yapılır.
+- Model/kapasite (başlık) araması yalnızca sütunun ilk satırlarında, model henüz
+  bulunmamışken yapılır.
+- SutunTarayici, her tarihi kendi satırı dahil sonraki 5 satırdaki ilk fiyatla
+  eşleştiren küçük bir durum makinesidir.
+"""
+
+import re
+from collections import deque
+
+# Model bilgisinin aranacağı ilk satır sayısı ve tarih-fiyat eşleştirme penceresi
+MODEL_ARAMA_SATIRI = 8
+FIYAT_PENCERESI = 5
+
+# Derlenmiş desenler
+# Model ile kapasite arasında boşluk şart: aksi halde 'iphone 16 pro' geri izlemeyle 'iPhone 1' / '6gb' olur
+MODEL_KAPASITE_DESENI = re.compile(r'iphone\s*(\d+)\s+(\d+)\s*(gb|tb)?')
+MODEL_DESENI = re.compile(r'iphone\s*(\d+)')
+KAPASITE_DESENI = re.compile(r'(\d{2,})\s*(gb|tb)')
+TARIH_DESENI = re.compile(r'\d{2}\.\d{2}\.\d{4}')
+FIYAT_DESENI = re.compile(r'\d{4,}\.\d{2}')
+HUCRE_DESENI = re.compile(r'(?P<tarih>\d{2}\.\d{2}\.\d{4})|(?P<fiyat>\d{4,}\.\d{2})')
+
+
+def model_bilgisi_bul(metin):
+    """Hücre metninden (model, kapasite) çıkarır; model yoksa None döner"""
+    cell_lower = metin.lower()
+
+    # iPhone model ve kapasite pattern'lerini ara
+    iphone_full_match = MODEL_KAPASITE_DESENI.search(cell_lower)
+    if iphone_full_match:
+        capacity_unit = iphone_full_match.group(3) or "gb"
+        return f"iPhone {iphone_full_match.group(1)}", f"{iphone_full_match.group(2)}{capacity_unit}"
+
+    iphone_match = MODEL_DESENI.search(cell_lower)
+    if iphone_match:
+        kapasite_match = KAPASITE_DESENI.search(cell_lower)
+        if kapasite_match:
+            return f"iPhone {iphone_match.group(1)}", f"{kapasite_match.group(1)}{kapasite_match.group(2)}"
+        return f"iPhone {iphone_match.group(1)}", "128gb"  # Default
+
+    return None
+
+
+def hucre_siniflandir(metin):
+    """Hücredeki ilk tarihi ve ilk fiyatı döndürür: (tarih | None, fiyat metni | None)
+
+    Sonuç, tarih ve fiyat desenlerinin hücrede ayrı ayrı aranmasıyla birebir aynıdır.
+    """
+    eslesme = HUCRE_DESENI.search(metin)
+    if eslesme is None:
+        return None, None
+
+    baslangic = eslesme.start()
+    if eslesme.lastgroup == 'tarih':
+        tarih = eslesme.group()
+        # Yalnızca tarihten oluşan hücrede fiyat olamaz
+        if eslesme.end() - baslangic == len(metin):
+            return tarih, None
+        fiyat_eslesmesi = FIYAT_DESENI.search(metin, baslangic)
+        return tarih, fiyat_eslesmesi.group() if fiyat_eslesmesi else None
+
+    fiyat = eslesme.group()
+    # Tarih için en az iki nokta gerekir; daha önceki bir konumda tarih yoktur
+    if metin.count('.') < 2:
+        return None, fiyat
+    tarih_eslesmesi = TARIH_DESENI.search(metin, baslangic + 1)
+    return (tarih_eslesmesi.group() if tarih_eslesmesi else None), fiyat
+
+
+class SutunTarayici:
+    """Tek bir sütunun hücrelerini sırayla işleyen tarih-fiyat eşleştirme durum makinesi"""
+
+    __slots__ = ('model', 'kapasite', 'aktif', 'bekleyen_tarihler', 'tampon')
+
+    def __init__(self):
+        self.model = None
+        self.kapasite = None
+        self.aktif = True
+        self.bekleyen_tarihler = deque()  # (satır, tarih) - henüz fiyatı bulunmamış tarihler
+        self.tampon = []  # Model bilgisi bulunmadan önce eşleşen (tarih, fiyat) çiftleri
+
+    def hucre_isle(self, satir, metin):
+        """Boş olmayan bir hücreyi işler; yayımlanabilir (tarih, fiyat) çiftlerini döndürür"""
+        cikti = []
+        if self.model is None:
+            if satir >= MODEL_ARAMA_SATIRI:
+                # İlk satırlarda model bulunamadı: sütun kullanılmayacak
+                self.aktif = False
+                self.bekleyen_tarihler.clear()
+                self.tampon = []
+                return cikti
+            model_bilgisi = model_bilgisi_bul(metin)
+            if model_bilgisi:
+                self.model, self.kapasite = model_bilgisi
+                cikti, self.tampon = self.tampon, []
+
+        tarih, fiyat = hucre_siniflandir(metin)
+
+        bekleyen = self.bekleyen_tarihler
+        if tarih is not None:
+            bekleyen.append((satir, tarih))
+        if not bekleyen:
+            return cikti
+
+        # Penceresi dolmuş tarihler artık fiyat alamaz
+        while bekleyen and bekleyen[0][0] <= satir - FIYAT_PENCERESI:
+            bekleyen.popleft()
+        if fiyat is None or not bekleyen:
+            return cikti
+
+        fiyat = float(fiyat)
+        eslesmeler = [(t, fiyat) for _, t in bekleyen]
+        bekleyen.clear()
+        if self.model is None:
+            self.tampon.extend(eslesmeler)
+        else:
+            cikti.extend(eslesmeler)
+        return cikti
+
+
+def sutun_tara(metinler):
+    """Bir sütunun hücre metinlerini tarar: (model, kapasite, [(tarih, fiyat), ...])
+
+    metinler str() ile çevrilmiş hücre değerleridir; boş ve 'nan' hücreler atlanır.
+    Model bulunamazsa (None, None, []) döner.
+    """
+    tarayici = SutunTarayici()
+    kayitlar = []
+    for satir, metin in enumerate(metinler):
+        if not metin or metin == 'nan' or metin == 'NaN':
+            continue
+        kayitlar.extend(tarayici.hucre_isle(satir, metin))
+        if not tarayici.aktif:
+            break
+    if tarayici.model is None:
+        return None, None, []
+    return tarayici.model, tarayici.kapasite, kayitlar
@@ -0,0 +1,61 @@
+"""
+Kaynak Manifestosu
+
+Artımlı veri hazırlama için kaynak parmak izlerini tutan küçük JSON dosyası.
+Manifesto; kaynak çalışma kitabının ve özellik kataloğunun özetlerini, çıktı
+dosyasındaki sırasıyla her kaynak sütun (SKU) için kayıt sayısını, kayıt
+özetini, son görülen tarihi ve fiyat toplamını saklar.
+
+- Kaynak dosya özeti değişmemişse çalışma kitabı hiç okunmaz.
+- Sütun özeti aynıysa o sütunun çıktı satırları olduğu gibi korunur.
+- Eski kayıtlar yeni kayıtların başında aynen duruyorsa (önek özeti eşleşirse)
+  yalnızca eklenen kayıtlar türetilir; ortalama fiyat saklanan toplamdan güncellenir.
+"""
+
+import hashlib
+import json
+import os
+
+MANIFESTO_SURUMU = 1
+
+
+def dosya_ozeti(dosya, blok_boyutu=1 << 20):
+    """Dosya içeriğinin SHA-256 özetini döndürür"""
+    ozet = hashlib.sha256()
+    with open(dosya, 'rb') as f:
+        for blok in iter(lambda: f.read(blok_boyutu), b''):
+            ozet.update(blok)
+    return ozet.hexdigest()
+
+
+def kayit_ozeti(model, kapasite, tarihler, fiyatlar):
+    """Bir sütunun (model, kapasite, [(tarih, fiyat), ...]) kayıtlarının özetini döndürür
+
+    Aynı başlık ve aynı kayıt öneki her zaman aynı özeti verir; böylece
+    kayit_ozeti(..., tarihler[:n], fiyatlar[:n]) eski özetle karşılaştırılabilir.
+    """
+    ozet = hashlib.sha1(f"{model};{kapasite}".encode('utf-8'))
+    for tarih, fiyat in zip(tarihler, fiyatlar):
+        ozet.update(f"\n{tarih};{float(fiyat)!r}".encode('utf-8'))
+    return ozet.hexdigest()
+
+
+def manifesto_oku(dosya):
+    """Manifestoyu okur; dosya yoksa, bozuksa ya da sürümü farklıysa None döner"""
+    try:
+        with open(dosya, 'r', encoding='utf-8') as f:
+            manifesto = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(manifesto, dict) or manifesto.get('surum') != MANIFESTO_SURUMU:
+        return None
+    return manifesto
+
+
+def manifesto_yaz(dosya, manifesto):
+    """Manifestoyu geçici dosya üzerinden atomik olarak yazar"""
+    manifesto = dict(manifesto, surum=MANIFESTO_SURUMU)
+    gecici = f"{dosya}.tmp"
+    with open(gecici, 'w', encoding='utf-8') as f:
+        json.dump(manifesto, f, ensure_ascii=False, indent=2)
+    os.replace(gecici, dosya)
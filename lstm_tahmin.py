@@ -0,0 +1,91 @@
+"""
+LSTM Çok Ufuklu Tahmin
+
+30 günlük LSTM tahmini için iki çıkarım yolu. İkisi de tek bir çağrıda birden
+çok SKU'nun son penceresini (b, pencere, 1) toplu olarak işler:
+
+- 'dogrudan': ağın çıkış katmanı Dense(ufuk) olur ve tüm ufuklar tek ileri
+  geçişte üretilir. Eğitim hedefleri (pencere, ufuk) kayan pencereleridir.
+- 'ozyinelemeli': tek adımlı ağ, derlenmiş bir tf.function içinde kendi
+  tahminini pencereye ekleyerek ufuk kadar ilerletilir. Her adımda
+  model.predict yerine model doğrudan çağrılır, np.roll kopyası yapılmaz.
+
+model.predict her çağrıda veri hattı ve geri çağırma kurulumu yapar; küçük
+ağlarda 30 ardışık çağrının süresini bu ek yük belirler.
+"""
+
+import numpy as np
+
+LSTM_MODLARI = ('ozyinelemeli', 'dogrudan')
+
+
+def lstm_agi_olustur(pencere=60, cikis=1):
+    """İki katmanlı LSTM ağı; cikis > 1 iken doğrudan çok ufuklu baş"""
+    from tensorflow.keras.layers import LSTM, Dense, Dropout, Input
+    from tensorflow.keras.models import Sequential
+
+    return Sequential([
+        Input(shape=(pencere, 1)),
+        LSTM(50, return_sequences=True),
+        Dropout(0.2),
+        LSTM(50, return_sequences=False),
+        Dropout(0.2),
+        Dense(25),
+        Dense(cikis)
+    ])
+
+
+def ozyinelemeli_tahminci(model, ufuk):
+    """Tek adımlı model için derlenmiş özyinelemeli tahmin fonksiyonu döndürür
+
+    Dönen fonksiyon (b, pencere, 1) pencereleri alır, (b, ufuk) tahmin döndürür.
+    """
+    import tensorflow as tf
+
+    @tf.function(reduce_retracing=True)
+    def tahmin(pencereler):
+        sira = tf.cast(pencereler, tf.float32)
+        ciktilar = tf.TensorArray(tf.float32, size=ufuk)
+        for adim in tf.range(ufuk):
+            sonraki = model(sira, training=False)  # (b, 1)
+            ciktilar = ciktilar.write(adim, sonraki[:, 0])
+            sira = tf.concat([sira[:, 1:, :], sonraki[:, tf.newaxis, :]], axis=1)
+        return tf.transpose(ciktilar.stack())
+
+    return tahmin
+
+
+def dogrudan_tahminci(model):
+    """Çok ufuklu başlı model için derlenmiş tahmin fonksiyonu döndürür"""
+    import tensorflow as tf
+
+    @tf.function(reduce_retracing=True)
+    def tahmin(pencereler):
+        return model(tf.cast(pencereler, tf.float32), training=False)
+
+    return tahmin
+
+
+def tahminci_olustur(model, mod, ufuk):
+    """Moda göre tahmin fonksiyonu; (b, pencere, 1) -> (b, ufuk) numpy"""
+    if mod not in LSTM_MODLARI:
+        raise ValueError(f"Bilinmeyen LSTM modu: '{mod}' (seçenekler: {', '.join(LSTM_MODLARI)})")
+    fonksiyon = ozyinelemeli_tahminci(model, ufuk) if mod == 'ozyinelemeli' else dogrudan_tahminci(model)
+    return lambda pencereler: fonksiyon(np.asarray(pencereler, dtype=np.float32)).numpy()
+
+
+def son_pencereler(seriler, pencere):
+    """Her serinin son pencere değerini (b, pencere, 1) tek yığında toplar"""
+    return np.stack([np.asarray(s, dtype=np.float32).reshape(-1)[-pencere:] for s in seriler])[..., np.newaxis]
+
+
+def eski_ozyinelemeli_tahmin(model, son_pencere, ufuk):
+    """Önceki yöntem: her adımda model.predict + np.roll (karşılaştırma için)"""
+    tahminler = []
+    sira = np.array(son_pencere, dtype=np.float32).reshape((1, -1, 1))
+    for _ in range(ufuk):
+        tahmin = model.predict(sira, verbose=0)
+        tahminler.append(tahmin[0, 0])
+        sira = np.roll(sira, -1, axis=1)
+        sira[0, -1, 0] = tahmin[0, 0]
+    return np.array(tahminler)
@@ -0,0 +1,167 @@
+"""
+Eğitilmiş Model Önbelleği
+
+Eğitilmiş ARIMA sonuçlarını, Prophet modellerini (ve sıcak başlangıç
+parametrelerini), Keras modellerini ve anomali dedektörlerini (scikit-learn)
+diskte saklar. Her kayıt; girdi serisinin, model hiperparametrelerinin ve ilgili
+kütüphane sürümlerinin SHA-256 özetiyle anahtarlanır. Seri ya da ayarlar değişmediği sürece tekrar eden çalıştırmalar
+modeli yeniden eğitmeden doğrudan tahmine geçer.
+
+- Kayıtlar geçici dosya üzerinden atomik olarak yazılır.
+- Okunan kaydın değiştirilme zamanı güncellenir; klasör boyutu sınırı aşılınca
+  en uzun süredir kullanılmayan kayıtlar silinir (LRU).
+- Okunamayan (bozuk ya da uyumsuz) kayıtlar silinip model yeniden eğitilir.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from functools import lru_cache
+from importlib import metadata
+
+import numpy as np
+
+ONBELLEK_KLASORU = '.model_onbellegi'
+VARSAYILAN_BOYUT_MB = 500
+
+# Model türü başına dosya uzantısı ve anahtara sürümü eklenen kütüphaneler
+MODEL_TURLERI = {
+    'arima': ('.pkl', ('statsmodels', 'numpy', 'scipy')),
+    'prophet': ('.json', ('prophet',)),
+    'keras': ('.keras', ('tensorflow', 'keras')),
+    'anomali': ('.pkl', ('scikit-learn', 'numpy')),
+    'prophet_baslangic': ('.pkl', ('prophet', 'numpy')),
+}
+
+
+@lru_cache(maxsize=None)
+def kutuphane_surumleri(kutuphaneler):
+    """Kurulu kütüphane sürümlerini döndürür (kurulu değilse None); süreç başına bir kez okunur"""
+    surumler = {}
+    for ad in kutuphaneler:
+        try:
+            surumler[ad] = metadata.version(ad)
+        except metadata.PackageNotFoundError:
+            surumler[ad] = None
+    return surumler
+
+
+def onbellek_anahtari(tur, seriler, parametreler):
+    """Model türü, girdi serileri, hiperparametreler ve kütüphane sürümlerinden anahtar üretir
+
+    seriler: dizi listesi (ör. [tarihler, fiyatlar]); her dizinin tipi, şekli ve
+    baytları özete girer.
+    """
+    ozet = hashlib.sha256(tur.encode('utf-8'))
+    for seri in seriler:
+        dizi = np.ascontiguousarray(seri)
+        ozet.update(f"\n{dizi.dtype.str};{dizi.shape}\n".encode('utf-8'))
+        ozet.update(dizi.tobytes())
+    ayarlar = {'parametreler': parametreler, 'surumler': kutuphane_surumleri(MODEL_TURLERI[tur][1])}
+    ozet.update(json.dumps(ayarlar, sort_keys=True, default=str).encode('utf-8'))
+    return ozet.hexdigest()
+
+
+def _yaz(tur, model, dosya):
+    if tur in ('arima', 'anomali', 'prophet_baslangic'):
+        with open(dosya, 'wb') as f:
+            pickle.dump(model, f, protocol=pickle.HIGHEST_PROTOCOL)
+    elif tur == 'prophet':
+        from prophet.serialize import model_to_json
+
+        with open(dosya, 'w', encoding='utf-8') as f:
+            f.write(model_to_json(model))
+    else:
+        model.save(dosya)
+
+
+def _oku(tur, dosya):
+    if tur in ('arima', 'anomali', 'prophet_baslangic'):
+        with open(dosya, 'rb') as f:
+            return pickle.load(f)
+    if tur == 'prophet':
+        from prophet.serialize import model_from_json
+
+        with open(dosya, 'r', encoding='utf-8') as f:
+            return model_from_json(f.read())
+    from tensorflow.keras.models import load_model
+
+    return load_model(dosya)
+
+
+class ModelOnbellegi:
+    """Boyut sınırlı (LRU) disk önbelleği; kayıtlar anahtar + tür uzantısıyla saklanır"""
+
+    def __init__(self, klasor=ONBELLEK_KLASORU, en_fazla_mb=VARSAYILAN_BOYUT_MB):
+        self.klasor = klasor
+        self.en_fazla_bayt = int(en_fazla_mb * 1e6)
+        self.isabet = 0
+        self.iska = 0
+        os.makedirs(klasor, exist_ok=True)
+
+    def _dosya(self, tur, anahtar):
+        return os.path.join(self.klasor, f"{tur}_{anahtar}{MODEL_TURLERI[tur][0]}")
+
+    def getir(self, tur, anahtar):
+        """Kayıtlı modeli döndürür; yoksa ya da okunamıyorsa None"""
+        dosya = self._dosya(tur, anahtar)
+        if not os.path.exists(dosya):
+            return None
+        try:
+            model = _oku(tur, dosya)
+        except Exception:
+            os.remove(dosya)
+            return None
+        os.utime(dosya)  # LRU sırası için son kullanım zamanı
+        return model
+
+    def kaydet(self, tur, anahtar, model):
+        """Modeli atomik olarak yazar ve boyut sınırını uygular"""
+        dosya = self._dosya(tur, anahtar)
+        kok, uzanti = os.path.splitext(os.path.basename(dosya))
+        # Geçici ad yazıcı başına benzersizdir (aynı anahtarı yazan süreçler çakışmaz);
+        # Keras kaydederken uzantıya baktığı için uzantı korunur
+        with tempfile.NamedTemporaryFile(dir=self.klasor, prefix=f"{kok}.", suffix=f".tmp{uzanti}",
+                                         delete=False) as f:
+            gecici = f.name
+        try:
+            _yaz(tur, model, gecici)
+            os.replace(gecici, dosya)
+        except BaseException:
+            if os.path.exists(gecici):
+                os.remove(gecici)
+            raise
+        self.temizle()
+
+    def getir_veya_egit(self, tur, seriler, parametreler, egit):
+        """Önbellekte varsa modeli döndürür, yoksa egit() ile eğitip kaydeder"""
+        anahtar = onbellek_anahtari(tur, seriler, parametreler)
+        model = self.getir(tur, anahtar)
+        if model is not None:
+            self.isabet += 1
+            return model
+        self.iska += 1
+        model = egit()
+        try:
+            self.kaydet(tur, anahtar, model)
+        except Exception as e:
+            print(f"⚠️ {tur} modeli önbelleğe yazılamadı: {e}")
+        return model
+
+    def temizle(self):
+        """Toplam boyut sınırı aşılıyorsa en eski kullanılan kayıtları siler"""
+        kayitlar = []
+        for ad in os.listdir(self.klasor):
+            dosya = os.path.join(self.klasor, ad)
+            if '.tmp' in ad or not os.path.isfile(dosya):
+                continue
+            bilgi = os.stat(dosya)
+            kayitlar.append((bilgi.st_mtime, bilgi.st_size, dosya))
+        toplam = sum(boyut for _, boyut, _ in kayitlar)
+        for _, boyut, dosya in sorted(kayitlar):
+            if toplam <= self.en_fazla_bayt:
+                break
+            os.remove(dosya)
+            toplam -= boyut
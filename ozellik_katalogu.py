@@ -0,0 +1,150 @@
+"""
+Model Teknik Özellik Kataloğu
+
+Teknik özellikler model_ozellikleri.csv dosyasından bir kez, tipli olarak okunur
+ve (MODEL, KAPASITE) anahtarıyla indekslenir. Yeni bir model (ör. iPhone 17) ya da
+başka bir marka eklemek için dosyaya satır eklemek yeterlidir.
+
+Eşleştirme kuralları:
+- KAPASITE sütunu '*' olan satır modelin tüm kapasiteleri için geçerlidir;
+  aynı model için belirli bir kapasite satırı varsa o satır önceliklidir.
+- MODEL sütunu '*' olan satır katalogda bulunmayan modeller için varsayılandır.
+- DAHILI_DEPOLAMA kapasiteden türetilir ('512gb' -> 512, '1tb' -> 1000); kapasite
+  bilinmiyorsa katalogdaki değer kullanılır.
+"""
+
+import os
+from functools import lru_cache
+
+import pandas as pd
+
+KATALOG_DOSYASI = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'model_ozellikleri.csv')
+JOKER = '*'
+
+# Katalog sütun tipleri (boş hücreler için nullable tipler kullanılır)
+SUTUN_TIPLERI = {
+    'MARKA': object,
+    'MODEL': object,
+    'KAPASITE': object,
+    'EKRAN_BOYUTU': 'float64',
+    'DAHILI_DEPOLAMA': 'Int64',
+    'RAM_GB': 'Int64',
+    'BATARYA_MAH': 'Int64',
+    'HIZLI_SARJ_W': 'Int64',
+    'CPU_FREKANSI_GHZ': 'float64',
+    'CPU_CEKIRDEK': 'Int64',
+    'KAMERA_MP': 'Int64',
+    'EKRAN_COZUNURLUGU': object,
+    'EKRAN_YENILEME_HZ': 'Int64',
+    'CHIPSET': object,
+    'DXOMARK_PUAN': 'float64',
+    'IOS_VERSIYON': object,
+    'YUKSELTILEBILIR_IOS': object,
+    '5G_DESTEGI': object,
+    '4_5G_DESTEGI': object,
+    'SUYA_DAYANIKLILIK': object,
+    'SU_GECIRMEZLIK_SEVIYESI': object,
+    'KABLOSUZ_SARJ': object,
+    'USB_C': object,
+    'AI_CHIP': object,
+    'SAR_DEGERI': 'float64',
+    'EKRAN_GOVDE_ORANI': 'float64',
+    'HAT_SAYISI': object,
+    'CIKIS_YILI': 'Int64',
+    'GENEL_PUAN': 'float64',
+}
+
+ANAHTAR_SUTUNLARI = ['MODEL', 'KAPASITE']
+
+
+def kapasite_gb(kapasite):
+    """'256gb' -> 256, '1tb' -> 1000; çözülemeyen kapasitelerde None döner"""
+    deger = str(kapasite).lower().replace('gb', '').replace('tb', '000')
+    return int(deger) if deger.isdigit() else None
+
+
+class OzellikKatalogu:
+    """(MODEL, KAPASITE) anahtarlı, O(1) erişimli teknik özellik kataloğu"""
+
+    def __init__(self, tablo):
+        self.tablo = tablo.reset_index(drop=True)
+        self.ozellik_sutunlari = [c for c in self.tablo.columns if c not in ANAHTAR_SUTUNLARI]
+
+        # Anahtar -> satır numarası indeksi
+        self.indeks = {
+            (model, kapasite): satir
+            for satir, (model, kapasite) in enumerate(zip(self.tablo['MODEL'], self.tablo['KAPASITE']))
+        }
+        if (JOKER, JOKER) not in self.indeks:
+            raise ValueError("Katalogda varsayılan ('*', '*') satırı bulunmalı")
+
+        # Tekil sorgular için satırlar sözlük olarak önceden hazırlanır
+        self._satir_sozlukleri = self.tablo[self.ozellik_sutunlari].to_dict('records')
+
+    @classmethod
+    def dosyadan(cls, dosya=KATALOG_DOSYASI):
+        """Katalog dosyasını tipli olarak okur"""
+        tablo = pd.read_csv(dosya, dtype=SUTUN_TIPLERI, keep_default_na=False, na_values=[''], encoding='utf-8')
+        return cls(tablo)
+
+    def satir_bul(self, model, kapasite):
+        """Model/kapasite için geçerli katalog satırının numarasını döndürür"""
+        indeks = self.indeks
+        satir = indeks.get((model, kapasite))
+        if satir is None:
+            satir = indeks.get((model, JOKER))
+        if satir is None:
+            satir = indeks[(JOKER, JOKER)]
+        return satir
+
+    def ozellikler(self, model, kapasite):
+        """Tek bir model/kapasite için özellik sözlüğü döndürür"""
+        ozellikler = dict(self._satir_sozlukleri[self.satir_bul(model, kapasite)])
+        depolama = kapasite_gb(kapasite)
+        if depolama is not None:
+            ozellikler['DAHILI_DEPOLAMA'] = depolama
+        return ozellikler
+
+    def sku_tablosu(self, skular):
+        """(MODEL, KAPASITE) çiftleri için özellik tablosu döndürür
+
+        skular: MODEL ve KAPASITE sütunlarını içeren DataFrame. İndeks araması her
+        farklı SKU için bir kez yapılır.
+        """
+        skular = skular[ANAHTAR_SUTUNLARI].drop_duplicates().reset_index(drop=True)
+        satirlar = [self.satir_bul(m, k) for m, k in zip(skular['MODEL'], skular['KAPASITE'])]
+        tablo = self.tablo[self.ozellik_sutunlari].take(satirlar).reset_index(drop=True)
+
+        depolama = pd.Series([kapasite_gb(k) for k in skular['KAPASITE']], dtype='Int64')
+        tablo['DAHILI_DEPOLAMA'] = depolama.fillna(tablo['DAHILI_DEPOLAMA'])
+        return pd.concat([skular, tablo], axis=1)
+
+    def ekle(self, kayitlar):
+        """Fiyat kayıtlarına teknik özellikleri tek bir birleştirme (join) ile ekler
+
+        Satır sırası korunur; kayitlar'da MODEL ve KAPASITE sütunları bulunmalıdır.
+        """
+        return sku_tablosunu_ekle(kayitlar, self.sku_tablosu(kayitlar))
+
+
+def sku_tablosunu_ekle(kayitlar, sku_tablosu):
+    """SKU başına bir satırlık tabloyu kayıtlara MODEL/KAPASITE üzerinden ekler
+
+    Her kayıt için SKU kodu bir kez hesaplanır ve tablo satırları bu kodlarla
+    seçilir (take); genel amaçlı merge'e göre milyonlarca satırda belirgin
+    biçimde hızlıdır. Satır sırası ve indeks korunur.
+    """
+    sku_kodlari = pd.MultiIndex.from_frame(sku_tablosu[ANAHTAR_SUTUNLARI]).get_indexer(
+        pd.MultiIndex.from_frame(kayitlar[ANAHTAR_SUTUNLARI])
+    )
+    if (sku_kodlari < 0).any():
+        raise KeyError("SKU tablosunda bulunmayan model/kapasite kayıtları var")
+    eklenecek = sku_tablosu.drop(columns=ANAHTAR_SUTUNLARI).take(sku_kodlari)
+    eklenecek.index = kayitlar.index
+    return pd.concat([kayitlar, eklenecek], axis=1)
+
+
+@lru_cache(maxsize=None)
+def katalogu_yukle(dosya=KATALOG_DOSYASI):
+    """Kataloğu süreç başına bir kez yükler"""
+    return OzellikKatalogu.dosyadan(dosya)
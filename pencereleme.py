@@ -0,0 +1,75 @@
+"""
+Kayan Pencere (Sekans) Oluşturucu
+
+Dizi modelleri (LSTM vb.) için eğitim pencerelerini
+numpy.lib.stride_tricks.sliding_window_view ile kopyasız üretir. Dönen X ve y
+dizileri serinin salt-okunur görünümleridir: bellekte yeni veri ayrılmaz, n
+noktalı bir seride süre ve bellek pencere uzunluğundan bağımsızdır.
+
+- pencereler(): tek seri için (X, y) görünümleri; pencere, ufuk ve adım ayarlı.
+- cok_seri_pencereleri(): birden çok SKU serisini tek diziye birleştirir (O(n)
+  tek kopya) ve seri sınırını aşmayan pencere başlangıçlarını döndürür.
+  grup_al() yalnızca istenen satırları (ör. bir mini yığın) kopyalar.
+
+Görünümler salt-okunurdur; yerinde değiştirmek gerekirse np.array(X) ile kopya alın.
+"""
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def pencereler(seri, pencere, ufuk=1, adim=1):
+    """Tek seri için (X, y) pencere görünümlerini döndürür
+
+    X[i] = seri[i*adim : i*adim + pencere], y[i] = sonraki ufuk değer. ufuk=1
+    iken y tek boyutludur (m,), aksi halde (m, ufuk). seri (n,) ya da (n, 1)
+    olabilir. Seri bir pencere + ufuk'tan kısaysa boş diziler döner.
+    """
+    seri = np.asarray(seri)
+    if seri.ndim == 2 and seri.shape[1] == 1:
+        seri = seri[:, 0]
+    if seri.ndim != 1:
+        raise ValueError(f"Tek boyutlu seri bekleniyordu, şekil: {seri.shape}")
+    if pencere < 1 or ufuk < 1 or adim < 1:
+        raise ValueError("pencere, ufuk ve adim pozitif olmalı")
+
+    uzunluk = pencere + ufuk
+    if len(seri) < uzunluk:
+        bos = np.empty((0, pencere), dtype=seri.dtype)
+        return bos, (np.empty(0, dtype=seri.dtype) if ufuk == 1 else np.empty((0, ufuk), dtype=seri.dtype))
+    gorunum = sliding_window_view(seri, uzunluk)[::adim]
+    X = gorunum[:, :pencere]
+    y = gorunum[:, pencere] if ufuk == 1 else gorunum[:, pencere:]
+    return X, y
+
+
+def cok_seri_pencereleri(seriler, pencere, ufuk=1, adim=1):
+    """Birden çok seriyi tek pencere kümesinde birleştirir
+
+    (gorunum, baslangiclar, seri_no) döndürür: gorunum, birleştirilmiş dizinin
+    (pencere + ufuk) uzunluklu kayan pencere görünümü; baslangiclar, seri
+    sınırını aşmayan ve adıma uyan pencerelerin gorunum satır numaraları;
+    seri_no, her pencerenin ait olduğu serinin sırası. Yığınlar grup_al() ile
+    alınır.
+    """
+    seriler = [np.asarray(s).reshape(-1) for s in seriler]
+    uzunluk = pencere + ufuk
+    birlesik = np.concatenate(seriler) if seriler else np.empty(0)
+    if len(birlesik) < uzunluk:
+        return np.empty((0, uzunluk), dtype=birlesik.dtype), np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+    gorunum = sliding_window_view(birlesik, uzunluk)
+    ofsetler = np.concatenate([[0], np.cumsum([len(s) for s in seriler])])
+    parcalar, numaralar = [], []
+    for no, (ilk, son) in enumerate(zip(ofsetler[:-1], ofsetler[1:])):
+        satirlar = np.arange(ilk, son - uzunluk + 1, adim)
+        parcalar.append(satirlar)
+        numaralar.append(np.full(len(satirlar), no))
+    return gorunum, np.concatenate(parcalar), np.concatenate(numaralar)
+
+
+def grup_al(gorunum, satirlar, pencere):
+    """Pencere görünümünden seçilen satırların (X, y) kopyalarını döndürür (ör. bir mini yığın)"""
+    secili = gorunum[satirlar]
+    ufuk = gorunum.shape[1] - pencere
+    return secili[:, :pencere], (secili[:, pencere] if ufuk == 1 else secili[:, pencere:])
@@ -0,0 +1,789 @@
+#!/usr/bin/env python3
+"""
+Performans Ölçümleri
+
+Veri hazırlama ve tahmin bileşenleri için küçük, tekrarlanabilir ölçümler.
+
+Kullanım:
+    python performans_olcumleri.py ozellik_katalogu --satir 2000000
+    python performans_olcumleri.py hucre_tarayici --satir 200000
+    python performans_olcumleri.py bellek_semasi --satir 5000000
+    python performans_olcumleri.py zaman_serisi_baslangic
+    python performans_olcumleri.py tahmin_havuzu --satir 40000
+    python performans_olcumleri.py model_onbellegi --satir 40000
+    python performans_olcumleri.py artimli_arima --satir 200
+    python performans_olcumleri.py arima_derece --satir 4
+    python performans_olcumleri.py pencereleme
+    python performans_olcumleri.py lstm_cikarim --satir 16
+    python performans_olcumleri.py geriye_donuk_test --satir 16
+    python performans_olcumleri.py prophet_yeniden_egitim --satir 16
+    python performans_olcumleri.py anomali_servisi --satir 100000
+    python performans_olcumleri.py seri_deposu --satir 2000000
+    python performans_olcumleri.py hiyerarsik_uzlastirma --satir 600
+    python performans_olcumleri.py ustel_duzeltme --satir 16
+    python performans_olcumleri.py tahmin_servisi --satir 5000
+    python performans_olcumleri.py grafik_seyreltme --satir 3650
+    python performans_olcumleri.py asama_olcumu --satir 1000000
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+
+def _sure_olc(fonksiyon, tekrar=3):
+    """Fonksiyonu birkaç kez çalıştırıp en iyi süreyi (saniye) ve son sonucu döndürür"""
+    en_iyi = float('inf')
+    sonuc = None
+    for _ in range(tekrar):
+        baslangic = time.perf_counter()
+        sonuc = fonksiyon()
+        en_iyi = min(en_iyi, time.perf_counter() - baslangic)
+    return en_iyi, sonuc
+
+
+def _ornek_kayitlar(satir_sayisi, seed=42):
+    """Rastgele (MODEL, KAPASITE, FIYAT) kayıtları üretir"""
+    rng = np.random.default_rng(seed)
+    modeller = np.array(['iPhone 13', 'iPhone 14', 'iPhone 15', 'iPhone 16'], dtype=object)
+    kapasiteler = np.array(['128gb', '256gb', '512gb', '1tb'], dtype=object)
+    return pd.DataFrame({
+        'MODEL': modeller[rng.integers(0, len(modeller), satir_sayisi)],
+        'KAPASITE': kapasiteler[rng.integers(0, len(kapasiteler), satir_sayisi)],
+        'FIYAT': rng.uniform(20000, 90000, satir_sayisi).round(2),
+    })
+
+
+def olcum_ozellik_katalogu(satir_sayisi):
+    """Satır bazlı özellik çağrısı ile katalog birleştirmesini karşılaştırır"""
+    from ozellik_katalogu import katalogu_yukle
+
+    katalog = katalogu_yukle()
+    kayitlar = _ornek_kayitlar(satir_sayisi)
+
+    # Satır bazlı yol: her kayıt için özellik sözlüğü + float dönüşümleri
+    ornek = kayitlar.head(min(satir_sayisi, 200_000))
+
+    def satir_bazli():
+        skorlar = []
+        for model, kapasite in zip(ornek['MODEL'], ornek['KAPASITE']):
+            ozellikler = katalog.ozellikler(model, kapasite)
+            skorlar.append(
+                float(ozellikler['DXOMARK_PUAN']) * 0.4 + float(ozellikler['RAM_GB']) * 10 +
+                float(ozellikler['BATARYA_MAH']) / 100 + float(ozellikler['CPU_FREKANSI_GHZ']) * 20
+            )
+        return skorlar
+
+    satir_suresi, _ = _sure_olc(satir_bazli, tekrar=1)
+    satir_suresi *= satir_sayisi / len(ornek)
+
+    birlestirme_suresi, sonuc = _sure_olc(lambda: katalog.ekle(kayitlar))
+
+    print(f"📊 {satir_sayisi:,} kayıt, {len(sonuc.columns)} sütun")
+    print(f"  🐢 Satır bazlı çağrı: {satir_suresi:.2f} sn (örnekten ölçeklendi)")
+    print(f"  🚀 Katalog birleştirmesi: {birlestirme_suresi:.2f} sn")
+    print(f"  ⚡ Hızlanma: {satir_suresi / birlestirme_suresi:.1f}x")
+
+
+def _eski_sutun_tarama(column):
+    """Hücre tarayıcıdan önceki sütun döngüsü (karşılaştırma için referans)"""
+    model_info = None
+    kapasite_info = None
+    for row_idx in range(min(8, len(column))):
+        cell_value = str(column.iloc[row_idx])
+        if cell_value and cell_value != 'nan' and cell_value != 'NaN':
+            cell_lower = cell_value.lower()
+            iphone_full_match = re.search(r'iphone\s*(\d+)\s*(\d+)\s*(gb|tb)?', cell_lower)
+            if iphone_full_match:
+                capacity_unit = iphone_full_match.group(3) if iphone_full_match.group(3) else "gb"
+                model_info = f"iPhone {iphone_full_match.group(1)}"
+                kapasite_info = f"{iphone_full_match.group(2)}{capacity_unit}"
+                break
+            elif re.search(r'iphone\s*(\d+)', cell_lower):
+                iphone_match = re.search(r'iphone\s*(\d+)', cell_lower)
+                model_info = f"iPhone {iphone_match.group(1)}"
+                kapasite_match = re.search(r'(\d{2,})\s*(gb|tb)', cell_lower)
+                kapasite_info = f"{kapasite_match.group(1)}{kapasite_match.group(2)}" if kapasite_match else "128gb"
+                break
+
+    sutun_verileri = []
+    for row_idx in range(len(column)):
+        cell_value = str(column.iloc[row_idx])
+        if cell_value and cell_value != 'nan' and cell_value != 'NaN':
+            tarih_eslesmesi = re.search(r'(\d{2}\.\d{2}\.\d{4})', cell_value)
+            if tarih_eslesmesi:
+                for fiyat_row in range(row_idx, min(row_idx + 5, len(column))):
+                    fiyat_eslesmesi = re.search(r'(\d{4,}\.\d{2})', str(column.iloc[fiyat_row]))
+                    if fiyat_eslesmesi:
+                        sutun_verileri.append((tarih_eslesmesi.group(1), float(fiyat_eslesmesi.group(1))))
+                        break
+
+    if model_info and sutun_verileri:
+        return model_info, kapasite_info, sutun_verileri
+    return None, None, []
+
+
+def olcum_hucre_tarayici(satir_sayisi):
+    """Eski sütun döngüsü ile hucre_tarayici'nın süresini karşılaştırır (doğruluk: tests/test_hucre_tarayici.py)"""
+    from hucre_tarayici import sutun_tara
+
+    # Fiyat takipçisi biçiminde sütunlar: başlık, tarih, (gürültü), fiyat ...
+    rng = np.random.default_rng(42)
+    sutun_sayisi = 16
+    satir_basina = max(satir_sayisi // sutun_sayisi, 10)
+    gunler = pd.date_range('2021-09-01', periods=satir_basina).strftime('%d.%m.%Y')
+    sutunlar = []
+    for i in range(sutun_sayisi):
+        hucreler = [f"Apple iPhone {13 + i % 4} {[128, 256, 512][i % 3]}GB"]
+        for gun in gunler:
+            hucreler.append(gun)
+            if rng.random() < 0.2:
+                hucreler.append('kargo bedava')
+            hucreler.append(f"{rng.uniform(20000, 90000):.2f} TL")
+        sutunlar.append(pd.Series(hucreler[:satir_basina], dtype=object))
+
+    eski_suresi, eski_sonuc = _sure_olc(lambda: [_eski_sutun_tarama(s) for s in sutunlar], tekrar=1)
+    yeni_suresi, yeni_sonuc = _sure_olc(lambda: [sutun_tara(map(str, s.tolist())) for s in sutunlar])
+
+    hucre_sayisi = sum(len(s) for s in sutunlar)
+    print(f"📊 {hucre_sayisi:,} hücre, {sum(len(k) for _, _, k in yeni_sonuc):,} kayıt "
+          f"(eski döngü: {sum(len(k) for _, _, k in eski_sonuc):,})")
+    print(f"  🐢 Eski sütun döngüsü: {eski_suresi:.2f} sn")
+    print(f"  🚀 Hücre tarayıcı: {yeni_suresi:.2f} sn")
+    print(f"  ⚡ Hızlanma: {eski_suresi / yeni_suresi:.1f}x")
+
+
+def olcum_bellek_semasi(satir_sayisi):
+    """Varsayılan tiplerle ve ortak şemayla yüklenen veri setinin bellek kullanımını karşılaştırır"""
+    import io
+    from veri_semasi import bellek_raporu, semayi_uygula
+
+    ornek = pd.read_csv('profesyonel_telefon_verileri2.csv')
+    tekrar = -(-satir_sayisi // len(ornek))
+    metin = ornek.to_csv(index=False)
+    govde = metin.split('\n', 1)[1]
+    csv_metni = metin + govde * (tekrar - 1)
+
+    varsayilan_suresi, varsayilan = _sure_olc(lambda: pd.read_csv(io.StringIO(csv_metni)), tekrar=1)
+    sema_suresi, kompakt = _sure_olc(lambda: semayi_uygula(varsayilan), tekrar=1)
+
+    print(f"📊 {len(varsayilan):,} kayıt")
+    bellek_raporu(varsayilan, kompakt, ilk=5)
+    print(f"  ⏱️ CSV okuma: {varsayilan_suresi:.2f} sn, şema uygulama: {sema_suresi:.2f} sn")
+
+
+# Alt süreçte çalışan başlangıç ölçümü: modülleri içe aktarır, süre ve tepe belleği JSON yazdırır
+_BASLANGIC_BETIGI = '''
+import importlib, json, resource, sys, time
+baslangic = time.perf_counter()
+import pandas, numpy, veri_semasi
+eksik = []
+for modul in sys.argv[1:]:
+    try:
+        importlib.import_module(modul)
+    except ImportError:
+        eksik.append(modul)
+print(json.dumps({'sure': time.perf_counter() - baslangic, 'eksik': eksik,
+                  'tepe_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024}))
+'''
+
+
+def olcum_zaman_serisi_baslangic(satir_sayisi):
+    """Aşama seçimine göre tahmin betiğinin başlangıç süresi ve tepe belleği
+
+    Her seçim temiz bir alt süreçte ölçülür; 'eski' satırı tüm bağımlılıkların
+    baştan içe aktarıldığı önceki davranıştır. satir_sayisi kullanılmaz.
+    """
+    import json
+    from profesyonel_zaman_serisi import ASAMA_BAGIMLILIKLARI
+
+    secimler = {asama: moduller for asama, moduller in ASAMA_BAGIMLILIKLARI.items()}
+    secimler['arima,anomali'] = ASAMA_BAGIMLILIKLARI['arima'] + ASAMA_BAGIMLILIKLARI['anomali']
+    secimler['eski (hepsi)'] = sorted({m for moduller in ASAMA_BAGIMLILIKLARI.values() for m in moduller})
+
+    print(f"🚀 Aşama seçimine göre başlangıç (en iyi 3 çalıştırma):")
+    for secim, moduller in secimler.items():
+        olcumler = []
+        for _ in range(3):
+            cikti = subprocess.run([sys.executable, '-c', _BASLANGIC_BETIGI, *moduller],
+                                   capture_output=True, text=True, check=True).stdout
+            olcumler.append(json.loads(cikti))
+        en_iyi = min(olcumler, key=lambda o: o['sure'])
+        eksik = f" (kurulu değil: {', '.join(en_iyi['eksik'])})" if en_iyi['eksik'] else ''
+        print(f"  🧩 {secim}: {en_iyi['sure']:.2f} sn, tepe bellek {en_iyi['tepe_mb']:.0f} MB{eksik}")
+
+
+def olcum_tahmin_havuzu(satir_sayisi):
+    """SKU bazlı ARIMA tahmininin işçi sayısına göre duvar saati süresi"""
+    from tahmin_havuzu import isci_hazirla, toplu_tahmin
+
+    isci_hazirla(['arima'])  # Tek işçili ölçüm de içe aktarma süresini içermesin
+    ornek = _ornek_kayitlar(satir_sayisi)
+    rng = np.random.default_rng(7)
+    ornek['TARIH'] = pd.Timestamp('2022-01-01') + pd.to_timedelta(rng.integers(0, 730, len(ornek)), unit='D')
+
+    cekirdek = os.cpu_count() or 1
+    print(f"📊 {len(ornek):,} kayıt, {ornek.groupby(['MODEL', 'KAPASITE']).ngroups} SKU serisi, {cekirdek} çekirdek")
+    temel = None
+    for islem_sayisi in sorted({1, 2, 4, cekirdek}):
+        sure, (tahminler, durum) = _sure_olc(lambda: toplu_tahmin(ornek, islem_sayisi), tekrar=1)
+        temel = temel or sure
+        print(f"  ⚙️ {islem_sayisi} işçi: {sure:.2f} sn ({temel / sure:.2f}x), "
+              f"{(durum['DURUM'] == 'TAMAM').sum()}/{len(durum)} seri tamam")
+
+
+def olcum_model_onbellegi(satir_sayisi):
+    """SKU serileri için ARIMA(1,1,1): önbelleksiz, soğuk önbellek ve sıcak önbellek süreleri
+
+    Önbellekten dönen modellerin aynı tahmini verdiği tests/test_model_onbellegi.py'de sınanır.
+    """
+    import tempfile
+    import warnings
+    from statsmodels.tsa.arima.model import ARIMA
+    from model_onbellegi import ModelOnbellegi
+
+    warnings.filterwarnings('ignore')
+    ornek = _ornek_kayitlar(satir_sayisi)
+    rng = np.random.default_rng(7)
+    ornek['TARIH'] = pd.Timestamp('2022-01-01') + pd.to_timedelta(rng.integers(0, 730, len(ornek)), unit='D')
+    seriler = [seri.to_numpy() for _, seri in ornek.groupby(['MODEL', 'KAPASITE', 'TARIH'])['FIYAT'].mean()
+               .groupby(level=[0, 1])]
+
+    def tahminler(onbellek=None):
+        sonuc = []
+        for fiyatlar in seriler:
+            egit = lambda: ARIMA(fiyatlar, order=(1, 1, 1)).fit()
+            model = onbellek.getir_veya_egit('arima', [fiyatlar], {'order': (1, 1, 1)}, egit) if onbellek else egit()
+            sonuc.append(model.forecast(steps=30))
+        return sonuc
+
+    with tempfile.TemporaryDirectory() as klasor:
+        onbellek = ModelOnbellegi(klasor)
+        onbelleksiz, _ = _sure_olc(tahminler, tekrar=1)
+        soguk, _ = _sure_olc(lambda: tahminler(onbellek), tekrar=1)
+        sicak, _ = _sure_olc(lambda: tahminler(onbellek), tekrar=3)
+        boyut = sum(os.path.getsize(os.path.join(klasor, ad)) for ad in os.listdir(klasor))
+
+    print(f"📊 {len(seriler)} SKU serisi, ARIMA(1,1,1) + 30 günlük tahmin")
+    print(f"  ⏱️ Önbelleksiz: {onbelleksiz:.2f} sn")
+    print(f"  ⏱️ Soğuk önbellek (eğit + yaz): {soguk:.2f} sn")
+    print(f"  ⚡ Sıcak önbellek: {sicak:.3f} sn ({onbelleksiz / sicak:.0f}x), {boyut / 1e6:.1f} MB disk")
+
+
+def olcum_artimli_arima(satir_sayisi):
+    """Bir günlük yeni veri için tam ARIMA yeniden eğitimi ile artımlı uzatmanın karşılaştırması
+
+    satir_sayisi SKU serisi sayısıdır; her seri 730 günlük rastgele yürüyüştür.
+    """
+    import tempfile
+    import warnings
+    from artimli_arima import _tam_egit, arima_guncelle
+    from model_onbellegi import ModelOnbellegi
+    import statsmodels.tsa.arima.model  # noqa: F401 - içe aktarılırken uyarı filtrelerini değiştirir
+
+    warnings.filterwarnings('ignore')
+    rng = np.random.default_rng(11)
+    seriler = 45000 + np.cumsum(rng.normal(0, 150, (satir_sayisi, 731)), axis=1)
+
+    with tempfile.TemporaryDirectory() as klasor:
+        onbellek = ModelOnbellegi(klasor, en_fazla_mb=10_000)
+        for i, seri in enumerate(seriler):
+            arima_guncelle(onbellek, f"sku{i}", seri[:-1])
+        tam_suresi, _ = _sure_olc(lambda: [_tam_egit(seri, (1, 1, 1)) for seri in seriler], tekrar=1)
+        artimli_suresi, islemler = _sure_olc(
+            lambda: [arima_guncelle(onbellek, f"sku{i}", seri)[1] for i, seri in enumerate(seriler)], tekrar=1)
+
+    print(f"📊 {satir_sayisi} SKU serisi x 730 gün, 1 yeni gün")
+    print(f"  ⏱️ Tam yeniden eğitim: {tam_suresi:.2f} sn ({tam_suresi / satir_sayisi * 1000:.0f} ms/seri)")
+    print(f"  ⚡ Artımlı güncelleme (okuma + extend + yazma): {artimli_suresi:.2f} sn "
+          f"({tam_suresi / artimli_suresi:.1f}x), işlemler: {pd.Series(islemler).value_counts().to_dict()}")
+
+
+def olcum_arima_derece(satir_sayisi):
+    """Izgara ve adımsal ARIMA derece aramasının süre ve model sayısı karşılaştırması
+
+    satir_sayisi SKU serisi sayısıdır; her seri 730 günlük ARMA(2,1) farklı rastgele yürüyüştür.
+    """
+    import statsmodels.tsa.arima.model  # noqa: F401 - içe aktarılırken uyarı filtrelerini değiştirir
+    import warnings
+    from arima_derece_secimi import derece_ara
+    from statsmodels.tsa.arima_process import arma_generate_sample
+
+    warnings.filterwarnings('ignore')
+    rng = np.random.default_rng(5)
+    seriler = [45000 + np.cumsum(arma_generate_sample([1, -0.5, 0.2], [1, 0.4], 730, scale=150,
+                                                      distrvs=rng.standard_normal))
+               for _ in range(satir_sayisi)]
+
+    print(f"📊 {satir_sayisi} seri x 730 gün, p, q <= 4")
+    for arama in ('izgara', 'adimsal'):
+        sure, sonuclar = _sure_olc(lambda: [derece_ara(s, arama=arama, en_fazla_p=4, en_fazla_q=4) for s in seriler],
+                                   tekrar=1)
+        print(f"  🔎 {arama}: {sure:.2f} sn, {sum(r['denenen'] for r in sonuclar)} model, "
+              f"dereceler {[tuple(r['order']) for r in sonuclar]}")
+
+
+def _eski_create_sequences(data, seq_length=60):
+    """create_lstm_model içindeki eski döngü (süre karşılaştırması için)"""
+    X, y = [], []
+    for i in range(seq_length, len(data)):
+        X.append(data[i-seq_length:i, 0])
+        y.append(data[i, 0])
+    return np.array(X), np.array(y)
+
+
+def olcum_pencereleme(satir_sayisi, pencere=60, bellek_siniri_gb=2.0):
+    """Eski döngü ile sliding_window_view pencerelerinin 1k, 100k ve 10M noktada karşılaştırması
+
+    Eski döngünün X dizisi bellek_siniri_gb'yi aşacaksa (10M noktada ~4.8 GB) o ölçüm atlanır.
+    satir_sayisi kullanılmaz. Pencerelerin eski döngüyle aynılığı tests/test_pencereleme.py'de sınanır.
+    """
+    from pencereleme import cok_seri_pencereleri, grup_al, pencereler
+
+    rng = np.random.default_rng(3)
+    print(f"🪟 Pencere uzunluğu {pencere}")
+    for nokta in (1_000, 100_000, 10_000_000):
+        data = rng.random((nokta, 1))
+        yeni_sure, _ = _sure_olc(lambda: pencereler(data, pencere))
+        eski_gb = (nokta - pencere) * pencere * 8 / 1e9
+        if eski_gb > bellek_siniri_gb:
+            eski = f"atlandı (X için ~{eski_gb:.1f} GB gerekir)"
+        else:
+            eski_sure, _ = _sure_olc(lambda: _eski_create_sequences(data, pencere), tekrar=1)
+            eski = f"{eski_sure:.4f} sn, {eski_gb * 1000:.1f} MB ({eski_sure / yeni_sure:,.0f}x)"
+        print(f"  📏 {nokta:,} nokta: görünüm {yeni_sure * 1e6:.0f} µs, 0 MB yeni bellek; eski döngü {eski}")
+
+    seriler = [rng.random(rng.integers(300, 1100)) for _ in range(16)]
+    sure, (gorunum, baslangiclar, seri_no) = _sure_olc(lambda: cok_seri_pencereleri(seriler, pencere))
+    yigin_suresi, _ = _sure_olc(lambda: grup_al(gorunum, baslangiclar[:512], pencere))
+    print(f"  🧺 16 SKU: {len(baslangiclar):,} pencere {sure * 1000:.2f} ms; 512'lik yığın {yigin_suresi * 1e6:.0f} µs")
+
+
+def olcum_lstm_cikarim(satir_sayisi, pencere=60, ufuk=30):
+    """30 günlük LSTM tahmininin gecikmesi: 30 x model.predict, derlenmiş özyineleme ve doğrudan baş
+
+    satir_sayisi toplu çıkarımdaki SKU sayısıdır. Ağlar eğitilmez; gecikme ağırlıklardan bağımsızdır.
+    Derlenmiş özyinelemenin eski döngüyle aynı tahmini verdiği tests/test_lstm_tahmin.py'de sınanır.
+    """
+    os.environ.setdefault('TF_CPP_MIN_LOG_LEVEL', '3')
+    from lstm_tahmin import eski_ozyinelemeli_tahmin, lstm_agi_olustur, son_pencereler, tahminci_olustur
+
+    rng = np.random.default_rng(9)
+    seriler = [rng.random(500) for _ in range(satir_sayisi)]
+    pencereler = son_pencereler(seriler, pencere)
+    tek_adim = lstm_agi_olustur(pencere, 1)
+    cok_ufuk = lstm_agi_olustur(pencere, ufuk)
+    ozyinelemeli = tahminci_olustur(tek_adim, 'ozyinelemeli', ufuk)
+    dogrudan = tahminci_olustur(cok_ufuk, 'dogrudan', ufuk)
+
+    tek_adim.predict(pencereler[:1], verbose=0)  # predict'in ilk çağrı (izleme) maliyeti ölçüme girmesin
+    eski_sure, _ = _sure_olc(lambda: [eski_ozyinelemeli_tahmin(tek_adim, p, ufuk) for p in pencereler[:4]], tekrar=1)
+    eski_sku = eski_sure / 4
+    ozyinelemeli(pencereler[:1]), ozyinelemeli(pencereler), dogrudan(pencereler[:1]), dogrudan(pencereler)  # izleme
+    tek_sure, _ = _sure_olc(lambda: ozyinelemeli(pencereler[:1]), tekrar=5)
+    toplu_sure, _ = _sure_olc(lambda: ozyinelemeli(pencereler), tekrar=5)
+    dogrudan_tek, _ = _sure_olc(lambda: dogrudan(pencereler[:1]), tekrar=5)
+    dogrudan_toplu, _ = _sure_olc(lambda: dogrudan(pencereler), tekrar=5)
+
+    print(f"🤖 {ufuk} günlük tahmin, pencere {pencere}, {satir_sayisi} SKU")
+    print(f"  🐢 Eski (30 x predict + np.roll): {eski_sku * 1000:.0f} ms/SKU -> {satir_sayisi} SKU ~{eski_sku * satir_sayisi:.2f} sn")
+    print(f"  🔁 Derlenmiş özyineleme: 1 SKU {tek_sure * 1000:.1f} ms ({eski_sku / tek_sure:.0f}x), "
+          f"{satir_sayisi} SKU tek çağrı {toplu_sure * 1000:.1f} ms ({eski_sku * satir_sayisi / toplu_sure:.0f}x)")
+    print(f"  🎯 Doğrudan baş: 1 SKU {dogrudan_tek * 1000:.1f} ms, {satir_sayisi} SKU tek çağrı {dogrudan_toplu * 1000:.1f} ms "
+          f"({eski_sku * satir_sayisi / dogrudan_toplu:.0f}x)")
+
+
+def olcum_geriye_donuk_test(satir_sayisi, kat_sayisi=10):
+    """ARIMA geriye dönük testi: her katta yeniden eğitim, durum yeniden kullanımı ve işçi sayısı
+
+    satir_sayisi SKU serisi sayısıdır; her seri 730 günlük rastgele yürüyüştür.
+    """
+    from geriye_donuk_test import geriye_donuk_test
+
+    rng = np.random.default_rng(13)
+    tarihler = pd.date_range('2023-01-01', periods=730, freq='D')
+    seriler = {(f"Model {i}", '128gb'): pd.Series(45000 + np.cumsum(rng.normal(0, 150, 730)), index=tarihler)
+               for i in range(satir_sayisi)}
+
+    print(f"🧪 {satir_sayisi} seri x 730 gün, ARIMA(1,1,1), {kat_sayisi} köken, 30 gün ufuk")
+    cekirdek = os.cpu_count() or 1
+    for aciklama, parca, islem in (('Her kökte yeniden eğitim', kat_sayisi, 1),
+                                   ('Durum yeniden kullanımı (2 parça)', 2, 1),
+                                   (f'Durum yeniden kullanımı, {cekirdek} işçi', 2, cekirdek)):
+        sure, (ozet, _, _) = _sure_olc(lambda: geriye_donuk_test(seriler, ('arima',), kat_sayisi=kat_sayisi,
+                                                                 parca_sayisi=parca, islem_sayisi=islem), tekrar=1)
+        print(f"  ⏱️ {aciklama}: {sure:.2f} sn, ortalama MAE {ozet['MAE'].mean():,.0f} TL")
+
+
+def olcum_prophet_yeniden_egitim(satir_sayisi, gun=730, ufuk=30):
+    """Günlük Prophet yeniden eğitimi: eski yol ile ortak tatil tablosu, MAP hızlı yolu ve sıcak başlangıç
+
+    satir_sayisi SKU serisi sayısıdır; her seri haftalık desenli rastgele yürüyüştür.
+    Dünün verisiyle bir eğitim yapılır, ölçülen bugünün (bir gün eklenmiş) eğitimi
+    ve tahminidir. Yolların aynı tahmini verdiği tests/test_prophet_hizli.py'de sınanır.
+    """
+    import logging
+
+    from prophet import Prophet
+    from prophet_hizli import PROPHET_AYARLARI, ProphetArkaUcu
+
+    logging.getLogger('cmdstanpy').disabled = True
+    logging.getLogger('prophet').setLevel(logging.ERROR)
+    rng = np.random.default_rng(22)
+    tarihler = pd.date_range('2023-01-01', periods=gun, freq='D')
+    gunler = np.arange(gun)
+    seriler = {f"Model {i}": 45000 + np.cumsum(rng.normal(0, 150, gun)) + 400 * np.sin(2 * np.pi * gunler / 7)
+               for i in range(max(1, satir_sayisi))}
+
+    def eski_yol(seri_adi, fiyatlar):
+        model = Prophet(**PROPHET_AYARLARI)
+        model.add_country_holidays(country_name='TR')
+        model.fit(pd.DataFrame({'ds': tarihler, 'y': fiyatlar}))
+        return model.predict(model.make_future_dataframe(periods=ufuk, include_history=False))['yhat'].to_numpy()
+
+    def arka_uc_yolu(arka_ucu):
+        def tahmin(seri_adi, fiyatlar):
+            return arka_ucu.tahmin_et(arka_ucu.egit(seri_adi, tarihler, fiyatlar, ufuk), ufuk)['yhat'].to_numpy()
+        return tahmin
+
+    sicak = ProphetArkaUcu(ayrintili=False)
+    for seri_adi, fiyatlar in seriler.items():
+        sicak.egit(seri_adi, tarihler[:-1], fiyatlar[:-1], ufuk)  # Dünkü eğitim (parametreler saklanır)
+
+    print(f"🔮 {len(seriler)} seri x {gun} gün, günlük yeniden eğitim + {ufuk} gün tahmin")
+    for aciklama, yol in (('add_country_holidays, soğuk, aralık simülasyonu', eski_yol),
+                          ('Ortak tatil tablosu + MAP hızlı yolu, soğuk', arka_uc_yolu(ProphetArkaUcu(sicak_baslangic=False, ayrintili=False))),
+                          ('Ortak tatil tablosu + MAP hızlı yolu, sıcak', arka_uc_yolu(sicak))):
+        sure, _ = _sure_olc(lambda: {ad: yol(ad, fiyatlar) for ad, fiyatlar in seriler.items()}, tekrar=1)
+        print(f"  ⏱️ {aciklama}: {sure:.2f} sn (seri başına {sure / len(seriler) * 1000:.0f} ms)")
+
+
+def olcum_anomali_servisi(satir_sayisi, gecmis_gun=1500):
+    """Yeni fiyatların anomali skorlaması: geçmişle yeniden eğitim ve kalıcı dedektörle skorlama
+
+    Geçmiş 4 model x gecmis_gun günlük kayıttır; satir_sayisi yeni kayıt skorlanır.
+    """
+    import tempfile
+
+    from anomali_servisi import AnomaliServisi, model_egit, ozellik_matrisi
+    from model_onbellegi import ModelOnbellegi
+
+    rng = np.random.default_rng(18)
+    modeller = ['iPhone 13', 'iPhone 14', 'iPhone 15', 'iPhone 16']
+    tarihler = pd.date_range('2021-01-01', periods=gecmis_gun, freq='D')
+    gecmis = pd.concat([pd.DataFrame({
+        'TARIH': tarihler, 'MODEL': model,
+        'FIYAT': 40000 + 5000 * i + np.cumsum(rng.normal(0, 100, gecmis_gun)),
+        'PERFORMANS_SKORU': 200.0 + 15 * i, 'URUN_YASI_GUN': np.arange(gecmis_gun)})
+        for i, model in enumerate(modeller)], ignore_index=True)
+    gecmis['FIYAT_PERFORMANS_ORANI'] = gecmis['FIYAT'] / gecmis['PERFORMANS_SKORU']
+    yeni = pd.DataFrame({'TARIH': tarihler[-1] + pd.Timedelta(days=1),
+                         'MODEL': rng.choice(modeller, satir_sayisi),
+                         'FIYAT': rng.normal(50000, 8000, satir_sayisi)})
+
+    def yeniden_egiterek():
+        # Önceki yöntem: her skorlamada geçmiş + yeni kayıtlarla dedektör yeniden eğitilir
+        birlesik = pd.concat([gecmis, yeni], ignore_index=True)
+        for model, grup in birlesik.groupby('MODEL'):
+            grup = grup.fillna({'PERFORMANS_SKORU': grup['PERFORMANS_SKORU'].iloc[0]})
+            grup['FIYAT_PERFORMANS_ORANI'] = grup['FIYAT'] / grup['PERFORMANS_SKORU']
+            durum = model_egit(grup)
+            durum['hat'].predict(ozellik_matrisi(grup, durum['ortalamalar']))
+
+    import sklearn.ensemble  # noqa: F401 - içe aktarma süresi ölçüme girmesin
+
+    print(f"🧪 Geçmiş {len(gecmis):,} kayıt, {satir_sayisi:,} yeni kayıt, {os.cpu_count()} çekirdek")
+    sure, _ = _sure_olc(yeniden_egiterek, tekrar=1)
+    print(f"  ⏱️ Geçmişle yeniden eğitip skorlama: {sure:.2f} sn")
+    with tempfile.TemporaryDirectory() as klasor:
+        sure, _ = _sure_olc(lambda: AnomaliServisi(ModelOnbellegi(klasor)).guncelle(gecmis), tekrar=1)
+        print(f"  ⏱️ İlk eğitim + diske yazma: {sure:.2f} sn")
+        servis = AnomaliServisi(ModelOnbellegi(klasor))
+        sure, _ = _sure_olc(lambda: [servis.durum(model) for model in modeller], tekrar=1)
+        print(f"  ⏱️ Dedektörleri diskten yükleme: {sure * 1000:.1f} ms")
+        for n_jobs in (1, -1):
+            servis.n_jobs = n_jobs
+            sure, _ = _sure_olc(lambda: servis.skorla(yeni.iloc[:1]))
+            print(f"  ⏱️ n_jobs={n_jobs}: tek kayıt {sure * 1000:.1f} ms", end='')
+            sure, _ = _sure_olc(lambda: servis.skorla(yeni))
+            print(f", {satir_sayisi:,} kayıt {sure * 1000:.1f} ms")
+
+
+def olcum_seri_deposu(satir_sayisi):
+    """Aşamaların model erişimi: her aşamada boolean maske + sıralama ile seri deposu
+
+    profesyonel_zaman_serisi aşamalarının erişim düzeni taklit edilir: anomali,
+    zaman serisi, rapor ve grafik için 4 model, LSTM için 2 model. Günlük
+    ortalamaların groupby ile aynılığı tests/test_seri_deposu.py'de sınanır.
+    """
+    from seri_deposu import SeriDeposu
+
+    rng = np.random.default_rng(19)
+    df = _ornek_kayitlar(satir_sayisi)
+    df['TARIH'] = pd.Timestamp('2022-01-01') + pd.to_timedelta(rng.integers(0, 1000, satir_sayisi), unit='D')
+    df = df.astype({'MODEL': 'category', 'KAPASITE': 'category'})
+    modeller = list(df['MODEL'].unique())
+
+    def maskeleyerek():
+        sonuc = 0.0
+        for model in modeller:  # anomali
+            sonuc += len(df[df['MODEL'] == model].copy().sort_values('TARIH'))
+        for model in modeller:  # ARIMA / Prophet
+            sonuc += df[df['MODEL'] == model].copy().groupby('TARIH')['FIYAT'].mean().iloc[-1]
+        for model in modeller[:2]:  # LSTM
+            model_data = df[df['MODEL'] == model].copy().sort_values('TARIH')
+            sonuc += model_data.groupby('TARIH')['FIYAT'].mean().iloc[-1]
+        for model in modeller:  # rapor
+            sonuc += df[df['MODEL'] == model].sort_values('TARIH')['FIYAT'].iloc[-1]
+        for model in modeller:  # grafik
+            sonuc += len(df[df['MODEL'] == model].sort_values('TARIH'))
+        return sonuc
+
+    def depodan():
+        depo = SeriDeposu(df)
+        sonuc = 0.0
+        for model in modeller:
+            sonuc += len(depo.satirlar(model))
+        for model in modeller:
+            sonuc += depo.gunluk(model)['FIYAT'].iloc[-1]
+        for model in modeller[:2]:
+            sonuc += depo.gunluk(model)['FIYAT'].iloc[-1]
+        for model in modeller:
+            sonuc += depo.gunluk(model)['FIYAT'].iloc[-1]
+        for model in modeller:
+            sonuc += len(depo.gunluk(model))
+        return depo
+
+    print(f"🧪 {satir_sayisi:,} kayıt, {len(modeller)} model, 1000 gün")
+    sure, _ = _sure_olc(maskeleyerek, tekrar=1)
+    print(f"  ⏱️ Her aşamada maske + kopya + sıralama: {sure:.2f} sn")
+    sure, depo = _sure_olc(depodan, tekrar=1)
+    print(f"  ⏱️ Seri deposu (kurulum dahil): {sure:.2f} sn")
+    sure, _ = _sure_olc(lambda: [depo.satirlar(m) for m in modeller for _ in range(100)])
+    print(f"  ⏱️ Kurulu depodan model dilimi: {sure / (100 * len(modeller)) * 1e6:.0f} µs")
+
+
+def olcum_hiyerarsik_uzlastirma(satir_sayisi, gun=730, ufuk=30):
+    """Hiyerarşi büyüdükçe S kurulumu ve uzlaştırma (alttan, usttan, MinT) süreleri
+
+    satir_sayisi en alt seri sayısıdır: 4 model x 3 kapasite x satıcılar
+    (MODEL → KAPASITE → SATICI). Temel tahmin naif, artıklar rastgele yürüyüş farkları.
+    Uzlaştırılmış tahminlerin tutarlılığı tests/test_hiyerarsik_tahmin.py'de sınanır.
+    """
+    from hiyerarsik_tahmin import dugum_gecmisi, naif_temel, toplama_matrisi, uzlastirma_matrisi
+
+    rng = np.random.default_rng(20)
+    for alt_sayisi in sorted({12, max(12, satir_sayisi // 10), max(12, satir_sayisi)}):
+        satici_sayisi = -(-alt_sayisi // 12)
+        anahtarlar = [(f"iPhone {m}", k, f"Satıcı {s}") for m in (13, 14, 15, 16)
+                      for k in ('128gb', '256gb', '512gb') for s in range(satici_sayisi)][:alt_sayisi]
+        Y = 50000 + np.cumsum(rng.normal(0, 150, (len(anahtarlar), gun)), axis=1)
+
+        baslangic = time.perf_counter()
+        dugumler, S = toplama_matrisi(anahtarlar)
+        H = dugum_gecmisi(S, Y)
+        temel, artiklar = naif_temel(H, ufuk)
+        # Naif temel tahmin zaten tutarlı olacağından düğümlere gürültü eklenir
+        temel = temel + rng.normal(0, 500, temel.shape)
+        kurulum = time.perf_counter() - baslangic
+
+        sureler = []
+        for yontem in ('alttan', 'usttan', 'mint'):
+            sure, _ = _sure_olc(lambda: S @ (uzlastirma_matrisi(S, yontem, H, artiklar)[0] @ temel))
+            sureler.append(f"{yontem} {sure * 1000:.1f} ms")
+        print(f"🌳 {len(anahtarlar)} alt seri, {len(dugumler)} düğüm: S + geçmiş {kurulum * 1000:.1f} ms, "
+              f"{', '.join(sureler)}")
+
+
+def olcum_ustel_duzeltme(satir_sayisi, gun=730, ufuk=30):
+    """Vektörel üstel düzeltme ile seri başına statsmodels ExponentialSmoothing döngüsü
+
+    satir_sayisi seri sayısıdır (sentetik: trend + haftalık desen + gürültü,
+    farklı başlangıç günleri). Uyum kalitesi (SSE) tests/test_ustel_duzeltme.py'de sınanır.
+    """
+    import warnings
+
+    from statsmodels.tsa.holtwinters import ExponentialSmoothing
+    from ustel_duzeltme import toplu_tahmin
+
+    warnings.filterwarnings('ignore')
+    rng = np.random.default_rng(21)
+    seri_sayisi = max(1, satir_sayisi)
+    gunler = np.arange(gun)
+    seriler = []
+    for _ in range(seri_sayisi):
+        baslangic_gunu = int(rng.integers(0, gun // 3))
+        desen = 300 * np.sin(2 * np.pi * gunler / 7)
+        seri = 50000 + rng.normal(-5, 3) * gunler + desen + np.cumsum(rng.normal(0, 120, gun))
+        seriler.append(seri[baslangic_gunu:])
+
+    ayarlar = {
+        'basit': {},
+        'holt': {'trend': 'add'},
+        'sonumlu': {'trend': 'add', 'damped_trend': True},
+        'holt_winters': {'trend': 'add', 'seasonal': 'add', 'seasonal_periods': 7},
+    }
+    print(f"⚡ {seri_sayisi} seri, {gun} güne kadar, {ufuk} gün ufuk")
+    for model, ayar in ayarlar.items():
+        vektorel_sure, _ = _sure_olc(lambda: toplu_tahmin(seriler, model, ufuk), tekrar=1)
+
+        def dongu():
+            return [ExponentialSmoothing(seri, initialization_method='estimated', **ayar).fit().forecast(ufuk)
+                    for seri in seriler]
+
+        dongu_sure, _ = _sure_olc(dongu, tekrar=1)
+        print(f"  {model:<13} vektörel {vektorel_sure * 1000:7.0f} ms | statsmodels döngüsü {dongu_sure * 1000:7.0f} ms "
+              f"({dongu_sure / vektorel_sure:.1f}x)")
+
+
+def olcum_tahmin_servisi(satir_sayisi, eszamanli=64):
+    """Yerel tahmin servisi: mikro toplama kapalı / yalnızca birikmiş istekler / 2 ms bekleme
+
+    Servis ve yük üreteci aynı süreçte, aynı olay döngüsünde çalışır. Veri 4 model
+    x 3 kapasite x 730 gün sentetik fiyattır; satir_sayisi toplam istek sayısıdır
+    (%20 anomali).
+    """
+    import asyncio
+    import tempfile
+
+    from model_onbellegi import ModelOnbellegi
+    from tahmin_servisi import TahminModelleri, TahminServisi, yuk_uret
+
+    rng = np.random.default_rng(23)
+    tarihler = pd.date_range('2023-01-01', periods=730, freq='D')
+    df = pd.concat([pd.DataFrame({
+        'TARIH': tarihler, 'MODEL': f"iPhone {13 + i}", 'KAPASITE': kapasite,
+        'FIYAT': 40000 + 5000 * i + 4000 * j + np.cumsum(rng.normal(0, 100, len(tarihler))),
+        'PERFORMANS_SKORU': 200.0 + 15 * i, 'URUN_YASI_GUN': np.arange(len(tarihler))})
+        for i in range(4) for j, kapasite in enumerate(('128gb', '256gb', '512gb'))], ignore_index=True)
+    df['FIYAT_PERFORMANS_ORANI'] = df['FIYAT'] / df['PERFORMANS_SKORU']
+
+    async def calistir(modeller, bekleme_ms, en_fazla):
+        servis = TahminServisi(modeller, bekleme_ms, en_fazla)
+        port = await servis.baslat(port=0)
+        try:
+            return await yuk_uret(port=port, istek_sayisi=satir_sayisi, eszamanli=eszamanli)
+        finally:
+            await servis.durdur()
+
+    with tempfile.TemporaryDirectory() as klasor:
+        baslangic = time.perf_counter()
+        modeller = TahminModelleri(df, onbellek=ModelOnbellegi(klasor))
+        print(f"🌐 {len(modeller.seriler)} seri + anomali dedektörleri {time.perf_counter() - baslangic:.2f} sn'de "
+              f"yüklendi; {satir_sayisi:,} istek, {eszamanli} eşzamanlı bağlantı")
+        for aciklama, bekleme_ms, en_fazla in (('Toplama yok', 0, 1), ('Birikmiş istekler', 0, 64),
+                                               ('2 ms bekleme', 2, 64)):
+            sonuc = asyncio.run(calistir(modeller, bekleme_ms, en_fazla))
+            toplu = {uc: ozet['ortalama_toplu'] for uc, ozet in sonuc['sunucu']['uclar'].items()}
+            print(f"  ⏱️ {aciklama}: {sonuc['verim_istek_sn']:,.0f} istek/sn, p50 {sonuc['p50_ms']:.1f} ms, "
+                  f"p99 {sonuc['p99_ms']:.1f} ms, ortalama toplu iş {toplu}, {sonuc['hata']} hata")
+
+
+def olcum_grafik_seyreltme(satir_sayisi, seri_sayisi=36):
+    """Fiyat grafiği yükü: ham go.Scatter izleri ile LTTB/zarf seyreltmeli Scattergl izleri
+
+    satir_sayisi en uzun geçmişin gün sayısıdır; seri_sayisi SKU için 1 yıl, 5 yıl ve
+    satir_sayisi günlük geçmişte grafik JSON boyutu ve oluşturma + serileştirme süresi.
+    """
+    import plotly.graph_objects as go
+
+    from grafik_seyreltme import NOKTA_BUTCESI, seyreltilmis_iz
+
+    rng = np.random.default_rng(24)
+    print(f"📊 {seri_sayisi} seri, iz başına {NOKTA_BUTCESI} nokta bütçesi")
+    for gun in sorted({365, 5 * 365, max(365, satir_sayisi)}):
+        tarihler = pd.date_range('2015-01-01', periods=gun, freq='D')
+        fiyatlar = 40000 + np.cumsum(rng.normal(0, 150, (seri_sayisi, gun)), axis=1)
+
+        def grafik(iz_uret):
+            fig = go.Figure([iz_uret(tarihler, seri, f"SKU {i}") for i, seri in enumerate(fiyatlar)])
+            return len(fig.to_json())
+
+        sonuclar = [
+            ('ham Scatter', lambda t, y, ad: go.Scatter(x=t, y=y, name=ad, mode='lines')),
+            ('LTTB Scattergl', lambda t, y, ad: seyreltilmis_iz(t, y, name=ad, mode='lines')),
+            ('zarf Scattergl', lambda t, y, ad: seyreltilmis_iz(t, y, yontem='zarf', name=ad, mode='lines')),
+        ]
+        parcalar = []
+        for aciklama, iz_uret in sonuclar:
+            sure, boyut = _sure_olc(lambda: grafik(iz_uret))
+            parcalar.append(f"{aciklama} {boyut / 1e6:.2f} MB / {sure * 1000:.0f} ms")
+        print(f"  ⏱️ {gun:>5} gün: {' | '.join(parcalar)}")
+
+
+def olcum_asama_olcumu(satir_sayisi, blok_sayisi=100_000):
+    """Aşama ölçümünün yükü: olc() bloğu başına maliyet ve tracemalloc'un pandas işine etkisi
+
+    Ölçüm kapalı, yalnızca süre ve süre + tracemalloc modlarında boş blok başına
+    süre ile satir_sayisi kayıtlık groupby + sıralama + dizgi birleştirme işinin süresi.
+    """
+    import asama_olcumu
+
+    df = _ornek_kayitlar(satir_sayisi)
+
+    def is_yuku():
+        # Vektörel kısım (az, büyük ayırma) + nesne dizgileri (çok sayıda küçük ayırma)
+        ozet = df.groupby(['MODEL', 'KAPASITE'])['FIYAT'].agg(['mean', 'std', 'count'])
+        sku = df['MODEL'].str.lower() + ' - ' + df['KAPASITE']
+        return len(df.sort_values('FIYAT')) + len(ozet) + sku.nunique()
+
+    def bos_bloklar():
+        for _ in range(blok_sayisi):
+            with asama_olcumu.olc('bos'):
+                pass
+
+    print(f"📊 {blok_sayisi:,} boş blok, {satir_sayisi:,} kayıtlık groupby + sıralama + dizgi birleştirme")
+    temel = None
+    for aciklama, ayarlar in (('ölçüm kapalı', None), ('süre', {'bellek': False}), ('süre + tracemalloc', {'bellek': True})):
+        if ayarlar is not None:
+            asama_olcumu.baslat(giris='olcum', **ayarlar)
+        try:
+            blok_sure, _ = _sure_olc(bos_bloklar, tekrar=1)
+            sure, _ = _sure_olc(lambda: asama_olcumu.olculen('is')(is_yuku)())
+        finally:
+            asama_olcumu.bitir(ozet=False)
+        temel = temel or sure
+        print(f"  ⏱️ {aciklama:<20} blok başına {blok_sure / blok_sayisi * 1e6:6.2f} µs | "
+              f"iş {sure * 1000:7.1f} ms ({sure / temel:.1f}x)")
+
+
+OLCUMLER = {
+    'ozellik_katalogu': olcum_ozellik_katalogu,
+    'hucre_tarayici': olcum_hucre_tarayici,
+    'bellek_semasi': olcum_bellek_semasi,
+    'zaman_serisi_baslangic': olcum_zaman_serisi_baslangic,
+    'tahmin_havuzu': olcum_tahmin_havuzu,
+    'model_onbellegi': olcum_model_onbellegi,
+    'artimli_arima': olcum_artimli_arima,
+    'arima_derece': olcum_arima_derece,
+    'pencereleme': olcum_pencereleme,
+    'lstm_cikarim': olcum_lstm_cikarim,
+    'geriye_donuk_test': olcum_geriye_donuk_test,
+    'prophet_yeniden_egitim': olcum_prophet_yeniden_egitim,
+    'anomali_servisi': olcum_anomali_servisi,
+    'seri_deposu': olcum_seri_deposu,
+    'hiyerarsik_uzlastirma': olcum_hiyerarsik_uzlastirma,
+    'ustel_duzeltme': olcum_ustel_duzeltme,
+    'tahmin_servisi': olcum_tahmin_servisi,
+    'grafik_seyreltme': olcum_grafik_seyreltme,
+    'asama_olcumu': olcum_asama_olcumu,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Performans ölçümleri')
+    parser.add_argument('olcum', choices=sorted(OLCUMLER), help='Çalıştırılacak ölçüm')
+    parser.add_argument('--satir', type=int, default=1_000_000, help='Ölçümde kullanılacak kayıt sayısı')
+    args = parser.parse_args()
+
+    OLCUMLER[args.olcum](args.satir)
+
+
+if __name__ == "__main__":
+    main()
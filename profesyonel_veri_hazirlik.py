@@ -1,160 +1,50 @@
-import re
-import pandas as pd
-import numpy as np
+"""
+Profesyonel Veri Hazırlama
 
-# Üzerinde çalışılacak kaynak dosyanın adı
-input_file_name = 'telefon_fiyatlar.xlsx'
+Kütüphane olarak içe aktarıldığında hiçbir dosya okumaz/yazmaz ve çıktı basmaz.
+Çekirdek fonksiyonlar DataFrame alıp DataFrame döndürür:
 
-# Temiz verilerin kaydedileceği yeni dosyanın adı
-output_file_name = 'profesyonel_telefon_verileri3.csv'
+- profesyonel_veri_seti(tablo): pd.read_excel ile okunmuş fiyat takip sayfasından
+  43 sütunlu veri setini üretir
+- kayit_tablosu(tablo) / profesyonel_ozellikleri_turet(kayitlar): aynı işin iki adımı
+- gercek_model_ozelliklerini_al, kampanya_ve_pazar_analizi (+ vektörel karşılığı)
+
+Dosya okuma/yazma (akışlı okuma, toplu mod, artımlı güncelleme, Parquet) ve
+komut satırı arayüzü ayrı fonksiyonlardadır. pandas/numpy ve yardımcı modüller
+fonksiyonların içinde içe aktarılır; `--help` ve içe aktarma hızlıdır.
+
+Kullanım:
+    python profesyonel_veri_hazirlik.py telefon_fiyatlar.xlsx -o profesyonel_telefon_verileri3.csv
+    python profesyonel_veri_hazirlik.py arsiv/ --toplu --kaynak-deseni '^([^_]+)_'
+    python profesyonel_veri_hazirlik.py telefon_fiyatlar.xlsx --olcum   # cikarma/turetme/yazma ölçümü
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+from operator import itemgetter
+
+import asama_olcumu
+from asama_olcumu import olc
 
-print(f"'{input_file_name}' dosyası okunuyor...")
+# Varsayılan kaynak dosya, çıktı dosyası ve artımlı mod manifestosu
+input_file_name = 'telefon_fiyatlar.xlsx'
+output_file_name = 'profesyonel_telefon_verileri3.csv'
+manifesto_file_name = 'profesyonel_telefon_verileri3_manifesto.json'
 
-# Ayıklanan verileri saklamak için boş listeler oluşturalım
-veriler = []
+KAYIT_SUTUNLARI = ['SUTUN', 'MODEL', 'KAPASITE', 'TARIH', 'FIYAT']
 
-# Gerçek teknik özellikler
+# Gerçek teknik özellikler (model_ozellikleri.csv kataloğundan)
 def gercek_model_ozelliklerini_al(model, kapasite):
     """Gerçek iPhone teknik özelliklerini döndürür"""
-    
-    # iPhone 13 özellikleri
-    if 'iPhone 13' in model:
-        ozellikler = {
-            'EKRAN_BOYUTU': '6.1',
-            'DAHILI_DEPOLAMA': kapasite.replace('gb', '').replace('tb', '000') if kapasite != 'bilinmiyor' else '128',
-            'RAM_GB': '4',
-            'BATARYA_MAH': '3227',
-            'HIZLI_SARJ_W': '20',
-            '5G_DESTEGI': 'Var',
-            'SUYA_DAYANIKLILIK': 'Var',
-            'KABLOSUZ_SARJ': 'Var',
-            'SU_GECIRMEZLIK_SEVIYESI': 'IPX8',
-            '4_5G_DESTEGI': 'Var',
-            'CPU_FREKANSI_GHZ': '3.2',
-            'CPU_CEKIRDEK': '6',
-            'HAT_SAYISI': 'Çift Hat',
-            'SAR_DEGERI': '0.98',
-            'EKRAN_GOVDE_ORANI': '85.62',
-            'KAMERA_MP': '12',
-            'EKRAN_COZUNURLUGU': '1170x2532',
-            'EKRAN_YENILEME_HZ': '60',
-            'CHIPSET': 'Apple A15 Bionic',
-            'DXOMARK_PUAN': '125',
-            'IOS_VERSIYON': 'iOS 15',
-            'YUKSELTILEBILIR_IOS': 'iOS 18',
-            'CIKIS_YILI': '2021',
-            'GENEL_PUAN': '125'
-        }
-    
-    # iPhone 14 özellikleri
-    elif 'iPhone 14' in model:
-        ozellikler = {
-            'EKRAN_BOYUTU': '6.1',
-            'DAHILI_DEPOLAMA': kapasite.replace('gb', '').replace('tb', '000') if kapasite != 'bilinmiyor' else '256',
-            'RAM_GB': '6',
-            'BATARYA_MAH': '3279',
-            'HIZLI_SARJ_W': '20',
-            '5G_DESTEGI': 'Var',
-            'SUYA_DAYANIKLILIK': 'Var',
-            'KABLOSUZ_SARJ': 'Var',
-            'SU_GECIRMEZLIK_SEVIYESI': 'IPX8',
-            '4_5G_DESTEGI': 'Var',
-            'CPU_FREKANSI_GHZ': '3.2',
-            'CPU_CEKIRDEK': '6',
-            'HAT_SAYISI': 'Çift Hat',
-            'SAR_DEGERI': '0.98',
-            'EKRAN_GOVDE_ORANI': '85.62',
-            'KAMERA_MP': '12',
-            'EKRAN_COZUNURLUGU': '1170x2532',
-            'EKRAN_YENILEME_HZ': '60',
-            'CHIPSET': 'Apple A15 Bionic',
-            'DXOMARK_PUAN': '133',
-            'IOS_VERSIYON': 'iOS 16',
-            'YUKSELTILEBILIR_IOS': 'iOS 18',
-            'CIKIS_YILI': '2022',
-            'GENEL_PUAN': '133'
-        }
-    
-    # iPhone 15 özellikleri
-    elif 'iPhone 15' in model:
-        ozellikler = {
-            'EKRAN_BOYUTU': '6.1',
-            'DAHILI_DEPOLAMA': kapasite.replace('gb', '').replace('tb', '000') if kapasite != 'bilinmiyor' else '256',
-            'RAM_GB': '6',
-            'BATARYA_MAH': '3349',
-            'HIZLI_SARJ_W': '20',
-            '5G_DESTEGI': 'Var',
-            'SUYA_DAYANIKLILIK': 'Var',
-            'KABLOSUZ_SARJ': 'Var',
-            'SU_GECIRMEZLIK_SEVIYESI': 'IPX8',
-            '4_5G_DESTEGI': 'Var',
-            'CPU_FREKANSI_GHZ': '3.46',
-            'CPU_CEKIRDEK': '6',
-            'HAT_SAYISI': 'Çift Hat',
-            'SAR_DEGERI': '0.98',
-            'EKRAN_GOVDE_ORANI': '85.55',
-            'KAMERA_MP': '48',
-            'EKRAN_COZUNURLUGU': '1179x2556',
-            'EKRAN_YENILEME_HZ': '60',
-            'CHIPSET': 'Apple A16 Bionic',
-            'DXOMARK_PUAN': '145',
-            'IOS_VERSIYON': 'iOS 17',
-            'YUKSELTILEBILIR_IOS': 'iOS 18',
-            'USB_C': 'Var',
-            'CIKIS_YILI': '2023',
-            'GENEL_PUAN': '145'
-        }
-    
-    # iPhone 16 özellikleri
-    elif 'iPhone 16' in model:
-        ozellikler = {
-            'EKRAN_BOYUTU': '6.1',
-            'DAHILI_DEPOLAMA': kapasite.replace('gb', '').replace('tb', '000') if kapasite != 'bilinmiyor' else '256',
-            'RAM_GB': '8',
-            'BATARYA_MAH': '3561',
-            'HIZLI_SARJ_W': '25',
-            '5G_DESTEGI': 'Var',
-            'SUYA_DAYANIKLILIK': 'Var',
-            'KABLOSUZ_SARJ': 'Var',
-            'SU_GECIRMEZLIK_SEVIYESI': 'IPX8',
-            '4_5G_DESTEGI': 'Var',
-            'CPU_FREKANSI_GHZ': '4.04',
-            'CPU_CEKIRDEK': '6',
-            'HAT_SAYISI': 'Çift Hat',
-            'SAR_DEGERI': '1.24',
-            'EKRAN_GOVDE_ORANI': '85.55',
-            'KAMERA_MP': '48',
-            'EKRAN_COZUNURLUGU': '1179x2556',
-            'EKRAN_YENILEME_HZ': '60',
-            'CHIPSET': 'Apple A18',
-            'DXOMARK_PUAN': '147',
-            'IOS_VERSIYON': 'iOS 18',
-            'YUKSELTILEBILIR_IOS': 'iOS 18',
-            'USB_C': 'Var',
-            'AI_CHIP': 'Var',
-            'CIKIS_YILI': '2024',
-            'GENEL_PUAN': '147'
-        }
-    
-    else:
-        # Default değerler
-        ozellikler = {
-            'EKRAN_BOYUTU': '6.1',
-            'DAHILI_DEPOLAMA': '128',
-            'RAM_GB': '4',
-            'BATARYA_MAH': '3000',
-            'HIZLI_SARJ_W': '20',
-            '5G_DESTEGI': 'Var',
-            'CHIPSET': 'Apple A15',
-            'DXOMARK_PUAN': '120',
-            'CIKIS_YILI': '2021',
-            'GENEL_PUAN': '120'
-        }
-    
-    return ozellikler
+    from ozellik_katalogu import katalogu_yukle
+    return katalogu_yukle().ozellikler(model, kapasite)
 
 def kampanya_ve_pazar_analizi(fiyat, model_ort_fiyat, tarih):
     """Gelişmiş kampanya ve pazar analizi"""
+    import pandas as pd
     
     # Kampanya tespiti
     if fiyat < model_ort_fiyat * 0.80:
@@ -194,210 +84,460 @@ def kampanya_ve_pazar_analizi(fiyat, model_ort_fiyat, tarih):
     
     return kampanya, pazar_durumu, sezonsal_etki
 
-try:
-    # Excel dosyasını pandas ile okuyoruz
-    df = pd.read_excel(input_file_name)
-    
+# Çıktı dosyasındaki sütun sırası
+CIKTI_SUTUNLARI = [
+    'TARIH', 'MARKA', 'MODEL', 'KAPASITE', 'FIYAT',
+    'EKRAN_BOYUTU', 'DAHILI_DEPOLAMA', 'RAM_GB', 'BATARYA_MAH', 'HIZLI_SARJ_W',
+    'CPU_FREKANSI_GHZ', 'CPU_CEKIRDEK', 'KAMERA_MP', 'EKRAN_COZUNURLUGU', 'EKRAN_YENILEME_HZ',
+    'CHIPSET', 'DXOMARK_PUAN', 'IOS_VERSIYON',
+    '5G_DESTEGI', '4_5G_DESTEGI', 'SUYA_DAYANIKLILIK', 'SU_GECIRMEZLIK_SEVIYESI', 'KABLOSUZ_SARJ',
+    'USB_C', 'AI_CHIP',
+    'SAR_DEGERI', 'EKRAN_GOVDE_ORANI', 'HAT_SAYISI',
+    'PERFORMANS_SKORU', 'FIYAT_PERFORMANS_ORANI', 'URUN_YASI_AY', 'URUN_YASI_GUN', 'CIKIS_YILI',
+    'KAMPANYA_DURUMU', 'PAZAR_DURUMU', 'SEZONSAL_ETKI', 'GUN_TIPI', 'YIL', 'AY', 'GUN', 'HAFTA_GUN',
+    'PREMIUM_KATEGORI', 'GENEL_PUAN'
+]
+
+# Vektörel etiketleme için etiket tabloları (np.select indeksleri ile seçilir)
+KAMPANYA_ETIKETLERI = ('Mega İndirim', 'Büyük İndirim', 'İndirim', 'Premium Fiyat', 'Yüksek Fiyat', 'Normal Fiyat')
+PAZAR_ETIKETLERI = ('Yükseliş Trendi', 'Stabil Pazar', 'Düşüş Trendi')
+SEZON_ETIKETLERI = ('İndirim Sezonu', 'Yaz Sezonu', 'Lansman Sezonu', 'Normal Sezon')
+GUN_TIPI_ETIKETLERI = ('Hafta İçi', 'Hafta Sonu')
+
+def _etiketle(etiketler, kodlar):
+    """Etiket kodlarını (np.select sonuçları) etiket dizisine çevirir"""
+    import numpy as np
+    return np.array(etiketler, dtype=object)[kodlar]
+
+def _tarih_bilesenleri(tarihler):
+    """Yıl, ay, gün ve haftanın günü dizilerini döndürür
+
+    Fiyat kayıtlarında aynı tarih çok kez tekrarlandığı için bileşenler yalnızca
+    farklı tarihler üzerinde hesaplanıp kayıtlara geri dağıtılır.
+    """
+    import numpy as np
+    import pandas as pd
+
+    kodlar, benzersiz = pd.factorize(np.asarray(tarihler, dtype='datetime64[ns]'))
+    benzersiz = pd.DatetimeIndex(benzersiz)
+    return (
+        benzersiz.year.to_numpy()[kodlar],
+        benzersiz.month.to_numpy()[kodlar],
+        benzersiz.day.to_numpy()[kodlar],
+        benzersiz.weekday.to_numpy()[kodlar],
+    )
+
+def kampanya_etiketleri(fiyatlar, model_ort_fiyatlar):
+    """Fiyatın model ortalamasına göre kampanya etiketlerini döndürür (vektörel)"""
+    import numpy as np
+
+    fiyatlar = np.asarray(fiyatlar, dtype=float)
+    model_ort_fiyatlar = np.asarray(model_ort_fiyatlar, dtype=float)
+
+    # Kampanya tespiti (koşullar if/elif sırasıyla değerlendirilir)
+    return _etiketle(KAMPANYA_ETIKETLERI, np.select(
+        [
+            fiyatlar < model_ort_fiyatlar * 0.80,
+            fiyatlar < model_ort_fiyatlar * 0.88,
+            fiyatlar < model_ort_fiyatlar * 0.95,
+            fiyatlar > model_ort_fiyatlar * 1.10,
+            fiyatlar > model_ort_fiyatlar * 1.05,
+        ],
+        [0, 1, 2, 3, 4],
+        default=5
+    ))
+
+def kampanya_ve_pazar_analizi_vektorel(fiyatlar, model_ort_fiyatlar, tarihler):
+    """kampanya_ve_pazar_analizi'nin dizi (vektörel) karşılığı
+
+    tarihler datetime64 dizisi/Series olmalıdır; üç etiket dizisi döndürür.
+    """
+    import numpy as np
+
+    kampanya = kampanya_etiketleri(fiyatlar, model_ort_fiyatlar)
+    yil, ay, _, _ = _tarih_bilesenleri(tarihler)
+
+    # Yıl bazında pazar durumu
+    pazar_durumu = _etiketle(PAZAR_ETIKETLERI, np.select([yil == 2024, yil == 2023], [0, 1], default=2))
+
+    # Sezonsal etkiler
+    sezonsal_etki = _etiketle(SEZON_ETIKETLERI, np.select(
+        [np.isin(ay, [11, 12]), np.isin(ay, [6, 7, 8]), np.isin(ay, [9, 10])],
+        [0, 1, 2],
+        default=3
+    ))
+
+    return kampanya, pazar_durumu, sezonsal_etki
+
+def _sku_ozellik_tablosu(skular, katalog=None):
+    """Her (MODEL, KAPASITE) çifti için katalog özellikleri ve performans skorunu üretir"""
+    import numpy as np
+    import pandas as pd
+    from ozellik_katalogu import katalogu_yukle
+
+    tablo = (katalog or katalogu_yukle()).sku_tablosu(skular)
+
+    # Performans skoru hesaplama (DxOMark + RAM + Batarya + CPU)
+    performans_skoru = (
+        tablo['DXOMARK_PUAN'].fillna(120).astype(float) * 0.4 +
+        tablo['RAM_GB'].fillna(4).astype(float) * 10 +
+        tablo['BATARYA_MAH'].fillna(3000).astype(float) / 100 +
+        tablo['CPU_FREKANSI_GHZ'].fillna(3.0).astype(float) * 20
+    )
+
+    # Hesaplanan Özellikler (yuvarlanmamış skor oran hesabında kullanılır)
+    tablo['PERFORMANS_SKORU'] = performans_skoru.round(2)
+    tablo['_PERFORMANS_HAM'] = performans_skoru
+    tablo['_CIKIS_TARIHI'] = pd.to_datetime(tablo['CIKIS_YILI'].fillna(2021).astype(int).astype(str) + '-09-01')
+
+    # Kategorizasyon
+    kapasite = tablo['KAPASITE'].str.lower()
+    tablo['PREMIUM_KATEGORI'] = np.where(
+        kapasite.str.contains('512gb'), 'Premium',
+        np.where(kapasite.str.contains('256gb'), 'Orta', 'Standart')
+    ).astype(object)
+    return tablo
+
+def profesyonel_ozellikleri_turet(kayitlar, sutun_ortalamalari=None, katalog=None):
+    """Ham fiyat kayıtlarından 43 sütunlu profesyonel veri setini sütun bazlı türetir
+
+    kayitlar: SUTUN, TARIH ('%d.%m.%Y' metni), MODEL, KAPASITE, FIYAT sütunlarını
+    içeren DataFrame; MARKA ve teknik özellikler katalogdan eklenir. Kampanya
+    etiketlerindeki ortalama fiyat her kaynak sütun (SUTUN) için ayrı hesaplanır;
+    sutun_ortalamalari (SUTUN -> ortalama) verilirse o değerler kullanılır.
+    katalog verilmezse varsayılan özellik kataloğu kullanılır. Satır sırası korunur.
+    """
+    import numpy as np
+    import pandas as pd
+    from ozellik_katalogu import sku_tablosunu_ekle
+
+    # Tüm tarihleri tek çağrıda ayrıştır (her farklı tarih metni yalnızca bir kez)
+    tarih_kodlari, tarih_metinleri = pd.factorize(kayitlar['TARIH'])
+    tarihler = pd.to_datetime(tarih_metinleri, format='%d.%m.%Y').to_numpy()[tarih_kodlari]
+    fiyatlar = kayitlar['FIYAT'].to_numpy(dtype=float)
+
+    # Her kaynak sütunun ortalama fiyatı (np.mean ile, satır bazlı akışla aynı sonuç)
+    if sutun_ortalamalari is None:
+        sutun_ortalamalari = kayitlar.groupby('SUTUN', sort=False)['FIYAT'].agg(lambda s: np.mean(s.to_numpy()))
+    model_ort_fiyatlar = kayitlar['SUTUN'].map(sutun_ortalamalari).to_numpy()
+
+    # Özellikler her SKU için bir kez hesaplanır ve kayıtlara birleştirilir
+    ozellik_tablosu = _sku_ozellik_tablosu(kayitlar[['MODEL', 'KAPASITE']], katalog)
+    df_sonuc = sku_tablosunu_ekle(kayitlar[['TARIH', 'MODEL', 'KAPASITE', 'FIYAT']], ozellik_tablosu)
+
+    kampanya, pazar_durumu, sezonsal_etki = kampanya_ve_pazar_analizi_vektorel(
+        fiyatlar, model_ort_fiyatlar, tarihler
+    )
+
+    # Ürün yaşı ve fiyat/performans oranı
+    urun_yasi_gun = (tarihler - df_sonuc['_CIKIS_TARIHI'].to_numpy()).astype('timedelta64[D]').astype(np.int64)
+    df_sonuc['FIYAT_PERFORMANS_ORANI'] = np.round(fiyatlar / df_sonuc['_PERFORMANS_HAM'].to_numpy(), 2)
+    df_sonuc['URUN_YASI_AY'] = urun_yasi_gun // 30
+    df_sonuc['URUN_YASI_GUN'] = urun_yasi_gun
+
+    # Pazar ve Zaman Analizi
+    yil, ay, gun, hafta_gun = _tarih_bilesenleri(tarihler)
+    df_sonuc['KAMPANYA_DURUMU'] = kampanya
+    df_sonuc['PAZAR_DURUMU'] = pazar_durumu
+    df_sonuc['SEZONSAL_ETKI'] = sezonsal_etki
+    df_sonuc['GUN_TIPI'] = _etiketle(GUN_TIPI_ETIKETLERI, (hafta_gun >= 5).astype(np.intp))
+    df_sonuc['YIL'] = yil
+    df_sonuc['AY'] = ay
+    df_sonuc['GUN'] = gun
+    df_sonuc['HAFTA_GUN'] = hafta_gun
+
+    return df_sonuc[CIKTI_SUTUNLARI]
+
+def dataframe_kayitlarini_oku(df):
+    """pd.read_excel ile okunmuş tablodan (sütun, model, kapasite, tarih, fiyat) kayıtları üretir"""
+    from hucre_tarayici import sutun_tara
+
     # Her sütunu ayrı ayrı işleyelim
     for col_idx in range(df.shape[1]):
-        column = df.iloc[:, col_idx]
-        
-        # Bu sütundaki model ve kapasite bilgisini bul
-        model_info = None
-        kapasite_info = None
-        marka_info = "iPhone"
-        
-        # Sütunun ilk birkaç hücresinde model bilgisi arayalım
-        for row_idx in range(min(8, len(column))):
-            cell_value = str(column.iloc[row_idx])
-            if cell_value and cell_value != 'nan' and cell_value != 'NaN':
-                cell_lower = cell_value.lower()
-                
-                # iPhone model ve kapasite pattern'lerini ara
-                iphone_full_match = re.search(r'iphone\s*(\d+)\s*(\d+)\s*(gb|tb)?', cell_lower)
-                if iphone_full_match:
-                    model_num = iphone_full_match.group(1)
-                    capacity_num = iphone_full_match.group(2)
-                    capacity_unit = iphone_full_match.group(3) if iphone_full_match.group(3) else "gb"
-                    
-                    model_info = f"iPhone {model_num}"
-                    kapasite_info = f"{capacity_num}{capacity_unit}"
-                    break
-                
-                elif re.search(r'iphone\s*(\d+)', cell_lower):
-                    iphone_match = re.search(r'iphone\s*(\d+)', cell_lower)
-                    model_num = iphone_match.group(1)
-                    model_info = f"iPhone {model_num}"
-                    kapasite_match = re.search(r'(\d{2,})\s*(gb|tb)', cell_lower)
-                    if kapasite_match:
-                        kapasite_info = f"{kapasite_match.group(1)}{kapasite_match.group(2)}"
-                    else:
-                        kapasite_info = "128gb"  # Default
-                    break
-        
-        # Bu sütundaki tarih ve fiyat bilgilerini ayıkla
-        sütun_verileri = []
-        
-        for row_idx in range(len(column)):
-            cell_value = str(column.iloc[row_idx])
-            if cell_value and cell_value != 'nan' and cell_value != 'NaN':
-                tarih_eslesmesi = re.search(r'(\d{2}\.\d{2}\.\d{4})', cell_value)
-                if tarih_eslesmesi:
-                    tarih = tarih_eslesmesi.group(1)
-                    
-                    for fiyat_row in range(row_idx, min(row_idx + 5, len(column))):
-                        fiyat_cell = str(column.iloc[fiyat_row])
-                        fiyat_eslesmesi = re.search(r'(\d{4,}\.\d{2})', fiyat_cell)
-                        if fiyat_eslesmesi:
-                            fiyat = fiyat_eslesmesi.group(1)
-                            sütun_verileri.append({
-                                'tarih': tarih,
-                                'fiyat': float(fiyat)
-                            })
-                            break
-        
+        model_info, kapasite_info, sutun_verileri = sutun_tara(map(str, df.iloc[:, col_idx].tolist()))
+
         # Eğer model bilgisi ve tarih/fiyat verileri varsa kaydet
-        if model_info and sütun_verileri:
-            # Gerçek model özelliklerini al
-            ozellikler = gercek_model_ozelliklerini_al(model_info, kapasite_info)
-            
-            # Bu model için ortalama fiyat hesapla
-            fiyatlar = [v['fiyat'] for v in sütun_verileri]
-            model_ort_fiyat = np.mean(fiyatlar)
-            
-            for veri in sütun_verileri:
-                # Kampanya ve pazar analizi
-                kampanya, pazar_durumu, sezonsal_etki = kampanya_ve_pazar_analizi(
-                    veri['fiyat'], model_ort_fiyat, veri['tarih']
-                )
-                
-                # Zaman bazlı özellikler
-                tarih_obj = pd.to_datetime(veri['tarih'], format='%d.%m.%Y')
-                
-                # Ürün yaşı hesaplama
-                cikis_yili = int(ozellikler.get('CIKIS_YILI', '2021'))
-                urun_yasi_gun = (tarih_obj - pd.to_datetime(f'{cikis_yili}-09-01')).days
-                urun_yasi_ay = urun_yasi_gun // 30
-                
-                # Hafta içi/hafta sonu
-                gun_tipi = 'Hafta Sonu' if tarih_obj.weekday() >= 5 else 'Hafta İçi'
-                
-                # Performans skoru hesaplama (DxOMark + RAM + Batarya + CPU)
-                performans_skoru = (
-                    float(ozellikler.get('DXOMARK_PUAN', '120')) * 0.4 +
-                    float(ozellikler.get('RAM_GB', '4')) * 10 +
-                    float(ozellikler.get('BATARYA_MAH', '3000')) / 100 +
-                    float(ozellikler.get('CPU_FREKANSI_GHZ', '3.0')) * 20
+        for tarih, fiyat in sutun_verileri:
+            yield col_idx, model_info, kapasite_info, tarih, fiyat
+
+def kayit_tablosu(df):
+    """pd.read_excel ile okunmuş tablodan SUTUN, MODEL, KAPASITE, TARIH, FIYAT kayıt tablosu üretir"""
+    import pandas as pd
+    return pd.DataFrame(list(dataframe_kayitlarini_oku(df)), columns=KAYIT_SUTUNLARI)
+
+def profesyonel_veri_seti(df, katalog=None):
+    """pd.read_excel ile okunmuş fiyat takip tablosundan 43 sütunlu veri setini üretir"""
+    import pandas as pd
+    kayitlar = kayit_tablosu(df)
+    return profesyonel_ozellikleri_turet(kayitlar, katalog=katalog) if len(kayitlar) else pd.DataFrame()
+
+# --- Dosya okuma/yazma katmanı ---
+
+def kayitlari_oku(dosya, akisli=True):
+    """Çalışma kitabından sütun sırasına dizilmiş (sütun, model, kapasite, tarih, fiyat) kayıtlarını okur
+
+    akisli=True iken çalışma kitabı openpyxl salt-okunur modunda satır satır okunur;
+    büyük dosyalar DataFrame'e yüklenmeden işlenir.
+    """
+    if akisli:
+        from akisli_excel_okuyucu import excel_kayitlarini_oku
+
+        # Çalışma kitabını tek geçişte akışla oku; kayıtları sütun sırasına diz
+        return sorted(excel_kayitlarini_oku(dosya), key=itemgetter(0))
+    import pandas as pd
+
+    # Excel dosyasını pandas ile okuyoruz
+    return list(dataframe_kayitlarini_oku(pd.read_excel(dosya)))
+
+def _metin_tablosu(df):
+    """Türetilmiş tabloyu CSV'ye yazıldığı haliyle metin sütunlarına çevirir"""
+    import pandas as pd
+    return pd.read_csv(io.StringIO(df.to_csv(index=False)), dtype=str, keep_default_na=False)
+
+def artimli_hazirla(kaynak_dosya, cikti_dosya, manifesto_dosya, akisli=True):
+    """Yalnızca değişen kaynak sütunları türetip mevcut çıktıyla birleştirir
+
+    Mevcut çıktı metin olarak (dtype=str) okunur; değişmeyen satırlar aynen yazılır.
+    Her sütun için üç durum vardır:
+    - aynı: kayıt özeti değişmemiş, satırlar korunur
+    - ekleme: eski kayıtlar yeni kayıtların önekidir; yalnızca yeni kayıtlar türetilir,
+      ortalama fiyat saklanan toplamdan güncellenir ve eski satırların kampanya
+      etiketleri yeni ortalamayla yenilenir
+    - yeniden: diğer tüm değişikliklerde sütun baştan türetilir
+    (Çıktı tablosu, yeni manifesto, sütun durumları) döndürür; sütun durumları
+    {'aynı', 'ekleme', 'yeniden'} başına sütun sayısıdır, kaynak dosya hiç
+    değişmemişse (mevcut çıktı aynen kullanılır) None olur. Manifesto çıktı
+    yazıldıktan sonra kaydedilmelidir.
+    """
+    import numpy as np
+    import pandas as pd
+    from kaynak_manifestosu import dosya_ozeti, kayit_ozeti, manifesto_oku
+    from ozellik_katalogu import KATALOG_DOSYASI
+
+    kaynak_ozeti = dosya_ozeti(kaynak_dosya)
+    katalog_ozeti = dosya_ozeti(KATALOG_DOSYASI)
+
+    # Mevcut çıktı ve manifesto yalnızca birbirleriyle ve katalogla tutarlıysa kullanılır
+    manifesto = manifesto_oku(manifesto_dosya)
+    eski = None
+    if manifesto and manifesto.get('katalog_ozeti') == katalog_ozeti and os.path.exists(cikti_dosya):
+        eski = pd.read_csv(cikti_dosya, dtype=str, keep_default_na=False)
+        if len(eski) != sum(s['kayit_sayisi'] for s in manifesto['sutunlar']):
+            eski = None
+    if eski is None:
+        manifesto = {'sutunlar': []}
+
+    yeni_manifesto = {'kaynak_ozeti': kaynak_ozeti, 'katalog_ozeti': katalog_ozeti}
+    if eski is not None and manifesto.get('kaynak_ozeti') == kaynak_ozeti:
+        yeni_manifesto['sutunlar'] = manifesto['sutunlar']
+        return eski, yeni_manifesto, None
+
+    # Eski sütunların çıktıdaki satır aralıkları (manifesto sırası = çıktı sırası)
+    eski_sutunlar = {}
+    baslangic = 0
+    for girdi in manifesto['sutunlar']:
+        eski_sutunlar[girdi['sutun']] = (girdi, baslangic)
+        baslangic += girdi['kayit_sayisi']
+
+    with olc('cikarma'):
+        kayitlar = pd.DataFrame(kayitlari_oku(kaynak_dosya, akisli), columns=KAYIT_SUTUNLARI)
+
+    sutun_girdileri = []
+    plan = []  # (sütun, korunacak eski satırlar, türetilecek kayıtlar, yeniden etiketlenecek mi)
+    turetilecekler = []
+    durum_sayilari = {'aynı': 0, 'ekleme': 0, 'yeniden': 0}
+    for sutun, grup in kayitlar.groupby('SUTUN', sort=False):
+        sutun = int(sutun)
+        model, kapasite = grup['MODEL'].iat[0], grup['KAPASITE'].iat[0]
+        tarihler, fiyatlar = grup['TARIH'].tolist(), grup['FIYAT'].tolist()
+        ozet = kayit_ozeti(model, kapasite, tarihler, fiyatlar)
+        onceki, onceki_baslangic = eski_sutunlar.get(sutun, (None, 0))
+
+        if onceki and onceki['ozet'] == ozet:
+            durum, yeni_kayit_sayisi = 'aynı', 0
+            toplam = onceki['fiyat_toplami']
+        elif (onceki and len(grup) > onceki['kayit_sayisi'] and
+              kayit_ozeti(model, kapasite, tarihler[:onceki['kayit_sayisi']], fiyatlar[:onceki['kayit_sayisi']]) == onceki['ozet']):
+            durum, yeni_kayit_sayisi = 'ekleme', len(grup) - onceki['kayit_sayisi']
+            toplam = onceki['fiyat_toplami'] + sum(fiyatlar[onceki['kayit_sayisi']:])
+        else:
+            durum, yeni_kayit_sayisi = 'yeniden', len(grup)
+            toplam = sum(fiyatlar)
+        durum_sayilari[durum] += 1
+
+        korunan = None
+        if durum != 'yeniden':
+            korunan = eski.iloc[onceki_baslangic:onceki_baslangic + onceki['kayit_sayisi']]
+        if yeni_kayit_sayisi:
+            turetilecekler.append(grup.iloc[len(grup) - yeni_kayit_sayisi:])
+        plan.append((sutun, korunan, yeni_kayit_sayisi, durum == 'ekleme'))
+        sutun_girdileri.append({
+            'sutun': sutun, 'model': model, 'kapasite': kapasite,
+            'kayit_sayisi': len(grup), 'ozet': ozet,
+            'son_tarih': tarihler[-1], 'fiyat_toplami': toplam,
+        })
+
+    # Ortalama fiyatlar saklanan toplamlardan güncellenir
+    ortalamalar = {g['sutun']: g['fiyat_toplami'] / g['kayit_sayisi'] for g in sutun_girdileri}
+
+    # Değişen tüm kayıtlar tek bir vektörel çağrıyla türetilir
+    turetilen = None
+    if turetilecekler:
+        with olc('turetme'):
+            turetilen = _metin_tablosu(profesyonel_ozellikleri_turet(
+                pd.concat(turetilecekler, ignore_index=True), pd.Series(ortalamalar)
+            ))
+
+    parcalar = []
+    turetilen_baslangic = 0
+    for sutun, korunan, yeni_kayit_sayisi, yeniden_etiketle in plan:
+        if korunan is not None:
+            if yeniden_etiketle:
+                korunan = korunan.copy()
+                korunan['KAMPANYA_DURUMU'] = kampanya_etiketleri(
+                    korunan['FIYAT'].astype(float), np.full(len(korunan), ortalamalar[sutun])
                 )
-                
-                # Fiyat/performans oranı
-                fiyat_performans_orani = veri['fiyat'] / performans_skoru
-                
-                # Veri satırını oluştur
-                veri_satiri = {
-                    # Temel Bilgiler
-                    'TARIH': veri['tarih'],
-                    'MARKA': marka_info,
-                    'MODEL': model_info,
-                    'KAPASITE': kapasite_info,
-                    'FIYAT': veri['fiyat'],
-                    
-                    # Gerçek Teknik Özellikler
-                    'EKRAN_BOYUTU': ozellikler['EKRAN_BOYUTU'],
-                    'DAHILI_DEPOLAMA': ozellikler['DAHILI_DEPOLAMA'],
-                    'RAM_GB': ozellikler['RAM_GB'],
-                    'BATARYA_MAH': ozellikler['BATARYA_MAH'],
-                    'HIZLI_SARJ_W': ozellikler['HIZLI_SARJ_W'],
-                    'CPU_FREKANSI_GHZ': ozellikler['CPU_FREKANSI_GHZ'],
-                    'CPU_CEKIRDEK': ozellikler['CPU_CEKIRDEK'],
-                    'KAMERA_MP': ozellikler['KAMERA_MP'],
-                    'EKRAN_COZUNURLUGU': ozellikler['EKRAN_COZUNURLUGU'],
-                    'EKRAN_YENILEME_HZ': ozellikler['EKRAN_YENILEME_HZ'],
-                    'CHIPSET': ozellikler['CHIPSET'],
-                    'DXOMARK_PUAN': float(ozellikler['DXOMARK_PUAN']),
-                    'IOS_VERSIYON': ozellikler['IOS_VERSIYON'],
-                    
-                    # Bağlantı ve Güvenlik
-                    '5G_DESTEGI': ozellikler['5G_DESTEGI'],
-                    '4_5G_DESTEGI': ozellikler.get('4_5G_DESTEGI', 'Var'),
-                    'SUYA_DAYANIKLILIK': ozellikler.get('SUYA_DAYANIKLILIK', 'Var'),
-                    'SU_GECIRMEZLIK_SEVIYESI': ozellikler.get('SU_GECIRMEZLIK_SEVIYESI', 'IPX8'),
-                    'KABLOSUZ_SARJ': ozellikler.get('KABLOSUZ_SARJ', 'Var'),
-                    'USB_C': ozellikler.get('USB_C', 'Hayır'),
-                    'AI_CHIP': ozellikler.get('AI_CHIP', 'Hayır'),
-                    
-                    # Sağlık ve Ergonomi
-                    'SAR_DEGERI': ozellikler.get('SAR_DEGERI', '0.98'),
-                    'EKRAN_GOVDE_ORANI': ozellikler.get('EKRAN_GOVDE_ORANI', '85.0'),
-                    'HAT_SAYISI': ozellikler.get('HAT_SAYISI', 'Çift Hat'),
-                    
-                    # Hesaplanan Özellikler
-                    'PERFORMANS_SKORU': round(performans_skoru, 2),
-                    'FIYAT_PERFORMANS_ORANI': round(fiyat_performans_orani, 2),
-                    'URUN_YASI_AY': urun_yasi_ay,
-                    'URUN_YASI_GUN': urun_yasi_gun,
-                    'CIKIS_YILI': ozellikler['CIKIS_YILI'],
-                    
-                    # Pazar ve Zaman Analizi
-                    'KAMPANYA_DURUMU': kampanya,
-                    'PAZAR_DURUMU': pazar_durumu,
-                    'SEZONSAL_ETKI': sezonsal_etki,
-                    'GUN_TIPI': gun_tipi,
-                    'YIL': tarih_obj.year,
-                    'AY': tarih_obj.month,
-                    'GUN': tarih_obj.day,
-                    'HAFTA_GUN': tarih_obj.weekday(),
-                    
-                    # Kategorizasyon
-                    'PREMIUM_KATEGORI': 'Premium' if '512gb' in kapasite_info.lower() else 'Orta' if '256gb' in kapasite_info.lower() else 'Standart',
-                    'GENEL_PUAN': float(ozellikler['GENEL_PUAN'])
-                }
-                
-                veriler.append(veri_satiri)
-
-    print(f"✅ {len(veriler)} adet profesyonel kayıt oluşturuldu.")
-    
-    # DataFrame oluştur
-    df_sonuc = pd.DataFrame(veriler)
-    
-    if not df_sonuc.empty:
-        print(f"📱 Modeller: {', '.join(df_sonuc['MODEL'].unique())}")
-        print(f"💾 Kapasiteler: {', '.join(df_sonuc['KAPASITE'].unique())}")
-        print(f"📊 Toplam özellik sayısı: {len(df_sonuc.columns)}")
-        
-        # Özellik kategorileri
-        print(f"\n📋 Özellik Kategorileri:")
-        print(f"  🔧 Teknik Özellikler: {len([col for col in df_sonuc.columns if any(x in col for x in ['RAM', 'BATARYA', 'CPU', 'KAMERA', 'EKRAN'])])}")
-        print(f"  📊 Performans Metrikleri: {len([col for col in df_sonuc.columns if any(x in col for x in ['PERFORMANS', 'DXOMARK', 'PUAN'])])}")
-        print(f"  🕐 Zaman Serileri: {len([col for col in df_sonuc.columns if any(x in col for x in ['TARIH', 'YIL', 'AY', 'URUN_YASI'])])}")
-        print(f"  💰 Pazar Analizi: {len([col for col in df_sonuc.columns if any(x in col for x in ['KAMPANYA', 'PAZAR', 'FIYAT'])])}")
-        
-        # Performans istatistikleri
-        print(f"\n🏆 Performans İstatistikleri:")
-        
-        # Veri tiplerini düzelt
-        df_sonuc['PERFORMANS_SKORU'] = pd.to_numeric(df_sonuc['PERFORMANS_SKORU'], errors='coerce')
-        df_sonuc['FIYAT_PERFORMANS_ORANI'] = pd.to_numeric(df_sonuc['FIYAT_PERFORMANS_ORANI'], errors='coerce')
-        df_sonuc['DXOMARK_PUAN'] = pd.to_numeric(df_sonuc['DXOMARK_PUAN'], errors='coerce')
-        
-        perf_stats = df_sonuc.groupby('MODEL')[['PERFORMANS_SKORU', 'FIYAT_PERFORMANS_ORANI', 'DXOMARK_PUAN']].mean()
-        for model in perf_stats.index:
-            print(f"  {model}:")
-            print(f"    🎯 Performans Skoru: {perf_stats.loc[model, 'PERFORMANS_SKORU']:.1f}")
-            print(f"    💰 Fiyat/Performans: {perf_stats.loc[model, 'FIYAT_PERFORMANS_ORANI']:.1f}")
-            print(f"    📸 DxOMark Puanı: {perf_stats.loc[model, 'DXOMARK_PUAN']:.0f}")
-
-    # CSV dosyasına yaz
-    df_sonuc.to_csv(output_file_name, index=False, encoding='utf-8')
-    
-    print(f"\n🎉 İşlem tamamlandı! Profesyonel veri seti '{output_file_name}' dosyasına kaydedildi.")
-    print(f"🚀 Artık ARIMA, Prophet, LSTM ve anomali tespiti için hazır!")
-    print(f"📊 Toplam {len(df_sonuc.columns)} özellik ile gerçek dünya analizi yapabilirsiniz.")
-    print(f"🔬 Performans skorları, fiyat/performans oranları ve pazar analizleri dahil!")
-
-except FileNotFoundError:
-    print(f"❌ HATA: '{input_file_name}' adında bir dosya bulunamadı.")
-except Exception as e:
-    print(f"❌ Beklenmedik bir hata oluştu: {e}")
-    import traceback
-    traceback.print_exc()
+            parcalar.append(korunan)
+        if yeni_kayit_sayisi:
+            parcalar.append(turetilen.iloc[turetilen_baslangic:turetilen_baslangic + yeni_kayit_sayisi])
+            turetilen_baslangic += yeni_kayit_sayisi
+
+    yeni_manifesto['sutunlar'] = sutun_girdileri
+    df_sonuc = pd.concat(parcalar, ignore_index=True) if parcalar else pd.DataFrame()
+    return df_sonuc, yeni_manifesto, durum_sayilari
+
+def ozet_yazdir(df_sonuc):
+    """Veri setinin model, özellik kategorisi ve performans özetini yazdırır"""
+    import pandas as pd
+
+    print(f"📱 Modeller: {', '.join(df_sonuc['MODEL'].unique())}")
+    print(f"💾 Kapasiteler: {', '.join(df_sonuc['KAPASITE'].unique())}")
+    print(f"📊 Toplam özellik sayısı: {len(df_sonuc.columns)}")
+
+    # Özellik kategorileri
+    print(f"\n📋 Özellik Kategorileri:")
+    print(f"  🔧 Teknik Özellikler: {len([col for col in df_sonuc.columns if any(x in col for x in ['RAM', 'BATARYA', 'CPU', 'KAMERA', 'EKRAN'])])}")
+    print(f"  📊 Performans Metrikleri: {len([col for col in df_sonuc.columns if any(x in col for x in ['PERFORMANS', 'DXOMARK', 'PUAN'])])}")
+    print(f"  🕐 Zaman Serileri: {len([col for col in df_sonuc.columns if any(x in col for x in ['TARIH', 'YIL', 'AY', 'URUN_YASI'])])}")
+    print(f"  💰 Pazar Analizi: {len([col for col in df_sonuc.columns if any(x in col for x in ['KAMPANYA', 'PAZAR', 'FIYAT'])])}")
+
+    # Performans istatistikleri (artımlı moddaki metin sütunları sayıya çevrilir)
+    print(f"\n🏆 Performans İstatistikleri:")
+    istatistik_sutunlari = ['PERFORMANS_SKORU', 'FIYAT_PERFORMANS_ORANI', 'DXOMARK_PUAN']
+    sayisal = df_sonuc[istatistik_sutunlari].apply(pd.to_numeric, errors='coerce')
+    perf_stats = sayisal.groupby(df_sonuc['MODEL']).mean()
+    for model in perf_stats.index:
+        print(f"  {model}:")
+        print(f"    🎯 Performans Skoru: {perf_stats.loc[model, 'PERFORMANS_SKORU']:.1f}")
+        print(f"    💰 Fiyat/Performans: {perf_stats.loc[model, 'FIYAT_PERFORMANS_ORANI']:.1f}")
+        print(f"    📸 DxOMark Puanı: {perf_stats.loc[model, 'DXOMARK_PUAN']:.0f}")
+
+def arguman_ayristirici():
+    """Komut satırı seçenekleri (pandas içe aktarılmadan kurulur)"""
+    parser = argparse.ArgumentParser(description='Fiyat takip çalışma kitabından profesyonel veri seti hazırlar')
+    parser.add_argument('girdi', nargs='?', default=input_file_name,
+                        help=f"Kaynak çalışma kitabı; --toplu ile klasör ya da glob deseni (varsayılan: {input_file_name})")
+    parser.add_argument('-o', '--cikti', default=output_file_name, help=f"CSV çıktı dosyası (varsayılan: {output_file_name})")
+    parser.add_argument('--format', choices=['csv', 'parquet', 'ikisi'], default='csv',
+                        help="Çıktı biçimi: CSV (varsayılan), Parquet yıldız şema "
+                             "(<çıktı>_olgu.parquet + <çıktı>_sku.parquet) ya da ikisi")
+    parser.add_argument('--pandas-okuma', action='store_true',
+                        help="Çalışma kitabını akışla değil pd.read_excel ile oku")
+    parser.add_argument('--artimli', action='store_true',
+                        help="Yalnızca değişen kaynak sütunları türet ve mevcut CSV çıktısıyla birleştir")
+    parser.add_argument('--manifesto', default=manifesto_file_name, help="Artımlı mod manifesto dosyası")
+    parser.add_argument('--toplu', action='store_true',
+                        help="Girdideki tüm çalışma kitaplarını/sayfaları süreç havuzunda işle (KAYNAK sütunu eklenir)")
+    parser.add_argument('--islem-sayisi', type=int, default=None, help="Toplu modda işlem sayısı (varsayılan: tüm çekirdekler)")
+    parser.add_argument('--kaynak-deseni', default=None, help="Dosya adından satıcı adını çıkaran desen, ör. '^([^_]+)_'")
+    parser.add_argument('--sayfa-deseni', default=None, help="Toplu modda yalnızca eşleşen sayfalar, ör. 'iPhone*'")
+    parser.add_argument('--sessiz', action='store_true', help="Özet istatistikleri yazdırma")
+    asama_olcumu.arguman_ekle(parser)
+    return parser
+
+def main(argv=None):
+    args = arguman_ayristirici().parse_args(argv)
+    if args.artimli and (args.toplu or args.format == 'parquet'):
+        print("❌ HATA: --artimli yalnızca tek çalışma kitabı ve CSV çıktısı ile kullanılabilir.")
+        return 2
+
+    import pandas as pd
+
+    print(f"'{args.girdi}' dosyası okunuyor...")
+
+    asama_olcumu.argumanlardan_baslat(args, 'hazirlik')
+    try:
+        if args.toplu:
+            from toplu_hazirlik import toplu_kayitlari_oku, verim_raporu_yazdir
+
+            baslangic = time.perf_counter()
+            with olc('cikarma'):
+                kayitlar, istatistikler = toplu_kayitlari_oku(args.girdi, args.islem_sayisi, args.kaynak_deseni, args.sayfa_deseni)
+            print(f"✅ {len(kayitlar)} adet profesyonel kayıt oluşturuldu.")
+
+            # Birleştirilmiş kayıtlar tek seferde türetilir; KAYNAK sütunu sona eklenir
+            with olc('turetme'):
+                df_sonuc = profesyonel_ozellikleri_turet(kayitlar) if len(kayitlar) else pd.DataFrame()
+                if not df_sonuc.empty:
+                    df_sonuc['KAYNAK'] = kayitlar['KAYNAK'].to_numpy()
+            verim_raporu_yazdir(istatistikler, time.perf_counter() - baslangic)
+        elif args.artimli:
+            df_sonuc, manifesto, sutun_durumlari = artimli_hazirla(args.girdi, args.cikti, args.manifesto,
+                                                                   not args.pandas_okuma)
+            if sutun_durumlari is None:
+                print("♻️  Kaynak dosya değişmemiş; mevcut çıktı kullanılıyor.")
+            else:
+                print(f"✅ {len(df_sonuc)} adet profesyonel kayıt oluşturuldu.")
+                print(f"🔁 Sütunlar: {sutun_durumlari['aynı']} aynı, {sutun_durumlari['ekleme']} ekleme, "
+                      f"{sutun_durumlari['yeniden']} yeniden türetildi")
+        else:
+            with olc('cikarma'):
+                veriler = kayitlari_oku(args.girdi, not args.pandas_okuma)
+            print(f"✅ {len(veriler)} adet profesyonel kayıt oluşturuldu.")
+
+            # Tüm kayıtlar için özellikleri tek seferde (sütun bazlı) türet
+            with olc('turetme'):
+                kayitlar = pd.DataFrame(veriler, columns=KAYIT_SUTUNLARI)
+                df_sonuc = profesyonel_ozellikleri_turet(kayitlar) if veriler else pd.DataFrame()
+
+        if not df_sonuc.empty and not args.sessiz:
+            ozet_yazdir(df_sonuc)
+
+        # CSV dosyasına yaz
+        if args.format in ('csv', 'ikisi'):
+            with olc('yazma', bicim='csv'):
+                df_sonuc.to_csv(args.cikti, index=False, encoding='utf-8')
+            print(f"\n🎉 İşlem tamamlandı! Profesyonel veri seti '{args.cikti}' dosyasına kaydedildi.")
+        if args.artimli:
+            from kaynak_manifestosu import manifesto_yaz
+            manifesto_yaz(args.manifesto, manifesto)
+        if args.format in ('parquet', 'ikisi') and not df_sonuc.empty:
+            from yildiz_sema import parquet_dosyalari, yildiz_sema_yaz
+
+            # Dosya adları CSV çıktısından türetilir; kaynak CSV imzası metadataya yazılır
+            olgu_dosyasi, sku_dosyasi = parquet_dosyalari(args.cikti)
+            with olc('yazma', bicim='parquet'):
+                olgu, sku = yildiz_sema_yaz(df_sonuc, args.cikti, csv_ile=args.format == 'ikisi')
+            print(f"🗜️  Parquet: '{olgu_dosyasi}' ({len(olgu)} kayıt, {len(olgu.columns)} sütun, "
+                  f"{os.path.getsize(olgu_dosyasi) / 1024:.0f} KB) + '{sku_dosyasi}' ({len(sku)} SKU, "
+                  f"{os.path.getsize(sku_dosyasi) / 1024:.0f} KB)")
+
+        print(f"🚀 Artık ARIMA, Prophet, LSTM ve anomali tespiti için hazır!")
+        print(f"📊 Toplam {len(df_sonuc.columns)} özellik ile gerçek dünya analizi yapabilirsiniz.")
+        print(f"🔬 Performans skorları, fiyat/performans oranları ve pazar analizleri dahil!")
+
+    except FileNotFoundError as e:
+        # Açılamayan dosyada filename dolu; toplu moddaki "kitap/sayfa yok" hatalarında mesaj yazdırılır
+        print(f"❌ HATA: '{args.girdi}' adında bir dosya bulunamadı." if e.filename else f"❌ HATA: {e}")
+        return 1
+    except Exception as e:
+        print(f"❌ Beklenmedik bir hata oluştu: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    finally:
+        asama_olcumu.bitir()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
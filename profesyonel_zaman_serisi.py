@@ -1,231 +1,325 @@
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
+"""
+Profesyonel iPhone Fiyat Analizi ve Tahmin Sistemi
+
+Analiz aşamalara bölünmüştür; her aşama kendi ağır bağımlılığını yalnızca o aşama
+seçildiğinde içe aktarır (ör. yalnızca ARIMA isteyen bir çalıştırma TensorFlow
+yüklemez):
+
+    anomali  - Isolation Forest ile kampanya/anomali tespiti (scikit-learn)
+    arima    - ARIMA tahmini ve durağanlık testi (statsmodels)
+    prophet  - Prophet tahmini (prophet)
+    ets      - Vektörel üstel düzeltme; tüm model ve SKU serileri tek geçişte (yalnızca NumPy)
+    lstm     - LSTM derin öğrenme tahmini (tensorflow)
+    rapor    - Ürün bazlı rapor (önceki aşamaların sonuçlarını kullanır)
+    grafik   - İnteraktif Plotly grafiği (plotly)
+
+Veri yükleme, özet ve temizleme adımları her zaman çalışır. Ardından veri bir kez
+(MODEL, KAPASITE, TARIH) sırasına dizilip seri deposuna alınır; aşamalar model ve
+SKU satırlarını ve günlük ortalamaları tabloyu yeniden taramadan depodan okur.
+
+Kullanım:
+    python profesyonel_zaman_serisi.py                      # Tüm aşamalar
+    python profesyonel_zaman_serisi.py --only arima,anomali
+    python profesyonel_zaman_serisi.py --veri-klasoru C:\\Users\\FURKAN\\excel_temizlik
+    python profesyonel_zaman_serisi.py --olcum --profil prophet   # Aşama süre/bellek ölçümü (asama_olcumu)
+"""
+
+import argparse
+import os
+import sys
 import warnings
 warnings.filterwarnings('ignore')
 
-# Zaman serisi kütüphaneleri
-from statsmodels.tsa.arima.model import ARIMA
-from statsmodels.tsa.seasonal import seasonal_decompose
-from statsmodels.tsa.stattools import adfuller
-from prophet import Prophet
-
-# Machine Learning kütüphaneleri
-from sklearn.ensemble import IsolationForest
-from sklearn.preprocessing import StandardScaler, MinMaxScaler
-from sklearn.metrics import mean_absolute_error, mean_squared_error
-from sklearn.model_selection import train_test_split
-
-# Deep Learning (LSTM)
-from tensorflow.keras.models import Sequential
-from tensorflow.keras.layers import LSTM, Dense, Dropout
-from tensorflow.keras.callbacks import EarlyStopping
+import asama_olcumu
+from asama_olcumu import olc, olculen
+
+ASAMALAR = ['anomali', 'arima', 'prophet', 'ets', 'lstm', 'rapor', 'grafik']
+ASAMA_TAKMA_ADLARI = {'anomaly': 'anomali', 'report': 'rapor', 'plot': 'grafik'}
+
+# Her aşamanın içe aktardığı ağır modüller (başlangıç ölçümlerinde de kullanılır)
+ASAMA_BAGIMLILIKLARI = {
+    'anomali': ['sklearn.ensemble', 'sklearn.preprocessing', 'sklearn.pipeline'],
+    'arima': ['statsmodels.tsa.arima.model', 'statsmodels.tsa.stattools'],
+    'prophet': ['prophet'],
+    'ets': [],
+    'lstm': ['tensorflow.keras.models', 'tensorflow.keras.layers', 'tensorflow.keras.callbacks',
+             'sklearn.preprocessing', 'sklearn.metrics'],
+    'rapor': [],
+    'grafik': ['plotly.graph_objects', 'plotly.subplots'],
+}
+
+# Veri setinden okunan sütunlar: yükleme/temizleme ve seri deposu için temel sütunlar
+# ile seçilen aşamaların ek sütunları (diğer aşamalar yalnızca temel sütunları kullanır)
+TEMEL_SUTUNLAR = ['MODEL', 'KAPASITE', 'TARIH', 'FIYAT', 'PERFORMANS_SKORU', 'FIYAT_PERFORMANS_ORANI', 'URUN_YASI_GUN']
+ASAMA_SUTUNLARI = {
+    'rapor': ['RAM_GB', 'BATARYA_MAH', 'KAMERA_MP', 'CHIPSET', 'DXOMARK_PUAN', 'KAMPANYA_DURUMU'],
+}
+
+
+def asamalari_coz(secim):
+    """'arima,anomaly' gibi bir seçimi aşama listesine çevirir (çalışma sırasıyla)"""
+    if not secim:
+        return list(ASAMALAR)
+    istenen = set()
+    for ad in secim.split(','):
+        ad = ASAMA_TAKMA_ADLARI.get(ad.strip().lower(), ad.strip().lower())
+        if ad not in ASAMALAR:
+            raise ValueError(f"Bilinmeyen aşama: '{ad}' (seçenekler: {', '.join(ASAMALAR)})")
+        istenen.add(ad)
+    return [a for a in ASAMALAR if a in istenen]
+
+
+def asama_sutunlari(asamalar):
+    """Seçilen aşamaların ihtiyaç duyduğu veri seti sütunları"""
+    sutunlar = list(TEMEL_SUTUNLAR)
+    for asama in asamalar:
+        sutunlar += [c for c in ASAMA_SUTUNLARI.get(asama, []) if c not in sutunlar]
+    return sutunlar
+
+
+@olculen('yukleme')
+def veriyi_hazirla(sutunlar=None):
+    """Veri setini yükler, tipleri düzeltir ve özetini yazdırır (sutunlar verilirse yalnızca onlar okunur)"""
+    import pandas as pd
+    from veri_semasi import veri_setini_yukle
 
-# Dosyayı oku
-print("🚀 Profesyonel iPhone Fiyat Analizi ve Tahmin Sistemi")
-print("=" * 80)
+    try:
+        # Parquet yıldız şema varsa onu, yoksa CSV'yi ortak şemayla (kompakt tiplerle) oku
+        df = veri_setini_yukle('profesyonel_telefon_verileri2.csv', rapor=True, sutunlar=sutunlar)
+        print(f"📊 Veri seti başarıyla yüklendi: {len(df)} kayıt, {len(df.columns)} özellik")
+    except Exception as e:
+        print(f"❌ Profesyonel veri seti bulunamadı: {e}")
+        print("Önce veri hazırlama scriptini çalıştırın.")
+        return None
 
-import os
-os.chdir(r"C:\Users\FURKAN\excel_temizlik")
-
-try:
-    df = pd.read_csv('profesyonel_telefon_verileri2.csv')
-    print(f"📊 Veri seti başarıyla yüklendi: {len(df)} kayıt, {len(df.columns)} özellik")
-except Exception as e:
-    print(f"❌ Profesyonel veri seti bulunamadı: {e}")
-    print("Önce veri hazırlama scriptini çalıştırın.")
-    exit()
-
-# Tarih formatını otomatik algıla ve düzelt
-try:
-    df['TARIH'] = pd.to_datetime(df['TARIH'])
-except:
+    # Tarih formatını otomatik algıla ve düzelt
     try:
-        df['TARIH'] = pd.to_datetime(df['TARIH'], format='%d.%m.%Y')
+        df['TARIH'] = pd.to_datetime(df['TARIH'])
     except:
-        df['TARIH'] = pd.to_datetime(df['TARIH'], format='%Y-%m-%d')
-
-df['FIYAT'] = pd.to_numeric(df['FIYAT'])
-
-# Eksik sütunları kontrol et ve ekle
-if 'PERFORMANS_SKORU' not in df.columns:
-    df['PERFORMANS_SKORU'] = 150.0  # Default değer
-if 'FIYAT_PERFORMANS_ORANI' not in df.columns:
-    df['FIYAT_PERFORMANS_ORANI'] = df['FIYAT'] / 150.0
-if 'URUN_YASI_GUN' not in df.columns:
-    df['URUN_YASI_GUN'] = 365  # Default 1 yıl
-
-# Numerik dönüşümler
-df['PERFORMANS_SKORU'] = pd.to_numeric(df['PERFORMANS_SKORU'], errors='coerce').fillna(150.0)
-df['FIYAT_PERFORMANS_ORANI'] = pd.to_numeric(df['FIYAT_PERFORMANS_ORANI'], errors='coerce').fillna(df['FIYAT'] / 150.0)
-df['URUN_YASI_GUN'] = pd.to_numeric(df['URUN_YASI_GUN'], errors='coerce').fillna(365)
-
-# Veri seti özeti
-print(f"\n📈 Veri Seti Özeti:")
-print(f"📅 Tarih aralığı: {df['TARIH'].min().strftime('%d.%m.%Y')} - {df['TARIH'].max().strftime('%d.%m.%Y')}")
-print(f"💰 Fiyat aralığı: {df['FIYAT'].min():,.0f} - {df['FIYAT'].max():,.0f} TL")
-print(f"🔢 Ortalama fiyat: {df['FIYAT'].mean():,.0f} TL")
-print(f"📊 Standart sapma: ±{df['FIYAT'].std():,.0f} TL")
-
-# Model bazında özet
-print(f"\n📱 Model Bazında Özet:")
-model_ozet = df.groupby('MODEL').agg({
-    'FIYAT': ['count', 'mean', 'std'],
-    'PERFORMANS_SKORU': 'mean',
-    'FIYAT_PERFORMANS_ORANI': 'mean'
-}).round(2)
-print(model_ozet)
-
-# 1. VERİ TEMİZLEME VE ÖN İŞLEME
-print(f"\n🧹 Veri Temizleme ve Ön İşleme")
-print("-" * 50)
-
-# Eksik değerleri kontrol et
-eksik_degerler = df.isnull().sum()
-if eksik_degerler.sum() > 0:
-    print(f"⚠️ Eksik değerler tespit edildi:")
-    print(eksik_degerler[eksik_degerler > 0])
-else:
-    print("✅ Eksik değer bulunamadı")
+        try:
+            df['TARIH'] = pd.to_datetime(df['TARIH'], format='%d.%m.%Y')
+        except:
+            df['TARIH'] = pd.to_datetime(df['TARIH'], format='%Y-%m-%d')
+
+    df['FIYAT'] = pd.to_numeric(df['FIYAT'])
+
+    # Eksik sütunları kontrol et ve ekle
+    if 'PERFORMANS_SKORU' not in df.columns:
+        df['PERFORMANS_SKORU'] = 150.0  # Default değer
+    if 'FIYAT_PERFORMANS_ORANI' not in df.columns:
+        df['FIYAT_PERFORMANS_ORANI'] = df['FIYAT'] / 150.0
+    if 'URUN_YASI_GUN' not in df.columns:
+        df['URUN_YASI_GUN'] = 365  # Default 1 yıl
+
+    # Numerik dönüşümler
+    df['PERFORMANS_SKORU'] = pd.to_numeric(df['PERFORMANS_SKORU'], errors='coerce').fillna(150.0)
+    df['FIYAT_PERFORMANS_ORANI'] = pd.to_numeric(df['FIYAT_PERFORMANS_ORANI'], errors='coerce').fillna(df['FIYAT'] / 150.0)
+    df['URUN_YASI_GUN'] = pd.to_numeric(df['URUN_YASI_GUN'], errors='coerce').fillna(365)
+
+    # Veri seti özeti
+    print(f"\n📈 Veri Seti Özeti:")
+    print(f"📅 Tarih aralığı: {df['TARIH'].min().strftime('%d.%m.%Y')} - {df['TARIH'].max().strftime('%d.%m.%Y')}")
+    print(f"💰 Fiyat aralığı: {df['FIYAT'].min():,.0f} - {df['FIYAT'].max():,.0f} TL")
+    print(f"🔢 Ortalama fiyat: {df['FIYAT'].mean():,.0f} TL")
+    print(f"📊 Standart sapma: ±{df['FIYAT'].std():,.0f} TL")
+
+    # Model bazında özet
+    print(f"\n📱 Model Bazında Özet:")
+    model_ozet = df.groupby('MODEL', observed=True).agg({
+        'FIYAT': ['count', 'mean', 'std'],
+        'PERFORMANS_SKORU': 'mean',
+        'FIYAT_PERFORMANS_ORANI': 'mean'
+    }).round(2)
+    print(model_ozet)
+    return df
+
 
 # Outlier tespiti (Z-score yöntemi)
 def z_score_outliers(data, threshold=3):
+    import numpy as np
     z_scores = np.abs((data - data.mean()) / data.std())
     return z_scores > threshold
 
-outliers = z_score_outliers(df['FIYAT'])
-print(f"🎯 Outlier tespiti: {outliers.sum()} adet outlier bulundu (%{outliers.sum()/len(df)*100:.1f})")
-
-# 2. ANOMALI TESPİTİ (KAMPANYA DÖNEMLERİ)
-print(f"\n🔍 Anomali Tespiti - Kampanya Dönemleri")
-print("-" * 50)
-
-# Model bazında anomali tespiti
-anomali_sonuclari = {}
-
-for model in df['MODEL'].unique():
-    model_data = df[df['MODEL'] == model].copy()
-    model_data = model_data.sort_values('TARIH')
-    
-    # Isolation Forest ile anomali tespiti
-    isolation_forest = IsolationForest(contamination=0.1, random_state=42)
-    
-    # Özellik matrisi hazırla
-    features = ['FIYAT', 'PERFORMANS_SKORU', 'FIYAT_PERFORMANS_ORANI', 'URUN_YASI_GUN']
-    X = model_data[features].fillna(model_data[features].mean())
-    
-    # Normalizasyon
-    scaler = StandardScaler()
-    X_scaled = scaler.fit_transform(X)
-    
-    # Anomali tespiti
-    anomalies = isolation_forest.fit_predict(X_scaled)
-    model_data['ANOMALI'] = anomalies
-    
-    # Anomali sonuçlarını kaydet
-    anomali_verileri = model_data[model_data['ANOMALI'] == -1]
-    anomali_sonuclari[model] = {
-        'toplam_anomali': len(anomali_verileri),
-        'anomali_orani': len(anomali_verileri) / len(model_data) * 100,
-        'ortalama_indirim': ((model_data['FIYAT'].mean() - anomali_verileri['FIYAT'].mean()) / model_data['FIYAT'].mean() * 100) if len(anomali_verileri) > 0 else 0
-    }
-    
-    print(f"📱 {model}:")
-    print(f"  🎯 Anomali sayısı: {anomali_sonuclari[model]['toplam_anomali']}")
-    print(f"  📊 Anomali oranı: %{anomali_sonuclari[model]['anomali_orani']:.1f}")
-    print(f"  💰 Ortalama indirim: %{anomali_sonuclari[model]['ortalama_indirim']:.1f}")
-
-# 3. ZAMAN SERİSİ MODELLEMESİ
-print(f"\n📈 Zaman Serisi Modelleme")
-print("-" * 50)
-
-def create_time_series_model(model_name, kapasite=None):
-    """Belirli model ve kapasite için zaman serisi analizi"""
-    
-    # Veri filtreleme
-    if kapasite:
-        model_data = df[(df['MODEL'] == model_name) & (df['KAPASITE'] == kapasite)].copy()
-        baslik = f"{model_name} - {kapasite}"
+
+@olculen('temizleme')
+def veri_temizleme(df):
+    """1. Veri temizleme ve ön işleme"""
+    print(f"\n🧹 Veri Temizleme ve Ön İşleme")
+    print("-" * 50)
+
+    # Eksik değerleri kontrol et
+    eksik_degerler = df.isnull().sum()
+    if eksik_degerler.sum() > 0:
+        print(f"⚠️ Eksik değerler tespit edildi:")
+        print(eksik_degerler[eksik_degerler > 0])
     else:
-        model_data = df[df['MODEL'] == model_name].copy()
-        baslik = model_name
-    
-    if len(model_data) < 30:
-        print(f"⚠️ {baslik} için yeterli veri yok ({len(model_data)} kayıt)")
+        print("✅ Eksik değer bulunamadı")
+
+    outliers = z_score_outliers(df['FIYAT'])
+    print(f"🎯 Outlier tespiti: {outliers.sum()} adet outlier bulundu (%{outliers.sum()/len(df)*100:.1f})")
+
+
+@olculen('anomali')
+def anomali_tespiti(depo, onbellek=None):
+    """2. Anomali tespiti (kampanya dönemleri)
+
+    onbellek verilirse model başına eğitilen dedektörler kalıcı anomali servisinde
+    saklanır ve yalnızca yeniden eğitim zamanı geldiğinde yeniden eğitilir.
+    """
+    from anomali_servisi import AnomaliServisi, model_egit, ozellik_matrisi
+
+    print(f"\n🔍 Anomali Tespiti - Kampanya Dönemleri")
+    print("-" * 50)
+
+    servis = None
+    if onbellek is not None:
+        servis = AnomaliServisi(onbellek)
+        islemler = servis.guncelle(depo.df)
+        print(f"💾 Dedektörler: {sum(i == 'egitildi' for i in islemler.values())} eğitildi, "
+              f"{sum(i == 'hazir' for i in islemler.values())} önbellekten")
+
+    # Model bazında anomali tespiti
+    anomali_sonuclari = {}
+
+    for model in depo.modeller():
+        model_data = depo.satirlar(model)
+
+        # Isolation Forest (StandardScaler + IsolationForest hattı) ile anomali tespiti
+        with olc('anomali', sku=model):
+            if servis is not None:
+                anomaliler = servis.skorla(model_data)['ANOMALI'].to_numpy()
+            else:
+                durum = model_egit(model_data)
+                anomaliler = durum['hat'].predict(ozellik_matrisi(model_data, durum['ortalamalar']))
+
+        # Anomali sonuçlarını kaydet
+        anomali_verileri = model_data[anomaliler == -1]
+        anomali_sonuclari[model] = {
+            'toplam_anomali': len(anomali_verileri),
+            'anomali_orani': len(anomali_verileri) / len(model_data) * 100,
+            'ortalama_indirim': ((model_data['FIYAT'].mean() - anomali_verileri['FIYAT'].mean()) / model_data['FIYAT'].mean() * 100) if len(anomali_verileri) > 0 else 0
+        }
+
+        print(f"📱 {model}:")
+        print(f"  🎯 Anomali sayısı: {anomali_sonuclari[model]['toplam_anomali']}")
+        print(f"  📊 Anomali oranı: %{anomali_sonuclari[model]['anomali_orani']:.1f}")
+        print(f"  💰 Ortalama indirim: %{anomali_sonuclari[model]['ortalama_indirim']:.1f}")
+
+    return anomali_sonuclari
+
+
+def create_time_series_model(depo, model_name, kapasite=None, arima=True, prophet=True, onbellek=None,
+                             dereceler=None, havuz=None, prophet_arka_ucu=None):
+    """Belirli model ve kapasite için zaman serisi analizi (ARIMA ve/veya Prophet)
+
+    onbellek (ModelOnbellegi) verilirse seri değişmediği sürece eğitilmiş modeller
+    yeniden eğitilmeden önbellekten okunur. dereceler (derece_dosyasi_oku) verilirse
+    ARIMA derecesi sabit (1,1,1) yerine otomatik seçilir. prophet_arka_ucu
+    (ProphetArkaUcu) seriler arasında tatil tablosunu ve sıcak başlangıçları paylaşır.
+    """
+
+    # Veri filtreleme (seri deposundan)
+    kapasite = kapasite or None
+    baslik = f"{model_name} - {kapasite}" if kapasite else model_name
+    kayit_sayisi = depo.satir_sayisi(model_name, kapasite)
+
+    if kayit_sayisi < 30:
+        print(f"⚠️ {baslik} için yeterli veri yok ({kayit_sayisi} kayıt)")
         return None
-    
-    # Günlük ortalama fiyat hesapla
-    daily_data = model_data.groupby('TARIH')['FIYAT'].mean().reset_index()
-    daily_data = daily_data.sort_values('TARIH')
-    
+
+    # Günlük ortalama fiyat (depoda önceden hesaplanmış)
+    daily_data = depo.gunluk(model_name, kapasite)
+
+    arima_forecast = None
+    prophet_forecast = None
+
     # ARIMA Modeli
-    print(f"\n🔮 {baslik} için ARIMA Modeli")
-    
-    # Durağanlık testi
-    result = adfuller(daily_data['FIYAT'])
-    print(f"📊 ADF Test p-değeri: {result[1]:.4f}")
-    if result[1] < 0.05:
-        print("✅ Seri durağan")
-    else:
-        print("⚠️ Seri durağan değil - differencing gerekli")
-    
-    try:
-        # ARIMA model eğitimi
-        arima_model = ARIMA(daily_data['FIYAT'], order=(1, 1, 1))
-        arima_fitted = arima_model.fit()
-        
-        # 30 günlük tahmin
-        arima_forecast = arima_fitted.forecast(steps=30)
-        
-        print(f"📈 ARIMA 30 günlük ortalama tahmin: {arima_forecast.mean():,.0f} TL")
-        print(f"📉 Mevcut ortalama: {daily_data['FIYAT'].iloc[-10:].mean():,.0f} TL")
-        
-        degisim = ((arima_forecast.mean() - daily_data['FIYAT'].iloc[-10:].mean()) / daily_data['FIYAT'].iloc[-10:].mean() * 100)
-        print(f"🎯 Öngörülen değişim: {degisim:+.1f}%")
-        
-    except Exception as e:
-        print(f"❌ ARIMA modeli hatası: {e}")
-        arima_forecast = None
-    
+    if arima:
+        with olc('arima', sku=baslik):
+            from statsmodels.tsa.arima.model import ARIMA
+            from statsmodels.tsa.stattools import adfuller
+
+            print(f"\n🔮 {baslik} için ARIMA Modeli")
+
+            # Durağanlık testi
+            result = adfuller(daily_data['FIYAT'])
+            print(f"📊 ADF Test p-değeri: {result[1]:.4f}")
+            if result[1] < 0.05:
+                print("✅ Seri durağan")
+            else:
+                print("⚠️ Seri durağan değil - differencing gerekli")
+
+            order, seasonal_order = (1, 1, 1), (0, 0, 0, 0)
+            if dereceler is not None:
+                from arima_derece_secimi import ARAMA_AYARLARI, derece_sec, seri_anahtari
+                order, seasonal_order, yeni = derece_sec(seri_anahtari(model_name, kapasite),
+                                                         daily_data['FIYAT'].to_numpy(), dereceler, havuz,
+                                                         **ARAMA_AYARLARI)
+                mevsim = f" x {seasonal_order}" if any(seasonal_order) else ''
+                print(f"🔎 Seçilen derece: ARIMA{order}{mevsim} ({'yeni arama' if yeni else 'kayıtlı'})")
+
+            try:
+                # ARIMA model eğitimi
+                if onbellek:
+                    # Önceki sonuç varsa yeni günlerle uzatılır; tam eğitim yalnızca gerektiğinde
+                    from artimli_arima import ISLEM_ACIKLAMALARI, arima_guncelle
+                    arima_fitted, islem = arima_guncelle(onbellek, baslik, daily_data['FIYAT'].to_numpy(),
+                                                         order=order, seasonal_order=seasonal_order)
+                    print(f"💾 ARIMA: {ISLEM_ACIKLAMALARI[islem]}")
+                else:
+                    arima_fitted = ARIMA(daily_data['FIYAT'], order=order, seasonal_order=seasonal_order).fit()
+
+                # 30 günlük tahmin
+                arima_forecast = arima_fitted.forecast(steps=30)
+
+                print(f"📈 ARIMA 30 günlük ortalama tahmin: {arima_forecast.mean():,.0f} TL")
+                print(f"📉 Mevcut ortalama: {daily_data['FIYAT'].iloc[-10:].mean():,.0f} TL")
+
+                degisim = ((arima_forecast.mean() - daily_data['FIYAT'].iloc[-10:].mean()) / daily_data['FIYAT'].iloc[-10:].mean() * 100)
+                print(f"🎯 Öngörülen değişim: {degisim:+.1f}%")
+
+            except Exception as e:
+                print(f"❌ ARIMA modeli hatası: {e}")
+                arima_forecast = None
+
     # Prophet Modeli
-    print(f"\n🔮 {baslik} için Prophet Modeli")
-    
-    try:
-        # Prophet için veri hazırlama
-        prophet_data = daily_data[['TARIH', 'FIYAT']].copy()
-        prophet_data.columns = ['ds', 'y']
-        
-        # Prophet model
-        prophet_model = Prophet(
-            yearly_seasonality=True,
-            weekly_seasonality=True,
-            daily_seasonality=False,
-            changepoint_prior_scale=0.05
-        )
-        
-        # Tatil günleri ekle (Türkiye)
-        prophet_model.add_country_holidays(country_name='TR')
-        
-        prophet_model.fit(prophet_data)
-        
-        # 30 günlük tahmin
-        future = prophet_model.make_future_dataframe(periods=30)
-        prophet_forecast = prophet_model.predict(future)
-        
-        gelecek_ortalama = prophet_forecast.tail(30)['yhat'].mean()
-        print(f"📈 Prophet 30 günlük ortalama tahmin: {gelecek_ortalama:,.0f} TL")
-        
-        prophet_degisim = ((gelecek_ortalama - daily_data['FIYAT'].iloc[-10:].mean()) / daily_data['FIYAT'].iloc[-10:].mean() * 100)
-        print(f"🎯 Prophet öngörülen değişim: {prophet_degisim:+.1f}%")
-        
-    except Exception as e:
-        print(f"❌ Prophet modeli hatası: {e}")
-        prophet_forecast = None
-    
+    if prophet:
+        with olc('prophet', sku=baslik):
+            print(f"\n🔮 {baslik} için Prophet Modeli")
+
+            try:
+                if prophet_arka_ucu is None:
+                    from prophet_hizli import ProphetArkaUcu
+                    prophet_arka_ucu = ProphetArkaUcu(onbellek)
+
+                # Prophet için veri hazırlama
+                tarihler = daily_data['TARIH'].to_numpy()
+                fiyatlar = daily_data['FIYAT'].to_numpy()
+
+                def prophet_egit():
+                    # Ortak TR tatil tablosu, önceki eğitimin parametrelerinden sıcak başlangıç
+                    return prophet_arka_ucu.egit(baslik, tarihler, fiyatlar)
+
+                if onbellek:
+                    prophet_model = onbellek.getir_veya_egit(
+                        'prophet', [tarihler, fiyatlar],
+                        dict(prophet_arka_ucu.model_ayarlari(), tatiller='TR'), prophet_egit)
+                else:
+                    prophet_model = prophet_egit()
+
+                # 30 günlük tahmin
+                prophet_forecast = prophet_arka_ucu.tahmin_et(prophet_model, 30, gecmis_dahil=True)
+
+                gelecek_ortalama = prophet_forecast.tail(30)['yhat'].mean()
+                print(f"📈 Prophet 30 günlük ortalama tahmin: {gelecek_ortalama:,.0f} TL")
+
+                prophet_degisim = ((gelecek_ortalama - daily_data['FIYAT'].iloc[-10:].mean()) / daily_data['FIYAT'].iloc[-10:].mean() * 100)
+                print(f"🎯 Prophet öngörülen değişim: {prophet_degisim:+.1f}%")
+
+            except Exception as e:
+                print(f"❌ Prophet modeli hatası: {e}")
+                prophet_forecast = None
+
     return {
         'model_name': baslik,
         'data': daily_data,
@@ -236,112 +330,196 @@ def create_time_series_model(model_name, kapasite=None):
         'prophet_change': prophet_degisim if 'prophet_degisim' in locals() else 0
     }
 
-# Her model için analiz yap
-model_tahminleri = {}
-for model in ['iPhone 16', 'iPhone 15', 'iPhone 14', 'iPhone 13']:
-    model_tahminleri[model] = create_time_series_model(model)
-
-# 4. LSTM DEEP LEARNING MODELİ
-print(f"\n🤖 LSTM Deep Learning Modeli")
-print("-" * 50)
-
-def create_lstm_model(model_name):
-    """LSTM modeli ile fiyat tahmini"""
-    
-    model_data = df[df['MODEL'] == model_name].copy()
-    model_data = model_data.sort_values('TARIH')
-    
-    if len(model_data) < 100:
+
+def zaman_serisi_modelleme(depo, arima=True, prophet=True, onbellek=None, derece_ara=False, prophet_mcmc=0):
+    """3. Zaman serisi modellemesi (derece_ara=True iken ARIMA dereceleri paralel aranır)
+
+    derece_ara=True iken model serilerinden sonra her SKU için de ARIMA kurulur;
+    SKU dereceleri arima_derece_secimi CLI'sı ile aynı anahtar ve ayarlarla
+    saklandığından iki giriş noktası birbirinin aramasını kullanır. SKU sonuçları
+    'MODEL - KAPASITE' anahtarıyla döner. Prophet eğitimleri tek bir
+    ProphetArkaUcu paylaşır; prophet_mcmc=0 yalnızca MAP'tir.
+    """
+    print(f"\n📈 Zaman Serisi Modelleme")
+    print("-" * 50)
+
+    dereceler, havuz = None, None
+    if arima and derece_ara:
+        from concurrent.futures import ProcessPoolExecutor
+        from arima_derece_secimi import derece_dosyasi_oku
+        dereceler = derece_dosyasi_oku()
+        havuz = ProcessPoolExecutor()
+    prophet_arka_ucu = None
+    if prophet:
+        from prophet_hizli import ProphetArkaUcu
+        prophet_arka_ucu = ProphetArkaUcu(onbellek, mcmc_samples=prophet_mcmc)
+
+    # Her model için analiz yap
+    model_tahminleri = {}
+    try:
+        for model in ['iPhone 16', 'iPhone 15', 'iPhone 14', 'iPhone 13']:
+            model_tahminleri[model] = create_time_series_model(depo, model, arima=arima, prophet=prophet,
+                                                               onbellek=onbellek, dereceler=dereceler, havuz=havuz,
+                                                               prophet_arka_ucu=prophet_arka_ucu)
+        if dereceler is not None:
+            from arima_derece_secimi import seri_anahtari
+            for model, kapasite in depo.skular():
+                model_tahminleri[seri_anahtari(model, kapasite)] = create_time_series_model(
+                    depo, model, kapasite, arima=True, prophet=False, onbellek=onbellek,
+                    dereceler=dereceler, havuz=havuz)
+    finally:
+        if havuz:
+            havuz.shutdown()
+    if prophet_arka_ucu and prophet_arka_ucu.sureler:
+        ozet = prophet_arka_ucu.ozet()
+        ortalamalar = [f"{tur} {ozet[f'{anahtar}_ortalama_sn']:.2f} sn"
+                       for tur, anahtar in (('sıcak', 'sicak'), ('soğuk', 'soguk'))
+                       if ozet[f'{anahtar}_ortalama_sn'] is not None]
+        print(f"\n⏱️ Prophet: {ozet['egitim']} eğitim, toplam {ozet['toplam_sn']:.1f} sn "
+              f"(ortalama {', '.join(ortalamalar)})")
+    if dereceler is not None:
+        from arima_derece_secimi import derece_dosyasi_yaz
+        derece_dosyasi_yaz(dereceler)
+    return model_tahminleri
+
+
+@olculen('ets')
+def ets_modelleme(depo, model='sonumlu', ufuk=30):
+    """3b. Hızlı tahmin: tüm modeller ve SKU'lar için vektörel üstel düzeltme
+
+    Model ve SKU günlük serileri tek bir (seri x gün) matriste uyumlanır ve
+    tahmin edilir; parametreler seri başına toplu ızgara aramasıyla seçilir.
+    """
+    import time
+    from ustel_duzeltme import toplu_tahmin
+
+    print(f"\n⚡ Üstel Düzeltme ({model}) - Tüm Seriler Tek Geçişte")
+    print("-" * 50)
+
+    basliklar, seriler = [], []
+    for anahtar in [(m, None) for m in depo.modeller()] + depo.skular():
+        daily_data = depo.gunluk(*anahtar)
+        if len(daily_data) < 30:
+            continue
+        basliklar.append(' - '.join(str(a) for a in anahtar if a is not None))
+        # Haftalık mevsimsellik için günlük takvime oturt (boş günler önceki fiyatla)
+        seriler.append(daily_data.set_index('TARIH')['FIYAT'].asfreq('D').ffill().to_numpy())
+    if not seriler:
+        print("⚠️ Üstel düzeltme için yeterli veri yok")
+        return {}
+
+    baslangic = time.perf_counter()
+    tahminler, uyum = toplu_tahmin(seriler, model, ufuk)
+    print(f"⏱️ {len(seriler)} seri uyumlandı ve tahmin edildi: {(time.perf_counter() - baslangic) * 1000:.0f} ms")
+
+    ets_sonuclari = {}
+    for no, (baslik, seri, tahmin) in enumerate(zip(basliklar, seriler, tahminler)):
+        mevcut_ortalama = seri[-10:].mean()
+        degisim = (tahmin.mean() - mevcut_ortalama) / mevcut_ortalama * 100
+        parametreler = {ad: float(deger[no]) for ad, deger in uyum['parametreler'].items()}
+        ets_sonuclari[baslik] = {
+            'model_name': baslik,
+            'ets_forecast': tahmin,
+            'current_avg': mevcut_ortalama,
+            'ets_change': degisim,
+            'parametreler': parametreler,
+        }
+        ayarlar = ', '.join(f"{ad}={deger:.2f}" for ad, deger in parametreler.items())
+        print(f"📈 {baslik}: 30 günlük ortalama {tahmin.mean():,.0f} TL ({degisim:+.1f}%) [{ayarlar}]")
+    return ets_sonuclari
+
+
+def create_lstm_model(depo, model_name, onbellek=None, mod='ozyinelemeli'):
+    """LSTM modeli ile fiyat tahmini (onbellek verilirse eğitilmiş model önbellekten okunur)
+
+    mod='ozyinelemeli' tek adımlı ağı derlenmiş bir döngüyle 30 gün ilerletir;
+    mod='dogrudan' 30 günü tek ileri geçişte üreten çok çıkışlı bir ağ eğitir.
+    """
+    import numpy as np
+    from sklearn.metrics import mean_absolute_error
+    from sklearn.preprocessing import MinMaxScaler
+    from tensorflow.keras.callbacks import EarlyStopping
+    from lstm_tahmin import lstm_agi_olustur, son_pencereler, tahminci_olustur
+    from pencereleme import pencereler
+
+    if depo.satir_sayisi(model_name) < 100:
         print(f"⚠️ {model_name} için LSTM'e yeterli veri yok")
         return None
-    
-    # Günlük ortalama fiyat
-    daily_data = model_data.groupby('TARIH')['FIYAT'].mean().reset_index()
+
+    # Günlük ortalama fiyat (depoda önceden hesaplanmış)
+    daily_data = depo.gunluk(model_name)
     prices = daily_data['FIYAT'].values.reshape(-1, 1)
-    
+
     # Normalizasyon
     scaler = MinMaxScaler()
     prices_scaled = scaler.fit_transform(prices)
-    
-    # Sekans oluşturma (60 günlük pencere)
-    def create_sequences(data, seq_length=60):
-        X, y = [], []
-        for i in range(seq_length, len(data)):
-            X.append(data[i-seq_length:i, 0])
-            y.append(data[i, 0])
-        return np.array(X), np.array(y)
-    
-    X, y = create_sequences(prices_scaled)
-    
+
+    # Sekans oluşturma (60 günlük pencere, kopyasız görünümler); doğrudan modda hedef 30 gündür
+    ufuk = 30
+    X, y = pencereler(prices_scaled, 60, ufuk=ufuk if mod == 'dogrudan' else 1)
+
     if len(X) < 30:
         print(f"⚠️ {model_name} için LSTM sekansı oluşturulamadı")
         return None
-    
+
     # Train-test split
     train_size = int(0.8 * len(X))
     X_train, X_test = X[:train_size], X[train_size:]
     y_train, y_test = y[:train_size], y[train_size:]
-    
-    # LSTM model
-    model = Sequential([
-        LSTM(50, return_sequences=True, input_shape=(X_train.shape[1], 1)),
-        Dropout(0.2),
-        LSTM(50, return_sequences=False),
-        Dropout(0.2),
-        Dense(25),
-        Dense(1)
-    ])
-    
-    model.compile(optimizer='adam', loss='mean_squared_error')
-    
-    # Model eğitimi
-    early_stopping = EarlyStopping(monitor='val_loss', patience=10, restore_best_weights=True)
-    
-    X_train = X_train.reshape((X_train.shape[0], X_train.shape[1], 1))
-    X_test = X_test.reshape((X_test.shape[0], X_test.shape[1], 1))
-    
-    model.fit(
-        X_train, y_train,
-        batch_size=32,
-        epochs=50,
-        validation_data=(X_test, y_test),
-        callbacks=[early_stopping],
-        verbose=0
-    )
-    
-    # Tahmin
-    last_sequence = prices_scaled[-60:].reshape((1, 60, 1))
-    
-    # 30 günlük tahmin
-    lstm_predictions = []
-    current_sequence = last_sequence.copy()
-    
-    for _ in range(30):
-        pred = model.predict(current_sequence, verbose=0)
-        lstm_predictions.append(pred[0, 0])
-        # Sequence'i güncelle
-        current_sequence = np.roll(current_sequence, -1, axis=1)
-        current_sequence[0, -1, 0] = pred[0, 0]
-    
+
+    X_train = X_train[..., np.newaxis]
+    X_test = X_test[..., np.newaxis]
+
+    def lstm_egit():
+        # LSTM model
+        model = lstm_agi_olustur(X_train.shape[1], ufuk if mod == 'dogrudan' else 1)
+
+        model.compile(optimizer='adam', loss='mean_squared_error')
+
+        # Model eğitimi
+        early_stopping = EarlyStopping(monitor='val_loss', patience=10, restore_best_weights=True)
+
+        model.fit(
+            X_train, y_train,
+            batch_size=32,
+            epochs=50,
+            validation_data=(X_test, y_test),
+            callbacks=[early_stopping],
+            verbose=0
+        )
+        return model
+
+    if onbellek:
+        lstm_ayarlari = {'pencere': 60, 'katmanlar': [50, 50, 25, 1], 'dropout': 0.2, 'batch_size': 32,
+                         'epochs': 50, 'patience': 10, 'egitim_orani': 0.8}
+        if mod == 'dogrudan':
+            lstm_ayarlari.update(mod=mod, ufuk=ufuk)
+        model = onbellek.getir_veya_egit('keras', [prices], lstm_ayarlari, lstm_egit)
+    else:
+        model = lstm_egit()
+
+    # 30 günlük tahmin (tek çağrı)
+    lstm_predictions = tahminci_olustur(model, mod, ufuk)(son_pencereler([prices_scaled], 60))[0]
+
     # Denormalizasyon
-    lstm_predictions = scaler.inverse_transform(np.array(lstm_predictions).reshape(-1, 1))
-    
+    lstm_predictions = scaler.inverse_transform(lstm_predictions.reshape(-1, 1))
+
     lstm_ortalama = lstm_predictions.mean()
     mevcut_ortalama = daily_data['FIYAT'].iloc[-10:].mean()
     lstm_degisim = ((lstm_ortalama - mevcut_ortalama) / mevcut_ortalama * 100)
-    
+
     print(f"🤖 {model_name} LSTM tahmini:")
     print(f"  📈 30 günlük ortalama: {lstm_ortalama:,.0f} TL")
     print(f"  🎯 Öngörülen değişim: {lstm_degisim:+.1f}%")
-    
-    # Model performansı
+
+    # Model performansı (doğrudan modda tüm ufuklar üzerinden)
     test_pred = model.predict(X_test, verbose=0)
-    test_pred = scaler.inverse_transform(test_pred)
+    test_pred = scaler.inverse_transform(test_pred.reshape(-1, 1))
     y_test_actual = scaler.inverse_transform(y_test.reshape(-1, 1))
-    
+
     mae = mean_absolute_error(y_test_actual, test_pred)
     print(f"  📊 Test MAE: {mae:.2f} TL")
-    
+
     return {
         'model_name': model_name,
         'predictions': lstm_predictions.flatten(),
@@ -350,39 +528,45 @@ def create_lstm_model(model_name):
         'mae': mae
     }
 
-# LSTM modelleri eğit
-lstm_sonuclari = {}
-for model in ['iPhone 16', 'iPhone 15']:  # En popüler modeller için
-    try:
-        lstm_sonuclari[model] = create_lstm_model(model)
-    except Exception as e:
-        print(f"❌ {model} LSTM hatası: {e}")
 
-# 5. ÜRÜN BAZLI RAPOR ÜRETİMİ
-print(f"\n📋 Ürün Bazlı Tahmin Raporu")
-print("=" * 80)
+@olculen('lstm')
+def lstm_modelleme(depo, onbellek=None, mod='ozyinelemeli'):
+    """4. LSTM deep learning modeli"""
+    print(f"\n🤖 LSTM Deep Learning Modeli")
+    print("-" * 50)
+
+    # LSTM modelleri eğit
+    lstm_sonuclari = {}
+    for model in ['iPhone 16', 'iPhone 15']:  # En popüler modeller için
+        try:
+            with olc('lstm', sku=model):
+                lstm_sonuclari[model] = create_lstm_model(depo, model, onbellek=onbellek, mod=mod)
+        except Exception as e:
+            print(f"❌ {model} LSTM hatası: {e}")
+    return lstm_sonuclari
+
 
-def generate_product_report(model_name):
+def generate_product_report(depo, model_name, model_tahminleri, lstm_sonuclari, ets_sonuclari=None):
     """Ürün bazlı detaylı rapor"""
-    
+
     print(f"\n📱 {model_name} Detaylı Analiz Raporu")
     print("-" * 60)
-    
-    model_data = df[df['MODEL'] == model_name]
+
+    model_data = depo.satirlar(model_name)
     if len(model_data) == 0:
         print(f"❌ {model_name} için veri bulunamadı")
         return
-    
-    # Mevcut durum
-    son_fiyat = model_data.sort_values('TARIH')['FIYAT'].iloc[-1]
+
+    # Mevcut durum (son günün ortalama fiyatı)
+    son_fiyat = depo.gunluk(model_name)['FIYAT'].iloc[-1]
     ortalama_fiyat = model_data['FIYAT'].mean()
     volatilite = model_data['FIYAT'].std()
-    
+
     print(f"💰 Mevcut Durum:")
     print(f"  Son fiyat: {son_fiyat:,.0f} TL")
     print(f"  Ortalama fiyat: {ortalama_fiyat:,.0f} TL")
     print(f"  Volatilite: ±{volatilite:,.0f} TL")
-    
+
     # Teknik özellikler
     ozellikler = model_data.iloc[0]
     print(f"\n🔧 Teknik Özellikler:")
@@ -391,21 +575,22 @@ def generate_product_report(model_name):
     print(f"  Kamera: {ozellikler['KAMERA_MP']} MP")
     print(f"  Chipset: {ozellikler['CHIPSET']}")
     print(f"  DxOMark Puanı: {ozellikler['DXOMARK_PUAN']}")
-    
+
     # Performans metrikleri
     perf_skoru = model_data['PERFORMANS_SKORU'].mean()
     fp_orani = model_data['FIYAT_PERFORMANS_ORANI'].mean()
-    
+
     print(f"\n📊 Performans Metrikleri:")
     print(f"  Performans Skoru: {perf_skoru:.1f}")
     print(f"  Fiyat/Performans Oranı: {fp_orani:.1f}")
-    
+
     # Pazar analizi
     kampanya_dagılım = model_data['KAMPANYA_DURUMU'].value_counts()
+    kampanya_dagılım = kampanya_dagılım[kampanya_dagılım > 0]
     print(f"\n🛍️ Pazar Analizi:")
     for durum, adet in kampanya_dagılım.head(3).items():
         print(f"  {durum}: {adet} kayıt (%{adet/len(model_data)*100:.1f})")
-    
+
     # Tahmin özeti
     if model_name in model_tahminleri and model_tahminleri[model_name]:
         tahmin = model_tahminleri[model_name]
@@ -414,16 +599,19 @@ def generate_product_report(model_name):
             print(f"  ARIMA: {tahmin['arima_change']:+.1f}% değişim")
         if tahmin['prophet_change'] != 0:
             print(f"  Prophet: {tahmin['prophet_change']:+.1f}% değişim")
-    
+
     if model_name in lstm_sonuclari and lstm_sonuclari[model_name]:
         lstm = lstm_sonuclari[model_name]
         print(f"  LSTM: {lstm['change_percent']:+.1f}% değişim")
-    
+
+    if ets_sonuclari and model_name in ets_sonuclari:
+        print(f"  Üstel düzeltme: {ets_sonuclari[model_name]['ets_change']:+.1f}% değişim")
+
     # Öneri
     if model_name in model_tahminleri and model_tahminleri[model_name]:
         tahmin = model_tahminleri[model_name]
         ortalama_degisim = (tahmin.get('arima_change', 0) + tahmin.get('prophet_change', 0)) / 2
-        
+
         print(f"\n💡 Öneriler:")
         if ortalama_degisim < -5:
             print(f"  🔴 Bu ürünün fiyatı önümüzdeki 1 ay içinde %{abs(ortalama_degisim):.1f} düşebilir")
@@ -435,34 +623,133 @@ def generate_product_report(model_name):
             print(f"  🟡 Fiyat değişimi minimal (%{ortalama_degisim:+.1f})")
             print(f"  📊 Stabil fiyat bekleniyor")
 
-# Tüm modeller için rapor üret
-for model in df['MODEL'].unique():
-    generate_product_report(model)
-
-# 6. VİZÜALİZASYON
-print(f"\n📊 Görselleştirmeler oluşturuluyor...")
-
-# İnteraktif Plotly grafikleri
-fig = make_subplots(
-    rows=2, cols=2,
-    subplot_titles=('Fiyat Trendi', 'Anomali Tespiti', 'Performans vs Fiyat', 'Kampanya Analizi'),
-    specs=[[{"secondary_y": False}, {"secondary_y": False}],
-           [{"secondary_y": False}, {"secondary_y": False}]]
-)
-
-# 1. Fiyat trendi
-for model in df['MODEL'].unique():
-    model_data = df[df['MODEL'] == model].sort_values('TARIH')
-    fig.add_trace(
-        go.Scatter(x=model_data['TARIH'], y=model_data['FIYAT'], 
-                  name=model, mode='lines'),
-        row=1, col=1
+
+@olculen('rapor')
+def urun_raporlari(depo, model_tahminleri, lstm_sonuclari, ets_sonuclari=None):
+    """5. Ürün bazlı rapor üretimi"""
+    print(f"\n📋 Ürün Bazlı Tahmin Raporu")
+    print("=" * 80)
+
+    # Tüm modeller için rapor üret
+    for model in depo.modeller():
+        with olc('rapor', sku=model):
+            generate_product_report(depo, model, model_tahminleri, lstm_sonuclari, ets_sonuclari)
+
+
+@olculen('grafik')
+def gorsellestirme(depo, dosya='profesyonel_telefon_analizi.html'):
+    """6. İnteraktif Plotly grafikleri (izler nokta bütçesine seyreltilir, WebGL ile çizilir)"""
+    from plotly.subplots import make_subplots
+
+    from grafik_seyreltme import seyreltilmis_iz
+
+    print(f"\n📊 Görselleştirmeler oluşturuluyor...")
+
+    fig = make_subplots(
+        rows=2, cols=2,
+        subplot_titles=('Fiyat Trendi', 'Anomali Tespiti', 'Performans vs Fiyat', 'Kampanya Analizi'),
+        specs=[[{"secondary_y": False}, {"secondary_y": False}],
+               [{"secondary_y": False}, {"secondary_y": False}]]
     )
 
-# Grafikleri kaydet
-fig.write_html('profesyonel_telefon_analizi.html')
+    # 1. Fiyat trendi (günlük ortalama)
+    for model in depo.modeller():
+        model_data = depo.gunluk(model)
+        fig.add_trace(
+            seyreltilmis_iz(model_data['TARIH'], model_data['FIYAT'],
+                            name=model, mode='lines'),
+            row=1, col=1
+        )
+
+    # Grafikleri kaydet
+    fig.write_html(dosya)
+    print(f"📊 İnteraktif grafik: {dosya}")
+
+
+def analiz(args, asamalar):
+    """Veriyi yükler, temizler ve seçilen aşamaları sırayla çalıştırır"""
+    df = veriyi_hazirla(asama_sutunlari(asamalar))
+    if df is None:
+        return 1
+    veri_temizleme(df)
+
+    from seri_deposu import SeriDeposu
+    with olc('seri_deposu'):
+        depo = SeriDeposu(df)
+
+    onbellek = None
+    if not args.onbellek_yok and {'anomali', 'arima', 'prophet', 'lstm'} & set(asamalar):
+        from model_onbellegi import ModelOnbellegi
+        onbellek = ModelOnbellegi(args.onbellek, args.onbellek_mb)
+
+    model_tahminleri = {}
+    lstm_sonuclari = {}
+    ets_sonuclari = {}
+    if 'anomali' in asamalar:
+        anomali_tespiti(depo, onbellek=onbellek)
+    if 'arima' in asamalar or 'prophet' in asamalar:
+        model_tahminleri = zaman_serisi_modelleme(depo, arima='arima' in asamalar, prophet='prophet' in asamalar,
+                                                  onbellek=onbellek, derece_ara=args.arima_derece_ara,
+                                                  prophet_mcmc=args.prophet_mcmc)
+    if 'ets' in asamalar:
+        ets_sonuclari = ets_modelleme(depo, model=args.ets_modeli)
+    if 'lstm' in asamalar:
+        lstm_sonuclari = lstm_modelleme(depo, onbellek=onbellek, mod=args.lstm_modu)
+    if 'rapor' in asamalar:
+        urun_raporlari(depo, model_tahminleri, lstm_sonuclari, ets_sonuclari)
+    if 'grafik' in asamalar:
+        gorsellestirme(depo)
+
+    print(f"✅ Analiz tamamlandı!")
+    if onbellek:
+        print(f"💾 Model önbelleği: {onbellek.isabet} isabet, {onbellek.iska} yeniden eğitim ({args.onbellek})")
+    if {'arima', 'prophet', 'ets', 'lstm'} & set(asamalar):
+        print(f"🔬 Seçilen modeller için fiyat tahminleri oluşturuldu")
+    if 'rapor' in asamalar:
+        print(f"📋 Detaylı raporlar yazdırıldı")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Profesyonel iPhone fiyat analizi ve tahmin sistemi')
+    parser.add_argument('--only', default=None,
+                        help=f"Çalıştırılacak aşamalar, virgülle ayrılmış ({', '.join(ASAMALAR)}); varsayılan: tümü")
+    parser.add_argument('--veri-klasoru', default=None,
+                        help="Veri dosyalarının bulunduğu ve çıktıların yazılacağı klasör (varsayılan: çalışma dizini)")
+    parser.add_argument('--onbellek', default='.model_onbellegi',
+                        help="Eğitilmiş model önbelleği klasörü (varsayılan: .model_onbellegi)")
+    parser.add_argument('--onbellek-mb', type=float, default=500, help="Önbellek boyut sınırı (MB)")
+    parser.add_argument('--onbellek-yok', action='store_true', help="Modelleri önbelleksiz, her seferinde yeniden eğit")
+    parser.add_argument('--lstm-modu', choices=['ozyinelemeli', 'dogrudan'], default='ozyinelemeli',
+                        help="LSTM 30 günlük tahmini: özyinelemeli (tek adımlı ağ) ya da doğrudan (30 çıkışlı ağ)")
+    parser.add_argument('--prophet-mcmc', type=int, default=0,
+                        help="Prophet MCMC örnek sayısı (varsayılan 0: yalnızca MAP, hızlı yol)")
+    parser.add_argument('--ets-modeli', choices=['basit', 'holt', 'sonumlu', 'holt_winters'], default='sonumlu',
+                        help="ets aşamasının üstel düzeltme modeli (varsayılan: sönümlü trend)")
+    parser.add_argument('--arima-derece-ara', action='store_true',
+                        help="ARIMA derecesini sabit (1,1,1) yerine ADF/KPSS + AIC aramasıyla seç "
+                             "(SKU serileri de kurulur; dereceler arima_derece_secimi ile paylaşılır)")
+    asama_olcumu.arguman_ekle(parser)
+    args = parser.parse_args(argv)
+    try:
+        asamalar = asamalari_coz(args.only)
+    except ValueError as e:
+        parser.error(str(e))
+
+    # Dosyayı oku
+    print("🚀 Profesyonel iPhone Fiyat Analizi ve Tahmin Sistemi")
+    print("=" * 80)
+    print(f"🧩 Aşamalar: {', '.join(asamalar)}")
+
+    if args.veri_klasoru:
+        os.chdir(args.veri_klasoru)
+
+    asama_olcumu.argumanlardan_baslat(args, 'analiz')
+    try:
+        return analiz(args, asamalar)
+    finally:
+        asama_olcumu.bitir()
+
 
-print(f"✅ Analiz tamamlandı!")
-print(f"📊 İnteraktif grafik: profesyonel_telefon_analizi.html")
-print(f"🔬 Tüm modeller için fiyat tahminleri oluşturuldu")
-print(f"📋 Detaylı raporlar yazdırıldı")
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+"""
+Hızlı Prophet Arka Ucu (Ortak Tatil Tablosu + Sıcak Başlangıç)
+
+Prophet'in her eğitimde `add_country_holidays` ile Türkiye tatillerini yeniden
+üretmesi ve Stan optimizasyonunu varsayılan başlangıç değerlerinden (soğuk)
+başlatması yerine:
+
+- Tatil tablosu süreç başına bir kez kurulur ve tüm eğitimlere `holidays=` ile
+  verilir (yalnızca veri tablonun yıl aralığını aşarsa genişletilir). Tablo sabit
+  kaldığından tatil özellik sayısı, dolayısıyla beta boyutu eğitimler arasında
+  değişmez.
+- Her seri için son eğitimin parametreleri (k, m, delta, beta, sigma_obs) seri
+  adıyla saklanır ve bir sonraki eğitimde Stan `init` olarak kullanılır. Boyutu
+  uymayan parametreleri Prophet kendisi varsayılana döndürür.
+- mcmc_samples=0 (varsayılan) yalnızca MAP optimizasyonudur; MAP yolunda tahmin
+  aralığı simülasyonu da kapatılır (uncertainty_samples=0, yalnızca yhat).
+
+Parametreler model önbelleğinde ('prophet_baslangic' türü) ya da önbellek
+verilmezse süreç belleğinde tutulur. Her eğitimin süresi ve başlangıç türü
+kaydedilir (ProphetArkaUcu.sureler).
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+PROPHET_AYARLARI = dict(
+    yearly_seasonality=True,
+    weekly_seasonality=True,
+    daily_seasonality=False,
+    changepoint_prior_scale=0.05
+)
+TATIL_ULKESI = 'TR'
+TATIL_ILK_YIL = 2015  # Tablo bu yıldan başlar; seriler arasında aynı tablo paylaşılır
+PARAMETRE_ADLARI = ('k', 'm', 'sigma_obs', 'delta', 'beta')
+
+_tatil_tablolari = {}
+
+
+def tatil_tablosu(ilk_yil, son_yil, ulke=TATIL_ULKESI):
+    """Ülke tatil tablosu (holiday, ds); süreç başına bir kez kurulur
+
+    İstenen yıllar kayıtlı tablonun dışındaysa tablo birleşik aralıkla yeniden kurulur.
+    """
+    kayit = _tatil_tablolari.get(ulke)
+    if kayit is not None and kayit[0] <= ilk_yil and son_yil <= kayit[1]:
+        return kayit[2]
+    if kayit is not None:
+        ilk_yil, son_yil = min(ilk_yil, kayit[0]), max(son_yil, kayit[1])
+    from prophet.make_holidays import make_holidays_df
+
+    tablo = make_holidays_df(year_list=list(range(ilk_yil, son_yil + 1)), country=ulke)
+    _tatil_tablolari[ulke] = (ilk_yil, son_yil, tablo)
+    return tablo
+
+
+def sicak_baslangic_parametreleri(model):
+    """Eğitilmiş modelin Stan parametreleri (MAP değeri ya da MCMC ortalaması)"""
+    parametreler = {}
+    for ad in PARAMETRE_ADLARI:
+        deger = np.asarray(model.params[ad])
+        ortalama = deger.mean(axis=0)
+        parametreler[ad] = float(ortalama.reshape(-1)[0]) if ad in ('k', 'm', 'sigma_obs') else ortalama.reshape(-1)
+    return parametreler
+
+
+class ProphetArkaUcu:
+    """Ortak tatil tablosu ve seri başına sıcak başlangıçla Prophet eğitimi"""
+
+    def __init__(self, onbellek=None, mcmc_samples=0, sicak_baslangic=True, ayarlar=None, ayrintili=True):
+        self.onbellek = onbellek
+        self.mcmc_samples = mcmc_samples
+        self.sicak_baslangic = sicak_baslangic
+        self.ayrintili = ayrintili
+        self.ayarlar = dict(PROPHET_AYARLARI if ayarlar is None else ayarlar)
+        self._parametreler = {}
+        self.sureler = []
+
+    def model_ayarlari(self):
+        """Prophet yapıcı ayarları (önbellek anahtarlarına da girer)"""
+        ayarlar = dict(self.ayarlar, mcmc_samples=self.mcmc_samples)
+        if self.mcmc_samples == 0:
+            ayarlar['uncertainty_samples'] = 0  # MAP hızlı yolu: tahmin aralığı simülasyonu yok
+        return ayarlar
+
+    def _anahtar(self, seri_adi):
+        from model_onbellegi import onbellek_anahtari
+
+        return onbellek_anahtari('prophet_baslangic', [], {'baslangic': str(seri_adi), 'ayarlar': self.ayarlar,
+                                                           'tatiller': TATIL_ULKESI})
+
+    def baslangic(self, seri_adi):
+        """Serinin saklanan parametreleri (bellekte yoksa önbellekten); yoksa None"""
+        if seri_adi not in self._parametreler and self.onbellek is not None:
+            parametreler = self.onbellek.getir('prophet_baslangic', self._anahtar(seri_adi))
+            if parametreler is not None:
+                self._parametreler[seri_adi] = parametreler
+        return self._parametreler.get(seri_adi)
+
+    def _sakla(self, seri_adi, model):
+        parametreler = sicak_baslangic_parametreleri(model)
+        self._parametreler[seri_adi] = parametreler
+        if self.onbellek is not None:
+            try:
+                self.onbellek.kaydet('prophet_baslangic', self._anahtar(seri_adi), parametreler)
+            except Exception as e:
+                print(f"⚠️ Prophet başlangıç parametreleri yazılamadı: {e}")
+
+    def egit(self, seri_adi, tarihler, fiyatlar, ufuk=30, baslangic=None):
+        """Seri için Prophet modelini eğitir; varsa önceki parametrelerden başlatır
+
+        baslangic verilirse (sicak_baslangic_parametreleri) saklanan parametreler
+        yerine o kullanılır.
+        """
+        from prophet import Prophet
+
+        veri = pd.DataFrame({'ds': pd.to_datetime(tarihler), 'y': np.asarray(fiyatlar, dtype=np.float64)})
+        son_yil = (veri['ds'].iloc[-1] + pd.Timedelta(days=ufuk)).year
+        tatiller = tatil_tablosu(min(TATIL_ILK_YIL, veri['ds'].iloc[0].year), son_yil)
+
+        if baslangic is None and self.sicak_baslangic:
+            baslangic = self.baslangic(seri_adi)
+        ek = {'init': baslangic} if baslangic is not None else {}
+        sure = time.perf_counter()
+        model = Prophet(holidays=tatiller, **self.model_ayarlari()).fit(veri, **ek)
+        sure = time.perf_counter() - sure
+
+        self._sakla(seri_adi, model)
+        self.sureler.append({'seri': seri_adi, 'sure': sure, 'sicak': baslangic is not None, 'gozlem': len(veri)})
+        if self.ayrintili:
+            print(f"⏱️ Prophet eğitimi {seri_adi}: {sure:.2f} sn ({'sıcak' if baslangic is not None else 'soğuk'} başlangıç)")
+        return model
+
+    @staticmethod
+    def tahmin_et(model, ufuk=30, gecmis_dahil=False):
+        """ufuk günlük Prophet tahmin tablosu (gecmis_dahil=True iken geçmiş günler de)"""
+        gelecek = model.make_future_dataframe(periods=ufuk, include_history=gecmis_dahil)
+        return model.predict(gelecek)
+
+    def ozet(self):
+        """Eğitim sürelerinin özeti: sayı, toplam ve başlangıç türüne göre ortalama süre (eğitim yoksa None)"""
+        sureler = pd.DataFrame(self.sureler, columns=['seri', 'sure', 'sicak', 'gozlem'])
+        ortalamalar = sureler.groupby('sicak')['sure'].mean()
+        return {
+            'egitim': len(sureler),
+            'toplam_sn': float(sureler['sure'].sum()),
+            'sicak_ortalama_sn': float(ortalamalar[True]) if True in ortalamalar.index else None,
+            'soguk_ortalama_sn': float(ortalamalar[False]) if False in ortalamalar.index else None,
+        }
@@ -0,0 +1,96 @@
+"""
+Seri Deposu (Model / SKU İndeksi)
+
+Veri seti yüklendikten sonra bir kez (MODEL, KAPASITE, TARIH) sırasına dizilir ve
+her model ile her SKU (MODEL x KAPASITE) için satır aralıkları çıkarılır. Aşamalar
+`df[df['MODEL'] == model]` ile her seferinde tüm tabloyu taramak yerine aralığı
+sözlükten alır ve `iloc` dilimi döndürür (kopya yok).
+
+Günlük ortalama fiyatlar da yükleme sırasında model ve SKU bazında bir kez
+hesaplanır; gunluk() aynı şekilde dilim döndürür. Toplam maliyet tek sıralama ve
+iki gruplamadır.
+
+Dönen dilimler ortak tablonun görünümleridir; yerinde değiştirilmemelidir
+(gerekiyorsa .copy() alın).
+"""
+
+import numpy as np
+import pandas as pd
+
+SIRALAMA = ['MODEL', 'KAPASITE', 'TARIH']
+
+
+def _degerler(seri):
+    """Karşılaştırma için dizi (kategorik sütunlarda kodlar)"""
+    return seri.cat.codes.to_numpy() if hasattr(seri, 'cat') else seri.to_numpy()
+
+
+def _araliklar(df, sutunlar):
+    """Sıralı tabloda sutunlar değerlerinin ardışık satır aralıkları: {anahtar: (ilk, son)}"""
+    n = len(df)
+    if n == 0:
+        return {}
+    degisim = np.zeros(n, dtype=bool)
+    degisim[0] = True
+    for sutun in sutunlar:
+        deger = _degerler(df[sutun])
+        degisim[1:] |= deger[1:] != deger[:-1]
+    ilkler = np.flatnonzero(degisim)
+    sonlar = np.append(ilkler[1:], n)
+    anahtarlar = zip(*(df[sutun].to_numpy()[ilkler] for sutun in sutunlar))
+    return {(a if len(sutunlar) > 1 else a[0]): (int(i), int(s))
+            for a, i, s in zip(anahtarlar, ilkler, sonlar)}
+
+
+class SeriDeposu:
+    """Model ve SKU bazında O(1) erişimli satır dilimleri ve günlük ortalamalar"""
+
+    def __init__(self, df):
+        self._model_sirasi = list(pd.unique(df['MODEL']))  # Raporlar için veri setindeki ilk görülme sırası
+        self.df = df.sort_values(SIRALAMA, kind='stable', ignore_index=True)
+        self._model_araliklari = _araliklar(self.df, ['MODEL'])
+        self._sku_araliklari = _araliklar(self.df, ['MODEL', 'KAPASITE'])
+
+        # Tablo zaten sıralı olduğundan gruplar sıralı çıkar
+        self._gunluk_sku = (self.df.groupby(SIRALAMA, observed=True, sort=False)['FIYAT']
+                            .mean().reset_index())
+        self._gunluk_model = (self.df.groupby(['MODEL', 'TARIH'], observed=True, sort=True)['FIYAT']
+                              .mean().reset_index())
+        self._gunluk_sku_araliklari = _araliklar(self._gunluk_sku, ['MODEL', 'KAPASITE'])
+        self._gunluk_model_araliklari = _araliklar(self._gunluk_model, ['MODEL'])
+        self._gunluk_sku = self._gunluk_sku[['TARIH', 'FIYAT']]
+        self._gunluk_model = self._gunluk_model[['TARIH', 'FIYAT']]
+
+    def __len__(self):
+        return len(self.df)
+
+    def modeller(self):
+        """Depodaki modeller (veri setinde ilk görülme sırasıyla)"""
+        return [model for model in self._model_sirasi if model in self._model_araliklari]
+
+    def skular(self):
+        """Depodaki (model, kapasite) çiftleri (sıralama düzeninde)"""
+        return list(self._sku_araliklari)
+
+    def _aralik(self, model, kapasite=None):
+        if kapasite is None:
+            return self._model_araliklari.get(model, (0, 0))
+        return self._sku_araliklari.get((model, kapasite), (0, 0))
+
+    def satir_sayisi(self, model, kapasite=None):
+        ilk, son = self._aralik(model, kapasite)
+        return son - ilk
+
+    def satirlar(self, model, kapasite=None):
+        """Model (kapasite verilirse SKU) satırları; KAPASITE, TARIH sıralı dilim"""
+        ilk, son = self._aralik(model, kapasite)
+        return self.df.iloc[ilk:son]
+
+    def gunluk(self, model, kapasite=None):
+        """Model ya da SKU için TARIH sıralı günlük ortalama fiyat (TARIH, FIYAT sütunları)"""
+        if kapasite is None:
+            tablo, araliklar, anahtar = self._gunluk_model, self._gunluk_model_araliklari, model
+        else:
+            tablo, araliklar, anahtar = self._gunluk_sku, self._gunluk_sku_araliklari, (model, kapasite)
+        ilk, son = araliklar.get(anahtar, (0, 0))
+        return tablo.iloc[ilk:son]
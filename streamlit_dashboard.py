@@ -5,6 +5,9 @@ import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
 from datetime import datetime, timedelta
+from veri_semasi import bayrak_metni
+from seri_deposu import SeriDeposu
+from grafik_seyreltme import seyrelt_tablo, seyreltilmis_iz
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -50,6 +53,14 @@ st.markdown("""
 st.markdown('<h1 class="main-header">📱 iPhone Fiyat Analizi Dashboard</h1>', unsafe_allow_html=True)
 
 # Veri yükleme
+VERI_DOSYASI = 'profesyonel_telefon_verileri2.csv'
+# Panelde kullanılan veri seti sütunları; yükleyiciler yalnızca bunları okur
+PANEL_SUTUNLARI = [
+    'MODEL', 'KAPASITE', 'TARIH', 'FIYAT', 'PERFORMANS_SKORU', 'FIYAT_PERFORMANS_ORANI', 'KAMPANYA_DURUMU',
+    'RAM_GB', 'BATARYA_MAH', 'KAMERA_MP', 'CHIPSET', 'DXOMARK_PUAN', 'DAHILI_DEPOLAMA', 'EKRAN_BOYUTU',
+    'EKRAN_COZUNURLUGU', '5G_DESTEGI', 'SU_GECIRMEZLIK_SEVIYESI',
+]
+
 @st.cache_data
 def load_data():
     import os
@@ -58,6 +69,19 @@ def load_data():
     current_dir = os.getcwd()
     st.sidebar.write(f"📁 Çalışma dizini: {current_dir}")
     
+    # CSV'den üretilmiş güncel Parquet yıldız şema (olgu + SKU tablosu) varsa önce onu dene;
+    # yalnızca panelin kullandığı sütunlar okunur ve ortak şema uygulanır
+    from veri_semasi import semayi_uygula, veri_setini_yukle
+    from yildiz_sema import parquet_dosyalari, yildiz_sema_guncel
+    if yildiz_sema_guncel(VERI_DOSYASI):
+        try:
+            df = veri_setini_yukle(VERI_DOSYASI, sutunlar=PANEL_SUTUNLARI)
+            st.sidebar.success(f"✅ Parquet veri seti bulundu: {parquet_dosyalari(VERI_DOSYASI)[0]}")
+            st.sidebar.info(f"📊 Yüklenen veri: {len(df)} kayıt, {len(df.columns)} sütun")
+            return df
+        except Exception as e:
+            st.sidebar.warning(f"⚠️ Parquet veri seti yüklenemedi: {str(e)}")
+    
     # Dosya yollarını dene
     file_paths = [
         'profesyonel_telefon_verileri.csv',
@@ -70,7 +94,7 @@ def load_data():
         try:
             if os.path.exists(file_path):
                 st.sidebar.success(f"✅ Dosya bulundu: {file_path}")
-                df = pd.read_csv(file_path)
+                df = pd.read_csv(file_path, usecols=lambda c: c in PANEL_SUTUNLARI)
                 
                 # Tarih formatını otomatik algıla
                 df['TARIH'] = pd.to_datetime(df['TARIH'])
@@ -87,6 +111,7 @@ def load_data():
                         elif col == 'KAMPANYA_DURUMU':
                             df[col] = 'Normal Fiyat'  # Default durum
                 
+                df = semayi_uygula(df)
                 st.sidebar.info(f"📊 Yüklenen veri: {len(df)} kayıt, {len(df.columns)} sütun")
                 return df
                 
@@ -136,6 +161,9 @@ if df is not None:
         (df['TARIH'] >= pd.to_datetime(date_range[0])) &
         (df['TARIH'] <= pd.to_datetime(date_range[1]))
     ]
+
+    # Model bazında satırlar ve günlük ortalamalar için tek sıralamalı indeks
+    depo = SeriDeposu(filtered_df)
     
     # Ana metrikler
     col1, col2, col3, col4 = st.columns(4)
@@ -162,16 +190,15 @@ if df is not None:
     with tab1:
         st.header("📈 Fiyat Trend Analizi")
         
-        # Model bazında fiyat trendi
+        # Model bazında fiyat trendi (iz başına nokta bütçesi, WebGL)
         fig_trend = go.Figure()
         
         for model in selected_models:
-            model_data = filtered_df[filtered_df['MODEL'] == model]
-            daily_avg = model_data.groupby('TARIH')['FIYAT'].mean().reset_index()
+            daily_avg = depo.gunluk(model)
             
-            fig_trend.add_trace(go.Scatter(
-                x=daily_avg['TARIH'],
-                y=daily_avg['FIYAT'],
+            fig_trend.add_trace(seyreltilmis_iz(
+                daily_avg['TARIH'],
+                daily_avg['FIYAT'],
                 mode='lines+markers',
                 name=model,
                 line=dict(width=3),
@@ -192,7 +219,7 @@ if df is not None:
         col1, col2 = st.columns(2)
         
         with col1:
-            capacity_avg = filtered_df.groupby('KAPASITE')['FIYAT'].mean().sort_values()
+            capacity_avg = filtered_df.groupby('KAPASITE', observed=True)['FIYAT'].mean().sort_values()
             fig_capacity = px.bar(
                 x=capacity_avg.index,
                 y=capacity_avg.values,
@@ -222,6 +249,7 @@ if df is not None:
         
         # Kampanya dağılımı
         kampanya_counts = filtered_df['KAMPANYA_DURUMU'].value_counts()
+        kampanya_counts = kampanya_counts[kampanya_counts > 0]
         
         col1, col2 = st.columns(2)
         
@@ -239,7 +267,7 @@ if df is not None:
             
             # Model bazında anomali oranları
             for model in selected_models:
-                model_data = filtered_df[filtered_df['MODEL'] == model]
+                model_data = depo.satirlar(model)
                 indirim_kayitlari = len(model_data[model_data['KAMPANYA_DURUMU'].isin(['İndirim', 'Büyük İndirim', 'Mega İndirim'])])
                 toplam_kayit = len(model_data)
                 
@@ -269,27 +297,25 @@ if df is not None:
     with tab3:
         st.header("🤖 AI Tahminleri ve Öngörüler")
         
-        # Basit trend tahmini
+        # Hızlı tahmin: seçili modeller için tek vektörel üstel düzeltme çağrısı
         st.subheader("📈 30 Günlük Fiyat Tahminleri")
         
         predictions = {}
         
-        for model in selected_models:
-            model_data = filtered_df[filtered_df['MODEL'] == model].sort_values('TARIH')
+        tahmin_modelleri = [model for model in selected_models if len(depo.gunluk(model)) >= 30]
+        if tahmin_modelleri:
+            from ustel_duzeltme import toplu_tahmin
             
-            if len(model_data) >= 30:
+            seriler = [depo.gunluk(model).set_index('TARIH')['FIYAT'].asfreq('D').ffill().to_numpy()
+                       for model in tahmin_modelleri]
+            tahminler, _ = toplu_tahmin(seriler, 'sonumlu', 30)
+            
+            for model, seri, tahmin in zip(tahmin_modelleri, seriler, tahminler):
                 # Son 30 günün ortalaması
-                recent_avg = model_data.tail(30)['FIYAT'].mean()
-                
-                # Basit trend hesaplama
-                if len(model_data) >= 60:
-                    older_avg = model_data.tail(60).head(30)['FIYAT'].mean()
-                    trend = (recent_avg - older_avg) / older_avg * 100
-                else:
-                    trend = 0
+                recent_avg = seri[-30:].mean()
                 
-                # Tahmin
-                predicted_price = recent_avg * (1 + trend/100)
+                # Sönümlü trend tahmininin 30 günlük ortalaması
+                predicted_price = tahmin.mean()
                 change_percent = ((predicted_price - recent_avg) / recent_avg) * 100
                 
                 predictions[model] = {
@@ -330,6 +356,30 @@ if df is not None:
                     else:
                         st.info("📊 Stabil fiyat bekleniyor")
         
+        # Hiyerarşik (uzlaştırılmış) tahminler: toplam, model ve kapasite seviyeleri birbiriyle tutarlı
+        st.subheader("🌳 Hiyerarşik Tahminler (Toplam → Model → Kapasite)")
+        
+        import os
+        if os.path.exists('hiyerarsik_tahminler.csv'):
+            hiyerarsik = pd.read_csv('hiyerarsik_tahminler.csv', keep_default_na=False)
+            hiyerarsik['TARIH'] = pd.to_datetime(hiyerarsik['TARIH'], format='%d.%m.%Y')
+            seviye = st.radio("Seviye:", options=list(hiyerarsik['SEVIYE'].unique()), horizontal=True)
+            seviye_tahminleri = hiyerarsik[hiyerarsik['SEVIYE'] == seviye]
+            seviye_tahminleri = seviye_tahminleri.assign(
+                DUGUM=(seviye_tahminleri['MODEL'] + ' ' + seviye_tahminleri['KAPASITE']).str.strip().replace('', 'Toplam'))
+            
+            fig_hiyerarsi = px.line(
+                seviye_tahminleri,
+                x='TARIH',
+                y='UZLASTIRILMIS',
+                color='DUGUM',
+                title="Uzlaştırılmış 30 Günlük Tahminler",
+                labels={'UZLASTIRILMIS': 'Tahmin (TL)', 'TARIH': 'Tarih', 'DUGUM': ''}
+            )
+            st.plotly_chart(fig_hiyerarsi, use_container_width=True)
+        else:
+            st.info("Hiyerarşik tahminler için: python hiyerarsik_tahmin.py --yontem mint")
+        
         # Performans vs Fiyat analizi
         st.subheader("🎯 Performans vs Fiyat Analizi")
         
@@ -350,7 +400,7 @@ if df is not None:
         # Teknik özellik karşılaştırması
         numeric_features = ['RAM_GB', 'BATARYA_MAH', 'KAMERA_MP', 'DXOMARK_PUAN', 'PERFORMANS_SKORU']
         
-        feature_comparison = filtered_df.groupby('MODEL')[numeric_features].mean()
+        feature_comparison = filtered_df.groupby('MODEL', observed=True)[numeric_features].mean()
         
         # Radar chart için veriyi normalize et
         from sklearn.preprocessing import MinMaxScaler
@@ -409,7 +459,7 @@ if df is not None:
         )
         
         if selected_model_report:
-            model_data = filtered_df[filtered_df['MODEL'] == selected_model_report]
+            model_data = depo.satirlar(selected_model_report)
             
             # Genel istatistikler
             col1, col2, col3 = st.columns(3)
@@ -443,7 +493,7 @@ if df is not None:
                     tech_specs['CHIPSET'],
                     f"{tech_specs['EKRAN_BOYUTU']} inç",
                     tech_specs['EKRAN_COZUNURLUGU'],
-                    tech_specs['5G_DESTEGI'],
+                    bayrak_metni(tech_specs['5G_DESTEGI']),
                     tech_specs['SU_GECIRMEZLIK_SEVIYESI']
                 ]
             })
@@ -453,13 +503,14 @@ if df is not None:
             # Fiyat geçmişi grafiği
             st.subheader("📈 Fiyat Geçmişi")
             
-            price_history = model_data.groupby('TARIH')['FIYAT'].mean().reset_index()
+            price_history = seyrelt_tablo(depo.gunluk(selected_model_report))
             
             fig_history = px.line(
                 price_history,
                 x='TARIH',
                 y='FIYAT',
-                title=f"{selected_model_report} Fiyat Geçmişi"
+                title=f"{selected_model_report} Fiyat Geçmişi",
+                render_mode='webgl'
             )
             st.plotly_chart(fig_history, use_container_width=True)
             
@@ -469,7 +520,7 @@ if df is not None:
             indirim_kayitlari = model_data[model_data['KAMPANYA_DURUMU'].str.contains('İndirim', na=False)]
             
             if len(indirim_kayitlari) > 0:
-                indirim_stats = indirim_kayitlari.groupby('KAMPANYA_DURUMU').agg({
+                indirim_stats = indirim_kayitlari.groupby('KAMPANYA_DURUMU', observed=True).agg({
                     'FIYAT': ['count', 'mean', 'min'],
                     'TARIH': ['min', 'max']
                 }).round(2)
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+SKU Bazlı Paralel Tahmin
+
+Veri setindeki her (MODEL, KAPASITE) serisi için ARIMA ve/veya Prophet tahminini
+bir süreç havuzunda (ProcessPoolExecutor) çalıştırır. Her görev tek bir SKU'nun
+günlük ortalama fiyat serisidir; işçilere yalnızca tarih ve fiyat dizileri gönderilir.
+
+- Sonuçlar tek bir düzenli tabloda döner: MODEL, KAPASITE, YONTEM, TARIH, TAHMIN.
+- Bir serinin hatası yalnızca o seriyi etkiler; durum tablosuna HATA olarak yazılır.
+  Tahmin tablosu yine yazılır, ancak CLI herhangi bir seri HATA ile bittiyse 1
+  döndürür (--kismi-basari-kabul ile en az bir seri tamamlandıysa 0).
+- Görevler SKU sırasına göre dizilir; çıktı işlem sayısından bağımsız olarak aynıdır.
+
+Süreç havuzu Windows'ta (spawn) ana modülü yeniden içe aktardığı için çağıran
+betikte `if __name__ == '__main__':` koruması bulunmalıdır.
+
+Kullanım:
+    python tahmin_havuzu.py --islem-sayisi 4 --yontem arima,prophet -o sku_tahminleri.csv
+"""
+
+import argparse
+import sys
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+YONTEMLER = ('arima', 'prophet')
+TAHMIN_SUTUNLARI = ['MODEL', 'KAPASITE', 'YONTEM', 'TARIH', 'TAHMIN']
+EN_AZ_GUN = 30
+
+
+def sku_serileri(df):
+    """Her (MODEL, KAPASITE) için günlük ortalama fiyat serisini döndürür
+
+    {(model, kapasite): pd.Series (TARIH indeksli)} sözlüğü; EN_AZ_GUN'den kısa
+    seriler de döner, tahmin sırasında durum tablosuna 'YETERSIZ' olarak yazılır.
+    """
+    gunluk = df.groupby(['MODEL', 'KAPASITE', 'TARIH'], observed=True, sort=True)['FIYAT'].mean()
+    return {
+        (model, kapasite): seri.droplevel([0, 1])
+        for (model, kapasite), seri in gunluk.groupby(level=[0, 1], observed=True, sort=True)
+    }
+
+
+def _arima_tahmini(fiyatlar, ufuk):
+    from statsmodels.tsa.arima.model import ARIMA
+
+    return np.asarray(ARIMA(fiyatlar, order=(1, 1, 1)).fit().forecast(steps=ufuk))
+
+
+_prophet_arka_ucu = None  # İşçi süreci başına bir kez kurulur (tatil tablosu süreç içinde paylaşılır)
+
+
+def _prophet_tahmini(seri_adi, tarihler, fiyatlar, ufuk):
+    global _prophet_arka_ucu
+    from prophet_hizli import ProphetArkaUcu
+
+    if _prophet_arka_ucu is None:
+        _prophet_arka_ucu = ProphetArkaUcu(ayrintili=False)
+    model = _prophet_arka_ucu.egit(seri_adi, tarihler, fiyatlar, ufuk)
+    return ProphetArkaUcu.tahmin_et(model, ufuk)['yhat'].to_numpy()
+
+
+def isci_hazirla(yontemler):
+    """İşçi başlatıcı: yöntem kütüphanelerini bir kez içe aktarır (süreler yalnızca model eğitimini ölçer)"""
+    moduller = {'arima': 'statsmodels.tsa.arima.model', 'prophet': 'prophet'}
+    for yontem in yontemler:
+        try:
+            __import__(moduller[yontem])
+        except ImportError:
+            pass  # Hata, seri tahmininde durum tablosuna yazılır
+
+
+def sku_tahmini(gorev):
+    """Süreç havuzu işçisi: bir SKU serisi için seçilen yöntemlerle tahmin üretir
+
+    gorev: (model, kapasite, tarihler, fiyatlar, yontemler, ufuk). Hatalar
+    yakalanır; (tahmin satırları, durum satırları) döndürür.
+    """
+    model, kapasite, tarihler, fiyatlar, yontemler, ufuk = gorev
+    warnings.filterwarnings('ignore')
+    satirlar, durumlar = [], []
+    gelecek = pd.date_range(pd.Timestamp(tarihler[-1]) + pd.Timedelta(days=1), periods=ufuk, freq='D')
+
+    for yontem in yontemler:
+        baslangic = time.perf_counter()
+        durum = {'MODEL': model, 'KAPASITE': kapasite, 'YONTEM': yontem, 'GUN': len(fiyatlar),
+                 'DURUM': 'TAMAM', 'HATA': ''}
+        if len(fiyatlar) < EN_AZ_GUN:
+            durum.update(DURUM='YETERSIZ', HATA=f"{len(fiyatlar)} gün (< {EN_AZ_GUN})")
+        else:
+            try:
+                if yontem == 'arima':
+                    tahmin = _arima_tahmini(fiyatlar, ufuk)
+                else:
+                    tahmin = _prophet_tahmini(f"{model} - {kapasite}", tarihler, fiyatlar, ufuk)
+                satirlar.extend(zip([model] * ufuk, [kapasite] * ufuk, [yontem] * ufuk, gelecek, tahmin))
+            except Exception as e:
+                durum.update(DURUM='HATA', HATA=f"{type(e).__name__}: {e}")
+        durum['SURE_SN'] = time.perf_counter() - baslangic
+        durumlar.append(durum)
+    return satirlar, durumlar
+
+
+def toplu_tahmin(df, islem_sayisi=None, yontemler=('arima',), ufuk=30):
+    """Tüm SKU serileri için tahminleri paralel üretir
+
+    (tahminler, durum) döndürür. tahminler: TAHMIN_SUTUNLARI sütunlu düzenli
+    tablo; durum: seri ve yöntem başına gün sayısı, DURUM (TAMAM/HATA/YETERSIZ),
+    hata mesajı ve süre. islem_sayisi=1 iken süreç havuzu kullanılmaz.
+    """
+    bilinmeyen = [y for y in yontemler if y not in YONTEMLER]
+    if bilinmeyen:
+        raise ValueError(f"Bilinmeyen yöntem: {bilinmeyen} (seçenekler: {', '.join(YONTEMLER)})")
+
+    gorevler = [
+        (model, kapasite, seri.index.to_numpy(), seri.to_numpy(np.float64), tuple(yontemler), ufuk)
+        for (model, kapasite), seri in sku_serileri(df).items()
+    ]
+    if islem_sayisi == 1 or len(gorevler) <= 1:
+        isci_hazirla(yontemler)
+        sonuclar = list(map(sku_tahmini, gorevler))
+    else:
+        with ProcessPoolExecutor(max_workers=islem_sayisi, initializer=isci_hazirla,
+                                 initargs=(tuple(yontemler),)) as havuz:
+            # map, görev sırasını korur; birleştirme tamamlanma sırasından bağımsızdır
+            sonuclar = list(havuz.map(sku_tahmini, gorevler, chunksize=1))
+
+    tahminler = pd.DataFrame([s for satirlar, _ in sonuclar for s in satirlar], columns=TAHMIN_SUTUNLARI)
+    durum = pd.DataFrame([d for _, durumlar in sonuclar for d in durumlar])
+    return tahminler, durum
+
+
+def durum_raporu_yazdir(durum, toplam_sure):
+    """Seri başına tahmin durumunu ve toplam süreyi yazdırır"""
+    print(f"\n🔮 SKU Tahmin Durumu:")
+    for d in durum.itertuples(index=False):
+        simge = {'TAMAM': '✅', 'YETERSIZ': '⚠️', 'HATA': '❌'}[d.DURUM]
+        hata = f" - {d.HATA}" if d.HATA else ''
+        print(f"  {simge} {d.MODEL} {d.KAPASITE} [{d.YONTEM}]: {d.GUN} gün, {d.SURE_SN:.2f} sn{hata}")
+    sayilar = durum['DURUM'].value_counts()
+    print(f"  🧮 Toplam: {sayilar.get('TAMAM', 0)} tamam, {sayilar.get('HATA', 0)} hata, "
+          f"{sayilar.get('YETERSIZ', 0)} yetersiz; seri süreleri toplamı {durum['SURE_SN'].sum():.2f} sn, "
+          f"{toplam_sure:.2f} sn (duvar saati)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='SKU (MODEL x KAPASITE) bazlı paralel fiyat tahmini')
+    parser.add_argument('-o', '--cikti', default='sku_tahminleri.csv', help='Tahmin tablosunun yazılacağı CSV')
+    parser.add_argument('--yontem', default='arima', help=f"Virgülle ayrılmış yöntemler ({', '.join(YONTEMLER)})")
+    parser.add_argument('--islem-sayisi', type=int, default=None, help='İşçi süreç sayısı (varsayılan: CPU sayısı)')
+    parser.add_argument('--ufuk', type=int, default=30, help='Tahmin ufku (gün)')
+    parser.add_argument('--csv', default='profesyonel_telefon_verileri2.csv', help='Parquet yoksa okunacak CSV')
+    parser.add_argument('--kismi-basari-kabul', action='store_true',
+                        help='Bazı seriler HATA ile bitse de en az bir seri tamamlandıysa 0 ile çık')
+    args = parser.parse_args(argv)
+
+    from veri_semasi import SERI_SUTUNLARI, veri_setini_yukle
+
+    df = veri_setini_yukle(args.csv, sutunlar=SERI_SUTUNLARI)
+    baslangic = time.perf_counter()
+    try:
+        tahminler, durum = toplu_tahmin(df, args.islem_sayisi, [y.strip() for y in args.yontem.split(',')], args.ufuk)
+    except ValueError as e:
+        parser.error(str(e))
+    durum_raporu_yazdir(durum, time.perf_counter() - baslangic)
+
+    tahminler.to_csv(args.cikti, index=False, date_format='%d.%m.%Y')
+    print(f"💾 {len(tahminler)} tahmin satırı: {args.cikti}")
+    if args.kismi_basari_kabul:
+        return 0 if (durum['DURUM'] == 'TAMAM').any() else 1
+    return 1 if (durum['DURUM'] == 'HATA').any() else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
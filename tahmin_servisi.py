@@ -0,0 +1,533 @@
+#!/usr/bin/env python3
+"""
+Yerel Tahmin Servisi (asyncio HTTP, Mikro Toplama)
+
+Hazırlanmış veri seti ve modeller süreç başında bir kez yüklenir. Servis ayakta
+kaldıkça istekler bellekteki modellerle yanıtlanır:
+
+- GET /forecast?model=&capacity=&horizon=  Model (capacity verilirse SKU) için
+  vektörel üstel düzeltme tahmini. Tüm model ve SKU serileri başlangıçta tek
+  geçişte uyumlanır.
+- GET /anomaly?model=&price=&date=  ya da  POST /anomaly (JSON kayıt / kayıt
+  listesi)  Kalıcı anomali dedektörleriyle (anomali_servisi) fiyat skorlama.
+- GET /stats  Uç nokta başına p50/p99 gecikme, verim ve ortalama toplu iş boyutu
+  (?sifirla=1 ile ölçümler sıfırlanır). GET /health  Servis durumu ve seriler.
+
+Eşzamanlı istekler mikro toplayıcıda (MikroToplayici) biriktirilir ve tek
+vektörel çağrıyla yanıtlanır: bir toplu iş işlenirken gelen istekler (en çok
+en_fazla) sonrakine girer; bekleme_ms > 0 iken ilk istekten sonra ayrıca beklenir.
+Tahminlerde istenen tüm seriler ve en uzun ufuk için tek tahmin_et çağrısı
+yapılır. Anomalide tüm kayıtlar tek skorla çağrısıyla skorlanır. Toplu çağrı hata
+verirse istekler tek tek yeniden denenir; yalnızca hatalı istek hata alır. Kayıtlar
+(fiyat, tarih) toplu işe girmeden doğrulanır ve hatalılar 400 ile döner. Her uç noktanın
+model çağrıları kendi tek iş parçacıklı yürütücüsünde çalışır; olay döngüsü bu
+sırada yeni istekleri kabul etmeye devam eder ve yavaş anomali skorlaması
+tahminleri bekletmez.
+
+HTTP katmanı standart kütüphanedir (asyncio akışları, HTTP/1.1 keep-alive); ek
+bağımlılık yoktur. Servis yerel kullanım içindir (varsayılan 127.0.0.1).
+
+Kullanım:
+    python tahmin_servisi.py sun --port 8765
+    python tahmin_servisi.py yuk --port 8765 --istek 5000 --eszamanli 64
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qsl, urlsplit
+
+import numpy as np
+import pandas as pd
+
+VARSAYILAN_PORT = 8765
+BEKLEME_MS = 0.0  # 0: yalnızca önceki toplu iş sürerken birikmiş istekler toplanır
+EN_FAZLA_TOPLU = 64
+EN_FAZLA_UFUK = 365
+OLCUM_PENCERESI = 100_000  # Uç nokta başına saklanan en çok gecikme ölçümü
+DURUM_METINLERI = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+                   500: 'Internal Server Error'}
+# API alan adları → veri seti sütunları
+ANOMALI_ALANLARI = {'model': 'MODEL', 'capacity': 'KAPASITE', 'price': 'FIYAT', 'date': 'TARIH'}
+
+
+class IstekHatasi(Exception):
+    """İstemciye HTTP durum koduyla döndürülen hata"""
+
+    def __init__(self, durum, mesaj):
+        super().__init__(mesaj)
+        self.durum = durum
+
+
+def _anahtar(model, kapasite=None):
+    """Seri arama anahtarı (büyük/küçük harf ve boşluk duyarsız)"""
+    return (str(model).strip().lower(), str(kapasite).strip().lower() if kapasite else None)
+
+
+def yuzdelikler(sureler):
+    """Gecikme dizisinin (saniye) p50/p99 değerleri (ms)"""
+    if len(sureler) == 0:
+        return {'p50_ms': None, 'p99_ms': None}
+    p50, p99 = np.percentile(np.asarray(sureler) * 1000, [50, 99])
+    return {'p50_ms': round(float(p50), 3), 'p99_ms': round(float(p99), 3)}
+
+
+class MikroToplayici:
+    """Eşzamanlı istekleri biriktirip tek çağrıda işleyen kuyruk
+
+    islem(istekler) aynı sırada sonuç listesi döndürür; bir sonuç Exception ise
+    yalnızca o isteğe hata olarak iletilir; islem hata fırlatırsa toplu işin
+    istekleri tek tek yeniden işlenir. İlk istekten sonra bekleme_ms kadar
+    (ya da en_fazla isteğe dek) beklenir. Önceki toplu iş işlenirken gelen
+    istekler de kuyrukta birikir ve bir sonraki toplu işe girer.
+    """
+
+    def __init__(self, islem, bekleme_ms=BEKLEME_MS, en_fazla=EN_FAZLA_TOPLU):
+        self.islem = islem
+        self.bekleme = bekleme_ms / 1000
+        self.en_fazla = max(1, en_fazla)
+        self.boyutlar = deque(maxlen=OLCUM_PENCERESI)
+        self._kuyruk = None
+        self._gorev = None
+        self._yurutucu = None
+
+    def baslat(self):
+        self._kuyruk = asyncio.Queue()
+        self._yurutucu = ThreadPoolExecutor(max_workers=1)
+        self._gorev = asyncio.create_task(self._dongu())
+
+    async def durdur(self):
+        if self._gorev:
+            self._gorev.cancel()
+            try:
+                await self._gorev
+            except asyncio.CancelledError:
+                pass
+            self._yurutucu.shutdown()
+
+    async def gonder(self, istek):
+        gelecek = asyncio.get_running_loop().create_future()
+        self._kuyruk.put_nowait((istek, gelecek))
+        return await gelecek
+
+    async def _topla(self):
+        dongu = asyncio.get_running_loop()
+        toplu = [await self._kuyruk.get()]
+        son_an = dongu.time() + self.bekleme
+        while len(toplu) < self.en_fazla:
+            if not self._kuyruk.empty():
+                toplu.append(self._kuyruk.get_nowait())
+                continue
+            kalan = son_an - dongu.time()
+            if kalan <= 0:
+                break
+            try:
+                toplu.append(await asyncio.wait_for(self._kuyruk.get(), kalan))
+            except asyncio.TimeoutError:
+                break
+        return toplu
+
+    async def _tekli(self, dongu, istek):
+        """Tek isteği ayrı bir toplu iş olarak işler; hatayı sonuç olarak döndürür"""
+        try:
+            return (await dongu.run_in_executor(self._yurutucu, self.islem, [istek]))[0]
+        except Exception as e:
+            return e
+
+    async def _dongu(self):
+        dongu = asyncio.get_running_loop()
+        while True:
+            toplu = await self._topla()
+            self.boyutlar.append(len(toplu))
+            istekler = [i for i, _ in toplu]
+            try:
+                sonuclar = await dongu.run_in_executor(self._yurutucu, self.islem, istekler)
+            except Exception as e:
+                if len(toplu) == 1:
+                    sonuclar = [e]
+                else:
+                    # Hatalı bir istek tüm toplu işi düşürmesin: istekler tek tek yeniden denenir
+                    sonuclar = [await self._tekli(dongu, istek) for istek in istekler]
+            for (_, gelecek), sonuc in zip(toplu, sonuclar):
+                if gelecek.done():
+                    continue  # İstemci bağlantıyı kapatmış
+                if isinstance(sonuc, Exception):
+                    gelecek.set_exception(sonuc)
+                else:
+                    gelecek.set_result(sonuc)
+
+
+class TahminModelleri:
+    """Bellekte tutulan modeller: tüm seriler için ETS uyumu ve anomali dedektörleri"""
+
+    def __init__(self, df, ets_modeli='sonumlu', onbellek=None, anomali=True):
+        from seri_deposu import SeriDeposu
+        from ustel_duzeltme import toplu_tahmin
+
+        depo = SeriDeposu(df)
+        self.seriler = []
+        self.satirlar = {}
+        seriler, son_tarihler = [], []
+        for model, kapasite in [(m, None) for m in depo.modeller()] + depo.skular():
+            gunluk = depo.gunluk(model, kapasite)
+            if len(gunluk) < 30:
+                continue
+            seri = gunluk.set_index('TARIH')['FIYAT'].asfreq('D').ffill()
+            self.satirlar[_anahtar(model, kapasite)] = len(seriler)
+            self.seriler.append({'model': str(model), 'capacity': str(kapasite) if kapasite else None})
+            seriler.append(seri.to_numpy())
+            son_tarihler.append(seri.index[-1])
+        _, self.uyum = toplu_tahmin(seriler, ets_modeli, ufuk=1)
+        # Yanıt tarihleri seri başına bir kez (en uzun ufka kadar) biçimlendirilir
+        self.tarihler = [list(pd.date_range(son + pd.Timedelta(days=1), periods=EN_FAZLA_UFUK, freq='D')
+                              .strftime('%Y-%m-%d')) for son in son_tarihler]
+        self.ets_modeli = ets_modeli
+
+        self.anomali = None
+        if anomali:
+            from anomali_servisi import AnomaliServisi
+
+            self.anomali = AnomaliServisi(onbellek, n_jobs=1)
+            self.anomali.guncelle(df)
+
+    def tahmin_toplu(self, istekler):
+        """[(model, kapasite, ufuk)] için tek tahmin_et çağrısı; istek başına yanıt ya da IstekHatasi"""
+        from ustel_duzeltme import tahmin_et
+
+        satirlar = [self.satirlar.get(_anahtar(model, kapasite)) for model, kapasite, _ in istekler]
+        gecerli = sorted({s for s in satirlar if s is not None})
+        if gecerli:
+            ufuk = max(u for s, (_, _, u) in zip(satirlar, istekler) if s is not None)
+            tahminler = tahmin_et(self.uyum, ufuk, gecerli)
+            konum = {s: i for i, s in enumerate(gecerli)}
+
+        sonuclar = []
+        for satir, (model, kapasite, ufuk) in zip(satirlar, istekler):
+            if satir is None:
+                seri = f"{model} {kapasite}" if kapasite else model
+                sonuclar.append(IstekHatasi(404, f"Seri bulunamadı: {seri}"))
+                continue
+            degerler = tahminler[konum[satir], :ufuk].round(2).tolist()
+            sonuclar.append(dict(self.seriler[satir], horizon=ufuk, method=self.ets_modeli,
+                                 forecast=[{'date': t, 'price': d} for t, d in zip(self.tarihler[satir], degerler)]))
+        return sonuclar
+
+    def anomali_toplu(self, istekler):
+        """Her istek bir kayıt listesidir; tüm kayıtlar tek skorla çağrısıyla skorlanır"""
+        if self.anomali is None:
+            return [IstekHatasi(404, 'Anomali dedektörleri yüklenmedi')] * len(istekler)
+        kayitlar = pd.DataFrame([k for istek in istekler for k in istek])
+        skorlar = self.anomali.skorla(kayitlar)
+        sonuclar = [
+            {'model': str(model), 'price': fiyat, 'score': None if skor != skor else round(skor, 5),
+             'anomaly': None if anomali == 0 else anomali == -1}
+            for model, fiyat, skor, anomali in zip(skorlar['MODEL'], skorlar['FIYAT'].tolist(),
+                                                  skorlar['ANOMALI_SKORU'].tolist(), skorlar['ANOMALI'].tolist())]
+        yanitlar, ilk = [], 0
+        for istek in istekler:
+            yanitlar.append({'results': sonuclar[ilk:ilk + len(istek)]})
+            ilk += len(istek)
+        return yanitlar
+
+
+def anomali_kayitlari(sorgu, govde):
+    """GET sorgusundan ya da POST JSON gövdesinden MODEL/FIYAT(/TARIH) kayıt listesi"""
+    if govde:
+        try:
+            veri = json.loads(govde)
+        except ValueError:
+            raise IstekHatasi(400, 'Gövde geçerli JSON değil')
+        ham = veri if isinstance(veri, list) else veri.get('records', [veri]) if isinstance(veri, dict) else None
+    else:
+        ham = [sorgu]
+    if not ham or not all(isinstance(k, dict) for k in ham):
+        raise IstekHatasi(400, 'En az bir kayıt (model, price) gerekli')
+    kayitlar = []
+    for k in ham:
+        kayit = {ANOMALI_ALANLARI.get(ad, ad): deger for ad, deger in k.items()}
+        if not isinstance(kayit.get('MODEL'), str) or 'FIYAT' not in kayit:
+            raise IstekHatasi(400, "Her kayıtta 'model' (metin) ve 'price' gerekli")
+        try:
+            fiyat = float(kayit['FIYAT'])
+        except (TypeError, ValueError):
+            fiyat = np.nan
+        if not np.isfinite(fiyat):
+            raise IstekHatasi(400, f"Geçersiz fiyat: {kayit['FIYAT']}")
+        kayit['FIYAT'] = fiyat
+        if kayit.get('TARIH') is not None:
+            try:
+                tarih = pd.Timestamp(kayit['TARIH'])
+            except (TypeError, ValueError):
+                tarih = pd.NaT
+            if pd.isna(tarih):
+                raise IstekHatasi(400, f"Geçersiz tarih: {kayit['TARIH']}")
+            kayit['TARIH'] = tarih.tz_convert(None) if tarih.tzinfo is not None else tarih
+        kayitlar.append(kayit)
+    return kayitlar
+
+
+class TahminServisi:
+    """asyncio HTTP sunucusu; uç noktalar mikro toplayıcılar üzerinden modellere iletilir"""
+
+    def __init__(self, modeller, bekleme_ms=BEKLEME_MS, en_fazla=EN_FAZLA_TOPLU):
+        self.modeller = modeller
+        self.toplayicilar = {
+            '/forecast': MikroToplayici(modeller.tahmin_toplu, bekleme_ms, en_fazla),
+            '/anomaly': MikroToplayici(modeller.anomali_toplu, bekleme_ms, en_fazla),
+        }
+        self._sunucu = None
+        self.sifirla()
+
+    def sifirla(self):
+        self.gecikmeler = {uc: deque(maxlen=OLCUM_PENCERESI) for uc in self.toplayicilar}
+        self.olcum_baslangici = time.perf_counter()
+        for toplayici in self.toplayicilar.values():
+            toplayici.boyutlar.clear()
+
+    def istatistikler(self):
+        gecen = time.perf_counter() - self.olcum_baslangici
+        uclar = {}
+        for uc, sureler in self.gecikmeler.items():
+            boyutlar = self.toplayicilar[uc].boyutlar
+            uclar[uc] = dict(yuzdelikler(sureler), istek=len(sureler),
+                             ortalama_toplu=round(float(np.mean(boyutlar)), 2) if boyutlar else None,
+                             toplu_is=len(boyutlar))
+        toplam = sum(len(s) for s in self.gecikmeler.values())
+        return {'sure_sn': round(gecen, 3), 'istek': toplam, 'verim_istek_sn': round(toplam / gecen, 1),
+                'uclar': uclar}
+
+    async def baslat(self, host='127.0.0.1', port=VARSAYILAN_PORT):
+        for toplayici in self.toplayicilar.values():
+            toplayici.baslat()
+        self._sunucu = await asyncio.start_server(self._baglanti, host, port)
+        return self._sunucu.sockets[0].getsockname()[1]
+
+    async def durdur(self):
+        self._sunucu.close()
+        await self._sunucu.wait_closed()
+        for toplayici in self.toplayicilar.values():
+            await toplayici.durdur()
+
+    async def _yanitla(self, yontem, hedef, govde):
+        parcalar = urlsplit(hedef)
+        yol, sorgu = parcalar.path.rstrip('/') or '/', dict(parse_qsl(parcalar.query))
+        if yol == '/forecast':
+            if yontem != 'GET':
+                raise IstekHatasi(405, 'Yalnızca GET')
+            if not sorgu.get('model'):
+                raise IstekHatasi(400, "'model' parametresi gerekli")
+            try:
+                ufuk = int(sorgu.get('horizon', 30))
+            except ValueError:
+                raise IstekHatasi(400, f"Geçersiz ufuk: {sorgu['horizon']}")
+            if not 1 <= ufuk <= EN_FAZLA_UFUK:
+                raise IstekHatasi(400, f"Ufuk 1..{EN_FAZLA_UFUK} gün olmalı")
+            return yol, await self.toplayicilar[yol].gonder((sorgu['model'], sorgu.get('capacity'), ufuk))
+        if yol == '/anomaly':
+            if yontem not in ('GET', 'POST'):
+                raise IstekHatasi(405, 'Yalnızca GET ya da POST')
+            return yol, await self.toplayicilar[yol].gonder(anomali_kayitlari(sorgu, govde))
+        if yol == '/stats':
+            istatistikler = self.istatistikler()
+            if sorgu.get('sifirla') == '1':
+                self.sifirla()
+            return yol, istatistikler
+        if yol == '/health':
+            return yol, {'durum': 'hazir', 'ets_modeli': self.modeller.ets_modeli,
+                         'anomali': self.modeller.anomali is not None, 'seriler': self.modeller.seriler}
+        raise IstekHatasi(404, f"Bilinmeyen uç nokta: {yol}")
+
+    async def _baglanti(self, okuyucu, yazici):
+        try:
+            while True:
+                satir = await okuyucu.readline()
+                if not satir:
+                    break
+                try:
+                    yontem, hedef, _ = satir.decode('latin-1').split(' ', 2)
+                except ValueError:
+                    break
+                basliklar = {}
+                while True:
+                    baslik = await okuyucu.readline()
+                    if baslik in (b'\r\n', b'\n', b''):
+                        break
+                    ad, _, deger = baslik.decode('latin-1').partition(':')
+                    basliklar[ad.strip().lower()] = deger.strip()
+                try:
+                    uzunluk = int(basliklar.get('content-length') or 0)
+                except ValueError:
+                    uzunluk = -1
+                # Gövde uzunluğu okunamazsa bağlantıdaki sonraki istek sınırı da bilinemez: 400 ve kapat
+                govde = await okuyucu.readexactly(uzunluk) if uzunluk >= 0 else b''
+
+                baslangic = time.perf_counter()
+                yol = None
+                try:
+                    if uzunluk < 0:
+                        raise IstekHatasi(400, f"Geçersiz Content-Length: {basliklar['content-length']}")
+                    yol, yanit = await self._yanitla(yontem, hedef, govde)
+                    durum = 200
+                except IstekHatasi as e:
+                    durum, yanit = e.durum, {'hata': str(e)}
+                except Exception as e:
+                    durum, yanit = 500, {'hata': f"{type(e).__name__}: {e}"}
+                veri = json.dumps(yanit, ensure_ascii=False).encode('utf-8')
+                kapat = basliklar.get('connection', '').lower() == 'close' or uzunluk < 0
+                ust = (f"HTTP/1.1 {durum} {DURUM_METINLERI[durum]}\r\n"
+                       f"Content-Type: application/json; charset=utf-8\r\n"
+                       f"Content-Length: {len(veri)}\r\n")
+                if kapat:
+                    ust += "Connection: close\r\n"
+                yazici.write(ust.encode('latin-1') + b"\r\n" + veri)
+                await yazici.drain()
+                if yol in self.gecikmeler:
+                    self.gecikmeler[yol].append(time.perf_counter() - baslangic)
+                if kapat:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            yazici.close()
+
+
+async def _istek(okuyucu, yazici, yontem, hedef, govde=b''):
+    """Açık (keep-alive) bağlantı üzerinden tek istek; (durum, JSON yanıt) döndürür"""
+    ust = f"{yontem} {hedef} HTTP/1.1\r\nHost: yerel\r\nContent-Length: {len(govde)}\r\n\r\n"
+    yazici.write(ust.encode('latin-1') + govde)
+    await yazici.drain()
+    durum = int((await okuyucu.readline()).split()[1])
+    uzunluk = 0
+    while True:
+        baslik = await okuyucu.readline()
+        if baslik in (b'\r\n', b'\n', b''):
+            break
+        ad, _, deger = baslik.decode('latin-1').partition(':')
+        if ad.strip().lower() == 'content-length':
+            uzunluk = int(deger)
+    return durum, json.loads(await okuyucu.readexactly(uzunluk))
+
+
+async def yuk_uret(host='127.0.0.1', port=VARSAYILAN_PORT, istek_sayisi=5000, eszamanli=64,
+                   anomali_orani=0.2, tohum=23):
+    """Yük üreteci: eszamanli keep-alive istemciden toplam istek_sayisi istek gönderir
+
+    İstekler /health'teki serilerden rastgele /forecast (ufuk 7..90) ve
+    anomali_orani kadar /anomaly isteğidir. Sunucu ölçümleri başta sıfırlanır.
+    İstemci tarafı gecikmeler, verim ve sunucunun /stats özetiyle sözlük döner.
+    """
+    from urllib.parse import urlencode
+
+    okuyucu, yazici = await asyncio.open_connection(host, port)
+    _, saglik = await _istek(okuyucu, yazici, 'GET', '/health')
+    await _istek(okuyucu, yazici, 'GET', '/stats?sifirla=1')
+
+    rng = np.random.default_rng(tohum)
+    seriler = saglik['seriler']
+    hedefler = []
+    for _ in range(istek_sayisi):
+        seri = seriler[rng.integers(len(seriler))]
+        if saglik['anomali'] and rng.random() < anomali_orani:
+            fiyat = round(float(rng.normal(50000, 8000)), 2)
+            hedefler.append('/anomaly?' + urlencode({'model': seri['model'], 'price': fiyat}))
+        else:
+            sorgu = {'model': seri['model'], 'horizon': int(rng.integers(7, 91))}
+            if seri['capacity']:
+                sorgu['capacity'] = seri['capacity']
+            hedefler.append('/forecast?' + urlencode(sorgu))
+
+    gecikmeler, hatalar = [], []
+    sira = iter(hedefler)
+
+    async def istemci():
+        ist_okuyucu, ist_yazici = await asyncio.open_connection(host, port)
+        try:
+            for hedef in sira:
+                baslangic = time.perf_counter()
+                durum, yanit = await _istek(ist_okuyucu, ist_yazici, 'GET', hedef)
+                gecikmeler.append(time.perf_counter() - baslangic)
+                if durum != 200:
+                    hatalar.append(yanit.get('hata'))
+        finally:
+            ist_yazici.close()
+
+    baslangic = time.perf_counter()
+    await asyncio.gather(*(istemci() for _ in range(eszamanli)))
+    sure = time.perf_counter() - baslangic
+
+    _, sunucu = await _istek(okuyucu, yazici, 'GET', '/stats')
+    yazici.close()
+    return dict(yuzdelikler(gecikmeler), istek=len(gecikmeler), hata=len(hatalar), sure_sn=sure,
+                verim_istek_sn=len(gecikmeler) / sure, sunucu=sunucu)
+
+
+def yuk_raporu_yazdir(sonuc):
+    print(f"🚀 {sonuc['istek']:,} istek {sonuc['sure_sn']:.2f} sn: {sonuc['verim_istek_sn']:,.0f} istek/sn, "
+          f"istemci p50 {sonuc['p50_ms']:.2f} ms, p99 {sonuc['p99_ms']:.2f} ms, {sonuc['hata']} hata")
+    for uc, ozet in sonuc['sunucu']['uclar'].items():
+        if ozet['istek']:
+            print(f"  🖥️ {uc}: {ozet['istek']:,} istek, sunucu p50 {ozet['p50_ms']:.2f} ms, "
+                  f"p99 {ozet['p99_ms']:.2f} ms, ortalama toplu iş {ozet['ortalama_toplu']}")
+
+
+async def _sun(modeller, args):
+    servis = TahminServisi(modeller, args.bekleme_ms, args.en_fazla_toplu)
+    port = await servis.baslat(args.host, args.port)
+    print(f"🌐 Tahmin servisi hazır: http://{args.host}:{port} (/forecast, /anomaly, /stats, /health)")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await servis.durdur()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Bellekteki modellerle yerel tahmin servisi ve yük üreteci')
+    parser.add_argument('komut', nargs='?', choices=['sun', 'yuk'], default='sun',
+                        help="sun: servisi başlat (varsayılan), yuk: çalışan servise yük üret")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=VARSAYILAN_PORT)
+    parser.add_argument('--ets-modeli', choices=['basit', 'holt', 'sonumlu', 'holt_winters'], default='sonumlu',
+                        help="Tahmin modeli (vektörel üstel düzeltme)")
+    parser.add_argument('--bekleme-ms', type=float, default=BEKLEME_MS,
+                        help="Mikro toplamada ilk istekten sonra beklenen süre (0: yalnızca birikmiş istekler)")
+    parser.add_argument('--en-fazla-toplu', type=int, default=EN_FAZLA_TOPLU, help="Toplu iş başına en çok istek")
+    parser.add_argument('--anomali-yok', action='store_true', help="Anomali dedektörlerini yükleme")
+    parser.add_argument('--onbellek', default='.model_onbellegi', help='Model önbelleği klasörü')
+    parser.add_argument('--csv', default='profesyonel_telefon_verileri2.csv', help='Parquet yoksa okunacak CSV')
+    parser.add_argument('--istek', type=int, default=5000, help="yuk: toplam istek sayısı")
+    parser.add_argument('--eszamanli', type=int, default=64, help="yuk: eşzamanlı bağlantı sayısı")
+    args = parser.parse_args(argv)
+
+    if args.komut == 'yuk':
+        try:
+            sonuc = asyncio.run(yuk_uret(args.host, args.port, args.istek, args.eszamanli))
+        except OSError as e:
+            print(f"❌ Servise bağlanılamadı ({args.host}:{args.port}): {e}")
+            return 1
+        yuk_raporu_yazdir(sonuc)
+        return 0
+
+    from model_onbellegi import ModelOnbellegi
+    from anomali_servisi import EGITIM_SUTUNLARI
+    from veri_semasi import SERI_SUTUNLARI, veri_setini_yukle
+
+    baslangic = time.perf_counter()
+    df = veri_setini_yukle(args.csv, sutunlar=SERI_SUTUNLARI + ([] if args.anomali_yok else EGITIM_SUTUNLARI))
+    df['TARIH'] = pd.to_datetime(df['TARIH'])
+    modeller = TahminModelleri(df, args.ets_modeli, ModelOnbellegi(args.onbellek), anomali=not args.anomali_yok)
+    dedektorler = '' if args.anomali_yok else ' ve anomali dedektörleri'
+    print(f"📦 {len(df):,} kayıt, {len(modeller.seriler)} seri ({args.ets_modeli}){dedektorler} "
+          f"{time.perf_counter() - baslangic:.2f} sn'de yüklendi")
+    try:
+        asyncio.run(_sun(modeller, args))
+    except KeyboardInterrupt:
+        print("\n👋 Servis durduruldu")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,6 @@
+"""Testler proje kökündeki düz modülleri (hucre_tarayici, grafik_seyreltme...) doğrudan içe aktarır"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,94 @@
+"""grafik_seyreltme: LTTB ve min/maks zarfının nokta bütçesi, uç değerler ve eksik noktalar"""
+
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from grafik_seyreltme import YONTEMLER, lttb, minmax_zarf, secilen_indeksler, seyrelt_tablo
+
+
+@pytest.fixture
+def seri():
+    rng = np.random.default_rng(24)
+    tarihler = pd.date_range('2015-01-01', periods=5000, freq='D').to_numpy()
+    return tarihler, 40000 + np.cumsum(rng.normal(0, 150, len(tarihler)))
+
+
+@pytest.mark.parametrize('yontem', YONTEMLER)
+def test_butce_ve_uclar(seri, yontem):
+    x, y = seri
+    indeksler = secilen_indeksler(x, y, 200, yontem)
+    assert len(indeksler) <= 200 and np.all(np.diff(indeksler) > 0)
+    assert indeksler[0] == 0 and indeksler[-1] == len(y) - 1
+
+
+def test_lttb_tam_hedef(seri):
+    assert len(lttb(*seri, 200)) == 200
+
+
+def test_zarf_en_kucuk_ve_en_buyuk_korunur(seri):
+    _, y = seri
+    indeksler = minmax_zarf(y, 200)
+    assert y.argmin() in indeksler and y.argmax() in indeksler
+
+
+@pytest.mark.parametrize('yontem', YONTEMLER)
+def test_kisa_seri_aynen_doner(yontem):
+    y = np.array([1.0, np.nan, 3.0])
+    assert secilen_indeksler(np.arange(3), y, 10, yontem).tolist() == [0, 1, 2]
+
+
+@pytest.mark.parametrize('yontem', YONTEMLER)
+def test_tamamen_eksik_kovalar(seri, yontem):
+    # Kovalardan daha uzun eksik aralıklar (satıcı verisi gelmeyen aylar)
+    x, y = seri
+    y = y.copy()
+    y[100:900] = np.nan
+    y[-300:] = np.nan
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')  # nanargmin 'All-NaN slice' uyarısı/hatası olmamalı
+        indeksler = secilen_indeksler(x, y, 200, yontem)
+    assert len(indeksler) <= 200 and np.all(np.diff(indeksler) > 0)
+    assert np.isfinite(y[indeksler]).all()
+    assert indeksler[0] == 0 and indeksler[-1] == len(y) - 301
+
+
+@pytest.mark.parametrize('yontem', YONTEMLER)
+def test_eksik_noktalar_atilmis_seriyle_ayni(seri, yontem):
+    x, y = seri
+    y = y.copy()
+    eksik = np.random.default_rng(1).choice(len(y), 500, replace=False)
+    y[eksik] = np.nan
+    gecerli = np.flatnonzero(~np.isnan(y))
+    beklenen = gecerli[secilen_indeksler(x[gecerli], y[gecerli], 200, yontem)]
+    assert np.array_equal(secilen_indeksler(x, y, 200, yontem), beklenen)
+
+
+@pytest.mark.parametrize('yontem', YONTEMLER)
+def test_tum_seri_eksik(yontem):
+    y = np.full(5000, np.nan)
+    assert len(secilen_indeksler(np.arange(5000), y, 200, yontem)) == 0
+
+
+def test_lttb_tarihsiz_noktalar(seri):
+    x, y = seri
+    x = x.copy()
+    x[10:20] = np.datetime64('NaT')
+    indeksler = lttb(x, y, 200)
+    assert not np.isin(np.arange(10, 20), indeksler).any()
+    assert len(indeksler) == 200
+
+
+def test_seyrelt_tablo_nullable_fiyat(seri):
+    x, y = seri
+    tablo = pd.DataFrame({'TARIH': x, 'FIYAT': pd.array(y, dtype='Float64')})
+    tablo.loc[1000:1999, 'FIYAT'] = pd.NA
+    seyrek = seyrelt_tablo(tablo, hedef=200, yontem='zarf')
+    assert len(seyrek) <= 200 and seyrek['FIYAT'].notna().all()
+
+
+def test_bilinmeyen_yontem(seri):
+    with pytest.raises(ValueError):
+        secilen_indeksler(*seri, 200, 'ortalama')
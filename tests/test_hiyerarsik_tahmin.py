@@ -0,0 +1,49 @@
+"""hiyerarsik_tahmin: toplama matrisi ve uzlaştırılmış tahminlerin tutarlılığı"""
+
+import numpy as np
+import pytest
+
+from hiyerarsik_tahmin import dugum_gecmisi, naif_temel, toplama_matrisi, uzlastirma_matrisi
+
+
+@pytest.fixture
+def hiyerarsi():
+    rng = np.random.default_rng(20)
+    anahtarlar = [(f"iPhone {m}", k, f"Satıcı {s}") for m in (13, 14, 15, 16)
+                  for k in ('128gb', '256gb', '512gb') for s in range(3)]
+    Y = 50000 + np.cumsum(rng.normal(0, 150, (len(anahtarlar), 200)), axis=1)
+    Y[0, :50] = np.nan  # Geç başlayan seri
+    dugumler, S = toplama_matrisi(anahtarlar)
+    H = dugum_gecmisi(S, Y)
+    temel, artiklar = naif_temel(H, 30)
+    # Naif temel tahmin zaten tutarlı olacağından düğümlere gürültü eklenir
+    return anahtarlar, dugumler, S, H, temel + rng.normal(0, 500, temel.shape), artiklar
+
+
+def test_toplama_matrisi(hiyerarsi):
+    anahtarlar, dugumler, S, *_ = hiyerarsi
+    assert len(dugumler) == 1 + 4 + 12 + 36 and dugumler[0] == ()
+    assert S.shape == (len(dugumler), len(anahtarlar))
+    assert np.allclose(S.sum(axis=1), 1.0)
+    assert np.array_equal(S[-len(anahtarlar):], np.eye(len(anahtarlar)))
+
+
+@pytest.mark.parametrize('yontem', ['alttan', 'usttan', 'mint'])
+def test_uzlastirilmis_tahminler_tutarli(hiyerarsi, yontem):
+    anahtarlar, _, S, H, temel, artiklar = hiyerarsi
+    G, _ = uzlastirma_matrisi(S, yontem, H, artiklar)
+    uzlastirilmis = S @ (G @ temel)
+    assert np.abs(S @ uzlastirilmis[-len(anahtarlar):] - uzlastirilmis).max() < 1e-6 * np.abs(temel).max()
+
+
+def test_mint_tutarli_tahmini_degistirmez(hiyerarsi):
+    anahtarlar, _, S, H, _, artiklar = hiyerarsi
+    tutarli = S @ np.random.default_rng(1).normal(50000, 1000, (len(anahtarlar), 30))
+    G, bilgi = uzlastirma_matrisi(S, 'mint', H, artiklar)
+    assert np.allclose(S @ (G @ tutarli), tutarli)
+    assert 0.0 <= bilgi['lambda'] <= 1.0
+
+
+def test_bilinmeyen_yontem(hiyerarsi):
+    with pytest.raises(ValueError):
+        uzlastirma_matrisi(hiyerarsi[2], 'yukaridan')
@@ -0,0 +1,118 @@
+"""hucre_tarayici: hücre sınıflandırma, model/kapasite çıkarımı ve tarih-fiyat eşleştirme"""
+
+import re
+
+import pytest
+
+from hucre_tarayici import hucre_siniflandir, model_bilgisi_bul, sutun_tara
+
+# Sınıflandırıcının tarih ve fiyat desenleriyle ayrı ayrı aramayla aynı sonucu vermesi gereken zor hücreler
+ZOR_HUCRELER = [
+    '13.09.2024', '45999.00', '45999.00 TL', '₺45999.00', 'Fiyat: 45999.00 TL (13.09.2024)',
+    '13.09.2024 - 45999.00', '45999.00 / 13.09.2024', '13.09.2024.50', '12345.67.2024',
+    '1234.5', '123.45', '79.999,00 TL', '2024-09-13 00:00:00', '13.09.24', '99999.999',
+    'iPhone 15 256GB', 'kargo bedava', '', '1.1.2024 45999.00', '31.12.202412345.67',
+]
+
+
+@pytest.mark.parametrize('hucre', ZOR_HUCRELER)
+def test_siniflandirma_ayri_aramalarla_ayni(hucre):
+    tarih = re.search(r'\d{2}\.\d{2}\.\d{4}', hucre)
+    fiyat = re.search(r'\d{4,}\.\d{2}', hucre)
+    assert hucre_siniflandir(hucre) == (tarih and tarih.group(), fiyat and fiyat.group())
+
+
+@pytest.mark.parametrize('metin, beklenen', [
+    ('Apple iPhone 13 64GB/128 GB Akıllı Telefon', ('iPhone 13', '64gb')),
+    ('Apple iPhone 13 128 GB/64GB', ('iPhone 13', '128gb')),
+    ('iPhone 15 (256 GB) / 512GB', ('iPhone 15', '256gb')),
+    ('IPHONE 14 1 TB', ('iPhone 14', '1tb')),
+    ('iPhone 16 Pro', ('iPhone 16', '128gb')),  # Kapasite yoksa varsayılan
+    ('Samsung Galaxy S24 256GB', None),
+])
+def test_karisik_kapasite_hucreleri(metin, beklenen):
+    assert model_bilgisi_bul(metin) == beklenen
+
+
+@pytest.mark.parametrize('hucre, fiyat', [
+    ('45999.00 TL', '45999.00'),
+    ('₺45999.00', '45999.00'),
+    ('TL 45999.00', '45999.00'),
+    ('Fiyat: 45999.00₺ (KDV dahil)', '45999.00'),
+    ('123456.78 TRY', '123456.78'),
+    ('45999.00 TL 46999.00 TL', '45999.00'),  # İlk fiyat alınır
+])
+def test_para_birimli_fiyatlar(hucre, fiyat):
+    assert hucre_siniflandir(hucre) == (None, fiyat)
+
+
+@pytest.mark.parametrize('hucre', ['45.999,00 TL', '45,999.00 TL', '₺45.999', '1.234.567,89', '999.00 TL'])
+def test_binlik_ayiricili_fiyatlar_kismi_eslesmez(hucre):
+    # Binlik ayırıcılı metinler fiyat sayılmaz; '45,999.00' içinden '999.00' gibi parça okunmaz
+    assert hucre_siniflandir(hucre) == (None, None)
+
+
+def test_para_birimli_sutun_tarama():
+    model, kapasite, kayitlar = sutun_tara([
+        'Apple iPhone 15 128GB', '13.09.2024', '₺45999.00', '14.09.2024', '45.999,00 TL', '46499.00 TL',
+    ])
+    assert (model, kapasite) == ('iPhone 15', '128gb')
+    assert kayitlar == [('13.09.2024', 45999.0), ('14.09.2024', 46499.0)]
+
+
+def test_bos_ve_none_hucreler_atlanir():
+    # pd.read_excel + str(): boş hücre 'nan', None değer 'None' olur; satır sayımı korunur
+    hucreler = ['', 'nan', 'Apple iPhone 14 256GB', 'NaN', '13.09.2024', '', 'None', 'nan', '39999.00 TL']
+    assert sutun_tara(hucreler) == ('iPhone 14', '256gb', [('13.09.2024', 39999.0)])
+
+
+def test_bos_hucreler_fiyat_penceresini_uzatmaz():
+    # Tarihten sonra 5 satır içinde fiyat yoksa (boş satırlar dahil) tarih düşer
+    hucreler = ['iPhone 14 256GB', '13.09.2024', '', 'nan', '', 'nan', '39999.00 TL']
+    assert sutun_tara(hucreler) == ('iPhone 14', '256gb', [])
+
+
+def test_tamamen_bos_sutun():
+    assert sutun_tara([]) == (None, None, [])
+    assert sutun_tara(['nan'] * 20) == (None, None, [])
+
+
+def test_birlestirilmis_baslik_tasmasi():
+    # Yatay birleştirilmiş başlıkta model yalnızca ilk sütundadır; taşılan sütun kullanılmaz
+    ilk = ['Apple iPhone 15 128GB', '13.09.2024', '45999.00 TL']
+    tasan = ['nan', '01.10.2024', '46999.00 TL'] + ['nan'] * 10
+    assert sutun_tara(ilk) == ('iPhone 15', '128gb', [('13.09.2024', 45999.0)])
+    assert sutun_tara(tasan) == (None, None, [])
+
+
+def test_birlestirilmis_tarih_ve_fiyat_tasmasi():
+    # Dikey birleştirilmiş hücrede değer yalnızca ilk satırdadır; taşılan satırlar boş
+    hucreler = ['iPhone 13 64GB', '13.09.2024', 'nan', '35999.00 TL', 'nan', '14.09.2024', '36499.00 TL', 'nan']
+    assert sutun_tara(hucreler) == ('iPhone 13', '64gb', [('13.09.2024', 35999.0), ('14.09.2024', 36499.0)])
+
+
+def test_birlestirilmis_hucreli_calisma_kitabi_iki_okuyucuda_ayni(tmp_path):
+    openpyxl = pytest.importorskip('openpyxl')
+    from profesyonel_veri_hazirlik import kayitlari_oku
+
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(['c0', 'c1', 'c2'])
+    ws.append(['Apple iPhone 15 128GB', None, 'Apple iPhone 14 64GB/128 GB'])
+    for satir in (['13.09.2024', '01.10.2024', '13.09.2024'],
+                  ['45999.00 TL', '46999.00 TL', '39999.00 TL'],
+                  ['14.09.2024', '02.10.2024', '14.09.2024'],
+                  ['45499.00 TL', None, '₺39499.00']):
+        ws.append(satir)
+    ws.merge_cells('A2:B2')  # Başlık B sütununa taşar
+    ws.merge_cells('C5:C6')  # Fiyat hücresi alttaki tarihin satırına taşar (o tarih silinir)
+    dosya = tmp_path / 'birlesik.xlsx'
+    wb.save(dosya)
+
+    beklenen = [
+        (0, 'iPhone 15', '128gb', '13.09.2024', 45999.0),
+        (0, 'iPhone 15', '128gb', '14.09.2024', 45499.0),
+        (2, 'iPhone 14', '64gb', '13.09.2024', 39999.0),
+    ]
+    assert kayitlari_oku(dosya, akisli=True) == beklenen
+    assert kayitlari_oku(dosya, akisli=False) == beklenen
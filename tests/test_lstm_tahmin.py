@@ -0,0 +1,41 @@
+"""lstm_tahmin: derlenmiş özyinelemeli tahmin eski predict + np.roll döngüsüyle aynı"""
+
+import os
+
+import numpy as np
+import pytest
+
+os.environ.setdefault('TF_CPP_MIN_LOG_LEVEL', '3')
+pytest.importorskip('tensorflow')
+
+from lstm_tahmin import eski_ozyinelemeli_tahmin, lstm_agi_olustur, son_pencereler, tahminci_olustur  # noqa: E402
+
+
+@pytest.fixture(scope='module')
+def pencereler():
+    rng = np.random.default_rng(9)
+    return son_pencereler([rng.random(n) for n in (100, 80, 150)], 20)
+
+
+def test_ozyinelemeli_eski_donguyle_ayni(pencereler):
+    ag = lstm_agi_olustur(20, 1)
+    toplu = tahminci_olustur(ag, 'ozyinelemeli', 10)(pencereler)
+    eski = np.array([eski_ozyinelemeli_tahmin(ag, p, 10) for p in pencereler])
+    assert toplu.shape == (len(pencereler), 10)
+    assert np.abs(toplu - eski).max() < 1e-5
+
+
+def test_dogrudan_tek_cagri(pencereler):
+    ag = lstm_agi_olustur(20, 10)
+    tahmin = tahminci_olustur(ag, 'dogrudan', 10)(pencereler)
+    assert tahmin.shape == (len(pencereler), 10)
+    assert np.allclose(tahmin, ag(pencereler.astype(np.float32), training=False).numpy(), atol=1e-6)
+
+
+def test_son_pencereler():
+    assert son_pencereler([np.arange(30.0), np.arange(50.0)], 20)[1, :, 0].tolist() == list(range(30, 50))
+
+
+def test_bilinmeyen_mod():
+    with pytest.raises(ValueError):
+        tahminci_olustur(None, 'tekrarli', 10)
@@ -0,0 +1,47 @@
+"""model_onbellegi: önbellekten dönen modeller yeni eğitilenlerle aynı tahmini verir"""
+
+import warnings
+
+import numpy as np
+import pytest
+
+from model_onbellegi import ModelOnbellegi
+
+
+@pytest.fixture
+def seriler():
+    rng = np.random.default_rng(7)
+    return [45000 + np.cumsum(rng.normal(0, 150, 200)) for _ in range(3)]
+
+
+def test_onbellekten_arima_tahminleri_ayni(tmp_path, seriler):
+    pytest.importorskip('statsmodels')
+    from statsmodels.tsa.arima.model import ARIMA
+
+    warnings.filterwarnings('ignore')
+    onbellek = ModelOnbellegi(str(tmp_path))
+    egitimler = []
+
+    def tahminler():
+        sonuc = []
+        for fiyatlar in seriler:
+            def egit():
+                egitimler.append(1)
+                return ARIMA(fiyatlar, order=(1, 1, 1)).fit()
+            model = onbellek.getir_veya_egit('arima', [fiyatlar], {'order': (1, 1, 1)}, egit)
+            sonuc.append(model.forecast(steps=30))
+        return sonuc
+
+    soguk = tahminler()
+    sicak = tahminler()
+    assert len(egitimler) == len(seriler)
+    assert (onbellek.iska, onbellek.isabet) == (len(seriler), len(seriler))
+    assert all(np.array_equal(a, b) for a, b in zip(soguk, sicak))
+
+
+def test_farkli_parametre_ayri_kayit(tmp_path, seriler):
+    onbellek = ModelOnbellegi(str(tmp_path))
+    onbellek.getir_veya_egit('arima', seriler[:1], {'order': (1, 1, 1)}, lambda: {'derece': 1})
+    model = onbellek.getir_veya_egit('arima', seriler[:1], {'order': (2, 1, 1)}, lambda: {'derece': 2})
+    assert model == {'derece': 2}
+    assert onbellek.getir_veya_egit('arima', seriler[:1], {'order': (1, 1, 1)}, lambda: None) == {'derece': 1}
@@ -0,0 +1,51 @@
+"""pencereleme: kopyasız pencere görünümleri eski kopyalayan döngüyle aynı (X, y) üretir"""
+
+import numpy as np
+import pytest
+
+from pencereleme import cok_seri_pencereleri, grup_al, pencereler
+
+
+def eski_pencereler(data, pencere):
+    """create_lstm_model içindeki eski döngü"""
+    X, y = [], []
+    for i in range(pencere, len(data)):
+        X.append(data[i - pencere:i, 0])
+        y.append(data[i, 0])
+    return np.array(X), np.array(y)
+
+
+@pytest.mark.parametrize('nokta, pencere', [(1_000, 60), (5_000, 60), (61, 60), (100, 1)])
+def test_eski_donguyle_ayni(nokta, pencere):
+    data = np.random.default_rng(3).random((nokta, 1))
+    X, y = pencereler(data, pencere)
+    X_eski, y_eski = eski_pencereler(data, pencere)
+    assert np.array_equal(X, X_eski) and np.array_equal(y, y_eski)
+
+
+def test_ufuk_ve_adim():
+    seri = np.arange(20.0)
+    X, y = pencereler(seri, 5, ufuk=3, adim=4)
+    assert X.shape == (4, 5) and y.shape == (4, 3)
+    assert np.array_equal(X[1], seri[4:9]) and np.array_equal(y[1], seri[9:12])
+
+
+def test_kisa_seri_bos():
+    X, y = pencereler(np.arange(10.0), 10)
+    assert X.shape == (0, 10) and y.shape == (0,)
+
+
+def test_gorunum_salt_okunur():
+    X, _ = pencereler(np.arange(100.0), 10)
+    with pytest.raises(ValueError):
+        X[0, 0] = 1.0
+
+
+def test_cok_seri_pencereleri_sinir_asmaz():
+    rng = np.random.default_rng(4)
+    seriler = [rng.random(n) for n in (300, 61, 40, 500)]
+    gorunum, baslangiclar, seri_no = cok_seri_pencereleri(seriler, 60)
+    X, y = grup_al(gorunum, baslangiclar, 60)
+    for no, seri in enumerate(seriler):
+        X_tek, y_tek = pencereler(seri, 60)
+        assert np.array_equal(X[seri_no == no], X_tek) and np.array_equal(y[seri_no == no], y_tek)
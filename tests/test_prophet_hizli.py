@@ -0,0 +1,46 @@
+"""prophet_hizli: ortak tatil tablosu + MAP hızlı yolu ve sıcak başlangıç eski yolla aynı tahmini verir"""
+
+import logging
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip('prophet')
+
+from prophet_hizli import PROPHET_AYARLARI, ProphetArkaUcu  # noqa: E402
+
+# Yollar arasında izin verilen en büyük tahmin farkı (ortalama fiyata oran)
+FARK_SINIRI = 0.01
+
+
+@pytest.fixture(scope='module')
+def seri():
+    logging.getLogger('cmdstanpy').disabled = True
+    logging.getLogger('prophet').setLevel(logging.ERROR)
+    rng = np.random.default_rng(22)
+    gunler = np.arange(400)
+    tarihler = pd.date_range('2023-01-01', periods=len(gunler), freq='D')
+    return tarihler, 45000 + np.cumsum(rng.normal(0, 150, len(gunler))) + 400 * np.sin(2 * np.pi * gunler / 7)
+
+
+@pytest.fixture(scope='module')
+def eski_tahmin(seri):
+    from prophet import Prophet
+
+    tarihler, fiyatlar = seri
+    model = Prophet(**PROPHET_AYARLARI)
+    model.add_country_holidays(country_name='TR')
+    model.fit(pd.DataFrame({'ds': tarihler, 'y': fiyatlar}))
+    return model.predict(model.make_future_dataframe(periods=30, include_history=False))['yhat'].to_numpy()
+
+
+@pytest.mark.parametrize('sicak', [False, True], ids=['soguk', 'sicak'])
+def test_eski_yolla_ayni_tahmin(seri, eski_tahmin, sicak):
+    tarihler, fiyatlar = seri
+    arka_ucu = ProphetArkaUcu(sicak_baslangic=sicak, ayrintili=False)
+    if sicak:
+        arka_ucu.egit('sku', tarihler[:-1], fiyatlar[:-1], 30)  # Dünkü eğitim (parametreler saklanır)
+    tahmin = arka_ucu.tahmin_et(arka_ucu.egit('sku', tarihler, fiyatlar, 30), 30)['yhat'].to_numpy()
+    assert arka_ucu.sureler[-1]['sicak'] is sicak
+    assert np.abs(tahmin - eski_tahmin).max() / eski_tahmin.mean() < FARK_SINIRI
@@ -0,0 +1,58 @@
+"""seri_deposu: model/SKU dilimleri ve günlük ortalamalar boolean maske + groupby ile aynı"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from seri_deposu import SeriDeposu
+
+
+@pytest.fixture(params=[False, True], ids=['object', 'kategorik'])
+def df(request):
+    rng = np.random.default_rng(19)
+    n = 5_000
+    df = pd.DataFrame({
+        'MODEL': rng.choice(['iPhone 15', 'iPhone 13', 'iPhone 16', 'iPhone 14'], n),
+        'KAPASITE': rng.choice(['128gb', '256gb', '512gb'], n),
+        'TARIH': pd.Timestamp('2022-01-01') + pd.to_timedelta(rng.integers(0, 200, n), unit='D'),
+        'FIYAT': rng.uniform(20000, 90000, n).round(2),
+    })
+    if request.param:
+        df = df.astype({'MODEL': 'category', 'KAPASITE': 'category'})
+    return df
+
+
+def test_gunluk_ortalamalar_groupby_ile_ayni(df):
+    depo = SeriDeposu(df)
+    for model in df['MODEL'].unique():
+        eski = df[df['MODEL'] == model].groupby('TARIH')['FIYAT'].mean()
+        yeni = depo.gunluk(model).set_index('TARIH')['FIYAT']
+        assert eski.index.equals(yeni.index)
+        assert np.allclose(eski.to_numpy(), yeni.to_numpy())
+
+
+def test_sku_gunluk_ortalamalari(df):
+    depo = SeriDeposu(df)
+    for model, kapasite in depo.skular():
+        maske = (df['MODEL'] == model) & (df['KAPASITE'] == kapasite)
+        eski = df[maske].groupby('TARIH')['FIYAT'].mean()
+        yeni = depo.gunluk(model, kapasite).set_index('TARIH')['FIYAT']
+        assert eski.index.equals(yeni.index)
+        assert np.allclose(eski.to_numpy(), yeni.to_numpy())
+
+
+def test_satirlar_maske_ile_ayni(df):
+    depo = SeriDeposu(df)
+    assert depo.modeller() == list(pd.unique(df['MODEL']))
+    for model in depo.modeller():
+        eski = df[df['MODEL'] == model].sort_values(['KAPASITE', 'TARIH'], kind='stable')
+        yeni = depo.satirlar(model)
+        assert depo.satir_sayisi(model) == len(eski)
+        assert np.array_equal(yeni['FIYAT'].to_numpy(), eski['FIYAT'].to_numpy())
+
+
+def test_olmayan_model_bos():
+    depo = SeriDeposu(pd.DataFrame({'MODEL': ['iPhone 15'], 'KAPASITE': ['128gb'],
+                                    'TARIH': [pd.Timestamp('2024-01-01')], 'FIYAT': [45999.0]}))
+    assert len(depo.satirlar('iPhone 99')) == 0
+    assert len(depo.gunluk('iPhone 15', '1tb')) == 0
@@ -0,0 +1,77 @@
+"""streamlit_dashboard: PANEL_SUTUNLARI ile yüklenen veri panelin okuduğu tüm sütunları içerir
+
+Panel streamlit olmadan içe aktarılamadığından sütun listesi ve panelin okuduğu
+sütun adları kaynak koddan (ast) çıkarılır.
+"""
+
+import ast
+import os
+import shutil
+
+import pandas as pd
+import pytest
+
+from veri_semasi import veri_setini_yukle
+from yildiz_sema import yildiz_sema_yaz
+
+KOK = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+VERI = os.path.join(KOK, 'profesyonel_telefon_verileri2.csv')
+# Panelde yüklenen veri setinden türeyen tablolar (hiyerarşik tahmin çıktısı gibi tablolar hariç)
+VERI_DEGISKENLERI = {'df', 'filtered_df', 'model_data', 'tech_specs', 'daily_avg'}
+
+
+@pytest.fixture(scope='module')
+def agac():
+    with open(os.path.join(KOK, 'streamlit_dashboard.py'), encoding='utf-8') as f:
+        return ast.parse(f.read())
+
+
+@pytest.fixture(scope='module')
+def panel_sutunlari(agac):
+    for dugum in ast.walk(agac):
+        if isinstance(dugum, ast.Assign) and any(getattr(h, 'id', None) == 'PANEL_SUTUNLARI' for h in dugum.targets):
+            return ast.literal_eval(dugum.value)
+    pytest.fail('PANEL_SUTUNLARI bulunamadı')
+
+
+def _okunan_sutunlar(agac, degiskenler):
+    """Panelin degiskenler'deki tablolardan x['SUTUN'] ile okuduğu (kendisi türetmediği) büyük harfli sütunlar"""
+    okunan, turetilen = set(), set()
+    for dugum in ast.walk(agac):
+        if not (isinstance(dugum, ast.Subscript) and isinstance(dugum.slice, ast.Constant)
+                and isinstance(dugum.slice.value, str) and dugum.slice.value.isupper()):
+            continue
+        if getattr(dugum.value, 'id', None) not in degiskenler:
+            continue
+        (turetilen if isinstance(dugum.ctx, ast.Store) else okunan).add(dugum.slice.value)
+    return okunan - turetilen
+
+
+@pytest.fixture(scope='module', params=['csv', 'parquet'])
+def panel_verisi(request, panel_sutunlari, tmp_path_factory):
+    if not os.path.exists(VERI):
+        pytest.skip('Veri seti yok')
+    klasor = tmp_path_factory.mktemp(request.param)
+    csv = str(klasor / 'veri.csv')
+    shutil.copy(VERI, csv)
+    if request.param == 'parquet':
+        pytest.importorskip('pyarrow')
+        yildiz_sema_yaz(pd.read_csv(csv), csv)
+    return veri_setini_yukle(csv, parquet=request.param == 'parquet', sutunlar=panel_sutunlari)
+
+
+def test_urun_raporu_ozellikleri_yuklenir(agac, panel_verisi):
+    ozellikler = _okunan_sutunlar(agac, {'tech_specs'})
+    assert '5G_DESTEGI' in ozellikler
+    assert ozellikler <= set(panel_verisi.columns)
+
+
+def test_panelin_okudugu_tum_sutunlar_listede(agac, panel_sutunlari):
+    assert _okunan_sutunlar(agac, VERI_DEGISKENLERI) <= set(panel_sutunlari)
+
+
+def test_csv_yedek_yolu(panel_sutunlari, agac):
+    if not os.path.exists(VERI):
+        pytest.skip('Veri seti yok')
+    df = pd.read_csv(VERI, usecols=lambda c: c in panel_sutunlari, nrows=10)
+    assert _okunan_sutunlar(agac, {'tech_specs'}) <= set(df.columns)
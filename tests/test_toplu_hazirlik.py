@@ -0,0 +1,45 @@
+"""toplu_hazirlik: sayfa deseni, boş eşleşmeler ve CLI hata mesajları"""
+
+import pytest
+
+openpyxl = pytest.importorskip('openpyxl')
+
+from toplu_hazirlik import toplu_kayitlari_oku  # noqa: E402
+
+
+@pytest.fixture
+def arsiv(tmp_path):
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = 'Ocak'
+    ws.append(['c0'])
+    for hucre in ('Apple iPhone 15 128GB', '13.09.2024', '45999.00 TL', '14.09.2024', '45499.00 TL'):
+        ws.append([hucre])
+    wb.save(tmp_path / 'satici_2024.xlsx')
+    return tmp_path
+
+
+def test_eslesen_sayfa(arsiv):
+    kayitlar, istatistikler = toplu_kayitlari_oku(str(arsiv), islem_sayisi=1, sayfa_deseni='Oca*')
+    assert list(kayitlar.columns) == ['SUTUN', 'MODEL', 'KAPASITE', 'TARIH', 'FIYAT', 'KAYNAK']
+    assert kayitlar['FIYAT'].tolist() == [45999.0, 45499.0]
+    assert istatistikler['SAYFA'].tolist() == [1]
+
+
+def test_eslesen_sayfa_yoksa_acik_hata(arsiv):
+    with pytest.raises(FileNotFoundError, match=r"'Şubat\*' desenine uyan sayfa bulunamadı"):
+        toplu_kayitlari_oku(str(arsiv), islem_sayisi=1, sayfa_deseni='Şubat*')
+
+
+def test_calisma_kitabi_yoksa_acik_hata(tmp_path):
+    with pytest.raises(FileNotFoundError, match='çalışma kitabı bulunamadı'):
+        toplu_kayitlari_oku(str(tmp_path))
+
+
+def test_cli_eslesen_sayfa_yok(arsiv, capsys):
+    from profesyonel_veri_hazirlik import main
+
+    cikti = arsiv / 'cikti.csv'
+    assert main([str(arsiv), '--toplu', '--islem-sayisi', '1', '--sayfa-deseni', 'Şubat*', '-o', str(cikti)]) == 1
+    assert "'Şubat*' desenine uyan sayfa bulunamadı" in capsys.readouterr().out
+    assert not cikti.exists()
@@ -0,0 +1,55 @@
+"""ustel_duzeltme: vektörel uyumun SSE'si seri başına statsmodels uyumuna yakın"""
+
+import warnings
+
+import numpy as np
+import pytest
+
+from ustel_duzeltme import MODELLER, sola_hizala, toplu_tahmin
+
+# Izgara araması statsmodels'in optimize ettiği uyumdan en fazla bu oranda kötü olabilir
+SSE_ORANI_SINIRI = {'basit': 1.02, 'holt': 1.05, 'sonumlu': 1.05, 'holt_winters': 1.2}
+
+STATSMODELS_AYARLARI = {
+    'basit': {},
+    'holt': {'trend': 'add'},
+    'sonumlu': {'trend': 'add', 'damped_trend': True},
+    'holt_winters': {'trend': 'add', 'seasonal': 'add', 'seasonal_periods': 7},
+}
+
+
+@pytest.fixture(scope='module')
+def seriler():
+    rng = np.random.default_rng(21)
+    gunler = np.arange(400)
+    seriler = []
+    for _ in range(3):
+        seri = (50000 + rng.normal(-5, 3) * gunler + 300 * np.sin(2 * np.pi * gunler / 7)
+                + np.cumsum(rng.normal(0, 120, len(gunler))))
+        seriler.append(seri[int(rng.integers(0, 130)):])
+    return seriler
+
+
+@pytest.mark.parametrize('model', MODELLER)
+def test_sse_statsmodels_ile_yakin(seriler, model):
+    pytest.importorskip('statsmodels')
+    from statsmodels.tsa.holtwinters import ExponentialSmoothing
+
+    warnings.filterwarnings('ignore')
+    tahminler, uyum = toplu_tahmin(seriler, model, 30)
+    beklenen = np.array([ExponentialSmoothing(s, initialization_method='estimated',
+                                              **STATSMODELS_AYARLARI[model]).fit().sse for s in seriler])
+    assert tahminler.shape == (len(seriler), 30) and np.isfinite(tahminler).all()
+    assert (uyum['sse'] / beklenen).max() <= SSE_ORANI_SINIRI[model]
+
+
+def test_sola_hizala():
+    Y = np.array([[np.nan, 1.0, 2.0, np.nan], [1.0, 2.0, 3.0, 4.0]])
+    hizali, uzunluklar, baslangiclar = sola_hizala(Y)
+    assert uzunluklar.tolist() == [2, 4] and baslangiclar.tolist() == [1, 0]
+    assert hizali[0, :2].tolist() == [1.0, 2.0]
+
+
+def test_bilinmeyen_model(seriler):
+    with pytest.raises(ValueError):
+        toplu_tahmin(seriler, 'arima')
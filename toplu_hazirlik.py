@@ -0,0 +1,151 @@
+"""
+Toplu (Paralel) Kayıt Çıkarma
+
+Bir klasördeki ya da glob deseniyle seçilen çalışma kitaplarının tüm sayfalarından
+fiyat kayıtlarını bir süreç havuzunda (ProcessPoolExecutor) çıkarır. Her görev bir
+(çalışma kitabı, sayfa) çiftidir ve akisli_excel_okuyucu ile tek geçişte okunur.
+
+- Görevler dosya yolu ve sayfa sırasına göre dizilir; sonuçlar bu sırayla
+  birleştirildiği için çıktı, işlem sayısından bağımsız olarak aynıdır.
+- Her kayda KAYNAK (satıcı) bilgisi eklenir; aynı (TARIH, MODEL, KAPASITE, KAYNAK)
+  kayıtlarından yalnızca ilki tutulur.
+- SUTUN, (görev, sayfa sütunu) başına benzersiz bir numaradır; kampanya
+  etiketlerindeki ortalama fiyat tek dosyalı akıştaki gibi kaynak sütun başınadır.
+
+Süreç havuzu Windows'ta (spawn) ana modülü yeniden içe aktardığı için çağıran
+betikte `if __name__ == '__main__':` koruması bulunmalıdır.
+"""
+
+import fnmatch
+import glob
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+
+import pandas as pd
+
+from akisli_excel_okuyucu import excel_kayitlarini_oku
+
+CALISMA_KITABI_UZANTILARI = ('.xlsx', '.xlsm')
+TEKILLIK_ANAHTARI = ['TARIH', 'MODEL', 'KAPASITE', 'KAYNAK']
+
+
+def calisma_kitaplarini_bul(giris):
+    """Klasör, glob deseni ya da tek dosyadan sıralı çalışma kitabı listesi döndürür"""
+    if os.path.isdir(giris):
+        dosyalar = [os.path.join(giris, ad) for ad in os.listdir(giris)]
+    else:
+        dosyalar = glob.glob(giris, recursive=True)
+    return sorted(
+        d for d in dosyalar
+        if d.lower().endswith(CALISMA_KITABI_UZANTILARI)
+        and not os.path.basename(d).startswith('~$')  # Excel kilit dosyaları
+        and os.path.isfile(d)
+    )
+
+
+def kaynak_adi(dosya, kaynak_deseni=None):
+    """Dosya adından KAYNAK (satıcı) adını çıkarır
+
+    kaynak_deseni verilirse dosya adının (uzantısız) ilk yakalama grubu, aksi
+    halde dosya adının kendisi kullanılır. ör. r'^([^_]+)_' ile
+    'hepsiburada_2024-09.xlsx' -> 'hepsiburada'.
+    """
+    ad = os.path.splitext(os.path.basename(dosya))[0]
+    if kaynak_deseni:
+        eslesme = re.search(kaynak_deseni, ad)
+        if eslesme:
+            return eslesme.group(1)
+    return ad
+
+
+def gorevleri_olustur(dosyalar, sayfa_deseni=None):
+    """Her çalışma kitabındaki (eşleşen) sayfalar için (dosya, sayfa) görevleri üretir"""
+    from openpyxl import load_workbook
+
+    gorevler = []
+    for dosya in dosyalar:
+        wb = load_workbook(dosya, read_only=True)
+        try:
+            sayfalar = wb.sheetnames
+        finally:
+            wb.close()
+        gorevler.extend(
+            (dosya, sayfa) for sayfa in sayfalar
+            if sayfa_deseni is None or fnmatch.fnmatch(sayfa, sayfa_deseni)
+        )
+    return gorevler
+
+
+def sayfa_kayitlarini_oku(gorev):
+    """Süreç havuzu işçisi: bir sayfanın kayıtlarını sütun sırasıyla okur
+
+    (dosya, sayfa, kayıtlar, süre) döndürür.
+    """
+    dosya, sayfa = gorev
+    baslangic = time.perf_counter()
+    kayitlar = sorted(excel_kayitlarini_oku(dosya, sayfa), key=itemgetter(0))
+    return dosya, sayfa, kayitlar, time.perf_counter() - baslangic
+
+
+def toplu_kayitlari_oku(giris, islem_sayisi=None, kaynak_deseni=None, sayfa_deseni=None):
+    """Tüm çalışma kitaplarından kayıtları paralel çıkarır ve deterministik birleştirir
+
+    (kayıtlar, istatistikler) döndürür. kayıtlar: SUTUN, MODEL, KAPASITE, TARIH,
+    FIYAT, KAYNAK sütunlu DataFrame; istatistikler: dosya başına sayfa, kayıt,
+    süre ve verim tablosu. islem_sayisi=1 iken süreç havuzu kullanılmaz.
+    Çalışma kitabı ya da sayfa_deseni'ne uyan sayfa yoksa FileNotFoundError verir.
+    """
+    dosyalar = calisma_kitaplarini_bul(giris)
+    if not dosyalar:
+        raise FileNotFoundError(f"'{giris}' içinde çalışma kitabı bulunamadı")
+    gorevler = gorevleri_olustur(dosyalar, sayfa_deseni)
+    if not gorevler:
+        raise FileNotFoundError(f"'{giris}' içindeki {len(dosyalar)} çalışma kitabında "
+                                f"'{sayfa_deseni}' desenine uyan sayfa bulunamadı")
+
+    if islem_sayisi == 1 or len(gorevler) == 1:
+        sonuclar = list(map(sayfa_kayitlarini_oku, gorevler))
+    else:
+        with ProcessPoolExecutor(max_workers=islem_sayisi) as havuz:
+            # map, görev sırasını korur; birleştirme tamamlanma sırasından bağımsızdır
+            sonuclar = list(havuz.map(sayfa_kayitlarini_oku, gorevler, chunksize=1))
+
+    parcalar = []
+    istatistikler = {}
+    for gorev_no, (dosya, sayfa, kayitlar, sure) in enumerate(sonuclar):
+        parca = pd.DataFrame(kayitlar, columns=['SAYFA_SUTUNU', 'MODEL', 'KAPASITE', 'TARIH', 'FIYAT'])
+        parca.insert(0, 'GOREV', gorev_no)
+        parca['KAYNAK'] = kaynak_adi(dosya, kaynak_deseni)
+        parcalar.append(parca)
+
+        ist = istatistikler.setdefault(dosya, {'DOSYA': dosya, 'SAYFA': 0, 'KAYIT': 0, 'SURE_SN': 0.0})
+        ist['SAYFA'] += 1
+        ist['KAYIT'] += len(kayitlar)
+        ist['SURE_SN'] += sure
+
+    kayitlar = pd.concat(parcalar, ignore_index=True)
+    kayitlar['SUTUN'] = kayitlar.groupby(['GOREV', 'SAYFA_SUTUNU'], sort=False).ngroup()
+    ham_kayit_sayisi = len(kayitlar)
+    kayitlar = kayitlar.drop_duplicates(subset=TEKILLIK_ANAHTARI, keep='first').reset_index(drop=True)
+    kayitlar = kayitlar[['SUTUN', 'MODEL', 'KAPASITE', 'TARIH', 'FIYAT', 'KAYNAK']]
+
+    istatistikler = pd.DataFrame(list(istatistikler.values()))
+    istatistikler['MB'] = [os.path.getsize(d) / 1e6 for d in istatistikler['DOSYA']]
+    istatistikler['KAYIT_SN'] = istatistikler['KAYIT'] / istatistikler['SURE_SN']
+    istatistikler['MB_SN'] = istatistikler['MB'] / istatistikler['SURE_SN']
+    istatistikler.attrs['tekrar_eden_kayit'] = ham_kayit_sayisi - len(kayitlar)
+    return kayitlar, istatistikler
+
+
+def verim_raporu_yazdir(istatistikler, toplam_sure):
+    """Dosya başına verim raporunu yazdırır"""
+    print(f"\n⚙️  Dosya Başına Verim:")
+    for ist in istatistikler.itertuples(index=False):
+        print(f"  📄 {os.path.basename(ist.DOSYA)}: {ist.SAYFA} sayfa, {ist.KAYIT} kayıt, "
+              f"{ist.SURE_SN:.2f} sn ({ist.KAYIT_SN:,.0f} kayıt/sn, {ist.MB_SN:.2f} MB/sn)")
+    print(f"  🧮 Toplam: {len(istatistikler)} dosya, {istatistikler['KAYIT'].sum()} kayıt, "
+          f"{istatistikler.attrs.get('tekrar_eden_kayit', 0)} tekrar eden kayıt atıldı, "
+          f"{toplam_sure:.2f} sn (duvar saati)")
@@ -0,0 +1,229 @@
+"""
+Vektörel Üstel Düzeltme (Hızlı Tahmin Katmanı)
+
+Tüm SKU serilerini (seri x gün) tek bir NumPy matrisinde aynı anda uyumlar ve
+tahmin eder. Zaman üzerindeki özyineleme tek Python döngüsüdür; her adım tüm
+seriler ve tüm aday parametreler için (seri x aday) dizileri üzerinde çalışır.
+
+Modeller (toplamsal hata):
+    basit         - basit üstel düzeltme (düzey)
+    holt          - Holt doğrusal trend
+    sonumlu       - sönümlü trend (phi < 1)
+    holt_winters  - trend + haftalık (7 gün) toplamsal mevsimsellik
+
+Parametre seçimi toplu ızgara aramasıdır: kaba ızgaradaki tüm adaylar tek
+geçişte denenir, her seri için bir adım sonrası hata kareleri toplamı (SSE) en
+küçük aday seçilir, ardından her serinin kendi en iyisi etrafında ince ızgara
+ikinci bir geçişte denenir.
+
+Seriler farklı günlerde başlayıp bitebilir: NaN ile doldurulmuş satırlar sola
+hizalanır ve her seri kendi uzunluğunda durdurulur (durum dondurulur).
+"""
+
+import itertools
+
+import numpy as np
+
+MODELLER = ('basit', 'holt', 'sonumlu', 'holt_winters')
+MEVSIM = 7
+BASLANGIC_DONEM = 8  # Mevsimsel başlangıç durumu için kullanılan en çok dönem
+
+# Kaba ızgara; ince ızgara her serinin en iyisi etrafında ±yarım adım
+IZGARA = {
+    'alfa': (0.05, 0.1, 0.2, 0.3, 0.5, 0.7, 0.9, 0.99),
+    'beta': (0.01, 0.05, 0.1, 0.2, 0.3),
+    'phi': (0.8, 0.9, 0.95, 0.98),
+    'gama': (0.01, 0.05, 0.1, 0.2, 0.3),
+}
+SINIRLAR = {'alfa': (0.001, 0.999), 'beta': (0.001, 0.999), 'phi': (0.5, 0.999), 'gama': (0.001, 0.999)}
+MODEL_PARAMETRELERI = {
+    'basit': ('alfa',),
+    'holt': ('alfa', 'beta'),
+    'sonumlu': ('alfa', 'beta', 'phi'),
+    'holt_winters': ('alfa', 'beta', 'gama'),
+}
+
+
+def sola_hizala(Y):
+    """Her satırın NaN olmayan ardışık bloğunu başa taşır
+
+    (hizali, uzunluklar, baslangiclar) döndürür; hizali'da her satırın
+    uzunluk sonrası NaN'dır. Satır içi boşluklar önceden doldurulmuş olmalıdır.
+    """
+    Y = np.asarray(Y, dtype=np.float64)
+    if Y.ndim == 1:
+        Y = Y[np.newaxis]
+    gecerli = ~np.isnan(Y)
+    uzunluklar = gecerli.sum(axis=1)
+    baslangiclar = np.where(uzunluklar > 0, gecerli.argmax(axis=1), 0)
+    sutunlar = baslangiclar[:, np.newaxis] + np.arange(Y.shape[1])
+    hizali = np.take_along_axis(Y, np.minimum(sutunlar, Y.shape[1] - 1), axis=1)
+    hizali[np.arange(Y.shape[1]) >= uzunluklar[:, np.newaxis]] = np.nan
+    return hizali, uzunluklar, baslangiclar
+
+
+def _baslangic_durumu(Y, model, mevsim):
+    """Basit başlangıç: düzey ilk gözlem, trend ilk fark ortalaması
+
+    Mevsimselde düzey ilk dönemin ortalaması; mevsimsel bileşen ilk (en çok
+    BASLANGIC_DONEM) dönemin, her dönem kendi ortalamasından sapmalarının
+    ortalamasıdır (tek dönemden tahmin gürültülü kalır). Dönem sayısı en kısa
+    seriye göre seçilir.
+    """
+    b = len(Y)
+    if model == 'holt_winters':
+        donem = max(2, min(BASLANGIC_DONEM, int(np.isfinite(Y).sum(axis=1).min()) // mevsim))
+        donemler = Y[:, :donem * mevsim].reshape(b, donem, mevsim)
+        ortalamalar = donemler.mean(axis=2)
+        duzey = ortalamalar[:, 0]
+        trend = (ortalamalar[:, -1] - ortalamalar[:, 0]) / ((donem - 1) * mevsim)
+        mevsimsel = (donemler - ortalamalar[:, :, np.newaxis]).mean(axis=1)
+    else:
+        duzey = Y[:, 0]
+        trend = (Y[:, min(mevsim, Y.shape[1] - 1)] - Y[:, 0]) / max(min(mevsim, Y.shape[1] - 1), 1)
+        mevsimsel = np.zeros((b, mevsim))
+    if model == 'basit':
+        trend = np.zeros(b)
+    return duzey, np.nan_to_num(trend), np.nan_to_num(mevsimsel)
+
+
+def _ozyineleme(Y, uzunluklar, model, parametreler, mevsim, artik_kaydet=False):
+    """Tüm seriler ve adaylar için düzeltme özyinelemesi
+
+    parametreler: {ad: (seri x aday) dizisi}. (sse, durum, artiklar) döndürür;
+    durum her serinin son gözleminden sonraki (düzey, trend, mevsimsel halka),
+    artıklar artik_kaydet iken (seri x aday x gün) bir adım sonrası hatalardır,
+    değilse None.
+
+    Seriler sola hizalı olduğundan bir seri bittikten sonraki adımlar (y=0)
+    hesaplanır ama SSE'ye girmez; serinin durumu son gözleminde kopyalanır. Böylece
+    her adımda durum maskelemesi gerekmez.
+    """
+    b, T = Y.shape
+    k = next(iter(parametreler.values())).shape[1]
+    alfa = parametreler['alfa']
+    beta = parametreler.get('beta', np.zeros((b, k)))
+    phi = parametreler.get('phi', np.ones((b, k)))
+    gama = parametreler.get('gama', np.zeros((b, k)))
+    trendli = model != 'basit'
+    mevsimli = model == 'holt_winters'
+    bir_eksi_alfa, bir_eksi_beta_phi, bir_eksi_gama = 1 - alfa, (1 - beta) * phi, 1 - gama
+
+    duzey0, trend0, mevsimsel0 = _baslangic_durumu(Y, model, mevsim)
+    duzey = np.repeat(duzey0[:, np.newaxis], k, axis=1)
+    trend = np.repeat(trend0[:, np.newaxis], k, axis=1)
+    halka = np.repeat(mevsimsel0[:, np.newaxis, :], k, axis=1)  # (seri, aday, mevsim)
+    son_duzey, son_trend, son_halka = duzey.copy(), trend.copy(), halka.copy()
+    sse = np.zeros((b, k))
+    artiklar = np.full((b, k, T), np.nan) if artik_kaydet else None
+
+    gozlemler = np.nan_to_num(Y)[:, :, np.newaxis]  # (seri, gün, 1): adım başına (seri, 1) dilim
+    aktif = (np.arange(T) < uzunluklar[:, np.newaxis]).astype(np.float64)[:, :, np.newaxis]
+    bitenler = {}
+    for satir, n in enumerate(uzunluklar):
+        bitenler.setdefault(int(n) - 1, []).append(satir)
+
+    for t in range(T):
+        y = gozlemler[:, t]
+        s = halka[:, :, t % mevsim]
+        onceki = duzey + phi * trend
+        hata = y - onceki - s
+        yeni_duzey = alfa * (y - s) + bir_eksi_alfa * onceki
+        if trendli:
+            trend = beta * (yeni_duzey - duzey) + bir_eksi_beta_phi * trend
+        if mevsimli:
+            halka[:, :, t % mevsim] = gama * (y - yeni_duzey) + bir_eksi_gama * s
+        duzey = yeni_duzey
+        hata *= aktif[:, t]
+        sse += hata * hata
+        if artik_kaydet:
+            artiklar[:, :, t] = np.where(aktif[:, t] > 0, hata, np.nan)
+        if t in bitenler:
+            satirlar = bitenler[t]
+            son_duzey[satirlar], son_trend[satirlar], son_halka[satirlar] = \
+                duzey[satirlar], trend[satirlar], halka[satirlar]
+    return sse, (son_duzey, son_trend, son_halka), artiklar
+
+
+def _aday_izgarasi(model, b, merkez=None):
+    """(seri x aday) parametre dizileri; merkez verilirse her seri için ince ızgara"""
+    adlar = MODEL_PARAMETRELERI[model]
+    if merkez is None:
+        kombinasyonlar = np.array(list(itertools.product(*(IZGARA[ad] for ad in adlar))))
+        return {ad: np.repeat(kombinasyonlar[np.newaxis, :, i], b, axis=0) for i, ad in enumerate(adlar)}
+    # Her parametre için en iyi değerin ±yarım kaba adım komşuları
+    ofsetler = np.array(list(itertools.product((-1, 0, 1), repeat=len(adlar))))
+    adaylar = {}
+    for i, ad in enumerate(adlar):
+        adim = np.diff(IZGARA[ad]).min() / 2
+        alt, ust = SINIRLAR[ad]
+        adaylar[ad] = np.clip(merkez[ad][:, np.newaxis] + ofsetler[np.newaxis, :, i] * adim, alt, ust)
+    return adaylar
+
+
+def uyumla(Y, model='sonumlu', mevsim=MEVSIM, artiklar=False):
+    """(seri x gün) matrisindeki tüm seriler için modeli toplu olarak uyumlar
+
+    Y NaN ile doldurulmuş olabilir (başta ve/veya sonda). Uyum sözlüğü döner:
+    model, seçilen parametreler ({ad: (seri,)}), sse, son durum, uzunluklar ve
+    artiklar=True iken bir adım sonrası artıklar (seri x gün, sola hizalı).
+    """
+    if model not in MODELLER:
+        raise ValueError(f"Bilinmeyen üstel düzeltme modeli: '{model}' (seçenekler: {', '.join(MODELLER)})")
+    hizali, uzunluklar, baslangiclar = sola_hizala(Y)
+    en_az = 2 * mevsim if model == 'holt_winters' else 2
+    if (uzunluklar < en_az).any():
+        raise ValueError(f"{model} için her seride en az {en_az} gözlem gerekli")
+
+    b = len(hizali)
+    satir = np.arange(b)
+    merkez = None
+    for _ in range(2):  # kaba ızgara, ardından seri başına ince ızgara
+        adaylar = _aday_izgarasi(model, b, merkez)
+        sse, durum, _ = _ozyineleme(hizali, uzunluklar, model, adaylar, mevsim)
+        en_iyi = sse.argmin(axis=1)
+        merkez = {ad: deger[satir, en_iyi] for ad, deger in adaylar.items()}
+
+    uyum = {
+        'model': model,
+        'mevsim': mevsim,
+        'parametreler': merkez,
+        'sse': sse[satir, en_iyi],
+        'durum': tuple(d[satir, en_iyi] for d in durum),
+        'uzunluklar': uzunluklar,
+        'baslangiclar': baslangiclar,
+        'artiklar': None,
+    }
+    if artiklar:
+        # Seçilen parametrelerle artıklar için tek adaylı ek geçiş
+        secilen = {ad: deger[:, np.newaxis] for ad, deger in merkez.items()}
+        uyum['artiklar'] = _ozyineleme(hizali, uzunluklar, model, secilen, mevsim, artik_kaydet=True)[2][:, 0]
+    return uyum
+
+
+def tahmin_et(uyum, ufuk, satirlar=None):
+    """Uyumlanmış seriler için (seri x ufuk) tahmin matrisi (satirlar verilirse yalnızca o seriler)"""
+    secim = slice(None) if satirlar is None else np.asarray(satirlar, dtype=np.intp)
+    duzey, trend, halka = (d[secim] for d in uyum['durum'])
+    phi = uyum['parametreler']['phi'][secim] if 'phi' in uyum['parametreler'] else np.ones(len(duzey))
+    adimlar = np.arange(1, ufuk + 1)
+    # Sönümlü trend katsayısı: phi + phi^2 + ... + phi^h
+    trend_katsayisi = np.cumsum(phi[:, np.newaxis] ** adimlar, axis=1)
+    tahmin = duzey[:, np.newaxis] + trend_katsayisi * trend[:, np.newaxis]
+    if uyum['model'] == 'holt_winters':
+        evre = (uyum['uzunluklar'][secim][:, np.newaxis] + adimlar - 1) % uyum['mevsim']
+        tahmin = tahmin + np.take_along_axis(halka, evre, axis=1)
+    return tahmin
+
+
+def toplu_tahmin(seriler, model='sonumlu', ufuk=30, mevsim=MEVSIM):
+    """Farklı uzunluktaki seri listesini tek matriste uyumlar ve tahmin eder
+
+    (tahminler (seri x ufuk), uyum) döndürür.
+    """
+    seriler = [np.asarray(s, dtype=np.float64).reshape(-1) for s in seriler]
+    Y = np.full((len(seriler), max(len(s) for s in seriler)), np.nan)
+    for i, seri in enumerate(seriler):
+        Y[i, :len(seri)] = seri
+    uyum = uyumla(Y, model, mevsim)
+    return tahmin_et(uyum, ufuk), uyum
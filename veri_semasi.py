@@ -0,0 +1,155 @@
+"""
+Veri Şeması ve Kompakt Yükleyici
+
+43 sütunlu profesyonel veri seti için ortak şema. Varsayılan tiplerle okunan
+tabloda metinler Python object, sayılar float64/int64 olur; şema uygulandığında:
+
+- Düşük kardinaliteli metinler (MODEL, KAPASITE, CHIPSET, etiketler...) kategorik
+- Var/Hayır bayrakları nullable boolean
+- Tam sayılar değer aralığına göre int8/int16/int32
+- Ondalıklı sütunlar, bildirilen ondalık basamakları koruduğu doğrulanırsa float32
+  (FIYAT float64 kalır: 100.000 TL mertebesinde float32 kuruşu koruyamaz)
+- TARIH datetime64
+
+veri_setini_yukle() CSV'den üretilmiş güncel Parquet yıldız şema varsa onu, yoksa
+CSV'yi okur ve şemayı uygular; sutunlar verilirse yalnızca o sütunlar okunur.
+rapor=True iken sütun bazlı bellek raporu yazdırır.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Düşük kardinaliteli metin sütunları
+KATEGORIK_SUTUNLAR = [
+    'MARKA', 'MODEL', 'KAPASITE', 'EKRAN_COZUNURLUGU', 'CHIPSET', 'IOS_VERSIYON',
+    'SU_GECIRMEZLIK_SEVIYESI', 'HAT_SAYISI',
+    'KAMPANYA_DURUMU', 'PAZAR_DURUMU', 'SEZONSAL_ETKI', 'GUN_TIPI', 'PREMIUM_KATEGORI', 'KAYNAK',
+]
+
+# Var/Hayır bayrakları
+BAYRAK_SUTUNLARI = ['5G_DESTEGI', '4_5G_DESTEGI', 'SUYA_DAYANIKLILIK', 'KABLOSUZ_SARJ', 'USB_C', 'AI_CHIP']
+BAYRAK_DEGERLERI = {'Var': True, 'Hayır': False, 'Yok': False}
+
+TAM_SAYI_SUTUNLARI = [
+    'DAHILI_DEPOLAMA', 'RAM_GB', 'BATARYA_MAH', 'HIZLI_SARJ_W', 'CPU_CEKIRDEK', 'KAMERA_MP',
+    'EKRAN_YENILEME_HZ', 'URUN_YASI_AY', 'URUN_YASI_GUN', 'CIKIS_YILI', 'YIL', 'AY', 'GUN', 'HAFTA_GUN',
+]
+
+# float32'ye çevrilecek sütunlar ve korunması gereken ondalık basamak sayısı
+FLOAT32_SUTUNLARI = {
+    'EKRAN_BOYUTU': 2, 'CPU_FREKANSI_GHZ': 2, 'DXOMARK_PUAN': 1, 'SAR_DEGERI': 2,
+    'EKRAN_GOVDE_ORANI': 2, 'PERFORMANS_SKORU': 2, 'FIYAT_PERFORMANS_ORANI': 2, 'GENEL_PUAN': 1,
+}
+
+# Bildirilmemiş metin sütunları, farklı değer oranı bunun altındaysa kategorik yapılır
+KATEGORIK_ORAN_SINIRI = 0.5
+
+# Günlük seri üreten tüketicilerin (SKU serileri, seri deposu, hiyerarşi) ihtiyaç duyduğu sütunlar
+SERI_SUTUNLARI = ['MODEL', 'KAPASITE', 'TARIH', 'FIYAT']
+
+
+def bayrak_metni(deger):
+    """Boolean bayrağı gösterim için 'Var'/'Hayır' metnine çevirir (eksikse '-')"""
+    if pd.isna(deger):
+        return '-'
+    if isinstance(deger, str):
+        return deger
+    return 'Var' if deger else 'Hayır'
+
+
+def _tarihleri_ayristir(seri):
+    """'%d.%m.%Y' tarih metinlerini datetime64'e çevirir (her farklı tarih bir kez ayrıştırılır)"""
+    kodlar, benzersiz = pd.factorize(seri)
+    tarihler = pd.to_datetime(benzersiz, format='%d.%m.%Y')
+    return pd.Series(tarihler.take(kodlar, allow_fill=True, fill_value=pd.NaT), index=seri.index, name=seri.name)
+
+
+def _tam_sayi_kucult(seri):
+    """Tam sayı sütununu değer aralığına sığan en küçük tipe çevirir (eksik varsa nullable)"""
+    if seri.isna().all():
+        return seri
+    en_kucuk, en_buyuk = seri.min(), seri.max()
+    for tip in (np.int8, np.int16, np.int32, np.int64):
+        bilgi = np.iinfo(tip)
+        if bilgi.min <= en_kucuk and en_buyuk <= bilgi.max:
+            break
+    if seri.hasnans:
+        return seri.astype(pd.api.types.pandas_dtype(tip.__name__.capitalize()))
+    return seri.astype(tip)
+
+
+def _float32_dene(seri, basamak):
+    """float32 dönüşümü basamak hassasiyetini koruyorsa float32, aksi halde özgün seriyi döndürür"""
+    yeni = seri.astype(np.float32)
+    if np.array_equal(np.round(yeni.to_numpy(np.float64), basamak), np.round(seri.to_numpy(np.float64), basamak),
+                      equal_nan=True):
+        return yeni
+    return seri
+
+
+def semayi_uygula(df):
+    """Tabloya ortak şemayı uygular; yeni bir DataFrame döndürür"""
+    df = df.copy()
+    if 'TARIH' in df.columns and not pd.api.types.is_datetime64_any_dtype(df['TARIH']):
+        df['TARIH'] = _tarihleri_ayristir(df['TARIH'])
+
+    for sutun in df.columns:
+        seri = df[sutun]
+        if sutun in BAYRAK_SUTUNLARI:
+            if seri.dtype != 'boolean':
+                df[sutun] = seri.astype(object).map(BAYRAK_DEGERLERI).astype('boolean')
+        elif sutun in KATEGORIK_SUTUNLAR:
+            df[sutun] = seri.astype('category')
+        elif sutun in TAM_SAYI_SUTUNLARI:
+            df[sutun] = _tam_sayi_kucult(pd.to_numeric(seri))
+        elif sutun in FLOAT32_SUTUNLARI:
+            df[sutun] = _float32_dene(pd.to_numeric(seri).astype(np.float64), FLOAT32_SUTUNLARI[sutun])
+        elif seri.dtype == object and len(seri) and seri.nunique() / len(seri) < KATEGORIK_ORAN_SINIRI:
+            df[sutun] = seri.astype('category')
+    return df
+
+
+def bellek_raporu(once, sonra, ilk=10):
+    """İki tablonun bellek kullanımını sütun bazında karşılaştırıp yazdırır"""
+    once_bayt = once.memory_usage(deep=True, index=False)
+    sonra_bayt = sonra.memory_usage(deep=True, index=False)
+    print(f"\n🧠 Bellek Kullanımı: {once_bayt.sum() / 1e6:.2f} MB -> {sonra_bayt.sum() / 1e6:.2f} MB "
+          f"({once_bayt.sum() / max(sonra_bayt.sum(), 1):.1f}x daha küçük)")
+    for sutun in once_bayt.sort_values(ascending=False).index[:ilk]:
+        print(f"  {sutun}: {once[sutun].dtype} {once_bayt[sutun] / 1e6:.2f} MB -> "
+              f"{sonra[sutun].dtype} {sonra_bayt[sutun] / 1e6:.2f} MB")
+
+
+def veri_setini_yukle(csv_dosyasi='profesyonel_telefon_verileri2.csv', parquet=True, rapor=False, sutunlar=None):
+    """Veri setini ortak şemayla (kompakt tiplerle) yükler
+
+    parquet=True iken csv_dosyasi'ndan üretilmiş güncel yıldız şema dosyaları
+    (yildiz_sema_guncel) varsa onlar okunur; yoksa CSV okunur. sutunlar verilirse
+    yalnızca bu sütunlardan dosyada bulunanlar okunur (eksikler sessizce atlanır).
+    rapor=True iken tablo önce varsayılan tiplerle okunup şemalı tabloyla
+    karşılaştırılır; aksi halde kategorik sütunlar CSV okunurken doğrudan
+    kategorik ayrıştırılır (tepe bellek kullanımı da düşer).
+    """
+    from yildiz_sema import genis_tablo_yukle, parquet_dosyalari, parquet_sutunlari, yildiz_sema_guncel
+
+    istenen = None if sutunlar is None else set(sutunlar)
+    if parquet and yildiz_sema_guncel(csv_dosyasi):
+        olgu_dosyasi, sku_dosyasi = parquet_dosyalari(csv_dosyasi)
+        if istenen is not None:
+            sutunlar = [c for c in parquet_sutunlari(olgu_dosyasi) if c in istenen]
+        once = genis_tablo_yukle(olgu_dosyasi, sku_dosyasi, sutunlar, kompakt=not rapor)
+    else:
+        baslik = pd.read_csv(csv_dosyasi, nrows=0).columns
+        if istenen is not None:
+            baslik = [c for c in baslik if c in istenen]
+        if rapor:
+            once = pd.read_csv(csv_dosyasi, usecols=baslik)
+        else:
+            once = pd.read_csv(csv_dosyasi, usecols=baslik, dtype={
+                c: 'category' for c in baslik if c in KATEGORIK_SUTUNLAR or c in BAYRAK_SUTUNLARI
+            })
+
+    df = semayi_uygula(once)
+    if rapor:
+        bellek_raporu(once, df)
+    return df
@@ -22,6 +22,10 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import logging
+import argparse
+
+import asama_olcumu
+from asama_olcumu import olc, olculen
 
 # Logging konfigürasyonu
 logging.basicConfig(
@@ -132,40 +136,42 @@ class iPhonePriceScraper:
             search_query = f"iphone {model.replace('iPhone ', '')} {capacity}"
             url = f"https://www.hepsiburada.com/ara?q={search_query.replace(' ', '+')}"
             
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
+            with olc('getir', site='hepsiburada', sku=f"{model} {capacity}"):
+                response = self.session.get(url, timeout=10)
+                response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            with olc('ayristir', site='hepsiburada', sku=f"{model} {capacity}"):
+                soup = BeautifulSoup(response.content, 'html.parser')
             
-            # Ürün kartlarını bul
-            products = soup.find_all('div', class_='productListContent-item')
+                # Ürün kartlarını bul
+                products = soup.find_all('div', class_='productListContent-item')
             
-            for product in products[:5]:  # İlk 5 sonuç
-                try:
-                    # Ürün başlığı
-                    title_elem = product.find('h3', class_='product-title')
-                    title = title_elem.get_text(strip=True) if title_elem else "Bilinmeyen"
+                for product in products[:5]:  # İlk 5 sonuç
+                    try:
+                        # Ürün başlığı
+                        title_elem = product.find('h3', class_='product-title')
+                        title = title_elem.get_text(strip=True) if title_elem else "Bilinmeyen"
                     
-                    # Fiyat
-                    price_elem = product.find('div', class_='price-value')
-                    price_text = price_elem.get_text(strip=True) if price_elem else None
-                    price = self.clean_price(price_text)
+                        # Fiyat
+                        price_elem = product.find('div', class_='price-value')
+                        price_text = price_elem.get_text(strip=True) if price_elem else None
+                        price = self.clean_price(price_text)
                     
-                    if price and model.lower() in title.lower() and capacity.lower() in title.lower():
-                        self.collected_data.append({
-                            'tarih': datetime.now().strftime('%d.%m.%Y'),
-                            'site': 'Hepsiburada',
-                            'model': model,
-                            'kapasite': capacity,
-                            'fiyat': price,
-                            'baslik': title,
-                            'url': url
-                        })
-                        logging.info(f"Hepsiburada'dan veri çekildi: {model} {capacity} - {price} TL")
+                        if price and model.lower() in title.lower() and capacity.lower() in title.lower():
+                            self.collected_data.append({
+                                'tarih': datetime.now().strftime('%d.%m.%Y'),
+                                'site': 'Hepsiburada',
+                                'model': model,
+                                'kapasite': capacity,
+                                'fiyat': price,
+                                'baslik': title,
+                                'url': url
+                            })
+                            logging.info(f"Hepsiburada'dan veri çekildi: {model} {capacity} - {price} TL")
                 
-                except Exception as e:
-                    logging.warning(f"Hepsiburada ürün işleme hatası: {e}")
-                    continue
+                    except Exception as e:
+                        logging.warning(f"Hepsiburada ürün işleme hatası: {e}")
+                        continue
                     
         except Exception as e:
             logging.error(f"Hepsiburada scraping hatası: {e}")
@@ -183,43 +189,45 @@ class iPhonePriceScraper:
                 'X-Requested-With': 'XMLHttpRequest'
             })
             
-            response = self.session.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
+            with olc('getir', site='trendyol', sku=f"{model} {capacity}"):
+                response = self.session.get(url, headers=headers, timeout=10)
+                response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            with olc('ayristir', site='trendyol', sku=f"{model} {capacity}"):
+                soup = BeautifulSoup(response.content, 'html.parser')
             
-            # Ürün kartlarını bul
-            products = soup.find_all('div', class_='p-card-wrppr')
+                # Ürün kartlarını bul
+                products = soup.find_all('div', class_='p-card-wrppr')
             
-            for product in products[:5]:  # İlk 5 sonuç
-                try:
-                    # Ürün başlığı
-                    title_elem = product.find('span', class_='prdct-desc-cntnr-name')
-                    title = title_elem.get_text(strip=True) if title_elem else "Bilinmeyen"
+                for product in products[:5]:  # İlk 5 sonuç
+                    try:
+                        # Ürün başlığı
+                        title_elem = product.find('span', class_='prdct-desc-cntnr-name')
+                        title = title_elem.get_text(strip=True) if title_elem else "Bilinmeyen"
                     
-                    # Fiyat
-                    price_elem = product.find('div', class_='prc-box-dscntd')
-                    if not price_elem:
-                        price_elem = product.find('div', class_='prc-box-orgnl')
+                        # Fiyat
+                        price_elem = product.find('div', class_='prc-box-dscntd')
+                        if not price_elem:
+                            price_elem = product.find('div', class_='prc-box-orgnl')
                     
-                    price_text = price_elem.get_text(strip=True) if price_elem else None
-                    price = self.clean_price(price_text)
+                        price_text = price_elem.get_text(strip=True) if price_elem else None
+                        price = self.clean_price(price_text)
                     
-                    if price and model.lower() in title.lower() and capacity.lower() in title.lower():
-                        self.collected_data.append({
-                            'tarih': datetime.now().strftime('%d.%m.%Y'),
-                            'site': 'Trendyol',
-                            'model': model,
-                            'kapasite': capacity,
-                            'fiyat': price,
-                            'baslik': title,
-                            'url': url
-                        })
-                        logging.info(f"Trendyol'dan veri çekildi: {model} {capacity} - {price} TL")
+                        if price and model.lower() in title.lower() and capacity.lower() in title.lower():
+                            self.collected_data.append({
+                                'tarih': datetime.now().strftime('%d.%m.%Y'),
+                                'site': 'Trendyol',
+                                'model': model,
+                                'kapasite': capacity,
+                                'fiyat': price,
+                                'baslik': title,
+                                'url': url
+                            })
+                            logging.info(f"Trendyol'dan veri çekildi: {model} {capacity} - {price} TL")
                 
-                except Exception as e:
-                    logging.warning(f"Trendyol ürün işleme hatası: {e}")
-                    continue
+                    except Exception as e:
+                        logging.warning(f"Trendyol ürün işleme hatası: {e}")
+                        continue
                     
         except Exception as e:
             logging.error(f"Trendyol scraping hatası: {e}")
@@ -237,45 +245,49 @@ class iPhonePriceScraper:
                 capacity=capacity.replace(' ', '+')
             )
             
-            driver.get(url)
+            site = site_config['base_url'].split('//')[1].split('.')[1]
+            with olc('getir', site=site, sku=f"{model} {capacity}"):
+                driver.get(url)
             self.random_delay(2, 4)
             
-            # Sayfanın yüklenmesini bekle
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, site_config['price_selector']))
-            )
+            with olc('ayristir', site=site, sku=f"{model} {capacity}"):  # JavaScript öğelerinin beklenmesi dahil
+                # Sayfanın yüklenmesini bekle
+                WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, site_config['price_selector']))
+                )
             
-            # Ürünleri bul
-            price_elements = driver.find_elements(By.CSS_SELECTOR, site_config['price_selector'])
-            title_elements = driver.find_elements(By.CSS_SELECTOR, site_config['title_selector'])
+                # Ürünleri bul
+                price_elements = driver.find_elements(By.CSS_SELECTOR, site_config['price_selector'])
+                title_elements = driver.find_elements(By.CSS_SELECTOR, site_config['title_selector'])
             
-            for i, (price_elem, title_elem) in enumerate(zip(price_elements[:5], title_elements[:5])):
-                try:
-                    title = title_elem.text.strip()
-                    price_text = price_elem.text.strip()
-                    price = self.clean_price(price_text)
+                for i, (price_elem, title_elem) in enumerate(zip(price_elements[:5], title_elements[:5])):
+                    try:
+                        title = title_elem.text.strip()
+                        price_text = price_elem.text.strip()
+                        price = self.clean_price(price_text)
                     
-                    if price and model.lower() in title.lower() and capacity.lower() in title.lower():
-                        self.collected_data.append({
-                            'tarih': datetime.now().strftime('%d.%m.%Y'),
-                            'site': site_config['base_url'].split('//')[1].split('.')[1].title(),
-                            'model': model,
-                            'kapasite': capacity,
-                            'fiyat': price,
-                            'baslik': title,
-                            'url': url
-                        })
-                        logging.info(f"Selenium ile veri çekildi: {model} {capacity} - {price} TL")
+                        if price and model.lower() in title.lower() and capacity.lower() in title.lower():
+                            self.collected_data.append({
+                                'tarih': datetime.now().strftime('%d.%m.%Y'),
+                                'site': site.title(),
+                                'model': model,
+                                'kapasite': capacity,
+                                'fiyat': price,
+                                'baslik': title,
+                                'url': url
+                            })
+                            logging.info(f"Selenium ile veri çekildi: {model} {capacity} - {price} TL")
                 
-                except Exception as e:
-                    logging.warning(f"Selenium ürün işleme hatası: {e}")
-                    continue
+                    except Exception as e:
+                        logging.warning(f"Selenium ürün işleme hatası: {e}")
+                        continue
                     
         except Exception as e:
             logging.error(f"Selenium scraping hatası: {e}")
         finally:
             driver.quit()
     
+    @olculen('toplama')
     def scrape_all_sites(self):
         """Tüm sitelerden veri çekme işlemini koordine eder"""
         logging.info("iPhone fiyat verisi çekme işlemi başlatıldı...")
@@ -304,6 +316,7 @@ class iPhonePriceScraper:
         
         logging.info(f"Veri çekme işlemi tamamlandı. Toplam {len(self.collected_data)} kayıt toplandı.")
     
+    @olculen('yazma')
     def save_to_excel(self, filename='scraped_iphone_data.xlsx'):
         """Çekilen verileri Excel dosyasına kaydeder"""
         if not self.collected_data:
@@ -331,6 +344,7 @@ class iPhonePriceScraper:
         logging.info(f"Veriler {filename} dosyasına kaydedildi.")
         return filename
     
+    @olculen('simulasyon')
     def generate_historical_data(self, days_back=365):
         """Geçmiş tarihler için simüle edilmiş veri üretir"""
         logging.info(f"Son {days_back} gün için tarihsel veri simülasyonu...")
@@ -401,8 +415,19 @@ class iPhonePriceScraper:
         
         logging.info(f"Tarihsel veri simülasyonu tamamlandı. {len(self.collected_data)} kayıt oluşturuldu.")
 
-def main():
-    """Ana çalıştırma fonksiyonu"""
+def main(argv=None):
+    """Ana çalıştırma fonksiyonu (--olcum ile site başına getirme/ayrıştırma süreleri kaydedilir)"""
+    parser = argparse.ArgumentParser(description='iPhone fiyat veri toplama (canlı ya da simülasyon)')
+    asama_olcumu.arguman_ekle(parser)
+    args = parser.parse_args(argv)
+    asama_olcumu.argumanlardan_baslat(args, 'toplama')
+    try:
+        calistir()
+    finally:
+        asama_olcumu.bitir()
+
+def calistir():
+    """Etkileşimli menü: canlı veri çekme, simülasyon ya da çıkış"""
     scraper = iPhonePriceScraper()
     
     print("🚀 iPhone Fiyat Veri Toplama Sistemi")
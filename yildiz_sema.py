@@ -0,0 +1,209 @@
+"""
+Yıldız Şema (Parquet) Çıktısı
+
+43 sütunlu profesyonel veri setindeki ~30 teknik özellik sütunu her kayıtta aynı
+SKU (MODEL + KAPASITE) değerlerini tekrarlar. Bu modül veri setini iki Parquet
+dosyasına ayırır:
+
+- Olgu tablosu: TARIH, SKU_ID, FIYAT ve kayıt düzeyinde türetilen zaman/pazar
+  alanları (etiketler sözlük kodlu kategorik, tam sayılar küçültülmüş tiplerle)
+- SKU boyut tablosu: SKU başına bir satır; marka, model, kapasite, teknik
+  özellikler ve SKU düzeyindeki türetilmiş alanlar
+
+Dosyalar CSV çıktısının adından türetilir (x.csv -> x_olgu.parquet, x_sku.parquet).
+Şema metadatasına kaynak CSV'nin adı, mtime'ı ve boyutu yazılır; yildiz_sema_guncel()
+Parquet çiftini yalnızca o CSV'den (ya da CSV'siz, yalnızca Parquet çıktısı olarak)
+üretilmişse geçerli sayar. Aksi halde okuyucular CSV'ye döner.
+
+genis_tablo_yukle() iki tabloyu SKU_ID üzerinden birleştirip geniş tabloyu
+orijinal sütun sırasıyla yeniden kurar; yalnızca istenen sütunlar okunur.
+pyarrow yalnızca yazma/okuma sırasında gereklidir.
+"""
+
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+# SKU başına sabit olan sütunlar; geri kalan sütunlar olgu tablosuna yazılır
+SKU_SUTUNLARI = [
+    'MARKA', 'MODEL', 'KAPASITE',
+    'EKRAN_BOYUTU', 'DAHILI_DEPOLAMA', 'RAM_GB', 'BATARYA_MAH', 'HIZLI_SARJ_W',
+    'CPU_FREKANSI_GHZ', 'CPU_CEKIRDEK', 'KAMERA_MP', 'EKRAN_COZUNURLUGU', 'EKRAN_YENILEME_HZ',
+    'CHIPSET', 'DXOMARK_PUAN', 'IOS_VERSIYON',
+    '5G_DESTEGI', '4_5G_DESTEGI', 'SUYA_DAYANIKLILIK', 'SU_GECIRMEZLIK_SEVIYESI', 'KABLOSUZ_SARJ',
+    'USB_C', 'AI_CHIP',
+    'SAR_DEGERI', 'EKRAN_GOVDE_ORANI', 'HAT_SAYISI',
+    'PERFORMANS_SKORU', 'CIKIS_YILI', 'PREMIUM_KATEGORI', 'GENEL_PUAN'
+]
+SKU_ANAHTARI = ['MODEL', 'KAPASITE']
+
+# Parquet şema metadatasında geniş tablonun sütun sırası ve kaynak CSV imzası bu anahtarlarla saklanır
+SUTUN_SIRASI_ANAHTARI = b'genis_sutunlar'
+KAYNAK_ANAHTARI = b'kaynak_csv'
+
+
+def parquet_dosyalari(csv_dosyasi):
+    """CSV çıktısına karşılık gelen (olgu, sku) Parquet dosya adları"""
+    kok = os.path.splitext(csv_dosyasi)[0]
+    return f"{kok}_olgu.parquet", f"{kok}_sku.parquet"
+
+
+def _kaynak_imzasi(csv_dosyasi, csv_ile):
+    """Metadataya yazılan kaynak: CSV adı, (CSV ile yazıldıysa) mtime ve boyutu, yazım zamanı"""
+    imza = {'dosya': os.path.basename(csv_dosyasi), 'mtime_ns': None, 'boyut': None, 'yazim_ns': time.time_ns()}
+    if csv_ile:
+        bilgi = os.stat(csv_dosyasi)
+        imza.update(mtime_ns=bilgi.st_mtime_ns, boyut=bilgi.st_size)
+    return imza
+
+
+def _tipleri_duzelt(df):
+    """Metin olarak gelen sayısal sütunları sayıya, TARIH'i datetime'a çevirir
+
+    Artımlı hazırlama çıktısı metin sütunlarıyla gelir; tipli tablolar olduğu
+    gibi geçer.
+    """
+    df = df.copy()
+    if not pd.api.types.is_datetime64_any_dtype(df['TARIH']):
+        df['TARIH'] = pd.to_datetime(df['TARIH'], format='%d.%m.%Y')
+    for sutun in df.columns:
+        if df[sutun].dtype != object:
+            continue
+        try:
+            df[sutun] = pd.to_numeric(df[sutun].replace('', np.nan))
+        except (ValueError, TypeError):
+            pass
+    return df
+
+
+def _kucult(seri):
+    """Metinleri kategorik, tam sayıları en küçük uygun tam sayı tipine çevirir"""
+    if seri.dtype == object:
+        return seri.astype('category')
+    if pd.api.types.is_integer_dtype(seri) and not seri.hasnans:
+        return pd.to_numeric(seri, downcast='integer')
+    return seri
+
+
+def yildiz_semaya_ayir(df):
+    """Geniş tabloyu (olgu, sku) tablolarına ayırır
+
+    SKU sütunlarının bir SKU içinde farklı değerler alması tasarım hatasıdır ve
+    ValueError ile bildirilir.
+    """
+    df = _tipleri_duzelt(df)
+    sku_sutunlari = [c for c in SKU_SUTUNLARI if c in df.columns]
+    olgu_sutunlari = [c for c in df.columns if c not in sku_sutunlari]
+
+    sku_kodlari, skular = pd.MultiIndex.from_frame(df[SKU_ANAHTARI]).factorize()
+    ilk_satirlar = pd.Series(np.arange(len(df))).groupby(sku_kodlari, sort=True).first().to_numpy()
+    sku = df[sku_sutunlari].iloc[ilk_satirlar].reset_index(drop=True)
+    if len(df[sku_sutunlari].drop_duplicates()) != len(sku):
+        raise ValueError("SKU sütunları aynı MODEL/KAPASITE içinde farklı değerler içeriyor")
+
+    sku_id_tipi = np.int16 if len(sku) < np.iinfo(np.int16).max else np.int32
+    sku.insert(0, 'SKU_ID', np.arange(len(sku), dtype=sku_id_tipi))
+    olgu = df[olgu_sutunlari].reset_index(drop=True)
+    olgu.insert(1, 'SKU_ID', sku_kodlari.astype(sku_id_tipi))
+
+    olgu = olgu.apply(_kucult)
+    sku = sku.apply(_kucult)
+    return olgu, sku
+
+
+def yildiz_sema_yaz(df, csv_dosyasi, csv_ile=True):
+    """Geniş tabloyu csv_dosyasi adından türetilen olgu ve SKU Parquet dosyalarına yazar
+
+    csv_ile=True iken aynı tablo csv_dosyasi'na az önce yazılmış olmalıdır; CSV'nin
+    mtime/boyutu kaynak imzası olarak saklanır. Yalnızca Parquet yazılıyorsa False.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    olgu, sku = yildiz_semaya_ayir(df)
+    kaynak = json.dumps(_kaynak_imzasi(csv_dosyasi, csv_ile)).encode('utf-8')
+    for tablo, dosya in zip((olgu, sku), parquet_dosyalari(csv_dosyasi)):
+        arrow_tablosu = pa.Table.from_pandas(tablo, preserve_index=False)
+        metadata = dict(arrow_tablosu.schema.metadata or {})
+        metadata[SUTUN_SIRASI_ANAHTARI] = json.dumps(list(df.columns), ensure_ascii=False).encode('utf-8')
+        metadata[KAYNAK_ANAHTARI] = kaynak
+        pq.write_table(arrow_tablosu.replace_schema_metadata(metadata), dosya, compression='zstd')
+    return olgu, sku
+
+
+def yildiz_sema_guncel(csv_dosyasi):
+    """csv_dosyasi'nın Parquet çifti varsa ve o CSV'den üretilmişse True döner
+
+    İki dosyanın kaynak imzası aynı yazıma ait ve CSV adıyla eşleşmeli; CSV
+    diskteyse mtime ve boyutu da imzadakiyle aynı olmalıdır (CSV sonradan
+    değiştiyse Parquet bayattır). CSV yoksa yalnızca Parquet çıktısı kabul edilir.
+    """
+    dosyalar = parquet_dosyalari(csv_dosyasi)
+    if not all(os.path.exists(d) for d in dosyalar):
+        return False
+    try:
+        import pyarrow.parquet as pq
+
+        imzalar = [(pq.read_schema(d).metadata or {}).get(KAYNAK_ANAHTARI) for d in dosyalar]
+    except Exception:
+        return False
+    if imzalar[0] is None or imzalar[0] != imzalar[1]:
+        return False
+    imza = json.loads(imzalar[0].decode('utf-8'))
+    if imza.get('dosya') != os.path.basename(csv_dosyasi):
+        return False
+    if not os.path.exists(csv_dosyasi):
+        return True
+    bilgi = os.stat(csv_dosyasi)
+    return imza.get('mtime_ns') == bilgi.st_mtime_ns and imza.get('boyut') == bilgi.st_size
+
+
+def parquet_sutunlari(olgu_dosyasi):
+    """Parquet çiftinden kurulabilecek geniş tablo sütunları (orijinal sırayla)"""
+    import pyarrow.parquet as pq
+
+    return json.loads(pq.read_schema(olgu_dosyasi).metadata[SUTUN_SIRASI_ANAHTARI].decode('utf-8'))
+
+
+def genis_tablo_yukle(olgu_dosyasi, sku_dosyasi, sutunlar=None, kompakt=False):
+    """Olgu ve SKU tablolarını birleştirip geniş tabloyu yeniden kurar
+
+    sutunlar verilirse yalnızca o sütunlar (ve birleştirme için SKU_ID) okunur.
+    kompakt=False iken tipler CSV'den okunmuş gibidir: kategorik metinler object,
+    küçültülmüş tam sayılar int64 olur (tüketicilerdeki aritmetikte taşma olmaz).
+    kompakt=True tipleri olduğu gibi bırakır. TARIH datetime64 olarak döner.
+    """
+    import pyarrow.parquet as pq
+
+    sema = pq.read_schema(olgu_dosyasi)
+    if sutunlar is None:
+        sutunlar = parquet_sutunlari(olgu_dosyasi)
+    sku_sema = pq.read_schema(sku_dosyasi)
+
+    olgu_sutunlari = [c for c in sutunlar if c in sema.names and c != 'SKU_ID']
+    sku_sutunlari = [c for c in sutunlar if c in sku_sema.names and c != 'SKU_ID']
+    eksik = [c for c in sutunlar if c not in olgu_sutunlari and c not in sku_sutunlari]
+    if eksik:
+        raise KeyError(f"Parquet dosyalarında bulunmayan sütunlar: {eksik}")
+
+    olgu = pd.read_parquet(olgu_dosyasi, columns=['SKU_ID'] + olgu_sutunlari)
+    if sku_sutunlari:
+        sku = pd.read_parquet(sku_dosyasi, columns=['SKU_ID'] + sku_sutunlari)
+        satirlar = pd.Index(sku['SKU_ID']).get_indexer(olgu['SKU_ID'])
+        eklenecek = sku[sku_sutunlari].take(satirlar).reset_index(drop=True)
+        df = pd.concat([olgu[olgu_sutunlari], eklenecek], axis=1)
+    else:
+        df = olgu[olgu_sutunlari]
+
+    df = df[sutunlar]
+    if not kompakt:
+        for sutun in df.columns:
+            tip = df[sutun].dtype
+            if isinstance(tip, pd.CategoricalDtype):
+                df[sutun] = df[sutun].astype(object)
+            elif pd.api.types.is_integer_dtype(tip):
+                df[sutun] = df[sutun].astype('Int64' if pd.api.types.is_extension_array_dtype(tip) else np.int64)
+    return df